@@ -0,0 +1,166 @@
+"""Persistent history of profiling results backed by local SQLite database."""
+
+import json
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiling_runs (
+    id INTEGER PRIMARY KEY,
+    result_type TEXT NOT NULL,
+    func_qualname TEXT,
+    source_hash TEXT,
+    kwargs_fingerprint TEXT,
+    host TEXT,
+    platform TEXT,
+    python_version TEXT,
+    timestamp REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS profiling_metrics (
+    run_id INTEGER NOT NULL REFERENCES profiling_runs(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS profiling_runs_func_timestamp ON profiling_runs(func_qualname, timestamp);
+CREATE INDEX IF NOT EXISTS profiling_metrics_run_name ON profiling_metrics(run_id, name);
+"""
+
+RUN_COLUMNS = (
+    'result_type', 'func_qualname', 'source_hash', 'kwargs_fingerprint',
+    'host', 'platform', 'python_version', 'timestamp'
+    )
+
+
+class BenchmarkHistoryStore:
+    """Stores profiling records (see BaseProfilingResult.profiling_record) and queries their history.
+
+    Every record becomes one row of `profiling_runs` plus one row of `profiling_metrics`
+    per numeric field of the result, so any numeric field can be queried as a metric.
+
+    The store keeps one connection open, shared by threads under a lock, use `cached_store` to
+    share a store of the same database between writers.
+
+    Args:
+        file_path (str): Path to SQLite database, created with its schema if missing.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(file_path, check_same_thread=False)
+        self._connection.execute('PRAGMA foreign_keys = ON')
+        self._connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Closes connection of the store."""
+        with self._lock:
+            self._connection.close()
+
+    def add(self, records: list[dict]) -> None:
+        """Inserts records in a single transaction.
+
+        Args:
+            records (list[dict]): Profiling records with run columns, `metrics` and `data`.
+        """
+        with self._lock, self._connection:
+            metric_rows = []
+            for record in records:
+                cursor = self._connection.execute(
+                    f'INSERT INTO profiling_runs ({", ".join(RUN_COLUMNS)}, data) '
+                    f'VALUES ({", ".join("?" * (len(RUN_COLUMNS) + 1))})',
+                    [record.get(column) for column in RUN_COLUMNS] + [json.dumps(record['data'])]
+                    )
+                metric_rows.extend((cursor.lastrowid, name, value) for name, value in record['metrics'].items())
+            self._connection.executemany(
+                'INSERT INTO profiling_metrics (run_id, name, value) VALUES (?, ?, ?)',
+                metric_rows
+                )
+
+    def runs(self, func_qualname: str, last_runs: int = 50) -> list[dict]:
+        """Returns the latest runs of a function, newest first.
+
+        Args:
+            func_qualname (str): Qualified name of profiled function (module.qualname).
+            last_runs (int): Maximum amount of returned runs.
+
+        Returns:
+            list[dict]: Run columns with `data` of the stored result.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                f'SELECT {", ".join(RUN_COLUMNS)}, data FROM profiling_runs '
+                'WHERE func_qualname = ? ORDER BY timestamp DESC, id DESC LIMIT ?',
+                (func_qualname, last_runs)
+                ).fetchall()
+        return [dict(zip(RUN_COLUMNS + ('data',), row[:-1] + (json.loads(row[-1]),))) for row in rows]
+
+    def trend(self, func_qualname: str, metric: str, last_runs: int = 50) -> list[tuple[float, float]]:
+        """Returns metric values of the latest runs of a function, oldest first.
+
+        Args:
+            func_qualname (str): Qualified name of profiled function (module.qualname).
+            metric (str): Name of numeric result field, e.g. func_execution_time.
+            last_runs (int): Maximum amount of runs to look at.
+
+        Returns:
+            list[tuple[float, float]]: Timestamp and metric value of each run that has the metric.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT runs.timestamp, metrics.value FROM profiling_runs AS runs '
+                'JOIN profiling_metrics AS metrics ON metrics.run_id = runs.id '
+                'WHERE runs.func_qualname = ? AND metrics.name = ? '
+                'ORDER BY runs.timestamp DESC, runs.id DESC LIMIT ?',
+                (func_qualname, metric, last_runs)
+                ).fetchall()
+        return rows[::-1]
+
+    def percentile(self, func_qualname: str, metric: str, percentile: float, last_runs: int = 50) -> float | None:
+        """Returns percentile of metric values of the latest runs, e.g. p99 of execution time over the last 50 runs.
+
+        Args:
+            func_qualname (str): Qualified name of profiled function (module.qualname).
+            metric (str): Name of numeric result field.
+            percentile (float): Percentile in [0, 100] range.
+            last_runs (int): Maximum amount of runs to look at.
+
+        Returns:
+            float | None: Percentile value, None if no run has the metric.
+        """
+        values = [value for _, value in self.trend(func_qualname, metric, last_runs)]
+        if not values:
+            return None
+        return float(np.percentile(values, percentile))
+
+    def __repr__(self) -> str:
+        return f'BenchmarkHistoryStore(file_path={self.file_path})'
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def cached_store(file_path: str) -> BenchmarkHistoryStore:
+    """Returns store of the database shared by all callers, so its schema is created once.
+
+    A new store is opened if the database file was removed since the store was cached.
+
+    Args:
+        file_path (str): Path to SQLite database.
+
+    Returns:
+        BenchmarkHistoryStore: Store of the database.
+    """
+    key = os.path.abspath(file_path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is not None and not os.path.exists(key):
+            store.close()
+            store = None
+        if store is None:
+            store = _stores[key] = BenchmarkHistoryStore(file_path)
+        return store
@@ -0,0 +1,116 @@
+"""Discovery of Python functions called by a function through inspection of its code objects.
+
+Names referenced by the code of a function are resolved against its closure and globals.
+Referenced modules and classes (including the class that owns a method, for calls through
+`self`) are searched for attributes with referenced names, so `module.helper(...)` and
+`self.helper(...)` calls are found as well. Discovery is static: callees passed around as
+arguments or resolved dynamically (getattr, dispatch tables) are not found.
+"""
+
+import inspect
+from types import CodeType, FunctionType, ModuleType
+
+
+def _code_names(code: CodeType) -> set[str]:
+    """Returns names referenced by the code object and code objects nested in it (e.g. comprehensions)."""
+    names = set(code.co_names) | set(code.co_freevars)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _owner_class(func: FunctionType) -> type | None:
+    """Returns class the method is defined in, None for functions defined outside of classes."""
+    owner = func.__globals__
+    for name in func.__qualname__.split('.')[:-1]:
+        if name == '<locals>':
+            return None
+        owner = owner.get(name) if isinstance(owner, dict) else inspect.getattr_static(owner, name, None)
+        if owner is None:
+            return None
+    return owner if isinstance(owner, type) else None
+
+
+def _as_function(obj) -> FunctionType | None:
+    """Returns Python function behind the object (unwrapping decorators and method descriptors), if any."""
+    if isinstance(obj, (staticmethod, classmethod)):
+        obj = obj.__func__
+    elif isinstance(obj, property):
+        obj = obj.fget
+    if not isinstance(obj, FunctionType):
+        return None
+    unwrapped = inspect.unwrap(obj)
+    return unwrapped if isinstance(unwrapped, FunctionType) else obj
+
+
+def direct_callees(func: FunctionType) -> list[FunctionType]:
+    """Returns Python functions referenced by the code of the function.
+
+    Args:
+        func (FunctionType): Function to inspect.
+
+    Returns:
+        list[FunctionType]: Referenced functions in order of discovery, without the function itself.
+    """
+    names = _code_names(func.__code__)
+    namespace = dict(func.__globals__)
+    if func.__closure__:
+        for name, cell in zip(func.__code__.co_freevars, func.__closure__):
+            try:
+                namespace[name] = cell.cell_contents
+            except ValueError:
+                continue
+
+    containers = [obj for name in names if isinstance(obj := namespace.get(name), (ModuleType, type))]
+    owner = _owner_class(func)
+    if owner is not None:
+        containers.append(owner)
+
+    candidates = [namespace.get(name) for name in sorted(names)]
+    for container in containers:
+        for name in sorted(names):
+            if isinstance(container, type):
+                candidates.extend(inspect.getattr_static(base, name, None) for base in container.__mro__)
+            else:
+                candidates.append(getattr(container, name, None))
+
+    callees = {}
+    for candidate in candidates:
+        callee = _as_function(candidate)
+        if callee is not None and callee.__code__ is not func.__code__:
+            callees.setdefault(callee.__code__, callee)
+    return list(callees.values())
+
+
+def discover_callees(func: FunctionType, max_depth: int = 1, package: str | None = None) -> list[FunctionType]:
+    """Returns functions reachable from the function through at most max_depth nested calls.
+
+    Args:
+        func (FunctionType): Root function.
+        max_depth (int): Maximum depth of the call chain, 1 returns direct callees only.
+        package (str | None): If provided, only functions defined in this package (or module)
+            are returned and searched for further callees.
+
+    Returns:
+        list[FunctionType]: Discovered functions in breadth-first order, without the root function.
+
+    Raises:
+        ValueError: If max_depth is negative.
+    """
+    if max_depth < 0:
+        raise ValueError(f'max_depth has to be non negative, got instead: {max_depth}')
+    discovered = {func.__code__: func}
+    frontier = [func]
+    for _ in range(max_depth):
+        next_frontier = []
+        for caller in frontier:
+            for callee in direct_callees(caller):
+                if callee.__code__ in discovered:
+                    continue
+                if package is not None and not (callee.__module__ == package or callee.__module__.startswith(package + '.')):
+                    continue
+                discovered[callee.__code__] = callee
+                next_frontier.append(callee)
+        frontier = next_frontier
+    return list(discovered.values())[1:]
@@ -2,16 +2,25 @@
 
 import io
 import sys
+import threading
 import timeit
 import tracemalloc
-from typing import Callable
+from typing import Callable, Sequence
 from types import BuiltinFunctionType, FunctionType
 
 import line_profiler
 import cProfile
 import pympler.tracker
 
-CALL_GRAPH_PROFILING_RESULT_FILE = 'result.prof'
+from Internals import monitoring
+from Internals import tracemalloc_sessions
+from Internals.logger import logger
+
+# Since Python 3.12 cProfile is built on sys.monitoring, which allows a single active profiler per process.
+CPROFILE_SINGLE_SESSION = sys.version_info >= (3, 12)
+_cprofile_lock = threading.Lock()
+# Identifier of the thread that holds _cprofile_lock, the lock is not reentrant.
+_cprofile_owner = None
 
 
 def profiler_manager_base_exception_handling(obj, exc_type):
@@ -90,13 +99,35 @@ class LineTimeProfilerManager:
     def __init__(
         self, 
         profiler : line_profiler.LineProfiler, 
-        profiled_func: BuiltinFunctionType | FunctionType
+        profiled_func: BuiltinFunctionType | FunctionType,
+        callees: list[FunctionType] = ()
         ):
         self.profiler = profiler
         self.profiled_func = profiled_func
+        self.callees = callees
         
     def __enter__(self):
         self.profiler.add_function(self.profiled_func)
+        for callee in self.callees:
+            self.profiler.add_function(callee)
+        self.profiler.enable_by_count()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.disable_by_count()
+        profiler_manager_base_exception_handling(self, exc_type)
+        return True
+    
+class AccumulatingLineTimeProfilerManager:
+    """Context manager for a single call of function instrumented by AccumulatingLineTimeProfiler.
+    
+    Tracing is enabled by count of the current thread only, so calls in several threads may overlap.
+    """
+    
+    def __init__(self, profiler: line_profiler.LineProfiler):
+        self.profiler = profiler
+        
+    def __enter__(self):
         self.profiler.enable_by_count()
         return self
     
@@ -106,19 +137,66 @@ class LineTimeProfilerManager:
         return True
     
 class CallGraphTimeProfilerManager:
-    """Context manager for profiling process of  CallGraphTimeProfiler class."""
+    """Context manager for profiling process of  CallGraphTimeProfiler class.
+    
+    Stats stay in memory in `profiler` (cProfile.Profile), a file is written only if requested.
+    Before Python 3.12 each thread is profiled by its own hook, so sessions in several threads run 
+    in parallel, since Python 3.12 sessions are serialized by a process wide lock.
+    
+    If the session can not start, because another session is active in the same thread (nested 
+    profiled call or concurrent coroutine), another session is active and blocking is False, or 
+    another profiler occupies the process, the body runs unprofiled: `profiled` is False and 
+    `profiler` is None.
+    
+    Args:
+        output_file (str | None): If provided, stats are dumped into this file when no exception occurred.
+        blocking (bool): If False, do not wait for another session to finish 
+            (used by coroutines, which would otherwise block their event loop).
+    """
     
-    def __init__(self, output_file: str = CALL_GRAPH_PROFILING_RESULT_FILE):
+    def __init__(self, output_file: str | None = None, blocking: bool = True):
         self.output_file = output_file
+        self.blocking = blocking
+        self.profiled = False
+        self.profiler = None
+        self._locked = False
+    
+    def _acquire(self) -> bool:
+        """Takes the process wide session lock, False if it is held by this thread or busy and not blocking."""
+        global _cprofile_owner
+        if _cprofile_owner == threading.get_ident():
+            return False
+        if not _cprofile_lock.acquire(blocking=self.blocking):
+            return False
+        _cprofile_owner = threading.get_ident()
+        self._locked = True
+        return True
     
     def __enter__(self):
-        """Start the profiler."""
-        self.profiler = cProfile.Profile()
-        self.profiler.enable()
+        """Start the profiler, unless another session is active (see class docstring)."""
+        if CPROFILE_SINGLE_SESSION and not self._acquire():
+            logger.warning('Another cProfile session is already active, call runs without call graph profiling')
+            return self
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:
+            self._release()
+            logger.warning('cProfile can not be enabled (%s), call runs without call graph profiling', e)
+            return self
+        self.profiler = profiler
+        self.profiled = True
         return self
+    
+    def _release(self):
+        global _cprofile_owner
+        if self._locked:
+            self._locked = False
+            _cprofile_owner = None
+            _cprofile_lock.release()
         
     def __exit__(self, exc_type, exc_value, traceback):
-        """Stop the profiler and dump stats if no exception occurred.
+        """Stop the profiler and dump stats if requested and no exception occurred.
 
         Args:
             exc_type (Type[BaseException] | None): Exception class if raised.
@@ -128,31 +206,78 @@ class CallGraphTimeProfilerManager:
         Returns:
             bool: True to suppress exceptions.
         """
-        self.profiler.disable()
-        if not exc_type: 
-            self.profiler.dump_stats(self.output_file)
+        if self.profiled:
+            self.profiler.disable()
+            self._release()
+            if not exc_type and self.output_file is not None: 
+                self.profiler.dump_stats(self.output_file)
+        profiler_manager_base_exception_handling(self, exc_type)
+        return True
+    
+    
+class MonitoringProfilerManager:
+    """Context manager for profiling processes based on sys.monitoring (see monitoring module).
+    
+    If all tool ids available to sessions are in use, the body runs unprofiled and `profiled` is False.
+    
+    Args:
+        session (MonitoringSession): Collector that is started on enter and stopped on exit.
+    """
+    
+    def __init__(self, session: monitoring.MonitoringSession):
+        self.session = session
+        self.profiled = False
+        
+    def __enter__(self):
+        try:
+            self.session.start()
+        except RuntimeError as e:
+            logger.warning('%s, call runs without sys.monitoring profiling', e)
+            return self
+        self.profiled = True
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.profiled:
+            self.session.stop()
         profiler_manager_base_exception_handling(self, exc_type)
         return True
     
     
 class PeakMemoryProfilerManager:
-    """Context manager for profiling process of  CallGraphTimeProfiler class.
+    """Context manager for profiling process of  PeakMemoryProfiler class.
+    
+    Tracing is shared with other profiles through a tracemalloc session, which stops tracing after
+    the last profile and keeps peak of each profile, so nested and concurrent profiles report their own peaks.
     
     Attributes:
         nframes: defines how many frames of traceback to record for each memory allocation.
+        peak_only: If True, only traced memory counters are read and no snapshots are taken.
+        filters: tracemalloc filters applied to snapshots, all traces are kept if empty.
     """
     
-    def __init__(self, nframes: int):
+    def __init__(self, nframes: int, peak_only: bool = False, filters: Sequence[tracemalloc.Filter] = ()):
         self.nframes = nframes
+        self.peak_only = peak_only
+        self.filters = list(filters)
+        
+    def _take_snapshot(self) -> tracemalloc.Snapshot | None:
+        """Takes snapshot of traced memory blocks kept by filters, None in peak only mode."""
+        if self.peak_only:
+            return None
+        snapshot = tracemalloc.take_snapshot()
+        return snapshot.filter_traces(self.filters) if self.filters else snapshot
         
     def __enter__(self) -> 'PeakMemoryProfilerManager':
-        """starts memory allocation tracing and  takes a snapshot of all memory allocations currently being traced."""
-        tracemalloc.start(self.nframes)
-        self.allocation_before = tracemalloc.take_snapshot()
+        """starts tracemalloc session, takes a snapshot of all memory allocations currently being traced and resets peak."""
+        self.session = tracemalloc_sessions.TracemallocSession(self.nframes).start()
+        self.allocation_before = self._take_snapshot()
+        self.session.reset()
+        self.memory_before = self.session.memory_before
         return self
         
     def __exit__(self, exc_type, exc_value,  traceback):
-        """Captures final memory snapshot and handles any exceptions.
+        """Reads traced memory, captures final memory snapshot and handles any exceptions.
 
         Args:
             exc_type: Exception type, if any.
@@ -162,7 +287,9 @@ class PeakMemoryProfilerManager:
         Returns:
             bool: True to suppress exceptions (consider returning False unless intended).
         """
-        self.allocation_after = tracemalloc.take_snapshot()
+        self.current_memory, self.peak_memory = self.session.traced_memory()
+        self.allocation_after = self._take_snapshot()
+        self.session.stop()
         profiler_manager_base_exception_handling(self, exc_type)
         return True
     
@@ -0,0 +1,52 @@
+"""Helpers for profiling coroutines of async def functions."""
+
+from typing import Any, Awaitable, Callable, Generator
+
+
+class TimedAwaitable:
+    """Awaitable wrapper that measures how long the wrapped awaitable actually ran on the event loop.
+
+    Every step of the wrapped awaitable (from resuming it until it suspends again) is timed,
+    time it spends suspended while other tasks run or I/O is pending is not included.
+
+    Args:
+        awaitable (Awaitable): Awaitable to run, usually coroutine of async def function.
+        timer (Callable): Timer used to measure running time.
+
+    Attributes:
+        running_time (int | float): Time spent inside steps of the awaitable.
+    """
+
+    __slots__ = ('awaitable', 'timer', 'running_time')
+
+    def __init__(self, awaitable: Awaitable, timer: Callable):
+        self.awaitable = awaitable
+        self.timer = timer
+        self.running_time = 0
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        iterator = self.awaitable.__await__()
+        timer = self.timer
+        send_value, thrown_exception = None, None
+        while True:
+            step_start = timer()
+            try:
+                if thrown_exception is not None:
+                    yielded = iterator.throw(thrown_exception)
+                else:
+                    yielded = iterator.send(send_value)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self.running_time += timer() - step_start
+            send_value, thrown_exception = None, None
+            try:
+                send_value = yield yielded
+            except GeneratorExit:
+                iterator.close()
+                raise
+            except BaseException as exception:
+                thrown_exception = exception
+
+    def __repr__(self) -> str:
+        return f'TimedAwaitable(awaitable={self.awaitable}, timer={self.timer})'
@@ -0,0 +1,191 @@
+"""Per-line memory increments of selected functions measured by a sys.settrace hook.
+
+Memory is read on line events of traced functions and the change since the previous reading of
+the frame is attributed to the line that was executing, including memory of its callees, like the
+increment column of memory_profiler. Peak of a line is the largest memory above its start seen
+until the line finished, callees included.
+
+Memory is either RSS of the process (see rss_sampling module), which also counts native
+allocations but only changes by whole pages and only shows peaks that last until a reading, or
+size of blocks traced by tracemalloc (see tracemalloc_sessions module), which shows exact peaks
+between readings but only Python allocations. In 'tracemalloc' mode memory allocated by the tracer
+itself on sampled events is excluded, so lines that do not allocate show no increments.
+
+Only the thread that starts the tracer is traced. The hook replaces any previous trace function
+(e.g. of a debugger or coverage) until the tracer stops.
+"""
+
+import sys
+from types import CodeType, FrameType
+
+from Internals import rss_sampling
+from Internals import tracemalloc_sessions
+
+# Entry of a traced frame: stats of the executing line, memory when it started,
+# peak during the line, peak during the frame and line stats of the frame's code.
+_LINE_STATS, _LINE_START, _LINE_PEAK, _FRAME_PEAK, _CODE_LINES = range(5)
+
+
+class LineMemoryTracer:
+    """Traces lines of given code objects and attributes memory changes to them.
+
+    Args:
+        codes (Iterable[CodeType]): Code objects of traced functions.
+        metric (str): 'rss' or 'tracemalloc', source of memory readings.
+        sample_every (int): Memory is read on every n-th event of traced code only, changes are
+            then attributed to the line that was executing when memory was read.
+
+    Raises:
+        ValueError: If metric is unknown or sample_every is not positive.
+    """
+
+    __slots__ = (
+        'codes', 'metric', 'sample_every', '_codes', '_lines', '_stack', '_events',
+        '_previous_trace', '_rss_reader', '_tracemalloc_session', '_memory', '_overhead'
+        )
+
+    def __init__(self, codes=(), metric: str = 'rss', sample_every: int = 1):
+        if metric not in ('rss', 'tracemalloc'):
+            raise ValueError(f"metric has to be 'rss' or 'tracemalloc', got instead: {metric}")
+        if sample_every <= 0:
+            raise ValueError(f'sample_every has to be positive, got instead: {sample_every}')
+        self.codes = list(codes)
+        self.metric = metric
+        self.sample_every = sample_every
+        # Keyed by id of code objects, since hashing a code object hashes its bytecode and constants.
+        self._codes = {id(code): code for code in self.codes}
+        self._lines = {}
+        self._stack = []
+        self._events = 0
+        self._previous_trace = None
+        self._rss_reader = None
+        self._tracemalloc_session = None
+        self._memory = 0
+        self._overhead = 0
+
+    def __repr__(self) -> str:
+        return f'LineMemoryTracer(metric={self.metric}, sample_every={self.sample_every})'
+
+    def _read(self) -> tuple[int, int]:
+        """Returns current memory and peak since the previous reading in bytes, memory of the tracer excluded."""
+        if self._rss_reader is not None:
+            rss = self._rss_reader.read()
+            return rss, rss
+        current_memory, peak_memory = self._tracemalloc_session.checkpoint()
+        self._memory = current_memory - self._overhead
+        return self._memory, peak_memory - self._overhead
+
+    def _exclude_tracer_memory(self) -> None:
+        """Adds memory allocated and freed by the tracer since the previous reading to its overhead.
+
+        Called at the end of sampled events in 'tracemalloc' mode, so entries of frames, stats of
+        lines and other objects of the tracer do not count into lines. RSS changes by whole pages,
+        objects of the tracer are not distinguishable in it.
+        """
+        if self._tracemalloc_session is not None:
+            self._overhead = self._tracemalloc_session.checkpoint()[0] - self._memory
+
+    def _sampled(self) -> bool:
+        self._events += 1
+        return self._events % self.sample_every == 0
+
+    def _close_line(self, entry: list) -> None:
+        """Reads memory and attributes its change since the start of the executing line to the line."""
+        current_memory, peak_memory = self._read()
+        line_peak = max(entry[_LINE_PEAK], peak_memory)
+        entry[_FRAME_PEAK] = max(entry[_FRAME_PEAK], line_peak)
+        line_stats = entry[_LINE_STATS]
+        if line_stats is not None:
+            line_stats[1] += current_memory - entry[_LINE_START]
+            line_stats[2] = max(line_stats[2], line_peak - entry[_LINE_START])
+        entry[_LINE_START] = entry[_LINE_PEAK] = current_memory
+
+    def _trace(self, frame: FrameType, event: str, arg):
+        """Global trace function, called on calls (and generator resumes) of every function."""
+        if event != 'call' or id(frame.f_code) not in self._codes:
+            return None
+        code_lines = self._lines.setdefault(id(frame.f_code), {})
+        parent = self._stack[-1] if self._stack else None
+        # Frame without a traced parent has no memory to start from, so its call is always read.
+        sampled = self._sampled() or parent is None
+        if sampled:
+            memory, peak_memory = self._read()
+            if parent is not None:
+                parent[_LINE_PEAK] = max(parent[_LINE_PEAK], peak_memory)
+        else:
+            memory = parent[_LINE_START]
+        self._stack.append([None, memory, memory, memory, code_lines])
+        if sampled:
+            self._exclude_tracer_memory()
+        return self._trace_lines
+
+    def _trace_lines(self, frame: FrameType, event: str, arg):
+        """Local trace function of traced frames."""
+        if event == 'line':
+            entry = self._stack[-1]
+            sampled = self._sampled()
+            if sampled:
+                self._close_line(entry)
+            line_stats = entry[_CODE_LINES].get(frame.f_lineno)
+            if line_stats is None:
+                line_stats = entry[_CODE_LINES][frame.f_lineno] = [0, 0, 0]
+            line_stats[0] += 1
+            entry[_LINE_STATS] = line_stats
+            if sampled:
+                self._exclude_tracer_memory()
+        elif event == 'return':
+            entry = self._stack[-1]
+            sampled = self._sampled()
+            if sampled:
+                self._close_line(entry)
+            self._stack.pop()
+            if self._stack:
+                parent = self._stack[-1]
+                parent[_LINE_PEAK] = max(parent[_LINE_PEAK], entry[_FRAME_PEAK])
+            if sampled:
+                self._exclude_tracer_memory()
+        return self._trace_lines
+
+    def start(self) -> 'LineMemoryTracer':
+        """Opens memory source and installs the trace function in the current thread, lines of previous runs are dropped."""
+        self._lines = {}
+        self._events = 0
+        self._overhead = 0
+        if self.metric == 'rss':
+            self._rss_reader = rss_sampling.RssReader()
+        else:
+            self._tracemalloc_session = tracemalloc_sessions.TracemallocSession().start()
+        self._previous_trace = sys.gettrace()
+        sys.settrace(self._trace)
+        return self
+
+    def stop(self) -> None:
+        """Restores previous trace function and closes memory source."""
+        sys.settrace(self._previous_trace)
+        self._previous_trace = None
+        self._stack.clear()
+        if self._rss_reader is not None:
+            self._rss_reader.close()
+            self._rss_reader = None
+        if self._tracemalloc_session is not None:
+            self._tracemalloc_session.stop()
+            self._tracemalloc_session = None
+
+    def lines(self) -> dict[tuple[str, int, str], list[tuple[int, int, int, int]]]:
+        """Returns (lineno, hits, increment, peak increment) of executed lines of each traced function.
+
+        Returns:
+            dict: Lines keyed by (filename, first_lineno, func_name), memory in bytes.
+        """
+        functions_lines = {}
+        for code_id, code_lines in self._lines.items():
+            code: CodeType = self._codes[code_id]
+            key = (code.co_filename, code.co_firstlineno, code.co_name)
+            functions_lines[key] = sorted((lineno, hits, increment, peak) for lineno, (hits, increment, peak) in code_lines.items())
+        return functions_lines
+
+    def __enter__(self) -> 'LineMemoryTracer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
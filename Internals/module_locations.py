@@ -0,0 +1,28 @@
+"""Locations of source files of importable modules and packages, used to restrict profiling to them."""
+
+import importlib.util
+import os
+
+
+def module_paths(modules: list[str]) -> tuple[str, ...]:
+    """Returns path prefixes of files that belong to given modules or packages.
+
+    Args:
+        modules (list[str]): Importable module or package names, e.g. 'json' or 'torch.nn'.
+
+    Returns:
+        tuple[str, ...]: Source file of each module and directory (with trailing separator) of each package.
+
+    Raises:
+        ValueError: If a module can not be found.
+    """
+    paths = []
+    for module in modules:
+        spec = importlib.util.find_spec(module)
+        if spec is None:
+            raise ValueError(f'Module {module} can not be found')
+        if spec.submodule_search_locations:
+            paths.extend(os.path.join(location, '') for location in spec.submodule_search_locations)
+        elif spec.origin:
+            paths.append(spec.origin)
+    return tuple(paths)
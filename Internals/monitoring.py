@@ -0,0 +1,346 @@
+"""Call graph and line timing collectors built on sys.monitoring (PEP 669), available since Python 3.12.
+
+Both collectors subscribe to PY_START globally and decide once per code object whether it is in
+scope: code of out of scope (cold) functions returns sys.monitoring.DISABLE, so the interpreter
+stops reporting it, and only code in scope gets local events (returns, yields, resumes and lines).
+Code outside of selected modules costs a single callback per code location and then runs at full
+speed, while cProfile reports every call of the process. Callbacks run in Python, so each event of
+code in scope costs more than in cProfile; the backend pays off when instrumentation is restricted
+to the modules of interest.
+
+PY_START is reported by every thread, so a session collects events of code in scope from all
+threads that run it while the session is active, not only from the thread that started it; state
+is kept per thread and merged in results.
+
+Collectors produce the raw formats of pstats ({(filename, lineno, func_name): (cc, nc, tt, ct, callers)})
+and line_profiler ({(filename, first_lineno, func_name): [(lineno, hits, time)]}), so results are
+built by the same code as results of cProfile and line_profiler.
+"""
+
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from types import CodeType
+
+MONITORING_AVAILABLE = hasattr(sys, 'monitoring')
+
+# Ids without a purpose assigned by PEP 669. PROFILER_ID (2) is left to cProfile, which fails to
+# enable while another tool holds it, and DEBUGGER_ID, COVERAGE_ID and OPTIMIZER_ID to their tools.
+_TOOL_IDS = (3, 4)
+_TOOL_NAME = 'python_profiling'
+# Tool ids whose previous sessions disabled events of out of scope code locations (except code of
+# this module, which is never in scope), disabled locations stay disabled after the tool id is freed.
+_tool_ids_with_disabled_events = set()
+
+
+def code_key(code: CodeType) -> tuple[str, int, str]:
+    """Returns key of the code object in pstats and line_profiler stats."""
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+class MonitoringSession(ABC):
+    """Claims a sys.monitoring tool id for the duration of a session and keeps per thread state.
+
+    Subclasses define local events of code in scope, callbacks and per thread state. Code in scope
+    is collected from every thread while the session is active (see module docstring).
+
+    Args:
+        codes (Iterable[CodeType]): Code objects that are always in scope.
+        paths (tuple[str, ...] | None): Path prefixes of files in scope, all code is in scope if None.
+
+    Raises:
+        RuntimeError: If sys.monitoring is not available (Python < 3.12).
+    """
+
+    local_events = 0
+
+    def __init__(self, codes=(), paths: tuple[str, ...] | None = None):
+        if not MONITORING_AVAILABLE:
+            raise RuntimeError('sys.monitoring backend requires Python 3.12 or newer')
+        self.codes = set(codes)
+        self.paths = paths
+        self.tool_id = None
+        # Keyed by id of code objects, since hashing a code object hashes its bytecode and constants.
+        self._in_scope = {}
+        self._codes = {}
+        self._local = threading.local()
+        self._thread_states = []
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(tool_id={self.tool_id})'
+
+    @abstractmethod
+    def _new_thread_state(self):
+        """Returns empty state of a thread that reported its first event."""
+
+    def _thread_state(self):
+        """Returns state of the current thread, created on the first event of the thread."""
+        try:
+            return self._local.state
+        except AttributeError:
+            state = self._local.state = self._new_thread_state()
+            with self._lock:
+                self._thread_states.append(state)
+            return state
+
+    @abstractmethod
+    def _callbacks(self) -> dict:
+        """Returns callback by local event."""
+
+    @abstractmethod
+    def _on_start(self, state, code: CodeType, now: int) -> None:
+        """Records start of a call of code in scope in state of the current thread."""
+
+    def _py_start(self, code: CodeType, instruction_offset: int):
+        in_scope = self._in_scope.get(id(code))
+        if in_scope is None:
+            in_scope = code in self.codes or (
+                code.co_filename != __file__ and (self.paths is None or code.co_filename.startswith(self.paths))
+                )
+            # Reference keeps the id from being reused by another code object during the session.
+            self._codes[id(code)] = code
+            self._in_scope[id(code)] = in_scope
+            if in_scope:
+                sys.monitoring.set_local_events(self.tool_id, code, self.local_events)
+        if not in_scope:
+            return sys.monitoring.DISABLE
+        self._on_start(self._thread_state(), code, time.perf_counter_ns())
+
+    def start(self) -> 'MonitoringSession':
+        """Claims a free tool id and starts reporting of events.
+
+        If a previous session of the tool id disabled out of scope code, sys.monitoring.restart_events()
+        enables it again, which also enables events disabled by other tools of the process.
+
+        Raises:
+            RuntimeError: If all tool ids are in use.
+        """
+        monitoring = sys.monitoring
+        for tool_id in _TOOL_IDS:
+            if monitoring.get_tool(tool_id) is None:
+                try:
+                    monitoring.use_tool_id(tool_id, _TOOL_NAME)
+                except ValueError:
+                    continue
+                self.tool_id = tool_id
+                break
+        else:
+            raise RuntimeError('All sys.monitoring tool ids available to profilers are in use')
+        if self.tool_id in _tool_ids_with_disabled_events:
+            # Code locations disabled by a previous session of the same tool id would not be reported.
+            # restart_events() is process-wide, it also enables locations disabled by other tools
+            # (e.g. coverage, debuggers), so it is called only when it is needed.
+            monitoring.restart_events()
+            _tool_ids_with_disabled_events.discard(self.tool_id)
+        monitoring.register_callback(self.tool_id, monitoring.events.PY_START, self._py_start)
+        for event, callback in self._callbacks().items():
+            monitoring.register_callback(self.tool_id, event, callback)
+        monitoring.set_events(self.tool_id, monitoring.events.PY_START | monitoring.events.PY_UNWIND | monitoring.events.PY_THROW)
+        return self
+
+    def stop(self) -> None:
+        """Stops reporting of events and releases the tool id."""
+        if self.tool_id is None:
+            return
+        monitoring = sys.monitoring
+        monitoring.set_events(self.tool_id, 0)
+        for code_id, in_scope in list(self._in_scope.items()):
+            if in_scope:
+                monitoring.set_local_events(self.tool_id, self._codes[code_id], 0)
+        monitoring.register_callback(self.tool_id, monitoring.events.PY_START, None)
+        for event in self._callbacks():
+            monitoring.register_callback(self.tool_id, event, None)
+        if any(not in_scope and self._codes[code_id].co_filename != __file__ for code_id, in_scope in self._in_scope.items()):
+            _tool_ids_with_disabled_events.add(self.tool_id)
+        monitoring.free_tool_id(self.tool_id)
+        self.tool_id = None
+
+    def __enter__(self) -> 'MonitoringSession':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+class CallGraphMonitor(MonitoringSession):
+    """Collects cProfile-like call graph statistics of Python functions.
+
+    Generators and coroutines are treated as cProfile treats them: a yield ends a call and a
+    resume starts a new one. Calls of built-in functions are not reported.
+
+    Args:
+        codes (Iterable[CodeType]): Code objects that are always in scope.
+        paths (tuple[str, ...] | None): Path prefixes of profiled files (see module_locations.module_paths), all Python code if None.
+    """
+
+    def __init__(self, codes=(), paths: tuple[str, ...] | None = None):
+        super().__init__(codes=codes, paths=paths)
+        if MONITORING_AVAILABLE:
+            events = sys.monitoring.events
+            self.local_events = events.PY_RETURN | events.PY_YIELD | events.PY_RESUME
+
+    def _callbacks(self) -> dict:
+        events = sys.monitoring.events
+        return {
+            events.PY_RESUME: self._py_resume,
+            events.PY_THROW: self._py_resume,
+            events.PY_RETURN: self._py_return,
+            events.PY_YIELD: self._py_return,
+            events.PY_UNWIND: self._py_return
+            }
+
+    def _new_thread_state(self):
+        # Stack of [code, start, time of callees], recursion depth by code id and
+        # [cc, nc, tt, ct, {caller code id: [nc, cc, tt, ct]}] by code id.
+        return [], {}, {}
+
+    def _on_start(self, state, code: CodeType, now: int) -> None:
+        stack, depths, _ = state
+        depths[id(code)] = depths.get(id(code), 0) + 1
+        stack.append([code, now, 0])
+
+    def _py_resume(self, code: CodeType, instruction_offset: int, *args) -> None:
+        if self._in_scope.get(id(code)):
+            self._on_start(self._thread_state(), code, time.perf_counter_ns())
+
+    def _py_return(self, code: CodeType, instruction_offset: int, value) -> None:
+        now = time.perf_counter_ns()
+        stack, depths, stats = self._thread_state()
+        if not stack or stack[-1][0] is not code:
+            return
+        _, start, callees_time = stack.pop()
+        elapsed = now - start
+        own_time = elapsed - callees_time
+        caller = id(stack[-1][0]) if stack else None
+        if stack:
+            stack[-1][2] += elapsed
+        code_id = id(code)
+        depths[code_id] -= 1
+        primitive = not depths[code_id]
+        func_stats = stats.get(code_id)
+        if func_stats is None:
+            func_stats = stats[code_id] = [0, 0, 0, 0, {}]
+        func_stats[1] += 1
+        func_stats[2] += own_time
+        if primitive:
+            func_stats[0] += 1
+            func_stats[3] += elapsed
+        edge_stats = func_stats[4].get(caller)
+        if edge_stats is None:
+            edge_stats = func_stats[4][caller] = [0, 0, 0, 0]
+        edge_stats[0] += 1
+        edge_stats[2] += own_time
+        if primitive:
+            edge_stats[1] += 1
+            edge_stats[3] += elapsed
+
+    def stats(self) -> dict:
+        """Returns statistics of all threads in the raw format of pstats, times in seconds."""
+        merged = {}
+        with self._lock:
+            thread_states = list(self._thread_states)
+        for _, _, thread_stats in thread_states:
+            for code_id, (cc, nc, tt, ct, callers) in thread_stats.items():
+                key = code_key(self._codes[code_id])
+                func_stats = merged.setdefault(key, [0, 0, 0.0, 0.0, {}])
+                for index, value in enumerate((cc, nc, tt / 1e9, ct / 1e9)):
+                    func_stats[index] += value
+                for caller, (edge_nc, edge_cc, edge_tt, edge_ct) in callers.items():
+                    if caller is None:
+                        continue
+                    edge_stats = func_stats[4].setdefault(code_key(self._codes[caller]), [0, 0, 0.0, 0.0])
+                    for index, value in enumerate((edge_nc, edge_cc, edge_tt / 1e9, edge_ct / 1e9)):
+                        edge_stats[index] += value
+        return {
+            key: (cc, nc, tt, ct, {caller: tuple(edge_stats) for caller, edge_stats in callers.items()})
+            for key, (cc, nc, tt, ct, callers) in merged.items()
+            }
+
+
+class LineMonitor(MonitoringSession):
+    """Collects line_profiler-like hits and time of each executed line.
+
+    Time of a line lasts until the next line event of the same frame or until the frame returns
+    or yields, so time of calls made by a line is included into it, as in line_profiler.
+
+    Args:
+        codes (Iterable[CodeType]): Code objects of profiled functions.
+        paths (tuple[str, ...]): Path prefixes of files (see module_locations.module_paths) profiled in addition to codes.
+    """
+
+    def __init__(self, codes=(), paths: tuple[str, ...] = ()):
+        super().__init__(codes=codes, paths=paths)
+        if MONITORING_AVAILABLE:
+            events = sys.monitoring.events
+            self.local_events = events.PY_RETURN | events.PY_YIELD | events.PY_RESUME | events.LINE
+
+    def _callbacks(self) -> dict:
+        events = sys.monitoring.events
+        return {
+            events.LINE: self._line,
+            events.PY_RESUME: self._py_resume,
+            events.PY_THROW: self._py_resume,
+            events.PY_RETURN: self._py_return,
+            events.PY_YIELD: self._py_return,
+            events.PY_UNWIND: self._py_return
+            }
+
+    def _new_thread_state(self):
+        # Stack of [code, executed line, start of the line] and [hits, time] by (code id, line).
+        return [], {}
+
+    def _on_start(self, state, code: CodeType, now: int) -> None:
+        state[0].append([code, None, now])
+
+    def _py_resume(self, code: CodeType, instruction_offset: int, *args) -> None:
+        if self._in_scope.get(id(code)):
+            # Execution continues in the line that yielded, the line is not hit again.
+            self._thread_state()[0].append([code, sys._getframe(1).f_lineno, time.perf_counter_ns()])
+
+    def _line(self, code: CodeType, line_number: int) -> None:
+        now = time.perf_counter_ns()
+        stack, timings = self._thread_state()
+        if not stack or stack[-1][0] is not code:
+            return
+        frame = stack[-1]
+        code_id = id(code)
+        if frame[1] is not None:
+            line_timings = timings.get((code_id, frame[1]))
+            if line_timings is None:
+                line_timings = timings[(code_id, frame[1])] = [0, 0]
+            line_timings[1] += now - frame[2]
+        line_timings = timings.get((code_id, line_number))
+        if line_timings is None:
+            line_timings = timings[(code_id, line_number)] = [0, 0]
+        line_timings[0] += 1
+        frame[1] = line_number
+        frame[2] = time.perf_counter_ns()
+
+    def _py_return(self, code: CodeType, instruction_offset: int, value) -> None:
+        now = time.perf_counter_ns()
+        stack, timings = self._thread_state()
+        if not stack or stack[-1][0] is not code:
+            return
+        _, line, start = stack.pop()
+        if line is not None:
+            line_timings = timings.get((id(code), line))
+            if line_timings is None:
+                line_timings = timings[(id(code), line)] = [0, 0]
+            line_timings[1] += now - start
+
+    def timings(self) -> dict:
+        """Returns timings of all threads in the raw format of line_profiler, times in nanoseconds."""
+        merged = {}
+        with self._lock:
+            thread_states = list(self._thread_states)
+        for _, thread_timings in thread_states:
+            for (code_id, line), (hits, line_time) in thread_timings.items():
+                lines = merged.setdefault(code_key(self._codes[code_id]), {})
+                line_hits, total_time = lines.get(line, (0, 0))
+                lines[line] = (line_hits + hits, total_time + line_time)
+        return {
+            key: [(line, hits, line_time) for line, (hits, line_time) in sorted(lines.items()) if hits]
+            for key, lines in merged.items()
+            }
@@ -1,12 +1,18 @@
 """Observers to save profiling results to multiple sources simultaneously."""
 
+import atexit
+import queue
+import threading
+import time
 from typing_extensions import override
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 
 from python_profiling import python_profiling_enums
 from python_profiling import _base_profiling_result
 from python_profiling import python_profiling_configs
+from Internals import serialization
+from Internals.logger import logger
 
 
 class ProfilingObserverI(ABC):
@@ -45,4 +51,130 @@ class ProfilingObserver(ProfilingObserverI):
                 mode=mode, 
                 serializer_strategy=serializer_strategy
                 )
-                
\ No newline at end of file
+
+
+@dataclass
+class AsyncProfilingObserver(ProfilingObserverI):
+    """Observer that hands profiling results to a background thread which stores them in batches.
+    
+    `dump` only puts the result on a bounded queue, so serialization and disk latency stay out of 
+    the profiled call. The queue is flushed and the writer stopped at interpreter exit.
+    
+    Attributes:
+        storages (StorageConfig): Data Transfer Object that contains all configured output destinations.
+        batch_size (int): Maximum amount of results stored in one batch.
+        flush_interval (int | float): Maximum time in seconds a batch waits for more results before it is stored.
+        max_queue_size (int): Capacity of the queue of results waiting to be stored.
+        full_queue_policy (QueueFullPolicy): What `dump` does when the queue is full.
+        dropped_results (int): Amount of results dropped because the queue was full.
+    """
+    storages: python_profiling_configs.StorageConfig
+    batch_size: int = 64
+    flush_interval: int | float = 1.0
+    max_queue_size: int = 1024
+    full_queue_policy: python_profiling_enums.QueueFullPolicy = python_profiling_enums.QueueFullPolicy.DROP_OLDEST
+    dropped_results: int = field(init=False, default=0)
+    
+    def __post_init__(self):
+        """Start background writer and register its shutdown at interpreter exit."""
+        if self.batch_size < 1 or self.max_queue_size < 1 or self.flush_interval <= 0:
+            raise ValueError(
+                f'batch_size, max_queue_size and flush_interval have to be positive, '
+                f'got instead: {self.batch_size, self.max_queue_size, self.flush_interval}'
+                )
+        self._queue = queue.Queue(maxsize=self.max_queue_size)
+        # Guards closing against enqueueing, so no result is queued after the writer stopped.
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._writer = threading.Thread(target=self._write_loop, name='AsyncProfilingObserverWriter', daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+    
+    @override
+    def dump(self, result: _base_profiling_result.BaseProfilingResult) -> None:
+        with self._lock:
+            if not self._closed.is_set():
+                self._enqueue(result)
+                return
+        self._write_batch([result])
+            
+    def _enqueue(self, result: _base_profiling_result.BaseProfilingResult) -> None:
+        """Put result on the queue according to full_queue_policy, called with lock held."""
+        if self.full_queue_policy == python_profiling_enums.QueueFullPolicy.BLOCK:
+            self._queue.put(result)
+            return
+        
+        while True:
+            try:
+                self._queue.put_nowait(result)
+                return
+            except queue.Full:
+                if self.full_queue_policy == python_profiling_enums.QueueFullPolicy.DROP_NEWEST:
+                    self.dropped_results += 1
+                    return
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self.dropped_results += 1
+            except queue.Empty:
+                pass
+            
+    def _next_batch(self) -> list[_base_profiling_result.BaseProfilingResult]:
+        """Wait for the first result, then collect results until batch is full or flush interval passes."""
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                if timeout <= 0 or self._closed.is_set():
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+            
+    def _write_batch(self, batch: list[_base_profiling_result.BaseProfilingResult]) -> None:
+        """Store batch of results to all configured destinations.
+        
+        Files opened in write mode keep only the last written result, so only the last result
+        of the batch is written to them, batched serializers (SQLite) store the whole batch at once.
+        """
+        for serializer_strategy, file_path, mode in zip(self.storages.serializers_strategies, 
+                                                        self.storages.file_paths, 
+                                                        self.storages.modes):
+            try:
+                serialization.SerializationHandler.dump_results(
+                    results=batch,
+                    file_path=file_path, 
+                    mode=mode, 
+                    serializer_strategy=serializer_strategy
+                    )
+            except Exception as e:
+                logger.info('Impossible to store profiling result to %s because of: %s', file_path, str(e))
+        
+    def _write_loop(self) -> None:
+        """Store batches of results until observer is closed and its queue is drained."""
+        while not (self._closed.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if not batch:
+                continue
+            self._write_batch(batch)
+            for _ in batch:
+                self._queue.task_done()
+                
+    def flush(self) -> None:
+        """Block until every result queued so far is stored."""
+        self._queue.join()
+        
+    def close(self) -> None:
+        """Store queued results and stop the background writer, later results are stored synchronously."""
+        with self._lock:
+            if self._closed.is_set():
+                return
+            self._closed.set()
+        self._writer.join()
+        atexit.unregister(self.close)
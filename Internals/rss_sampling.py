@@ -0,0 +1,223 @@
+"""Resident set size (RSS) timeline of the process sampled by a background thread.
+
+On Linux RSS is read from /proc/self/statm through a file descriptor that is opened once, which
+costs under a microsecond per sample, so the sampler keeps up with up to 1 kHz while profiled code
+releases the GIL (see RssSampler for CPU bound Python code). On other systems
+it is read through psutil. Samples are written into preallocated ring buffers: sampling runs without
+a timeout and, once buffers are full, the oldest samples are overwritten, while start, peak and end
+of the whole run are tracked separately.
+
+Profiled code marks phases with mark(label), markers are recorded by all running samplers.
+"""
+
+import os
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+
+import psutil
+
+STATM_PATH = '/proc/self/statm'
+STATM_AVAILABLE = os.path.exists(STATM_PATH)
+MAX_FREQUENCY = 1000
+_MIB = 1024 ** 2
+
+_active_samplers = []
+_active_samplers_lock = threading.Lock()
+
+
+def mark(label: str) -> None:
+    """Records a phase marker into timelines of all running samplers, no-op if none is running.
+
+    Args:
+        label (str): Name of the phase that starts now.
+    """
+    with _active_samplers_lock:
+        samplers = list(_active_samplers)
+    for sampler in samplers:
+        sampler.mark(label)
+
+
+class RssReader:
+    """Reads RSS of the process, from /proc/self/statm if available and through psutil otherwise."""
+
+    __slots__ = ('_statm', '_process', '_page_size')
+
+    def __init__(self):
+        self._statm = os.open(STATM_PATH, os.O_RDONLY) if STATM_AVAILABLE else None
+        self._process = None if STATM_AVAILABLE else psutil.Process()
+        self._page_size = os.sysconf('SC_PAGE_SIZE') if STATM_AVAILABLE else 0
+
+    def read(self) -> int:
+        """Returns current RSS in bytes."""
+        if self._statm is not None:
+            return int(os.pread(self._statm, 64, 0).split()[1]) * self._page_size
+        return self._process.memory_info().rss
+
+    def close(self) -> None:
+        if self._statm is not None:
+            os.close(self._statm)
+            self._statm = None
+
+
+@dataclass
+class MemoryTimeline:
+    """RSS of the process over time, one array element per sample.
+
+    Attributes:
+        times: Seconds since start of sampling of each sample.
+        rss: RSS of each sample in MiB.
+        marker_times: Seconds since start of sampling of each phase marker.
+        marker_labels: Label of each phase marker.
+        dropped: Amount of the oldest samples overwritten in the ring buffer.
+    """
+
+    times: array = field(default_factory=lambda: array('d'))
+    rss: array = field(default_factory=lambda: array('d'))
+    marker_times: array = field(default_factory=lambda: array('d'))
+    marker_labels: list[str] = field(default_factory=list)
+    dropped: int = 0
+
+    def __len__(self) -> int:
+        return len(self.rss)
+
+    def phase_peaks(self) -> dict[str, float]:
+        """Returns peak RSS in MiB of sampled memory between each marker and the next one."""
+        peaks = {}
+        bounds = list(self.marker_times) + [float('inf')]
+        for label, phase_start, phase_end in zip(self.marker_labels, bounds, bounds[1:]):
+            phase_rss = [rss for sample_time, rss in zip(self.times, self.rss) if phase_start <= sample_time < phase_end]
+            if phase_rss:
+                peaks[label] = max(peaks.get(label, 0.0), max(phase_rss))
+        return peaks
+
+    def to_dict(self) -> dict:
+        """Returns timeline with arrays as lists of numbers, ready for JSON/YAML serialization."""
+        return {
+            'times': self.times.tolist(),
+            'rss': self.rss.tolist(),
+            'marker_times': self.marker_times.tolist(),
+            'marker_labels': list(self.marker_labels),
+            'dropped': self.dropped
+            }
+
+    def __str__(self) -> str:
+        duration = self.times[-1] if self.times else 0.0
+        peak = max(self.rss) if self.rss else 0.0
+        return f'MemoryTimeline(samples={len(self)}, duration={duration:.3f} s, peak={peak:.3f} MiB, markers={self.marker_labels})'
+
+
+class RssSampler:
+    """Samples RSS of the process into preallocated ring buffers from a daemon thread.
+
+    The sampling thread needs the GIL, so while profiled code is CPU bound Python, intervals shorter
+    than sys.getswitchinterval() (5 ms by default, about 200 Hz) do not increase the sampling frequency.
+
+    Args:
+        interval (float): Seconds between samples, at least 1 / MAX_FREQUENCY.
+        capacity (int): Amount of samples kept in ring buffers.
+
+    Attributes:
+        start_rss (float): RSS when sampling started in MiB.
+        peak_rss (float): Peak sampled RSS of the whole run in MiB, including overwritten samples.
+        end_rss (float): RSS when sampling stopped in MiB.
+
+    Raises:
+        ValueError: If interval is below 1 / MAX_FREQUENCY or capacity is not positive.
+    """
+
+    __slots__ = (
+        'interval', 'capacity', 'start_rss', 'peak_rss', 'end_rss', '_times', '_rss', '_count',
+        '_marker_times', '_marker_labels', '_start_time', '_stop_event', '_thread', '_reader'
+        )
+
+    def __init__(self, interval: float = 0.001, capacity: int = 65536):
+        if interval < 1 / MAX_FREQUENCY:
+            raise ValueError(f'interval has to be at least {1 / MAX_FREQUENCY} seconds, got instead: {interval}')
+        if capacity <= 0:
+            raise ValueError(f'capacity has to be positive, got instead: {capacity}')
+        self.interval = interval
+        self.capacity = capacity
+        self.start_rss = self.peak_rss = self.end_rss = 0.0
+        self._times = array('d', bytes(8 * capacity))
+        self._rss = array('d', bytes(8 * capacity))
+        self._count = 0
+        self._marker_times = array('d')
+        self._marker_labels = []
+        self._start_time = 0.0
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._reader = None
+
+    def _sample(self) -> None:
+        rss = self._reader.read() / _MIB
+        index = self._count % self.capacity
+        self._times[index] = time.perf_counter() - self._start_time
+        self._rss[index] = rss
+        self._count += 1
+        if rss > self.peak_rss:
+            self.peak_rss = rss
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def mark(self, label: str) -> None:
+        """Records a phase marker at the current time."""
+        self._marker_times.append(time.perf_counter() - self._start_time)
+        self._marker_labels.append(label)
+
+    def start(self) -> 'RssSampler':
+        """Takes the first sample and starts the sampling thread."""
+        self._reader = RssReader()
+        self._start_time = time.perf_counter()
+        self._sample()
+        self.start_rss = self.peak_rss = self._rss[0]
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='RssSampler', daemon=True)
+        with _active_samplers_lock:
+            _active_samplers.append(self)
+        self._thread.start()
+        return self
+
+    def stop(self) -> MemoryTimeline:
+        """Stops the sampling thread, takes the last sample and returns the timeline."""
+        with _active_samplers_lock:
+            if self in _active_samplers:
+                _active_samplers.remove(self)
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+            self._sample()
+            self.end_rss = self._rss[(self._count - 1) % self.capacity]
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        return self.timeline()
+
+    def timeline(self) -> MemoryTimeline:
+        """Returns kept samples in chronological order."""
+        if self._count <= self.capacity:
+            times, rss = self._times[:self._count], self._rss[:self._count]
+        else:
+            oldest = self._count % self.capacity
+            times = self._times[oldest:] + self._times[:oldest]
+            rss = self._rss[oldest:] + self._rss[:oldest]
+        return MemoryTimeline(
+            times=times,
+            rss=rss,
+            marker_times=array('d', self._marker_times),
+            marker_labels=list(self._marker_labels),
+            dropped=max(self._count - self.capacity, 0)
+            )
+
+    def __enter__(self) -> 'RssSampler':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        return f'RssSampler(interval={self.interval}, capacity={self.capacity})'
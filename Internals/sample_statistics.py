@@ -0,0 +1,172 @@
+"""Robust statistics of benchmark samples (e.g. per-repeat execution times)."""
+
+import math
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+BOOTSTRAP_RESAMPLES = 2000
+IQR_OUTLIER_FACTOR = 1.5
+
+
+@dataclass(frozen=True)
+class SampleStatistics:
+    """Summary of benchmark samples.
+
+    Attributes:
+        median: Median of samples.
+        std: Sample standard deviation, 0 for a single sample.
+        mad: Median absolute deviation from the median.
+        outliers: Amount of samples outside of [Q1 - 1.5 * IQR, Q3 + 1.5 * IQR].
+        ci_low: Lower bound of bootstrap confidence interval of the mean, None if not computed.
+        ci_high: Upper bound of bootstrap confidence interval of the mean, None if not computed.
+    """
+
+    median: float
+    std: float
+    mad: float
+    outliers: int
+    ci_low: float | None = None
+    ci_high: float | None = None
+
+
+def iqr_outliers(samples: np.ndarray, factor: float = IQR_OUTLIER_FACTOR) -> np.ndarray:
+    """Returns boolean mask of samples outside of Tukey fences."""
+    first_quartile, third_quartile = np.percentile(samples, [25, 75])
+    iqr = third_quartile - first_quartile
+    return (samples < first_quartile - factor * iqr) | (samples > third_quartile + factor * iqr)
+
+
+def bootstrap_mean_ci(
+    samples: np.ndarray,
+    confidence_level: float = 0.95,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: int | None = None
+    ) -> tuple[float, float]:
+    """Percentile bootstrap confidence interval of the mean.
+
+    All resamples are drawn as one (resamples, len(samples)) index matrix, so the cost is
+    a few NumPy calls regardless of the amount of resamples.
+
+    Args:
+        samples: One dimensional array of samples.
+        confidence_level: Probability mass inside the interval.
+        resamples: Amount of bootstrap resamples.
+        seed: Seed of random generator, for reproducible intervals.
+
+    Returns:
+        tuple[float, float]: Lower and upper bound of the interval.
+    """
+    rng = np.random.default_rng(seed)
+    resampled_means = samples[rng.integers(0, len(samples), size=(resamples, len(samples)))].mean(axis=1)
+    tail = (1 - confidence_level) / 2 * 100
+    ci_low, ci_high = np.percentile(resampled_means, [tail, 100 - tail])
+    return float(ci_low), float(ci_high)
+
+
+def describe(
+    samples: Sequence[float],
+    confidence_level: float = 0.95,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: int | None = None
+    ) -> SampleStatistics:
+    """Computes robust statistics of samples.
+
+    Args:
+        samples: Non empty sequence of samples, array('d') is used without copying.
+        confidence_level: Probability mass inside the bootstrap confidence interval.
+        resamples: Amount of bootstrap resamples, 0 skips the confidence interval.
+        seed: Seed of random generator, for reproducible intervals.
+
+    Returns:
+        SampleStatistics: Summary of samples.
+
+    Raises:
+        ValueError: If samples are empty or confidence_level is not in (0, 1) range.
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    if not samples.size:
+        raise ValueError('Can not describe empty samples')
+    if not 0 < confidence_level < 1:
+        raise ValueError(f'confidence_level has to be in (0, 1) range, got instead: {confidence_level}')
+    median = float(np.median(samples))
+    ci_low, ci_high = None, None
+    if resamples:
+        ci_low, ci_high = bootstrap_mean_ci(samples, confidence_level=confidence_level, resamples=resamples, seed=seed)
+    return SampleStatistics(
+        median=median,
+        std=float(samples.std(ddof=1)) if samples.size > 1 else 0.0,
+        mad=float(np.median(np.abs(samples - median))),
+        outliers=int(iqr_outliers(samples).sum()),
+        ci_low=ci_low,
+        ci_high=ci_high
+        )
+
+
+def mann_whitney_u(first_samples: Sequence[float], second_samples: Sequence[float]) -> tuple[float, float]:
+    """Two-sided Mann-Whitney U test with normal approximation and tie correction.
+
+    Args:
+        first_samples: Non empty sequence of samples.
+        second_samples: Non empty sequence of samples.
+
+    Returns:
+        tuple[float, float]: U statistic of first samples and p-value, U / (n1 * n2) is the
+            probability that a first sample is greater than a second one (ties count half).
+
+    Raises:
+        ValueError: If any of sequences is empty.
+    """
+    first_samples = np.asarray(first_samples, dtype=np.float64)
+    second_samples = np.asarray(second_samples, dtype=np.float64)
+    first_size, second_size = first_samples.size, second_samples.size
+    if not first_size or not second_size:
+        raise ValueError('Can not compare empty samples')
+    pooled_samples = np.concatenate([first_samples, second_samples])
+    _, inverse, counts = np.unique(pooled_samples, return_inverse=True, return_counts=True)
+    # Tied values share the average of ranks they occupy.
+    average_ranks = np.cumsum(counts) - (counts - 1) / 2
+    ranks = average_ranks[inverse]
+    u_statistic = float(ranks[:first_size].sum() - first_size * (first_size + 1) / 2)
+    total_size = first_size + second_size
+    tie_correction = float((counts ** 3 - counts).sum()) / (total_size * (total_size - 1))
+    variance = first_size * second_size / 12 * (total_size + 1 - tie_correction)
+    if variance <= 0:
+        return u_statistic, 1.0
+    # Continuity correction of 0.5 towards the mean.
+    z_score = (abs(u_statistic - first_size * second_size / 2) - 0.5) / math.sqrt(variance)
+    return u_statistic, min(math.erfc(max(z_score, 0.0) / math.sqrt(2)), 1.0)
+
+
+def bootstrap_median_ratio_ci(
+    baseline_samples: Sequence[float],
+    candidate_samples: Sequence[float],
+    confidence_level: float = 0.95,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: int | None = None
+    ) -> tuple[float, float]:
+    """Percentile bootstrap confidence interval of median(candidate) / median(baseline) - 1.
+
+    Args:
+        baseline_samples: Non empty sequence of positive samples.
+        candidate_samples: Non empty sequence of samples.
+        confidence_level: Probability mass inside the interval.
+        resamples: Amount of bootstrap resamples.
+        seed: Seed of random generator, for reproducible intervals.
+
+    Returns:
+        tuple[float, float]: Lower and upper bound of relative change of the median.
+    """
+    baseline_samples = np.asarray(baseline_samples, dtype=np.float64)
+    candidate_samples = np.asarray(candidate_samples, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    baseline_medians = np.median(
+        baseline_samples[rng.integers(0, baseline_samples.size, size=(resamples, baseline_samples.size))], axis=1
+        )
+    candidate_medians = np.median(
+        candidate_samples[rng.integers(0, candidate_samples.size, size=(resamples, candidate_samples.size))], axis=1
+        )
+    tail = (1 - confidence_level) / 2 * 100
+    ci_low, ci_high = np.percentile(candidate_medians / baseline_medians - 1, [tail, 100 - tail])
+    return float(ci_low), float(ci_high)
@@ -0,0 +1,128 @@
+"""Sampling policies that decide which calls of a decorated function get profiled.
+
+Samplers run on every call of a decorated function, so they are plain classes that keep
+their state in slots instead of validated models.
+"""
+
+import itertools
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing_extensions import override
+
+
+class SamplerI(ABC):
+    """Interface for sampling policies used by profiling decorators."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def sample(self) -> float | None:
+        """Decides whether the current call has to be profiled.
+
+        Returns:
+            float | None: Sampling weight of the call (amount of calls it stands for),
+                None if the call has to run without profiling.
+        """
+
+
+class EveryNthSampler(SamplerI):
+    """Profiles every n-th call of the decorated function.
+
+    Args:
+        n (int): Profile one call out of n calls.
+
+    Raises:
+        ValueError: If n is lower than 1.
+    """
+
+    __slots__ = ('n', '_weight', '_calls')
+
+    def __init__(self, n: int = 100):
+        if not isinstance(n, int) or n < 1:
+            raise ValueError(f'n has to be a positive integer, got instead: {n}')
+        self.n = n
+        self._weight = float(n)
+        self._calls = itertools.count()
+
+    @override
+    def sample(self) -> float | None:
+        if next(self._calls) % self.n:
+            return None
+        return self._weight
+
+    def __repr__(self) -> str:
+        return f'EveryNthSampler(n={self.n})'
+
+
+class ProbabilisticSampler(SamplerI):
+    """Profiles each call independently with a fixed probability (Bernoulli sampling).
+
+    Args:
+        rate (float): Probability of profiling a single call.
+
+    Raises:
+        ValueError: If rate is not in (0, 1] range.
+    """
+
+    __slots__ = ('rate', '_weight')
+
+    def __init__(self, rate: float = 0.01):
+        if not isinstance(rate, (int, float)) or not 0 < rate <= 1:
+            raise ValueError(f'rate has to be in (0, 1] range, got instead: {rate}')
+        self.rate = rate
+        self._weight = 1 / rate
+
+    @override
+    def sample(self) -> float | None:
+        if random.random() >= self.rate:
+            return None
+        return self._weight
+
+    def __repr__(self) -> str:
+        return f'ProbabilisticSampler(rate={self.rate})'
+
+
+class TokenBucketSampler(SamplerI):
+    """Profiles at most `rate` calls per second, allowing short bursts of `burst` calls.
+
+    Weight of a sampled call equals to the amount of calls seen since the previous sampled call.
+
+    Args:
+        rate (float): Amount of tokens (profiles) added to the bucket per second.
+        burst (int): Capacity of the bucket, the bucket starts full.
+
+    Raises:
+        ValueError: If rate is not positive or burst is lower than 1.
+    """
+
+    __slots__ = ('rate', 'burst', '_tokens', '_skipped_calls', '_last_refill', '_lock')
+
+    def __init__(self, rate: float = 1.0, burst: int = 1):
+        if not isinstance(rate, (int, float)) or rate <= 0:
+            raise ValueError(f'rate has to be positive, got instead: {rate}')
+        if not isinstance(burst, int) or burst < 1:
+            raise ValueError(f'burst has to be a positive integer, got instead: {burst}')
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._skipped_calls = 0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @override
+    def sample(self) -> float | None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            if self._tokens < 1:
+                self._skipped_calls += 1
+                return None
+            self._tokens -= 1
+            weight, self._skipped_calls = self._skipped_calls + 1, 0
+            return float(weight)
+
+    def __repr__(self) -> str:
+        return f'TokenBucketSampler(rate={self.rate}, burst={self.burst})'
@@ -10,12 +10,32 @@ from typing_extensions import override
 from python_profiling import python_profiling_enums
 from Internals import checks
 from Internals import execution_guards
+from Internals import benchmark_history
 from Internals.logger import logger
 from Internals import serialization
 
 
 class SerializerI(ABC):
-    """Defines common interface for all data serializers."""
+    """Defines common interface for all data serializers.
+    
+    Attributes:
+        batched (bool): If True, `dump` accepts list of prepared results and appends all of them 
+            regardless of file mode.
+    """
+    
+    batched = False
+    
+    @classmethod
+    def prepare(cls, result) -> dict:
+        """Converts profiling result into data this serializer writes.
+        
+        Args:
+            result (BaseProfilingResult): Profiling result to serialize.
+            
+        Returns:
+            dict: Profiling data with all values as strings.
+        """
+        return result.profiling_data_str
     
     @classmethod
     @abstractmethod
@@ -30,7 +50,12 @@ class SerializerI(ABC):
         
         
 class JSONSerializer(SerializerI):
-    """Serialize data in JSON format."""
+    """Serialize data in JSON format, structured values are written as JSON objects."""
+    
+    @classmethod
+    @override
+    def prepare(cls, result) -> dict:
+        return result.profiling_data_structured
     
     @classmethod
     @execution_guards.serialization_handler('.json')
@@ -53,7 +78,12 @@ class TXTSerializer(SerializerI):
                 
                 
 class YAMLSerializer(SerializerI):
-    """Serializes data in YAML format."""
+    """Serializes data in YAML format, structured values are written as YAML mappings."""
+    
+    @classmethod
+    @override
+    def prepare(cls, result) -> dict:
+        return result.profiling_data_structured
     
     @classmethod
     @execution_guards.serialization_handler('.yaml')
@@ -63,6 +93,27 @@ class YAMLSerializer(SerializerI):
             yaml.safe_dump(data, f)    
       
                 
+
+class SQLiteSerializer(SerializerI):
+    """Appends profiling records to SQLite benchmark history, see BenchmarkHistoryStore.
+    
+    History is never truncated, so file mode is ignored.
+    """
+    
+    batched = True
+    
+    @classmethod
+    @override
+    def prepare(cls, result) -> dict:
+        return result.profiling_record
+    
+    @classmethod
+    @execution_guards.serialization_handler('.db')
+    @override
+    def dump(cls, data: dict | list[dict], file_path: str, mode: str):
+        benchmark_history.cached_store(file_path).add(data if isinstance(data, list) else [data])
+      
+                
 class SerializationHandler:
     """Handles registration and execution of serializers for various formats.
     
@@ -73,7 +124,8 @@ class SerializationHandler:
     _avaliable_serializers = {
         python_profiling_enums.SerializerStrategy.JSON: JSONSerializer,
         python_profiling_enums.SerializerStrategy.TXT: TXTSerializer,
-        python_profiling_enums.SerializerStrategy.YAML: YAMLSerializer
+        python_profiling_enums.SerializerStrategy.YAML: YAMLSerializer,
+        python_profiling_enums.SerializerStrategy.SQLITE: SQLiteSerializer
         }  
     
     @classmethod
@@ -148,6 +200,55 @@ class SerializationHandler:
         cls._avaliable_serializers[serializer_strategy].dump(data=data,
                                                              file_path=file_path,
                                                              mode=mode)
-                
-                
-                
\ No newline at end of file
+    
+    @classmethod
+    @checks.ValidateType(('serializer_strategy', python_profiling_enums.SerializerStrategy))
+    def prepare(cls, result, serializer_strategy: python_profiling_enums.SerializerStrategy) -> dict:
+        """Converts profiling result into data the chosen serializer writes.
+        
+        Args:
+            result (BaseProfilingResult): Profiling result to serialize.
+            serializer_strategy (SerializerStrategy): Serializer to prepare data for.
+            
+        Returns:
+            dict: Data to pass to `dump`.
+            
+        Raises:
+            InvalidInputTypeError: If the provided serializer strategy is invalid.
+            MissingArgumentError: If a required argument is missing.
+        """
+        return cls._avaliable_serializers[serializer_strategy].prepare(result)
+    
+    @classmethod
+    @checks.ValidateType(('serializer_strategy', python_profiling_enums.SerializerStrategy))
+    def dump_results(
+        cls, 
+        results: list, 
+        file_path: str,
+        mode: str = 'w', 
+        serializer_strategy: python_profiling_enums.SerializerStrategy = python_profiling_enums.SerializerStrategy.TXT
+        ) -> None:
+        """Serializes batch of profiling results to a file using the chosen serialization strategy.
+        
+        Batched serializers write the whole batch at once, files of other serializers opened 
+        in write mode keep only the last written result, so only the last result is written to them.
+        
+        Args:
+            results (list[BaseProfilingResult]): Profiling results to serialize.
+            file_path (str): Output file path.
+            mode (str):  File mode, default is 'w' (write).
+            serializer_strategy (SerializerStrategy): Serializer to perform serializaton.
+            
+        Returns:
+            None
+            
+        Raises:
+            InvalidInputTypeError: If the provided serializer strategy is invalid.
+            MissingArgumentError: If a required argument is missing.
+        """
+        serializer = cls._avaliable_serializers[serializer_strategy]
+        if serializer.batched:
+            serializer.dump(data=[serializer.prepare(result) for result in results], file_path=file_path, mode=mode)
+            return
+        for result in results if not mode.startswith('w') else results[-1:]:
+            serializer.dump(data=serializer.prepare(result), file_path=file_path, mode=mode)
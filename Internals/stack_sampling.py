@@ -0,0 +1,233 @@
+"""Statistical stack sampling: a compact trie of sampled stacks and samplers that fill it.
+
+Sampling runs on a fixed frequency no matter how many calls the profiled code makes, so its
+overhead is bounded by the cost of a single stack walk times the sampling frequency.
+"""
+
+import os
+import signal
+import sys
+import threading
+import time
+from array import array
+from types import FrameType
+
+# Frame key: filename, first line of the function, function name and currently executed line.
+FrameKey = tuple[str, int, str, int]
+
+
+class StackTrie:
+    """Prefix tree of sampled stacks with sample counts.
+
+    Nodes are stored in parallel arrays (parent node, frame id, samples ending in the node),
+    frames are interned once, so memory grows with the amount of distinct stacks, not samples.
+    Node 0 is the root and has no frame.
+    """
+
+    __slots__ = ('frames', '_frame_ids', '_parents', '_frame_indexes', '_counts', '_children', '_lock')
+
+    def __init__(self):
+        self.frames: list[FrameKey] = []
+        self._frame_ids = {}
+        self._parents = array('q', [-1])
+        self._frame_indexes = array('q', [-1])
+        self._counts = array('q', [0])
+        self._children = {}
+        # Reentrant, since in signal mode samples are added by a handler that interrupts the main thread.
+        self._lock = threading.RLock()
+
+    @property
+    def samples(self) -> int:
+        """Returns amount of recorded samples."""
+        return sum(self._counts)
+
+    def __len__(self) -> int:
+        """Returns amount of nodes without the root."""
+        return len(self._parents) - 1
+
+    def add(self, frames: list[FrameKey], count: int = 1) -> None:
+        """Records a sampled stack.
+
+        Args:
+            frames (list[FrameKey]): Frames of the stack, root first.
+            count (int): Amount of samples the stack stands for.
+        """
+        with self._lock:
+            node = 0
+            for frame in frames:
+                frame_id = self._frame_ids.get(frame)
+                if frame_id is None:
+                    frame_id = self._frame_ids[frame] = len(self.frames)
+                    self.frames.append(frame)
+                child = self._children.get((node, frame_id))
+                if child is None:
+                    child = self._children[(node, frame_id)] = len(self._parents)
+                    self._parents.append(node)
+                    self._frame_indexes.append(frame_id)
+                    self._counts.append(0)
+                node = child
+            self._counts[node] += count
+
+    def _leaf_stacks(self):
+        """Yields frame ids (leaf first) and amount of samples of every stack with samples."""
+        for node, count in enumerate(self._counts):
+            if not count:
+                continue
+            frame_ids = []
+            while node > 0:
+                frame_ids.append(self._frame_indexes[node])
+                node = self._parents[node]
+            yield frame_ids, count
+
+    def stacks(self) -> dict[tuple[FrameKey, ...], int]:
+        """Returns amount of samples of every sampled stack (frames root first).
+
+        Stacks are rendered as flame graphs through flame_graph.collapsed_stacks_from_samples.
+        """
+        with self._lock:
+            return {
+                tuple(self.frames[frame_id] for frame_id in reversed(frame_ids)): count
+                for frame_ids, count in self._leaf_stacks()
+                }
+
+    def _shares(self, key) -> list[tuple[tuple, float, float]]:
+        """Returns inclusive and exclusive share of samples grouped by key of frames, largest inclusive first."""
+        inclusive, exclusive = {}, {}
+        with self._lock:
+            total = sum(self._counts)
+            for frame_ids, count in self._leaf_stacks():
+                keys = {key(self.frames[frame_id]) for frame_id in frame_ids}
+                for frame_key in keys:
+                    inclusive[frame_key] = inclusive.get(frame_key, 0) + count
+                leaf_key = key(self.frames[frame_ids[0]]) if frame_ids else None
+                if leaf_key is not None:
+                    exclusive[leaf_key] = exclusive.get(leaf_key, 0) + count
+        if not total:
+            return []
+        return sorted(
+            ((frame_key, samples / total, exclusive.get(frame_key, 0) / total) for frame_key, samples in inclusive.items()),
+            key=lambda share: (-share[1], -share[2])
+            )
+
+    def function_shares(self) -> list[tuple[tuple[str, int, str], float, float]]:
+        """Returns (filename, first line, function name), inclusive and exclusive share of samples per function.
+
+        Inclusive share counts samples where the function is anywhere on the stack (once per sample),
+        exclusive share counts samples where the function was executing itself.
+        """
+        return self._shares(lambda frame: frame[:3])
+
+    def line_shares(self) -> list[tuple[tuple[str, int, str, int], float, float]]:
+        """Returns frame key, inclusive and exclusive share of samples per executed line."""
+        return self._shares(lambda frame: frame)
+
+    def to_dict(self) -> dict:
+        """Returns trie arrays and interned frames, ready for JSON/YAML serialization."""
+        with self._lock:
+            return {
+                'frames': [list(frame) for frame in self.frames],
+                'parents': self._parents.tolist(),
+                'frame_indexes': self._frame_indexes.tolist(),
+                'counts': self._counts.tolist()
+                }
+
+    def __repr__(self) -> str:
+        return f'StackTrie(samples={self.samples}, nodes={len(self)})'
+
+
+def walk_stack(frame: FrameType | None, max_depth: int = 256) -> list[FrameKey]:
+    """Returns keys of the frame and its callers, root first."""
+    frames = []
+    while frame is not None and len(frames) < max_depth:
+        code = frame.f_code
+        frames.append((code.co_filename, code.co_firstlineno, code.co_name, frame.f_lineno))
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+class StackSampler:
+    """Samples stacks of running threads into a StackTrie at a fixed interval.
+
+    In 'thread' mode a daemon thread wakes up every interval and walks stacks of all threads
+    (or of given thread ids) through sys._current_frames. In 'signal' mode ITIMER_PROF delivers
+    SIGPROF every interval of consumed CPU time and the stack of the main thread is walked in
+    the signal handler, so idle waiting is not sampled; it is available on Unix main thread only.
+
+    Args:
+        interval (float): Seconds between samples.
+        mode (str): 'thread' or 'signal'.
+        thread_ids (set[int] | None): Threads to sample in 'thread' mode, all threads if None.
+        max_depth (int): Maximum amount of frames of a sampled stack.
+
+    Raises:
+        ValueError: If interval is not positive, mode is unknown or signal mode is not available.
+    """
+
+    __slots__ = (
+        'interval', 'mode', 'thread_ids', 'max_depth', 'trie', 'sampling_time',
+        '_stop_event', '_thread', '_previous_handler'
+        )
+
+    def __init__(self, interval: float = 0.005, mode: str = 'thread', thread_ids: set[int] | None = None, max_depth: int = 256):
+        if interval <= 0:
+            raise ValueError(f'interval has to be positive, got instead: {interval}')
+        if mode not in ('thread', 'signal'):
+            raise ValueError(f"mode has to be 'thread' or 'signal', got instead: {mode}")
+        if mode == 'signal' and (os.name != 'posix' or threading.current_thread() is not threading.main_thread()):
+            raise ValueError('signal mode is available on Unix main thread only')
+        self.interval = interval
+        self.mode = mode
+        self.thread_ids = thread_ids
+        self.max_depth = max_depth
+        self.trie = StackTrie()
+        self.sampling_time = 0.0
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._previous_handler = None
+
+    def _sample_threads(self) -> None:
+        sampler_thread_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            sampling_start = time.perf_counter()
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == sampler_thread_id or (self.thread_ids is not None and thread_id not in self.thread_ids):
+                    continue
+                self.trie.add(walk_stack(frame, self.max_depth))
+            self.sampling_time += time.perf_counter() - sampling_start
+
+    def _sample_signal(self, signum, frame) -> None:
+        sampling_start = time.perf_counter()
+        self.trie.add(walk_stack(frame, self.max_depth))
+        self.sampling_time += time.perf_counter() - sampling_start
+
+    def start(self) -> 'StackSampler':
+        """Starts sampling."""
+        self._stop_event.clear()
+        if self.mode == 'signal':
+            self._previous_handler = signal.signal(signal.SIGPROF, self._sample_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            self._thread = threading.Thread(target=self._sample_threads, name='StackSampler', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> StackTrie:
+        """Stops sampling and returns sampled stacks."""
+        if self.mode == 'signal':
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        elif self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        return self.trie
+
+    def __enter__(self) -> 'StackSampler':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        return f'StackSampler(interval={self.interval}, mode={self.mode})'
@@ -0,0 +1,175 @@
+"""Reference counted sessions of process-wide tracemalloc tracing.
+
+tracemalloc has a single tracing state, traceback limit and peak per process. Sessions share it:
+the first session starts tracing, the last one stops it unless tracing was already on before the
+first session started, so the previous state is restored and tracing does not slow down allocations
+of the process after profiling.
+
+The traceback limit can not be changed without restarting tracing, which drops traces that active
+sessions rely on. Tracing is started with the limit requested by the session that starts it, later
+sessions get the running limit (a warning is logged if they requested more frames) and report it in
+their nframes attribute.
+
+The peak of traced memory is reset whenever a session (re)starts measuring. Before each reset the
+peak is folded into every active session, since the interval since the previous reset lies within
+each of them, so overlapping sessions get their own peaks.
+"""
+
+import threading
+import tracemalloc
+
+from Internals.logger import logger
+
+
+def _warn_downgraded(session: 'TracemallocSession'):
+    """Logs that session gets fewer frames than requested.
+
+    Logged from a separate function, so objects created by logging (e.g. frame of the caller) are
+    released before the measurement of the session starts.
+    """
+    logger.warning(
+        'tracemalloc is already tracing with %s frames, session requested %s frames and gets the running limit',
+        session.nframes, session.requested_nframes
+        )
+
+
+class TracemallocSessions:
+    """Shared state of all tracemalloc sessions of the process, see module docstring.
+
+    Attributes:
+        active (list[TracemallocSession]): Sessions that are started and not stopped yet.
+        owns_tracing (bool): True if tracing was started by the first of active sessions.
+    """
+
+    def __init__(self):
+        self.active = []
+        self.owns_tracing = False
+        self._lock = threading.Lock()
+
+    def _fold_peak(self) -> int:
+        """Folds peak since the last reset into active sessions, returns current traced size."""
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+        for session in self.active:
+            session.peak_memory = max(session.peak_memory, peak_memory)
+        return current_memory
+
+    def _reset(self, session: 'TracemallocSession'):
+        session.memory_before = self._fold_peak()
+        session.peak_memory = session.memory_before
+        tracemalloc.reset_peak()
+
+    def start(self, session: 'TracemallocSession'):
+        """Starts tracing if it is off, registers the session and starts its measurement."""
+        with self._lock:
+            if not self.active:
+                self.owns_tracing = not tracemalloc.is_tracing()
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(session.requested_nframes)
+            session.nframes = tracemalloc.get_traceback_limit()
+            if session.nframes < session.requested_nframes:
+                _warn_downgraded(session)
+            self.active.append(session)
+            self._reset(session)
+
+    def reset(self, session: 'TracemallocSession'):
+        """Restarts measurement of the session, peaks of other sessions are kept."""
+        with self._lock:
+            self._reset(session)
+
+    def traced_memory(self, session: 'TracemallocSession') -> tuple[int, int]:
+        """Returns current traced size and peak of the session so far."""
+        with self._lock:
+            return self._fold_peak(), session.peak_memory
+
+    def checkpoint(self) -> tuple[int, int]:
+        """Returns current traced size and peak since the previous reset, then resets peak."""
+        with self._lock:
+            current_memory, peak_memory = tracemalloc.get_traced_memory()
+            for session in self.active:
+                session.peak_memory = max(session.peak_memory, peak_memory)
+            tracemalloc.reset_peak()
+            return current_memory, peak_memory
+
+    def stop(self, session: 'TracemallocSession') -> tuple[int, int]:
+        """Unregisters the session, stops tracing after the last session if it was started by sessions.
+
+        Returns:
+            tuple[int, int]: Traced size at stop and peak of the session.
+        """
+        with self._lock:
+            current_memory = self._fold_peak()
+            self.active.remove(session)
+            if not self.active and self.owns_tracing:
+                tracemalloc.stop()
+                self.owns_tracing = False
+            return current_memory, session.peak_memory
+
+
+SESSIONS = TracemallocSessions()
+
+
+class TracemallocSession:
+    """Single user of process-wide tracemalloc tracing, usable as a context manager.
+
+    Args:
+        nframes (int): Requested number of frames stored in traceback of each trace.
+        sessions (TracemallocSessions | None): Shared state, process-wide SESSIONS if None.
+
+    Attributes:
+        nframes (int): Traceback limit tracing runs with, may differ from requested one.
+        memory_before (int): Traced size when the measurement started, in bytes.
+        peak_memory (int): Peak traced size during the session so far (folded on resets), in bytes.
+        current_memory (int): Traced size when the session stopped, in bytes.
+
+    Raises:
+        ValueError: If nframes is less than 1.
+    """
+
+    def __init__(self, nframes: int = 1, sessions: TracemallocSessions | None = None):
+        if nframes < 1:
+            raise ValueError('nframes must be at least 1')
+        self.requested_nframes = nframes
+        self.sessions = sessions if sessions is not None else SESSIONS
+        self.nframes = None
+        self.memory_before = 0
+        self.peak_memory = 0
+        self.current_memory = 0
+
+    def __repr__(self) -> str:
+        return f'TracemallocSession(nframes={self.nframes}, peak_memory={self.peak_memory})'
+
+    def start(self) -> 'TracemallocSession':
+        self.sessions.start(self)
+        return self
+
+    def reset(self):
+        """Restarts measurement, e.g. after taking a snapshot that should not count into the peak."""
+        self.sessions.reset(self)
+
+    def traced_memory(self) -> tuple[int, int]:
+        """Returns current traced size and peak of the session so far."""
+        return self.sessions.traced_memory(self)
+
+    def checkpoint(self) -> tuple[int, int]:
+        """Returns current traced size and peak since the previous checkpoint or reset of any session.
+
+        Peak is reset after reading and kept by all active sessions, e.g. to measure peaks of
+        consecutive intervals within the session.
+        """
+        return self.sessions.checkpoint()
+
+    def stop(self) -> tuple[int, int]:
+        """Stops the session, returns traced size at stop and peak of the session."""
+        self.current_memory, self.peak_memory = self.sessions.stop(self)
+        return self.current_memory, self.peak_memory
+
+    @property
+    def peak_increase(self) -> int:
+        """Peak traced size above the size when the measurement started."""
+        return self.peak_memory - self.memory_before
+
+    def __enter__(self) -> 'TracemallocSession':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
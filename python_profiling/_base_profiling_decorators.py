@@ -2,14 +2,61 @@
 
 from typing import Callable
 import functools
+import inspect
+import math
+import threading
+import time
 
 from python_profiling import python_profiling_configs
 from Internals import checks
 from Internals import observers
+from Internals import samplers
+
+
+class SnapshotSchedule:
+    """Tracks when aggregating decorators have to emit accumulated profiling state.
+    
+    Args:
+        interval (int | float | None): Seconds between snapshots, None disables periodic snapshots.
+    """
+    
+    def __init__(self, interval: int | float | None = None):
+        self.interval = interval
+        self._next_snapshot = time.monotonic() + interval if interval else math.inf
+        self._lock = threading.Lock()
+        
+    def due(self) -> bool:
+        """Returns True once per elapsed interval, so only one caller emits the snapshot."""
+        if time.monotonic() < self._next_snapshot:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_snapshot:
+                return False
+            self._next_snapshot = now + self.interval
+            return True
+        
+    def __repr__(self) -> str:
+        return f'SnapshotSchedule(interval={self.interval})'
+
+
+def sampled_return_value(result):
+    """Returns value that sampled and aggregating wrappers return for a profiled call.
+
+    Wrappers with a sampler or in aggregating mode are transparent: every call returns the value
+    of the decorated function, whether it was profiled or not, and profiling results only reach
+    the observer. Value is None if the call raised, like results of all profilers.
+    """
+    return getattr(result, 'func_result', None)
 
 
 class BaseProfilingDecorator:
-    """Provides shared functionality for all profiling decorators."""
+    """Provides shared functionality for all profiling decorators.
+    
+    Without a sampler a decorated function returns the profiling result of each call. With a
+    sampler (and in aggregating modes of decorators) it returns the value of the function for
+    every call, sampled or not, and profiling results are only passed to the observer.
+    """
     
     @checks.ValidateType(
         [
@@ -26,36 +73,126 @@ class BaseProfilingDecorator:
         
         Args:
             storages: Instance of StorageConfig.
-            observer: Class that implements ProfilingObserverI interface.
+            observer: Class that implements ProfilingObserverI interface, initialized with storages,
+                or its instance, used as is (storages are ignored then).
         
         Raises:
             InvalidInputType: If storages or observer of incorrect type.
         """
-        self.observer = observer(storages=storages)
+        self.observer = observer(storages=storages) if inspect.isclass(observer) else observer
     
     @staticmethod
-    def base_profiling__call__(func: Callable, profiling_func: Callable, observing_func: Callable):
+    def base_profiling__call__(
+        func: Callable, 
+        profiling_func: Callable, 
+        observing_func: Callable,
+        sampler: samplers.SamplerI | None = None,
+        async_profiling_func: Callable | None = None
+        ):
         """Decorator for profiling and storing profiling results.
         
         Args:
             func (Callable): The original function to decorate.
             profiling_func (Callable): A profiling function that wraps the target function.
-             observing_func (Callable): A function that handles storing of profiling result.
+            observing_func (Callable): A function that handles storing of profiling result.
+            sampler (SamplerI | None): Sampling policy that decides which calls are profiled,
+                if None every call is profiled.
+            async_profiling_func (Callable | None): A profiling coroutine function used when 
+                the target function is an async def function.
              
         Returns:
-            Callable: A wrapped function that runs profiling and stores the result.
+            Callable: A wrapped function that runs profiling and stores the result, 
+                async def function if the target function is one.
+                
+        Raises:
+            TypeError: If the target is an async def function and no async_profiling_func is provided.
         """
+        if inspect.iscoroutinefunction(func):
+            if async_profiling_func is None:
+                raise TypeError(f'{profiling_func} can not profile async def function {func.__qualname__}')
+            return BaseProfilingDecorator.base_async_profiling__call__(
+                func=func,
+                async_profiling_func=async_profiling_func,
+                observing_func=observing_func,
+                sampler=sampler
+                )
+        
+        if sampler is None:
+            @functools.wraps(func)
+            def wrapper(**kwargs) -> Callable:
+                """Profile provided function and stores profiling result.
+                
+                Args:
+                **kwargs: Keyword arguments to pass to the function.
+                
+                Returns:
+                    object: Structured profiling result returned by the profiling function.
+                """
+                result = profiling_func(func=func, **kwargs)
+                observing_func(result)
+                return result
+            return wrapper
+        
         @functools.wraps(func)
-        def wrapper(**kwargs) -> Callable:
-            """Profile provided function and stores profiling result.
+        def sampled_wrapper(**kwargs) -> Callable:
+            """Profile sampled calls of provided function, run the rest without profiling.
             
             Args:
             **kwargs: Keyword arguments to pass to the function.
             
             Returns:
-                object: Structured profiling result returned by the profiling function.
+                object: Function result for every call, None if a sampled call raised. Profiling
+                    results of sampled calls are extended with `sampling_weight` context and
+                    passed to the observer.
             """
+            sampling_weight = sampler.sample()
+            if sampling_weight is None:
+                return func(**kwargs)
             result = profiling_func(func=func, **kwargs)
+            result.add_context(context={'sampling_weight': sampling_weight})
+            observing_func(result)
+            return sampled_return_value(result)
+        return sampled_wrapper
+    
+    @staticmethod
+    def base_async_profiling__call__(
+        func: Callable, 
+        async_profiling_func: Callable, 
+        observing_func: Callable,
+        sampler: samplers.SamplerI | None = None
+        ):
+        """Decorator for profiling async def functions and storing profiling results.
+        
+        Args:
+            func (Callable): The original async def function to decorate.
+            async_profiling_func (Callable): A profiling coroutine function that awaits the target function.
+            observing_func (Callable): A function that handles storing of profiling result.
+            sampler (SamplerI | None): Sampling policy that decides which calls are profiled,
+                if None every call is profiled.
+             
+        Returns:
+            Callable: A wrapped async def function that runs profiling and stores the result.
+        """
+        @functools.wraps(func)
+        async def wrapper(**kwargs) -> Callable:
+            """Profile provided coroutine function and stores profiling result.
+            
+            Args:
+            **kwargs: Keyword arguments to pass to the function.
+            
+            Returns:
+                object: Structured profiling result without a sampler, function result for every
+                    call with one (see sampled_wrapper of base_profiling__call__).
+            """
+            if sampler is None:
+                result = await async_profiling_func(func=func, **kwargs)
+                observing_func(result)
+                return result
+            sampling_weight = sampler.sample()
+            if sampling_weight is None:
+                return await func(**kwargs)
+            result = await async_profiling_func(func=func, **kwargs)
+            result.add_context(context={'sampling_weight': sampling_weight})
             observing_func(result)
-            return result
-        return wrapper
\ No newline at end of file
+            return sampled_return_value(result)
+        return wrapper
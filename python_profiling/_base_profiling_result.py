@@ -1,5 +1,11 @@
 """Functionality that is common accross all profiling result (time, memory, call graph)."""
 
+import functools
+import hashlib
+import inspect
+import math
+import platform
+import time
 from typing import Any
 
 
@@ -9,19 +15,82 @@ from Internals import checks
 from Internals.logger import logger
 
 
+@functools.lru_cache(maxsize=1024)
+def _source_hash(profiled_func, func_qualname: str) -> str:
+    """Returns sha256 of source of the function, cached since reading source opens its file."""
+    try:
+        source = inspect.getsource(profiled_func).encode()
+    except (OSError, TypeError):
+        source = getattr(getattr(profiled_func, '__code__', None), 'co_code', func_qualname.encode())
+    return hashlib.sha256(source).hexdigest()
+
+
 class BaseProfilingResult:
     """Defines functionality that is common across all profiling results."""
     
+    def __new__(cls, *args, **kwargs):
+        """Stamps the time the result is created at, i.e. right after the profiled call."""
+        instance = super().__new__(cls)
+        instance._created_at = time.time()
+        return instance
+    
     @property
     def profiling_data(self):
-        """Returns profiling data as a dictionary."""
-        return self.__dict__
+        """Returns profiling data as a dictionary, private attributes excluded."""
+        return {key: value for key, value in self.__dict__.items() if not key.startswith('_')}
     
     @property
     def profiling_data_str(self):
         """Returns profiling data with all values as strings."""
         return {key: f'{value}' for key, value in self.profiling_data.items()}
     
+    @property
+    def profiling_data_structured(self):
+        """Returns profiling data with structured values (having `to_dict`) as dictionaries of plain
+        numbers and strings, and all other values as strings."""
+        def structure(value):
+            if hasattr(value, 'to_dict'):
+                return value.to_dict()
+            if isinstance(value, list) and value and all(hasattr(element, 'to_dict') for element in value):
+                return [element.to_dict() for element in value]
+            return f'{value}'
+        return {key: structure(value) for key, value in self.profiling_data.items()}
+    
+    @property
+    def profiling_record(self) -> dict:
+        """Returns profiling data with metadata that identifies the profiled code and environment.
+        
+        Record contains qualified name and source hash of profiled function, fingerprint of its 
+        keyword arguments, host information, timestamp of creation of the result (not of the
+        serialization, which may be delayed by asynchronous observers), numeric fields of the result as `metrics` 
+        and stringified profiling data as `data`.
+        """
+        profiled_func = self.profiling_data.get('profiled_func')
+        func_kwargs = self.profiling_data.get('func_kwargs')
+        func_qualname, source_hash = None, None
+        if profiled_func is not None:
+            func_qualname = f"{getattr(profiled_func, '__module__', None)}.{getattr(profiled_func, '__qualname__', profiled_func)}"
+            source_hash = _source_hash(profiled_func, func_qualname)
+        kwargs_fingerprint = None
+        if isinstance(func_kwargs, dict):
+            kwargs_repr = repr(sorted((key, type(value).__name__, repr(value)) for key, value in func_kwargs.items()))
+            kwargs_fingerprint = hashlib.sha256(kwargs_repr.encode()).hexdigest()
+        return {
+            'result_type': type(self).__name__,
+            'func_qualname': func_qualname,
+            'source_hash': source_hash,
+            'kwargs_fingerprint': kwargs_fingerprint,
+            'host': platform.node(),
+            'platform': platform.platform(),
+            'python_version': platform.python_version(),
+            'timestamp': self._created_at,
+            'metrics': {
+                key: float(value) for key, value in self.profiling_data.items()
+                if isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+                },
+            'data': self.profiling_data_str
+            }
+    
     @checks.ValidateType(('context', dict))
     def add_context(self, context: dict) -> None:
         """Adds additional metadata to profiling result.
@@ -69,7 +138,10 @@ class BaseProfilingResult:
             MissingArgumentError: If a required argument is missing.
         """
         
-        serialization.SerializationHandler.dump(data=self.profiling_data_str,
+        serialization.SerializationHandler.dump(data=serialization.SerializationHandler.prepare(
+                                                    result=self, 
+                                                    serializer_strategy=serializer_strategy
+                                                    ),
                                                 file_path=file_path,
                                                 mode=mode,
                                                 serializer_strategy=serializer_strategy)
\ No newline at end of file
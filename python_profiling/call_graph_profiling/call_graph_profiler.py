@@ -15,7 +15,8 @@ class CallGraphProfilerI(ABC):
     """Interface for call graph profilers using different visualization strategies."""
     _avaliable_visualizers = {
         python_profiling_enums.CallGraphVisualizers.GPROF2DOT: call_graph_visualization.Gprof2dotVisualizer,
-        python_profiling_enums.CallGraphVisualizers.SNAKEVIZ: call_graph_visualization.SnakevizVisualizer
+        python_profiling_enums.CallGraphVisualizers.SNAKEVIZ: call_graph_visualization.SnakevizVisualizer,
+        python_profiling_enums.CallGraphVisualizers.FLAME_GRAPH: call_graph_visualization.FlameGraphVisualizer
         }
     
     def __init__(
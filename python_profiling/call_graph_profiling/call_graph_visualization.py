@@ -5,6 +5,10 @@ import os
 import subprocess
 from typing_extensions import override
 
+import pstats
+
+from python_profiling.call_graph_profiling import flame_graph
+from python_profiling.time_profiling import call_graph_stats
 from Internals import checks
 from Internals.logger import logger
 
@@ -40,4 +44,26 @@ class SnakevizVisualizer(CallGraphVisualizerI):
     @override
     def visualize(output_file):
         subprocess.run(f"snakeviz {output_file}", shell=True)
-        logger.info('Visualization done successfuly.')
\ No newline at end of file
+        logger.info('Visualization done successfuly.')
+        
+class FlameGraphVisualizer(CallGraphVisualizerI):
+    """Renders flame graph in process, without external binaries.
+    
+    Next to the .prof file writes collapsed stacks (.folded) and interactive flame graph (.svg).
+    """
+    
+    @staticmethod
+    @checks.ValidateType(('output_file', str))
+    @override
+    def visualize(output_file):
+        if not os.path.exists(output_file):
+            logger.warning('Output file %s does not exist, flame graph is not rendered.', output_file)
+            return
+        stats = call_graph_stats.CallGraphStats.from_stats(pstats.Stats(output_file))
+        stacks = flame_graph.collapsed_stacks_from_stats(stats)
+        file_name = os.path.splitext(output_file)[0]
+        with open(f'{file_name}.folded', 'w') as f:
+            f.write(flame_graph.format_collapsed(stacks))
+        with open(f'{file_name}.svg', 'w') as f:
+            f.write(flame_graph.render_svg(stacks, title=os.path.basename(file_name)))
+        logger.info('Visualization done successfuly.')
@@ -0,0 +1,313 @@
+"""In-process flame graphs: collapsed stacks from cProfile stats or sampled stacks and their SVG rendering."""
+
+import bisect
+import html
+import itertools
+import os
+from typing import Iterable
+
+from python_profiling.time_profiling import call_graph_stats
+
+FRAME_HEIGHT = 16
+FONT_SIZE = 11
+CHAR_WIDTH = 6.5
+
+# Click on a frame zooms into it, click on the title (or on an ancestor frame) zooms out,
+# WIDTH and CHAR_WIDTH are declared by render_svg.
+_SVG_SCRIPT = """
+var frames = document.querySelectorAll('g.frame');
+function zoom(target) {
+  var x0 = +target.getAttribute('data-x'), w0 = +target.getAttribute('data-w'), y0 = +target.getAttribute('data-y');
+  var scale = WIDTH / w0;
+  frames.forEach(function (frame) {
+    var x = +frame.getAttribute('data-x'), w = +frame.getAttribute('data-w'), y = +frame.getAttribute('data-y');
+    var inside = y <= y0 && x >= x0 - 1e-9 && x + w <= x0 + w0 + 1e-9;
+    var ancestor = y > y0 && x <= x0 + 1e-9 && x + w >= x0 + w0 - 1e-9;
+    frame.style.display = inside || ancestor ? '' : 'none';
+    var rect = frame.querySelector('rect'), text = frame.querySelector('text');
+    var newX = ancestor ? 0 : (x - x0) * scale, newW = ancestor ? WIDTH : w * scale;
+    rect.setAttribute('x', newX); rect.setAttribute('width', Math.max(newW - 0.5, 0));
+    text.setAttribute('x', newX + 3);
+    var label = frame.getAttribute('data-label'), chars = Math.floor((newW - 6) / CHAR_WIDTH);
+    text.textContent = chars < 3 ? '' : (label.length > chars ? label.slice(0, chars - 2) + '..' : label);
+  });
+}
+frames.forEach(function (frame) { frame.addEventListener('click', function () { zoom(frame); }); });
+document.getElementById('title').addEventListener('click', function () { zoom(document.getElementById('root')); });
+]]></script>
+"""
+
+
+def frame_label(filename: str, lineno: int, func_name: str) -> str:
+    """Returns label of a frame, semicolons are replaced since they separate frames of collapsed stacks."""
+    label = func_name if filename == '~' else f'{func_name} ({os.path.basename(filename)}:{lineno})'
+    return label.replace(';', ':')
+
+
+def collapsed_stacks_from_stats(
+    stats: call_graph_stats.CallGraphStats,
+    min_fraction: float = 0.001,
+    max_depth: int = 128
+    ) -> dict[str, float]:
+    """Reconstructs weighted stacks from caller/callee edges of cProfile stats.
+
+    cProfile does not record full stacks, so time of a function is split between its callees
+    proportionally to the cumulative time of each caller/callee edge (the approach of gprof-like
+    tools). Recursive calls are folded into the self time of the recursive frame, so times of stacks
+    of a root add up to the time of the root.
+
+    Stacks start from functions with calls that are not covered by callers within the profile
+    (e.g. the profiled function, even if it is also called recursively through other functions),
+    with the share of their cumulative time of such calls. If every call is covered, the function
+    with the largest cumulative time is the root.
+
+    Args:
+        stats (CallGraphStats): Table of profiled functions.
+        min_fraction (float): Callees with less than this fraction of total time are folded into
+            the self time of their caller, which bounds the cost of traversal of very large profiles.
+        max_depth (int): Maximum depth of reconstructed stacks, deeper callees are folded the same way.
+
+    Returns:
+        dict[str, float]: Time in seconds by stack of ';' separated frame labels, root first.
+    """
+    callees = {}
+    covered_calls = {}
+    for caller, callee, ncalls, cumtime in zip(stats.edge_callers, stats.edge_callees, stats.edge_ncalls, stats.edge_cumtimes):
+        covered_calls[callee] = covered_calls.get(callee, 0) + ncalls
+        if caller != callee:
+            callees.setdefault(caller, []).append((callee, cumtime))
+    labels = [frame_label(*key) for key in zip(stats.filenames, stats.linenos, stats.func_names)]
+    roots = {}
+    for row in range(len(stats)):
+        uncovered_calls = stats.ncalls[row] - covered_calls.get(row, 0)
+        if uncovered_calls > 0 and stats.primitive_calls[row]:
+            # Only primitive calls count into cumulative time, recursive calls run within them.
+            roots[row] = stats.cumtimes[row] * min(uncovered_calls / stats.primitive_calls[row], 1.0)
+    if not roots and len(stats):
+        root = max(range(len(stats)), key=stats.cumtimes.__getitem__)
+        roots[root] = stats.cumtimes[root]
+    total_time = sum(roots.values()) or stats.total_time
+    threshold = total_time * min_fraction
+
+    # Time of a frame is split between its own time and its callees. Within recursion cumulative
+    # times of edges also count nested calls, then the split is scaled down to the time of the frame.
+    split_times = [max(cumtime, tottime) for cumtime, tottime in zip(stats.cumtimes, stats.tottimes)]
+    for caller, caller_callees in callees.items():
+        split_times[caller] = max(split_times[caller], stats.tottimes[caller] + sum(cumtime for _, cumtime in caller_callees))
+
+    stacks = {}
+    pending = [((row,), time) for row, time in roots.items() if time >= threshold and time > 0]
+    while pending:
+        path, time = pending.pop()
+        row = path[-1]
+        ratio = time / split_times[row] if split_times[row] else 0.0
+        self_time = stats.tottimes[row] * ratio
+        for callee, cumtime in callees.get(row, ()):
+            callee_time = cumtime * ratio
+            if callee in path or callee_time < threshold or len(path) >= max_depth:
+                self_time += callee_time
+            elif callee_time > 0:
+                pending.append((path + (callee,), callee_time))
+        if self_time > 0:
+            stack = ';'.join(labels[frame] for frame in path)
+            stacks[stack] = stacks.get(stack, 0.0) + self_time
+    return stacks
+
+
+def collapsed_stacks_from_samples(samples: dict[tuple, int | float]) -> dict[str, float]:
+    """Converts sampled stacks into collapsed stacks.
+
+    Args:
+        samples (dict[tuple, int | float]): Weight by stack, frames root first. Frames are labels or
+            frame keys of StackTrie.stacks() (filename, first line, function name, line), which are
+            labeled by function, so samples of different lines of a function share the frame.
+
+    Returns:
+        dict[str, float]: Weight by stack of ';' separated frame labels, root first.
+    """
+    stacks = {}
+    for frames, weight in samples.items():
+        stack = ';'.join(
+            frame.replace(';', ':') if isinstance(frame, str) else frame_label(*frame[:3]) for frame in frames
+            )
+        stacks[stack] = stacks.get(stack, 0) + weight
+    return stacks
+
+
+def format_collapsed(stacks: dict[str, float], scale: float = 1e6) -> str:
+    """Formats stacks as collapsed-stack text ('frame;frame weight' per line), the input format of
+    flamegraph.pl, speedscope and similar tools.
+
+    Args:
+        stacks (dict[str, float]): Weight by stack.
+        scale (float): Factor applied to weights before rounding to integers, 1e6 turns seconds into microseconds.
+
+    Returns:
+        str: Collapsed stacks sorted by stack.
+    """
+    return ''.join(
+        f'{stack} {round(weight * scale)}\n' for stack, weight in sorted(stacks.items()) if round(weight * scale) > 0
+        )
+
+
+def parse_collapsed(text: str | Iterable[str]) -> dict[str, float]:
+    """Parses collapsed-stack text into weight by stack.
+
+    Raises:
+        ValueError: If a line has no weight.
+    """
+    lines = text.splitlines() if isinstance(text, str) else text
+    stacks = {}
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        stack, _, weight = line.rpartition(' ')
+        if not stack:
+            raise ValueError(f'Collapsed stack line has no weight: {line}')
+        stacks[stack] = stacks.get(stack, 0.0) + float(weight)
+    return stacks
+
+
+def _frames(stacks: dict[str, float], with_stacks: bool = False):
+    """Yields level, label, start, width and stack (root first, ending with the frame, if with_stacks
+    is True, None otherwise) of every frame, level 1 for root frames.
+
+    Stacks are swept in sorted order, so frames are closed as soon as the next stack diverges
+    from them and no tree of frames is built. Sort key ends every stack with ';', so stacks 
+    sharing a prefix of frames are adjacent.
+    """
+    open_frames = []
+    x = 0.0
+    for stack in sorted(stacks, key=lambda stack: stack + ';'):
+        weight = stacks[stack]
+        if weight <= 0:
+            continue
+        frames = stack.split(';')
+        common = 0
+        while common < min(len(open_frames), len(frames)) and open_frames[common][0] == frames[common]:
+            common += 1
+        while len(open_frames) > common:
+            label, start, frame_stack = open_frames.pop()
+            yield len(open_frames) + 1, label, start, x - start, frame_stack
+        for frame in frames[common:]:
+            open_frames.append((frame, x, (f'{open_frames[-1][2]};{frame}' if open_frames else frame) if with_stacks else None))
+        x += weight
+    while open_frames:
+        label, start, frame_stack = open_frames.pop()
+        yield len(open_frames) + 1, label, start, x - start, frame_stack
+
+
+def _inclusive_weight_lookup(stacks: dict[str, float]):
+    """Returns function that returns inclusive weight of a frame, given by its stack, within stacks.
+
+    Stacks that pass through a frame are those whose key (stack + ';') starts with the stack of the
+    frame and ';', they form a range of sorted keys, so each lookup is two binary searches.
+    """
+    keys = sorted(stack + ';' for stack, weight in stacks.items() if weight > 0)
+    cumulative_weights = [0.0, *itertools.accumulate(stacks[key[:-1]] for key in keys)]
+
+    def inclusive_weight(frame_stack: str) -> float:
+        # ';' is followed by '<' in code point order, so the range ends before frame_stack + '<'.
+        return cumulative_weights[bisect.bisect_left(keys, frame_stack + '<')] - cumulative_weights[bisect.bisect_left(keys, frame_stack + ';')]
+    return inclusive_weight
+
+
+def _frame_color(label: str) -> str:
+    """Returns warm color that is stable for the same function name."""
+    name = label.split(' (')[0]
+    hash_ = sum((index + 1) * ord(char) for index, char in enumerate(name))
+    return f'rgb({205 + hash_ % 50},{(hash_ // 7) % 180 + 40},{(hash_ // 13) % 55})'
+
+
+def _diff_color(delta: float, max_delta: float) -> str:
+    """Returns red for positive and blue for negative delta, saturated in proportion to max_delta."""
+    intensity = round(min(abs(delta) / max_delta, 1.0) * 190) if max_delta else 0
+    if delta > 0:
+        return f'rgb(255,{235 - intensity},{235 - intensity})'
+    return f'rgb({235 - intensity},{235 - intensity},255)'
+
+
+def render_svg(
+    stacks: dict[str, float],
+    title: str = 'Flame Graph',
+    width: int = 1200,
+    min_width: float = 0.1,
+    unit: str = 's',
+    baseline: dict[str, float] | None = None
+    ) -> str:
+    """Renders collapsed stacks as a self-contained interactive SVG flame graph.
+
+    Frames narrower than min_width pixels are pruned together with their descendants,
+    so the size of the SVG is bounded by the width of the image, not by the amount of stacks.
+    If baseline stacks are provided, a differential flame graph is rendered: frames keep widths
+    of stacks, but are colored by the change of their share of total weight against the baseline,
+    red for frames that grew and blue for frames that shrank.
+
+    Args:
+        stacks (dict[str, float]): Weight by stack.
+        title (str): Title of the image.
+        width (int): Width of the image in pixels.
+        min_width (float): Minimum width of rendered frame in pixels.
+        unit (str): Unit of weights shown in tooltips.
+        baseline (dict[str, float] | None): Weight by stack of the baseline profile.
+
+    Returns:
+        str: SVG document, frames zoom in on click.
+    """
+    total = sum(weight for weight in stacks.values() if weight > 0)
+    scale = width / total if total else 0.0
+    frames = [(0, 'all', total, 0.0, width, None)] if total else []
+    frames.extend(
+        (level, label, value, start * scale, value * scale, frame_stack)
+        for level, label, start, value, frame_stack in _frames(stacks, with_stacks=baseline is not None)
+        if value * scale >= min_width
+        )
+    depth = max((frame[0] for frame in frames), default=0)
+    deltas = {}
+    if baseline is not None:
+        baseline_weight = _inclusive_weight_lookup(baseline)
+        baseline_total = sum(weight for weight in baseline.values() if weight > 0)
+        deltas = {
+            frame_stack: value / total - (baseline_weight(frame_stack) / baseline_total if baseline_total else 0.0)
+            for _, _, value, _, _, frame_stack in frames if frame_stack is not None
+            }
+    max_delta = max((abs(delta) for delta in deltas.values()), default=0.0)
+
+    title_height = FRAME_HEIGHT * 2
+    height = title_height + (depth + 1) * FRAME_HEIGHT + FRAME_HEIGHT
+    elements = []
+    for level, label, value, x, frame_width, frame_stack in frames:
+        y = height - FRAME_HEIGHT * (level + 2)
+        chars = int((frame_width - 6) / CHAR_WIDTH)
+        text = '' if chars < 3 else (label if len(label) <= chars else label[:chars - 2] + '..')
+        percentage = value / total * 100 if total else 0.0
+        escaped_label = html.escape(label, quote=True)
+        frame_id = ' id="root"' if level == 0 else ''
+        if level == 0:
+            fill, change = 'rgb(200,200,200)', ''
+        elif baseline is not None:
+            fill, change = _diff_color(deltas[frame_stack], max_delta), f', {deltas[frame_stack] * 100:+.2f}%'
+        else:
+            fill, change = _frame_color(label), ''
+        elements.append(
+            f'<g class="frame"{frame_id} data-x="{x:.3f}" data-w="{frame_width:.3f}" '
+            f'data-y="{y}" data-label="{escaped_label}">'
+            f'<title>{escaped_label} ({value:.6g} {unit}, {percentage:.2f}%{change})</title>'
+            f'<rect x="{x:.3f}" y="{y}" width="{max(frame_width - 0.5, 0):.3f}" height="{FRAME_HEIGHT - 1}" '
+            f'fill="{fill}" rx="2"/>'
+            f'<text x="{x + 3:.3f}" y="{y + FRAME_HEIGHT - 4}">{html.escape(text)}</text></g>'
+            )
+    return (
+        f'<?xml version="1.0" standalone="no"?>\n'
+        f'<svg version="1.1" xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="Verdana, sans-serif" font-size="{FONT_SIZE}">\n'
+        f'<style>g.frame {{ cursor: pointer; }} g.frame:hover rect {{ stroke: black; stroke-width: 0.5; }}</style>\n'
+        f'<rect width="100%" height="100%" fill="rgb(250,250,240)"/>\n'
+        f'<text id="title" x="{width / 2}" y="{FRAME_HEIGHT + 2}" text-anchor="middle" font-size="{FONT_SIZE + 5}" '
+        f'style="cursor: pointer">{html.escape(title)}</text>\n'
+        + '\n'.join(elements)
+        + f'\n<script type="text/ecmascript"><![CDATA[\nvar WIDTH = {width}, CHAR_WIDTH = {CHAR_WIDTH};'
+        + _SVG_SCRIPT
+        + '</svg>\n'
+        )
@@ -9,6 +9,7 @@ from python_profiling import python_profiling_configs
 from python_profiling.composed_profiling import composed_profiling_results
 from python_profiling import _base_profiling_decorators
 from Internals import observers
+from Internals import samplers
 
 
 class ComposedProfilerI(ABC, _base_profiling_decorators.BaseProfilingDecorator):
@@ -18,6 +19,7 @@ class ComposedProfilerI(ABC, _base_profiling_decorators.BaseProfilingDecorator):
         composed_profiling_config (ComposedProfilingConfig): Configuration specifying time and memory profilers.
         storages (StorageConfig): Data Transfer Object containing all output destinations.
         observer (ProfilingObserver): Responsible for storing profiling results.
+        sampler (SamplerI | None): Sampling policy that decides which calls are profiled.
     """
     def __init__(
         self, 
@@ -28,9 +30,11 @@ class ComposedProfilerI(ABC, _base_profiling_decorators.BaseProfilingDecorator):
             call_graph_profiling_strategy=python_profiling_enums.CallGraphProfilingStrategy.CALL_GRAPH_PROFILER
             ),
         storages: python_profiling_configs.StorageConfig = python_profiling_configs.StorageConfig(),
-        observer: observers.ProfilingObserverI = observers.ProfilingObserver
+        observer: observers.ProfilingObserverI = observers.ProfilingObserver,
+        sampler: samplers.SamplerI | None = None
         ):
         self.composed_profiling_config = composed_profiling_config
+        self.sampler = sampler
         self._init_observer(storages=storages, observer=observer)
 
     @abstractmethod
@@ -63,7 +67,8 @@ class ComposedProfiler(ComposedProfilerI):
         return self.base_profiling__call__(
             func=func,
             profiling_func=self.profile,
-            observing_func=self.observer.dump
+            observing_func=self.observer.dump,
+            sampler=self.sampler
             )
     
     def __repr__(self) -> str:
@@ -1,14 +1,28 @@
-"""Line by line memory profiling with memory_profiler module."""
+"""Line by line memory profiling with memory_profiler module and per-line memory tracing."""
 
-from typing import Literal
+from typing import Any, Literal
 from types import BuiltinFunctionType, FunctionType
 
 import memory_profiler
 import pydantic
 
+from python_profiling.memory_profiling import line_memory_stats
 from python_profiling.memory_profiling import memory_profiling_results
+from Internals import callee_discovery
 from Internals import checks
 from Internals import context_managers
+from Internals import line_memory_tracing
+from Internals import rss_sampling
+
+
+def mark_phase(label: str) -> None:
+    """Marks start of a phase in memory timelines of running 'native' profiles, no-op if none is running.
+    
+    Args:
+        label: Name of the phase, e.g. 'load' or 'train'.
+    """
+    rss_sampling.mark(label)
+
 
 class LineMemoryProfiler(pydantic.BaseModel):
     """.
@@ -16,9 +30,19 @@ class LineMemoryProfiler(pydantic.BaseModel):
     Attributes:
         interval: The time interval (in seconds) between consecutive memory measurements.
         timeout: Specifies the maximum duration (in seconds) to collect memory measurements. 
-            If exceeded, measurement is terminated.
-        backed: Etermines the backend method for acquiring memory usage data.
-        include_children: If True, includes memory usage of all child processes 
+            If exceeded, measurement is terminated. Not used by 'native' backend.
+        backed: Etermines the backend method for acquiring memory usage data. 'native' samples RSS of 
+            the process from a background thread (see rss_sampling module) at up to 1 kHz, without 
+            timeout, and stores the timeline with phase markers (see mark_phase) as MemoryTimeline.
+        include_children: If True, includes memory usage of all child processes. Not used by 'native' backend.
+        capacity: Amount of samples kept by 'native' backend, the oldest samples are overwritten 
+            when exceeded, while start, peak and end memory cover the whole run.
+        line_memory: 'rss' or 'tracemalloc' to also trace memory increment and peak of each line of
+            the profiled function (see line_memory_tracing module), None to profile the timeline only.
+        max_depth: Depth of traced call chain below the profiled function (see callee_discovery module).
+        package: If provided, only callees defined in this package are traced.
+        sample_every: Memory is read on every n-th line event only, which reduces tracing overhead
+            at the cost of attributing changes to the line that was executing at the reading.
         
     Raises:
         ValidationError: If attribute of wrong type.
@@ -27,8 +51,20 @@ class LineMemoryProfiler(pydantic.BaseModel):
     
     interval: int | float = pydantic.Field(default=0.2)
     timeout: int = pydantic.Field(default=5)
-    backed: Literal['psutil', 'ps'] = pydantic.Field(default='psutil')
+    backed: Literal['psutil', 'ps', 'native'] = pydantic.Field(default='psutil')
     include_children: bool = pydantic.Field(default=True)
+    capacity: int = pydantic.Field(default=65536, gt=0)
+    line_memory: Literal['rss', 'tracemalloc'] | None = pydantic.Field(default=None)
+    max_depth: int = pydantic.Field(default=0, ge=0)
+    package: str | None = pydantic.Field(default=None)
+    sample_every: int = pydantic.Field(default=1, gt=0)
+    _codes: dict = pydantic.PrivateAttr(default_factory=dict)
+    
+    @pydantic.model_validator(mode='after')
+    def _check_interval(self) -> 'LineMemoryProfiler':
+        if self.backed == 'native' and self.interval < 1 / rss_sampling.MAX_FREQUENCY:
+            raise ValueError(f"interval of 'native' backend has to be at least {1 / rss_sampling.MAX_FREQUENCY} seconds")
+        return self
     
     @staticmethod
     def _get_memory_stats(memory: list[float | int]) -> tuple[float | int]:
@@ -39,6 +75,35 @@ class LineMemoryProfiler(pydantic.BaseModel):
         max_memory_increase = peak_memory - start_memory
         return start_memory, peak_memory, end_memory, max_memory_increase
     
+    def codes(self, func: BuiltinFunctionType | FunctionType) -> list:
+        """Returns code objects of the function and its callees traced line by line, discovered on the first call."""
+        if not isinstance(func, FunctionType):
+            return []
+        if func not in self._codes:
+            callees = callee_discovery.discover_callees(func, max_depth=self.max_depth, package=self.package)
+            self._codes[func] = [function.__code__ for function in (func, *callees)]
+        return self._codes[func]
+    
+    def _line_memory_tracer(self, func: BuiltinFunctionType | FunctionType) -> line_memory_tracing.LineMemoryTracer | None:
+        """Returns tracer of per-line memory of the function, None if line memory is not traced."""
+        if self.line_memory is None:
+            return None
+        return line_memory_tracing.LineMemoryTracer(codes=self.codes(func), metric=self.line_memory, sample_every=self.sample_every)
+    
+    @staticmethod
+    def _traced(func: BuiltinFunctionType | FunctionType, tracer: line_memory_tracing.LineMemoryTracer | None):
+        """Returns function that calls profiled function with the tracer running.
+        
+        memory_profiler runs the function again when it collected too few measurements, lines of the last run are kept.
+        """
+        if tracer is None:
+            return func
+        
+        def traced_func(**kwargs):
+            with tracer:
+                return func(**kwargs)
+        return traced_func
+    
     @checks.ValidateType(('func', (BuiltinFunctionType, FunctionType)))
     def profile(self, func: BuiltinFunctionType | FunctionType, **kwargs):
         """Profile Memory usage over time during function execution.
@@ -53,9 +118,13 @@ class LineMemoryProfiler(pydantic.BaseModel):
         Raises:
             InvalidInputTypeError: If the function is not of the correct type.
         """
+        tracer = self._line_memory_tracer(func)
+        if self.backed == 'native':
+            return self._profile_native(func, kwargs, tracer)
+        func_result = None
         with context_managers.LineMemoryProfilerManager() as line_memory_profiler_manager:
             memory, func_result = memory_profiler.memory_usage(
-                (func, (), kwargs), 
+                (self._traced(func, tracer), (), kwargs), 
                 interval=self.interval,
                 timeout=self.timeout,
                 backend=self.backed,
@@ -66,6 +135,42 @@ class LineMemoryProfiler(pydantic.BaseModel):
             start_memory, peak_memory, end_memory, max_memory_increase, memory = 0, 0, 0, 0, []
         else:
             start_memory, peak_memory, end_memory, max_memory_increase = self._get_memory_stats(memory)
+        return self._get_profiling_result(
+            func, kwargs, func_result, line_memory_profiler_manager, 
+            (start_memory, peak_memory, end_memory, max_memory_increase), memory, tracer
+            )
+    
+    def _profile_native(
+        self, 
+        func: BuiltinFunctionType | FunctionType, 
+        kwargs: dict, 
+        tracer: line_memory_tracing.LineMemoryTracer | None
+        ):
+        """Profile RSS timeline of the process with a background sampler thread."""
+        func_result = None
+        sampler = rss_sampling.RssSampler(interval=self.interval, capacity=self.capacity)
+        with context_managers.LineMemoryProfilerManager() as line_memory_profiler_manager:
+            with sampler:
+                func_result = self._traced(func, tracer)(**kwargs)
+        if line_memory_profiler_manager.exception:
+            memory_stats, memory = (0, 0, 0, 0), rss_sampling.MemoryTimeline()
+        else:
+            memory_stats = (sampler.start_rss, sampler.peak_rss, sampler.end_rss, sampler.peak_rss - sampler.start_rss)
+            memory = sampler.timeline()
+        return self._get_profiling_result(func, kwargs, func_result, line_memory_profiler_manager, memory_stats, memory, tracer)
+    
+    def _get_profiling_result(
+        self,
+        func: BuiltinFunctionType | FunctionType,
+        kwargs: dict,
+        func_result: Any,
+        line_memory_profiler_manager: context_managers.LineMemoryProfilerManager,
+        memory_stats: tuple[float | int],
+        memory: list[float | int] | rss_sampling.MemoryTimeline,
+        tracer: line_memory_tracing.LineMemoryTracer | None
+        ) -> memory_profiling_results.LineMemoryProfilerResult:
+        """Build structured profiling result from finished profiling process."""
+        start_memory, peak_memory, end_memory, max_memory_increase = memory_stats
         return memory_profiling_results.LineMemoryProfilerResult(
             profiler=LineMemoryProfiler,
             profiled_func=func,
@@ -76,5 +181,6 @@ class LineMemoryProfiler(pydantic.BaseModel):
             end_memory=end_memory,
             max_memory_increase=max_memory_increase,
             memory_timeline=memory,
-            func_exception=line_memory_profiler_manager.func_exception
+            func_exception=line_memory_profiler_manager.func_exception,
+            line_memory=line_memory_stats.LineMemoryStats.from_lines(tracer.lines()) if tracer and not line_memory_profiler_manager.exception else None
             )
@@ -0,0 +1,109 @@
+"""Columnar per-line memory increments of functions traced by LineMemoryTracer."""
+
+import heapq
+import linecache
+from array import array
+from dataclasses import dataclass, field
+
+_MIB = 1024 ** 2
+
+
+@dataclass
+class LineMemoryStats:
+    """Per-line memory of a single function, one array element per executed line.
+
+    Attributes:
+        filename: File the function is defined in.
+        func_name: Name of the function.
+        first_lineno: Line number of the function definition.
+        linenos: Line numbers of executed lines.
+        hits: Amount of times each line was executed.
+        increments: Sum of memory changes of all executions of each line in MiB, callees included.
+        peak_increments: Largest memory above start of a single execution of each line in MiB.
+        source_lines: Source text of each line, empty if source is not available.
+    """
+
+    filename: str
+    func_name: str
+    first_lineno: int
+    linenos: array = field(default_factory=lambda: array('q'))
+    hits: array = field(default_factory=lambda: array('q'))
+    increments: array = field(default_factory=lambda: array('d'))
+    peak_increments: array = field(default_factory=lambda: array('d'))
+    source_lines: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_lines(cls, functions_lines: dict[tuple[str, int, str], list[tuple[int, int, int, int]]]) -> list['LineMemoryStats']:
+        """Converts lines of LineMemoryTracer.lines into tables per traced function.
+
+        Args:
+            functions_lines (dict): (lineno, hits, increment, peak increment) in bytes of each
+                executed line, keyed by (filename, first_lineno, func_name).
+
+        Returns:
+            list[LineMemoryStats]: Table of each traced function that executed at least one line.
+        """
+        functions_memory = []
+        for (filename, first_lineno, func_name), lines in functions_lines.items():
+            if not lines:
+                continue
+            source = linecache.getlines(filename)
+            functions_memory.append(cls(
+                filename=filename,
+                func_name=func_name,
+                first_lineno=first_lineno,
+                linenos=array('q', [lineno for lineno, _, _, _ in lines]),
+                hits=array('q', [hits for _, hits, _, _ in lines]),
+                increments=array('d', [increment / _MIB for _, _, increment, _ in lines]),
+                peak_increments=array('d', [peak / _MIB for _, _, _, peak in lines]),
+                source_lines=[source[lineno - 1].rstrip() if lineno <= len(source) else '' for lineno, _, _, _ in lines]
+                ))
+        return functions_memory
+
+    @property
+    def total_increment(self) -> float:
+        """Memory change of all executed lines of the function in MiB."""
+        return sum(self.increments)
+
+    def hot_lines(self, k: int = 5) -> list[tuple[int, int, float, float, str]]:
+        """Returns k lines with the largest peak increment, largest first.
+
+        Args:
+            k (int): Amount of returned lines.
+
+        Returns:
+            list[tuple[int, int, float, float, str]]: Line number, hits, increment, peak increment and source of each line.
+        """
+        indexes = heapq.nlargest(k, range(len(self.linenos)), key=self.peak_increments.__getitem__)
+        return [
+            (self.linenos[index], self.hits[index], self.increments[index], self.peak_increments[index], self.source_lines[index])
+            for index in indexes
+            ]
+
+    def to_dict(self) -> dict:
+        """Returns table with columns as lists of numbers, ready for JSON/YAML serialization."""
+        return {
+            'filename': self.filename,
+            'func_name': self.func_name,
+            'first_lineno': self.first_lineno,
+            'linenos': self.linenos.tolist(),
+            'hits': self.hits.tolist(),
+            'increments': self.increments.tolist(),
+            'peak_increments': self.peak_increments.tolist(),
+            'source_lines': list(self.source_lines)
+            }
+
+    def __str__(self) -> str:
+        header = (f"Function: {self.func_name} at line {self.first_lineno} of {self.filename}\n"
+                  f"Total increment: {self.total_increment:.3f} MiB\n"
+                  f"{'Line #':>6} {'Hits':>9} {'Increment':>12} {'Peak':>12}  Line Contents")
+        rows = (
+            f"{lineno:>6} {hits:>9} {increment:>8.3f} MiB {peak_increment:>8.3f} MiB  {source_line}"
+            for lineno, hits, increment, peak_increment, source_line in zip(
+                self.linenos, self.hits, self.increments, self.peak_increments, self.source_lines
+                )
+            )
+        return '\n'.join((header, *rows))
+
+    def __repr__(self) -> str:
+        return f'LineMemoryStats(func_name={self.func_name}, first_lineno={self.first_lineno}, lines={len(self.linenos)})'
@@ -0,0 +1,183 @@
+"""Compact tables of memory differences and allocation tracebacks computed from tracemalloc snapshots.
+
+Tables are computed once and hold only top entries as typed arrays, so snapshots (which hold every
+traced memory block of the process) can be released right after profiling.
+"""
+
+from array import array
+from dataclasses import dataclass, field
+import tracemalloc
+
+
+def _format_size(size: int, sign: bool = False) -> str:
+    """Formats size in bytes like tracemalloc, e.g. '+10.4 KiB'."""
+    for unit in ('B', 'KiB', 'MiB', 'GiB', 'TiB'):
+        if abs(size) < 100 and unit != 'B':
+            return f'{size:+.1f} {unit}' if sign else f'{size:.1f} {unit}'
+        if abs(size) < 10 * 1024 or unit == 'TiB':
+            return f'{size:+.0f} {unit}' if sign else f'{size:.0f} {unit}'
+        size /= 1024
+
+
+@dataclass
+class MemoryDiff:
+    """Top memory differences between two snapshots, one array element per allocation site.
+
+    Attributes:
+        key_type: Grouping of traces, 'lineno', 'filename' or 'traceback'.
+        filenames: File of each allocation site, the most recent frame of grouped traceback.
+        linenos: Line of each allocation site, 0 when grouped by filename.
+        sizes: Size of memory blocks of each site after the call in bytes.
+        size_diffs: Difference of size of memory blocks of each site in bytes.
+        counts: Number of memory blocks of each site after the call.
+        count_diffs: Difference of number of memory blocks of each site.
+    """
+
+    key_type: str = 'lineno'
+    filenames: list[str] = field(default_factory=list)
+    linenos: array = field(default_factory=lambda: array('q'))
+    sizes: array = field(default_factory=lambda: array('q'))
+    size_diffs: array = field(default_factory=lambda: array('q'))
+    counts: array = field(default_factory=lambda: array('q'))
+    count_diffs: array = field(default_factory=lambda: array('q'))
+
+    @classmethod
+    def from_snapshots(
+        cls,
+        before: tracemalloc.Snapshot,
+        after: tracemalloc.Snapshot,
+        key_type: str = 'lineno',
+        top_n: int | None = None
+        ) -> 'MemoryDiff':
+        """Compares snapshots and keeps top differences, largest absolute size difference first.
+
+        Args:
+            before (Snapshot): Snapshot taken before the call.
+            after (Snapshot): Snapshot taken after the call.
+            key_type (str): Grouping of traces, 'lineno', 'filename' or 'traceback'.
+            top_n (int | None): Number of kept differences, all if None.
+
+        Returns:
+            MemoryDiff: Table with one row per allocation site.
+        """
+        table = cls(key_type=key_type)
+        for stat in after.compare_to(before, key_type)[:top_n]:
+            frame = stat.traceback[-1]
+            table.filenames.append(frame.filename)
+            table.linenos.append(frame.lineno if key_type != 'filename' else 0)
+            table.sizes.append(stat.size)
+            table.size_diffs.append(stat.size_diff)
+            table.counts.append(stat.count)
+            table.count_diffs.append(stat.count_diff)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.filenames)
+
+    def row(self, row: int) -> dict:
+        """Returns a single allocation site as a dictionary."""
+        return {
+            'filename': self.filenames[row],
+            'lineno': self.linenos[row],
+            'size': self.sizes[row],
+            'size_diff': self.size_diffs[row],
+            'count': self.counts[row],
+            'count_diff': self.count_diffs[row]
+            }
+
+    def format(self) -> list[str]:
+        """Returns one line per allocation site in the format of tracemalloc.StatisticDiff."""
+        lines = []
+        for row in range(len(self)):
+            lines.append(
+                f'{self.filenames[row]}:{self.linenos[row]}: size={_format_size(self.sizes[row])} ({_format_size(self.size_diffs[row], sign=True)}), '
+                f'count={self.counts[row]} ({self.count_diffs[row]:+d})'
+                )
+        return lines
+
+    def to_dict(self) -> dict:
+        """Returns table with columns as lists, ready for JSON/YAML serialization."""
+        return {
+            'key_type': self.key_type,
+            'filenames': list(self.filenames),
+            'linenos': self.linenos.tolist(),
+            'sizes': self.sizes.tolist(),
+            'size_diffs': self.size_diffs.tolist(),
+            'counts': self.counts.tolist(),
+            'count_diffs': self.count_diffs.tolist()
+            }
+
+    def __str__(self) -> str:
+        return '\n'.join(self.format())
+
+
+@dataclass
+class TracebackStats:
+    """Top allocations of a snapshot grouped by traceback.
+
+    Frames of all tracebacks are stored in flat arrays, frames of traceback i are
+    frame_filenames[frame_offsets[i]:frame_offsets[i + 1]], from the oldest to the most recent one.
+
+    Attributes:
+        sizes: Size of memory blocks allocated by each traceback in bytes.
+        counts: Number of memory blocks allocated by each traceback.
+        frame_offsets: Index of the first frame of each traceback, followed by the total number of frames.
+        frame_filenames: File of each frame.
+        frame_linenos: Line of each frame.
+    """
+
+    sizes: array = field(default_factory=lambda: array('q'))
+    counts: array = field(default_factory=lambda: array('q'))
+    frame_offsets: array = field(default_factory=lambda: array('q', [0]))
+    frame_filenames: list[str] = field(default_factory=list)
+    frame_linenos: array = field(default_factory=lambda: array('q'))
+
+    @classmethod
+    def from_snapshot(cls, snapshot: tracemalloc.Snapshot, top_n: int | None = None) -> 'TracebackStats':
+        """Groups traces of the snapshot by traceback and keeps the largest ones.
+
+        Args:
+            snapshot (Snapshot): Snapshot taken after the call.
+            top_n (int | None): Number of kept tracebacks, all if None.
+
+        Returns:
+            TracebackStats: Table with one row per traceback.
+        """
+        table = cls()
+        for stat in snapshot.statistics('traceback')[:top_n]:
+            table.sizes.append(stat.size)
+            table.counts.append(stat.count)
+            for frame in stat.traceback:
+                table.frame_filenames.append(frame.filename)
+                table.frame_linenos.append(frame.lineno)
+            table.frame_offsets.append(len(table.frame_filenames))
+        return table
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def frames(self, row: int) -> list[tuple[str, int]]:
+        """Returns (filename, lineno) of frames of a traceback, from the oldest to the most recent one."""
+        start, end = self.frame_offsets[row], self.frame_offsets[row + 1]
+        return list(zip(self.frame_filenames[start:end], self.frame_linenos[start:end]))
+
+    def format(self) -> list[str]:
+        """Returns size and count of each traceback followed by its frames, the most recent frame last."""
+        lines = []
+        for row in range(len(self)):
+            lines.append(f'Memory block: {self.sizes[row] / 1024:.2f} KB in {self.counts[row]} allocations')
+            lines.extend(f'  - {filename}:{lineno}' for filename, lineno in self.frames(row))
+        return lines
+
+    def to_dict(self) -> dict:
+        """Returns table with columns as lists, ready for JSON/YAML serialization."""
+        return {
+            'sizes': self.sizes.tolist(),
+            'counts': self.counts.tolist(),
+            'frame_offsets': self.frame_offsets.tolist(),
+            'frame_filenames': list(self.frame_filenames),
+            'frame_linenos': self.frame_linenos.tolist()
+            }
+
+    def __str__(self) -> str:
+        return '\n'.join(self.format())
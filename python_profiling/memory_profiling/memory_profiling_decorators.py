@@ -8,6 +8,7 @@ from python_profiling.memory_profiling import line_memory_profiler
 from python_profiling import _base_profiling_decorators
 from python_profiling import python_profiling_configs
 from Internals import observers
+from Internals import samplers
 
 class PeakMemoryProfilerDecorator(_base_profiling_decorators.BaseProfilingDecorator):
     """Decorator for memory profiling with tracemalloc module.
@@ -20,6 +21,9 @@ class PeakMemoryProfilerDecorator(_base_profiling_decorators.BaseProfilingDecora
         top_n: .
         storages (StorageConfig): Data Transfer Object that contains all configured output destinations.
         obaserver (ProfilingObserver): A class that responsible for storing profiling result to.
+        sampler (SamplerI | None): Sampling policy that decides which calls are profiled.
+        peak_only (bool): If True, only current and peak traced memory are recorded, no snapshots are taken.
+        trace_filters (list[str] | None): File name patterns or module and package names kept in snapshots.
         
     Raises:
         ValidationError: If sort_key, func_filter, top_n has incorrect type.
@@ -31,18 +35,26 @@ class PeakMemoryProfilerDecorator(_base_profiling_decorators.BaseProfilingDecora
         key_type: str = 'lineno',
         top_n: int = 5,
         storages: python_profiling_configs.StorageConfig = python_profiling_configs.StorageConfig(), 
-        observer: observers.ProfilingObserverI = observers.ProfilingObserver
+        observer: observers.ProfilingObserverI = observers.ProfilingObserver,
+        sampler: samplers.SamplerI | None = None,
+        peak_only: bool = False,
+        trace_filters: list[str] | None = None
         ):
+        self.sampler = sampler
         self._init_observer(storages=storages, observer=observer)
         self.memory_profiler = peak_memory_profiler.PeakMemoryProfiler(nframes=nframes,
                                                                        key_type=key_type,
-                                                                       top_n=top_n)
+                                                                       top_n=top_n,
+                                                                       peak_only=peak_only,
+                                                                       trace_filters=trace_filters)
         
     def __call__(self, func: Callable):
         return self.base_profiling__call__(
             func=func,
             profiling_func=self.memory_profiler.profile,
-            observing_func=self.observer.dump
+            observing_func=self.observer.dump,
+            sampler=self.sampler,
+            async_profiling_func=self.memory_profiler.profile_async
             )
         
         
@@ -54,6 +66,7 @@ class ObjectAllocationProfilerDecorator(_base_profiling_decorators.BaseProfiling
     Attributes:
         storages (StorageConfig): Data Transfer Object that contains all configured output destinations.
         obaserver (ProfilingObserver): A class that responsible for storing profiling result to.
+        sampler (SamplerI | None): Sampling policy that decides which calls are profiled.
         
     Raises:
         InvalidInputError: If storages or observer has incorrect type.
@@ -62,15 +75,18 @@ class ObjectAllocationProfilerDecorator(_base_profiling_decorators.BaseProfiling
     def __init__(
         self, 
         storages: python_profiling_configs.StorageConfig = python_profiling_configs.StorageConfig(), 
-        observer: observers.ProfilingObserverI = observers.ProfilingObserver
+        observer: observers.ProfilingObserverI = observers.ProfilingObserver,
+        sampler: samplers.SamplerI | None = None
         ):
+        self.sampler = sampler
         self._init_observer(storages=storages, observer=observer)
         
     def __call__(self, func: Callable):
         return self.base_profiling__call__(
             func=func,
             profiling_func=object_allocation_profiler.ObjectAllocationProfiler.profile,
-            observing_func=self.observer.dump
+            observing_func=self.observer.dump,
+            sampler=self.sampler
             )
         
 class LineMemoryProfilerDecorator(_base_profiling_decorators.BaseProfilingDecorator):
@@ -83,8 +99,14 @@ class LineMemoryProfilerDecorator(_base_profiling_decorators.BaseProfilingDecora
         backed: Etermines the backend method for acquiring memory usage data.
         include_children: If True, includes memory usage of all child processes 
             spawned by the target process or callable.
+        capacity: Amount of samples kept by 'native' backend.
+        line_memory: 'rss' or 'tracemalloc' to also trace memory of each line, None to profile the timeline only.
+        max_depth: Depth of traced call chain below the profiled function.
+        package: If provided, only callees defined in this package are traced.
+        sample_every: Memory is read on every n-th line event only.
         storages (StorageConfig): Data Transfer Object that contains all configured output destinations.
         obaserver (ProfilingObserver): A class that responsible for storing profiling result to.
+        sampler (SamplerI | None): Sampling policy that decides which calls are profiled.
         
     Raises:
         ValidationError: If sort_key, func_filter, top_n has incorrect type.
@@ -94,17 +116,29 @@ class LineMemoryProfilerDecorator(_base_profiling_decorators.BaseProfilingDecora
         self, 
         interval: int | float = 0.2, 
         timeout: int = 5,
-        backed: Literal['psutil', 'ps'] = 'psutil',
+        backed: Literal['psutil', 'ps', 'native'] = 'psutil',
         include_children: bool = True,
+        capacity: int = 65536,
+        line_memory: Literal['rss', 'tracemalloc'] | None = None,
+        max_depth: int = 0,
+        package: str | None = None,
+        sample_every: int = 1,
         storages: python_profiling_configs.StorageConfig = python_profiling_configs.StorageConfig(), 
-        observer: observers.ProfilingObserverI = observers.ProfilingObserver
+        observer: observers.ProfilingObserverI = observers.ProfilingObserver,
+        sampler: samplers.SamplerI | None = None
         ):
         """Initialize LineMemoryProfiler, observer with provided parametrs and storages."""
+        self.sampler = sampler
         self.memory_profiler = line_memory_profiler.LineMemoryProfiler(
             interval=interval,
             timeout=timeout,
             backed=backed,
-            include_children=include_children
+            include_children=include_children,
+            capacity=capacity,
+            line_memory=line_memory,
+            max_depth=max_depth,
+            package=package,
+            sample_every=sample_every
             )
         self._init_observer(storages=storages, observer=observer)
         
@@ -112,5 +146,6 @@ class LineMemoryProfilerDecorator(_base_profiling_decorators.BaseProfilingDecora
         return self.base_profiling__call__(
             func=func,
             profiling_func=self.memory_profiler.profile,
-            observing_func=self.observer.dump
+            observing_func=self.observer.dump,
+            sampler=self.sampler
             )
@@ -3,10 +3,12 @@
 from typing import Type, Any
 from types import  BuiltinFunctionType, FunctionType
 from dataclasses import dataclass
-import tracemalloc
 import pympler.tracker
 
 from python_profiling import _base_profiling_result
+from python_profiling.memory_profiling import line_memory_stats
+from python_profiling.memory_profiling import memory_diff
+from Internals import rss_sampling
 
 @dataclass
 class PeakMemoryProfilerResult(_base_profiling_result.BaseProfilingResult):
@@ -19,9 +21,13 @@ class PeakMemoryProfilerResult(_base_profiling_result.BaseProfilingResult):
         func_result: Profiled function result.
         current_memory: Current size of traced memory blocks.
         peak_memory: Peak size of traced memory blocks.
-        snapshot_before: Captures memory allocations before function call.
-        snapshot_after: Captures memory allocations after function call.
+        memory_diff: Top memory differences between snapshots before and after the call, None in peak only mode.
+        traceback_stats: Top allocations by traceback after the call, None in peak only mode.
         func_exception: Exception raised during execution, if any.
+        memory_before: Size of traced memory blocks before function call.
+        snapshot_before_file: Path of dumped snapshot taken before the call, if snapshots were dumped.
+        snapshot_after_file: Path of dumped snapshot taken after the call, if snapshots were dumped.
+        nframes: Number of frames stored in traceback of each trace, may be lower than requested if tracing was already on.
     """
     top_n: int
     key_type: str
@@ -31,38 +37,37 @@ class PeakMemoryProfilerResult(_base_profiling_result.BaseProfilingResult):
     func_result: Any
     current_memory: float
     peak_memory: float
-    allocation_before: tracemalloc.Snapshot
-    allocation_after: tracemalloc.Snapshot
+    memory_diff: memory_diff.MemoryDiff | None
+    traceback_stats: memory_diff.TracebackStats | None
     func_exception: str | None = None
+    memory_before: float = 0
+    snapshot_before_file: str | None = None
+    snapshot_after_file: str | None = None
+    nframes: int | None = None
     
-    def _top_memory_differences(self):
-        """Compare allocations by specified sort key."""
-        print(f"Top {self.top_n} memory differences by '{self.key_type}':")
-        for stat in self.allocation_after.compare_to(self.allocation_before, self.key_type)[:self.top_n]:
-            print(stat)
-        print()
-        
-    def _top_memory_allocations(self):
-        """Compare snapshots by 'traceback' and explore call stack."""
-        print(f"Top {self.top_n} allocations by 'traceback':")
-        for stat in self.allocation_after.statistics('traceback')[:self.top_n]:
-            print(f"Memory block: {stat.size / 1024:.2f} KB in {stat.count} allocations")
-            for line in stat.traceback.format():
-                print("  -", line)
-            print()
+    @property
+    def peak_increase(self) -> float:
+        """Peak size of traced memory blocks during function call above size before the call."""
+        return self.peak_memory - self.memory_before
+    
+    def _memory_sections(self) -> str:
+        """Top memory differences and allocations by traceback as text."""
+        if self.memory_diff is None or self.traceback_stats is None:
+            return ''
+        return (f"Top {self.top_n} memory differences by '{self.key_type}':\n"
+                f"{self.memory_diff}\n\n"
+                f"Top {self.top_n} allocations by 'traceback':\n"
+                f"{self.traceback_stats}\n\n")
     
     def __str__(self) -> str:
-        self._top_memory_differences()
-        self._top_memory_allocations()
-        return (f"Profiler: {self.profiler}\n"
+        return (f"{self._memory_sections()}"
+                f"Profiler: {self.profiler}\n"
                 f"Profiled Function: {self.profiled_func.__name__}\n"
                 f"Function Kwargs: {self.func_kwargs}\n"
                 f"Function Result: {self.func_result}\n"
                 f"Current memory: {self.current_memory:.6f} KB\n"
                 f"Peak memory: {self.peak_memory:.6f} KB\n"
-                f"Allocation before: {self.allocation_before}KB\n"
-                f"Allocation after: {self.allocation_after}\n"
-                f"Allocation after statictics: {self.allocation_after.statistics}\n"
+                f"Peak increase: {self.peak_increase:.6f} KB\n"
                 f"Function Exception: {self.func_exception or 'None'}")
         
     def __repr__(self) -> str:
@@ -120,8 +125,9 @@ class LineMemoryProfilerResult(_base_profiling_result.BaseProfilingResult):
             spikes due to object creation, temporary data, etc.
         end_memory: The memory after the function finishes running..
         max_memory_increase: Net increase in memory usage during the execution, from baseline to the highest point.
-        memory_timeline: Memory usage over time.
+        memory_timeline: Memory usage over time, MemoryTimeline with sample times and phase markers for 'native' backend.
         func_exception: Exception raised during execution, if any.
+        line_memory: Per-line memory increments of the profiled function and its traced callees, if traced.
     """
     profiler: Type
     profiled_func: BuiltinFunctionType | FunctionType
@@ -131,11 +137,14 @@ class LineMemoryProfilerResult(_base_profiling_result.BaseProfilingResult):
     peak_memory: int | float
     end_memory: int | float
     max_memory_increase: int | float
-    memory_timeline: list[int | float]
+    memory_timeline: list[int | float] | rss_sampling.MemoryTimeline
     func_exception: str | None = None
+    line_memory: list[line_memory_stats.LineMemoryStats] | None = None
     
     def __str__(self) -> str:
-        return (f"Profiler: {self.profiler}\n"
+        line_memory_sections = ''.join(f"{function_memory}\n\n" for function_memory in self.line_memory or [])
+        return (f"{line_memory_sections}"
+                f"Profiler: {self.profiler}\n"
                 f"Profiled Function: {self.profiled_func.__name__}\n"
                 f"Function Kwargs: {self.func_kwargs}\n"
                 f"Function Result: {self.func_result}\n"
@@ -1,15 +1,19 @@
 """Memory Profiling of Python functions with tracemalloc module."""
 
+import os
+import tempfile
 import tracemalloc
 from types import BuiltinFunctionType, FunctionType
-from typing import Literal
+from typing import Any, Literal
 
 import pydantic
 
 from python_profiling import _base_profiling_result
+from python_profiling.memory_profiling import memory_diff
 from python_profiling.memory_profiling import memory_profiling_results
 from Internals import checks
 from Internals import context_managers
+from Internals import module_locations
 
 
 class PeakMemoryProfiler(pydantic.BaseModel):
@@ -19,15 +23,57 @@ class PeakMemoryProfiler(pydantic.BaseModel):
         nframes: Number of stack frames to include in each memory trace.
         key_type: Sorting method for snapshot comparisons.
         top_n: .
+        peak_only: If True, only current and peak traced memory are read, no snapshots are taken,
+            which makes profiling cheap enough to sample calls in production.
+        trace_filters: File name patterns (e.g. '*/app/*.py') or importable module and package names,
+            snapshots keep only allocations made in matching files; all allocations if None. Modules
+            are resolved once, when the profiler is created. Not allowed with peak_only, which takes
+            no snapshots.
+        dump_snapshots: If True, raw snapshots are also dumped with Snapshot.dump into unique temporary
+            files (load them with tracemalloc.Snapshot.load), paths of the files are stored in the result.
         
     Raises:
-        ValidationError: If attribute of wrong type.
+        ValidationError: If attribute of wrong type or trace_filters are combined with peak_only.
+        ValueError: If a module or package of trace filters can not be found.
+        
+    Note:
+        tracemalloc traces the whole process, filters are applied to snapshots, current and peak
+        memory include allocations of all files.
     """
     model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
     
-    nframes: int = pydantic.Field(default=1, ge=0)
+    nframes: int = pydantic.Field(default=1, ge=1)
     key_type: Literal['lineno', 'filename', 'traceback']  = pydantic.Field(default='lineno')
     top_n: int = pydantic.Field(default=5)
+    peak_only: bool = pydantic.Field(default=False)
+    trace_filters: list[str] | None = pydantic.Field(default=None)
+    dump_snapshots: bool = pydantic.Field(default=False)
+    _filters: tuple = pydantic.PrivateAttr(default=())
+    
+    @pydantic.model_validator(mode='after')
+    def _check_trace_filters(self) -> 'PeakMemoryProfiler':
+        if self.peak_only and self.trace_filters:
+            raise ValueError('trace_filters apply to snapshots, which are not taken in peak_only mode')
+        return self
+    
+    def model_post_init(self, __context):
+        """Converts trace filters into inclusive tracemalloc filters once.
+        
+        Raises:
+            ValueError: If a module or package can not be found.
+        """
+        filters = []
+        for trace_filter in self.trace_filters or []:
+            if trace_filter.endswith('.py') or any(char in trace_filter for char in ('*', '?', '/', os.sep)):
+                patterns = [trace_filter]
+            else:
+                patterns = [path + '*' if path.endswith(os.sep) else path for path in module_locations.module_paths([trace_filter])]
+            filters.extend(tracemalloc.Filter(True, pattern) for pattern in patterns)
+        self._filters = tuple(filters)
+    
+    def _profiling_manager(self) -> context_managers.PeakMemoryProfilerManager:
+        """Returns context manager of a profiling session with configured mode and filters."""
+        return context_managers.PeakMemoryProfilerManager(self.nframes, peak_only=self.peak_only, filters=self._filters)
     
     @checks.ValidateType(('func', (BuiltinFunctionType, FunctionType)))
     def profile(self, func: BuiltinFunctionType | FunctionType, **kwargs):
@@ -43,9 +89,52 @@ class PeakMemoryProfiler(pydantic.BaseModel):
         Raises:
             InvalidInputTypeError: If the function is not of the correct type.
         """
-        with context_managers.PeakMemoryProfilerManager(self.nframes)  as  peak_memory_profiler_manager:
+        func_result = None
+        with self._profiling_manager() as peak_memory_profiler_manager:
             func_result =  func(**kwargs)
-        current_memory, peak_memory = tracemalloc.get_traced_memory()
+        return self._get_profiling_result(func, kwargs, func_result, peak_memory_profiler_manager)
+    
+    @checks.ValidateType(('func', (BuiltinFunctionType, FunctionType)))
+    async def profile_async(self, func: BuiltinFunctionType | FunctionType, **kwargs):
+        """Profile peak memory allocation of an async def function until its coroutine finishes.
+        
+        Allocations of other tasks that run on the event loop while the coroutine is suspended are traced as well.
+        
+        Args:
+            func: Profiled coroutine function.
+            **kwargs:  Keyword arguments to pass to the function.
+            
+        Returns:
+            PeakMemoryProfilerResult:  Structured profiling result.
+            
+        Raises:
+            InvalidInputTypeError: If the function is not of the correct type.
+        """
+        func_result = None
+        with self._profiling_manager() as peak_memory_profiler_manager:
+            func_result = await func(**kwargs)
+        return self._get_profiling_result(func, kwargs, func_result, peak_memory_profiler_manager)
+    
+    def _get_profiling_result(
+        self, 
+        func: BuiltinFunctionType | FunctionType, 
+        kwargs: dict, 
+        func_result: Any, 
+        peak_memory_profiler_manager: context_managers.PeakMemoryProfilerManager
+        ) -> memory_profiling_results.PeakMemoryProfilerResult:
+        """Build structured profiling result from finished profiling process.
+        
+        Top memory differences and allocation tracebacks are computed once and snapshots are released.
+        """
+        allocation_before = peak_memory_profiler_manager.allocation_before
+        allocation_after = peak_memory_profiler_manager.allocation_after
+        peak_memory_profiler_manager.allocation_before = peak_memory_profiler_manager.allocation_after = None
+        func_memory_diff, traceback_stats, snapshot_files = None, None, (None, None)
+        if allocation_after is not None:
+            func_memory_diff = memory_diff.MemoryDiff.from_snapshots(allocation_before, allocation_after, key_type=self.key_type, top_n=self.top_n)
+            traceback_stats = memory_diff.TracebackStats.from_snapshot(allocation_after, top_n=self.top_n)
+            if self.dump_snapshots:
+                snapshot_files = (self._dump_snapshot(allocation_before, 'before'), self._dump_snapshot(allocation_after, 'after'))
         return memory_profiling_results.PeakMemoryProfilerResult(
             top_n=self.top_n,
             key_type=self.key_type,
@@ -53,13 +142,21 @@ class PeakMemoryProfiler(pydantic.BaseModel):
             profiled_func=func,
             func_kwargs=kwargs,
             func_result=func_result if not peak_memory_profiler_manager.exception else None,
-            current_memory=current_memory,
-            peak_memory=peak_memory,
-            allocation_before=peak_memory_profiler_manager.allocation_before,
-            allocation_after=peak_memory_profiler_manager.allocation_after,
-            func_exception=peak_memory_profiler_manager.func_exception
+            current_memory=peak_memory_profiler_manager.current_memory,
+            peak_memory=peak_memory_profiler_manager.peak_memory,
+            memory_diff=func_memory_diff,
+            traceback_stats=traceback_stats,
+            func_exception=peak_memory_profiler_manager.func_exception,
+            memory_before=peak_memory_profiler_manager.memory_before,
+            snapshot_before_file=snapshot_files[0],
+            snapshot_after_file=snapshot_files[1],
+            nframes=peak_memory_profiler_manager.session.nframes
             )
     
-    
-    
-    
\ No newline at end of file
+    @staticmethod
+    def _dump_snapshot(snapshot: tracemalloc.Snapshot, name: str) -> str:
+        """Dumps snapshot into a unique temporary file and returns its path."""
+        file_descriptor, snapshot_file = tempfile.mkstemp(prefix=f'peak_memory_{name}_', suffix='.tracemalloc')
+        os.close(file_descriptor)
+        snapshot.dump(snapshot_file)
+        return snapshot_file
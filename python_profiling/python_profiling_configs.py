@@ -7,7 +7,10 @@ from python_profiling.time_profiling import (
     time_profiler, 
     timeit_profiler, 
     line_time_profiler, 
-    call_graph_time_profiler
+    call_graph_time_profiler,
+    load_time_profiler,
+    scaling_time_profiler,
+    sampling_time_profiler
     )
 from python_profiling.memory_profiling import (
     peak_memory_profiler,
@@ -77,6 +80,9 @@ class ComposedProfilingConfig:
             python_profiling_enums.TimeProfilingStrategy.TIMEIT_PROFILER: timeit_profiler.TimeItProfiler,
             python_profiling_enums.TimeProfilingStrategy.LINE_TIME_PROFILER: line_time_profiler.LineTimeProfiler,
             python_profiling_enums.TimeProfilingStrategy.CALL_GRAPH_TIME_PROFILER: call_graph_time_profiler.CallGraphTimeProfiler,
+            python_profiling_enums.TimeProfilingStrategy.LOAD_TIME_PROFILER: load_time_profiler.LoadTimeProfiler,
+            python_profiling_enums.TimeProfilingStrategy.SCALING_TIME_PROFILER: scaling_time_profiler.ScalingTimeProfiler,
+            python_profiling_enums.TimeProfilingStrategy.SAMPLING_TIME_PROFILER: sampling_time_profiler.SamplingTimeProfiler,
             }, 
         python_profiling_enums.ProfilingType.MEMORY_PROFILING: {
             python_profiling_enums.MemoryProfilingStrategy.PEAK_MEMORY_PROFILER: peak_memory_profiler.PeakMemoryProfiler, 
@@ -18,6 +18,23 @@ class SerializerStrategy(enum.Enum):
     JSON = 'json'
     TXT = 'txt'
     YAML = 'yaml'
+    SQLITE = 'sqlite'
+    
+    
+class QueueFullPolicy(enum.Enum):
+    """Enumeration of behaviours of asynchronous observers when their queue is full."""
+    
+    DROP_OLDEST = 'drop_oldest'
+    DROP_NEWEST = 'drop_newest'
+    BLOCK = 'block'
+    
+    
+class RegressionVerdict(enum.Enum):
+    """Enumeration of outcomes of comparing candidate benchmark samples against baseline ones."""
+    
+    IMPROVED = 'improved'
+    REGRESSED = 'regressed'
+    UNCHANGED = 'unchanged'
     
     
 class ProfilingType(enum.Enum):
@@ -35,6 +52,9 @@ class TimeProfilingStrategy(enum.Enum):
     TIMEIT_PROFILER = 'timeit_profiler'
     LINE_TIME_PROFILER = 'line_time_profiler'
     CALL_GRAPH_TIME_PROFILER = 'call_graph_time_profiler'
+    LOAD_TIME_PROFILER = 'load_time_profiler'
+    SCALING_TIME_PROFILER = 'scaling_time_profiler'
+    SAMPLING_TIME_PROFILER = 'sampling_time_profiler'
     
     
 class MemoryProfilingStrategy(enum.Enum):
@@ -55,4 +75,5 @@ class CallGraphVisualizers(enum.Enum):
     
     GPROF2DOT = 'gprof2dot'
     SNAKEVIZ = 'snakeviz'
+    FLAME_GRAPH = 'flame_graph'
     
\ No newline at end of file
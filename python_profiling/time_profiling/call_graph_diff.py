@@ -0,0 +1,160 @@
+"""Functions of two call graphs matched by file, line and name, with per-function deltas."""
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Literal
+
+from python_profiling.call_graph_profiling import flame_graph
+from python_profiling.time_profiling import call_graph_stats
+
+DiffMetric = Literal['tottime', 'cumtime', 'ncalls']
+
+
+@dataclass
+class CallGraphDiff:
+    """Functions of two call graphs matched by file, line and name.
+
+    Each function that was called in any of the profiles is one row, rows reference rows of
+    baseline and candidate tables, -1 marks a function missing in the profile.
+
+    Attributes:
+        baseline: Table of the baseline profile.
+        candidate: Table of the candidate profile.
+        filenames: File each function is defined in.
+        linenos: Line number of each function definition.
+        func_names: Name of each function.
+        baseline_rows: Row of each function in the baseline table, -1 if it was not called.
+        candidate_rows: Row of each function in the candidate table, -1 if it was not called.
+    """
+
+    baseline: call_graph_stats.CallGraphStats = field(repr=False)
+    candidate: call_graph_stats.CallGraphStats = field(repr=False)
+    filenames: list[str] = field(default_factory=list)
+    linenos: array = field(default_factory=lambda: array('q'))
+    func_names: list[str] = field(default_factory=list)
+    baseline_rows: array = field(default_factory=lambda: array('q'))
+    candidate_rows: array = field(default_factory=lambda: array('q'))
+
+    @classmethod
+    def from_stats(cls, baseline: call_graph_stats.CallGraphStats, candidate: call_graph_stats.CallGraphStats) -> 'CallGraphDiff':
+        """Matches functions of two tables, baseline functions first.
+
+        Args:
+            baseline (CallGraphStats): Table of the baseline profile.
+            candidate (CallGraphStats): Table of the candidate profile.
+
+        Returns:
+            CallGraphDiff: Table with one row per function called in any of the profiles.
+        """
+        rows = {}
+        for table_index, table in enumerate((baseline, candidate)):
+            for row, key in enumerate(zip(table.filenames, table.linenos, table.func_names)):
+                rows.setdefault(key, [-1, -1])[table_index] = row
+        return cls(
+            baseline=baseline,
+            candidate=candidate,
+            filenames=[filename for filename, _, _ in rows],
+            linenos=array('q', (lineno for _, lineno, _ in rows)),
+            func_names=[func_name for _, _, func_name in rows],
+            baseline_rows=array('q', (baseline_row for baseline_row, _ in rows.values())),
+            candidate_rows=array('q', (candidate_row for _, candidate_row in rows.values()))
+            )
+
+    def __len__(self) -> int:
+        return len(self.func_names)
+
+    @staticmethod
+    def _column(table: call_graph_stats.CallGraphStats, metric: DiffMetric) -> array:
+        columns = {'tottime': table.tottimes, 'cumtime': table.cumtimes, 'ncalls': table.ncalls}
+        if metric not in columns:
+            raise ValueError(f'Can not compare {metric}, expected one of: {list(columns)}')
+        return columns[metric]
+
+    def values(self, metric: DiffMetric = 'tottime', normalized: bool = True) -> tuple[list[float], list[float]]:
+        """Returns baseline and candidate value of the metric of each function, 0 for missing functions.
+
+        Args:
+            metric (str): 'tottime', 'cumtime' or 'ncalls'.
+            normalized (bool): If True, times are divided by total time of their profile, so profiles
+                of runs with different load or duration are comparable; ncalls are never normalized.
+
+        Raises:
+            ValueError: If metric is unknown.
+        """
+        values = []
+        for table, rows in ((self.baseline, self.baseline_rows), (self.candidate, self.candidate_rows)):
+            column = self._column(table, metric)
+            scale = 1 / table.total_time if normalized and metric != 'ncalls' and table.total_time else 1
+            values.append([column[row] * scale if row >= 0 else 0 for row in rows])
+        return values[0], values[1]
+
+    def deltas(self, metric: DiffMetric = 'tottime', normalized: bool = True) -> list[float]:
+        """Returns candidate minus baseline value of the metric of each function, positive when it got slower."""
+        baseline_values, candidate_values = self.values(metric=metric, normalized=normalized)
+        return [candidate_value - baseline_value for baseline_value, candidate_value in zip(baseline_values, candidate_values)]
+
+    def added(self) -> list[int]:
+        """Returns rows of functions called only in the candidate profile."""
+        return [row for row, baseline_row in enumerate(self.baseline_rows) if baseline_row < 0]
+
+    def removed(self) -> list[int]:
+        """Returns rows of functions called only in the baseline profile."""
+        return [row for row, candidate_row in enumerate(self.candidate_rows) if candidate_row < 0]
+
+    def _ranked(self, metric: DiffMetric, normalized: bool, top_n: int | None, regressions: bool) -> list[tuple[int, float]]:
+        deltas = self.deltas(metric=metric, normalized=normalized)
+        ranked = sorted(
+            ((row, delta) for row, delta in enumerate(deltas) if (delta > 0 if regressions else delta < 0)),
+            key=lambda row_delta: -abs(row_delta[1])
+            )
+        return ranked[:top_n]
+
+    def regressions(self, metric: DiffMetric = 'tottime', normalized: bool = True, top_n: int | None = 10) -> list[tuple[int, float]]:
+        """Returns rows and deltas of functions that got slower, largest delta first."""
+        return self._ranked(metric, normalized, top_n, regressions=True)
+
+    def improvements(self, metric: DiffMetric = 'tottime', normalized: bool = True, top_n: int | None = 10) -> list[tuple[int, float]]:
+        """Returns rows and deltas of functions that got faster, largest decrease first."""
+        return self._ranked(metric, normalized, top_n, regressions=False)
+
+    def row(self, row: int) -> dict:
+        """Returns both profiles' statistics of a single function as a dictionary."""
+        baseline_row, candidate_row = self.baseline_rows[row], self.candidate_rows[row]
+        baseline = self.baseline.row(baseline_row) if baseline_row >= 0 else {}
+        candidate = self.candidate.row(candidate_row) if candidate_row >= 0 else {}
+        return {
+            'filename': self.filenames[row],
+            'lineno': self.linenos[row],
+            'func_name': self.func_names[row],
+            'status': 'added' if baseline_row < 0 else 'removed' if candidate_row < 0 else 'common',
+            **{f'baseline_{metric}': baseline.get(metric, 0) for metric in ('ncalls', 'tottime', 'cumtime')},
+            **{f'candidate_{metric}': candidate.get(metric, 0) for metric in ('ncalls', 'tottime', 'cumtime')}
+            }
+
+    def collapsed_stacks(self, min_fraction: float = 0.001) -> tuple[dict[str, float], dict[str, float]]:
+        """Returns collapsed stacks of baseline and candidate profiles (see flame_graph module)."""
+        return (
+            flame_graph.collapsed_stacks_from_stats(self.baseline, min_fraction=min_fraction),
+            flame_graph.collapsed_stacks_from_stats(self.candidate, min_fraction=min_fraction)
+            )
+
+    def render_flame_graph(self, title: str = 'Differential Flame Graph', width: int = 1200, min_fraction: float = 0.001) -> str:
+        """Renders differential flame graph: frames of the candidate profile colored by change of their share
+        of total time, red for frames that got slower and blue for frames that got faster (see flame_graph.render_svg)."""
+        baseline_stacks, candidate_stacks = self.collapsed_stacks(min_fraction=min_fraction)
+        return flame_graph.render_svg(candidate_stacks, title=title, width=width, baseline=baseline_stacks)
+
+    def to_dict(self) -> dict:
+        """Returns matched functions and both tables, ready for JSON/YAML serialization."""
+        return {
+            'filenames': list(self.filenames),
+            'linenos': self.linenos.tolist(),
+            'func_names': list(self.func_names),
+            'baseline_rows': self.baseline_rows.tolist(),
+            'candidate_rows': self.candidate_rows.tolist(),
+            'baseline': self.baseline.to_dict(),
+            'candidate': self.candidate.to_dict()
+            }
+
+    def __repr__(self) -> str:
+        return f'CallGraphDiff(functions={len(self)}, added={len(self.added())}, removed={len(self.removed())})'
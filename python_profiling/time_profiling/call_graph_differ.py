@@ -0,0 +1,94 @@
+"""Per-function comparison of two call graphs profiled with cProfile (or sys.monitoring backend)."""
+
+import os
+
+import pydantic
+import pstats
+
+from python_profiling.time_profiling import call_graph_diff
+from python_profiling.time_profiling import call_graph_stats
+from python_profiling.time_profiling import time_profiling_results
+from Internals import checks
+
+CallGraphProfile = (
+    time_profiling_results.CallGraphTimeProfilerResult
+    | time_profiling_results.CallGraphWindowResult
+    | call_graph_stats.CallGraphStats
+    | pstats.Stats
+    | str
+    | os.PathLike
+    )
+
+
+class CallGraphDiffer(pydantic.BaseModel):
+    """Compares call graph of a candidate run against a baseline one, function by function.
+
+    Functions are matched by file, line and name. Times are compared as shares of total time of
+    each profile by default, so a function that takes the same share of a longer run is not
+    reported as a regression.
+
+    Attributes:
+        metric (str): Metric that ranks regressions and improvements: 'tottime', 'cumtime' or 'ncalls'.
+        normalized (bool): If True, times are divided by total time of their profile.
+        top_n (int): Amount of regressions and improvements in the result.
+    """
+
+    metric: call_graph_diff.DiffMetric = pydantic.Field(default='tottime')
+    normalized: bool = pydantic.Field(default=True)
+    top_n: int = pydantic.Field(default=10, gt=0)
+
+    @staticmethod
+    def _stats(profile: CallGraphProfile) -> call_graph_stats.CallGraphStats:
+        """Returns table of a profiling result, pstats.Stats or saved .prof file.
+
+        Raises:
+            ValueError: If the result has no stats, since profiling of the function failed.
+        """
+        if isinstance(profile, (time_profiling_results.CallGraphTimeProfilerResult, time_profiling_results.CallGraphWindowResult)):
+            if profile.func_profiling_stats is None:
+                raise ValueError(f'{profile!r} has no stats, profiling of the function failed')
+            return profile.func_profiling_stats
+        if isinstance(profile, call_graph_stats.CallGraphStats):
+            return profile
+        if not isinstance(profile, pstats.Stats):
+            profile = pstats.Stats(os.fspath(profile))
+        return call_graph_stats.CallGraphStats.from_stats(profile)
+
+    @checks.ValidateType([
+        ('baseline', (time_profiling_results.CallGraphTimeProfilerResult, time_profiling_results.CallGraphWindowResult,
+                      call_graph_stats.CallGraphStats, pstats.Stats, str, os.PathLike)),
+        ('candidate', (time_profiling_results.CallGraphTimeProfilerResult, time_profiling_results.CallGraphWindowResult,
+                       call_graph_stats.CallGraphStats, pstats.Stats, str, os.PathLike))
+        ])
+    def compare(self, baseline: CallGraphProfile, candidate: CallGraphProfile) -> time_profiling_results.CallGraphDiffResult:
+        """Compares candidate call graph against baseline one.
+
+        Args:
+            baseline: CallGraphTimeProfilerResult, CallGraphWindowResult, CallGraphStats, pstats.Stats or path of a .prof file.
+            candidate: Same as baseline, for the changed code.
+
+        Returns:
+            CallGraphDiffResult: Top regressions and improvements, added and removed functions.
+
+        Raises:
+            InvalidInputTypeError: If baseline or candidate are of incorrect types.
+            MissingArgumentError: If any required argument is missing.
+            ValueError: If a profiling result has no stats.
+            OSError: If a .prof file can not be read.
+        """
+        baseline_stats, candidate_stats = self._stats(baseline), self._stats(candidate)
+        func_profiling_diff = call_graph_diff.CallGraphDiff.from_stats(baseline_stats, candidate_stats)
+        rows = lambda ranked: [{**func_profiling_diff.row(row), 'delta': delta} for row, delta in ranked]
+        return time_profiling_results.CallGraphDiffResult(
+            profiler=self,
+            baseline_total_time=baseline_stats.total_time,
+            candidate_total_time=candidate_stats.total_time,
+            regressions=rows(func_profiling_diff.regressions(metric=self.metric, normalized=self.normalized, top_n=self.top_n)),
+            improvements=rows(func_profiling_diff.improvements(metric=self.metric, normalized=self.normalized, top_n=self.top_n)),
+            added_funcs=[func_profiling_diff.row(row) for row in func_profiling_diff.added()],
+            removed_funcs=[func_profiling_diff.row(row) for row in func_profiling_diff.removed()],
+            func_profiling_diff=func_profiling_diff
+            )
+
+    def __repr__(self):
+        return f'CallGraphDiffer(metric={self.metric}, normalized={self.normalized}, top_n={self.top_n})'
@@ -0,0 +1,260 @@
+"""Columnar per-function statistics of call graphs profiled with cProfile module."""
+
+import os
+from array import array
+from dataclasses import dataclass, field
+from typing import Literal
+
+import pstats
+
+SortKey = Literal['ncalls', 'primitive_calls', 'tottime', 'cumtime', 'func_name', 'filename']
+
+
+@dataclass
+class CallGraphStats:
+    """Per-function statistics of a call graph, one array element per called function.
+
+    Caller/callee edges reference rows by index, each edge holds statistics of calls made
+    from the caller row to the callee row.
+
+    Attributes:
+        filenames: File each function is defined in, '~' for built-in functions.
+        linenos: Line number of each function definition, 0 for built-in functions.
+        func_names: Name of each function.
+        ncalls: Total amount of calls of each function.
+        primitive_calls: Amount of calls of each function that were not induced by recursion.
+        tottimes: Time spent in each function itself in seconds.
+        cumtimes: Time spent in each function and its callees in seconds.
+        edge_callers: Caller row of each edge.
+        edge_callees: Callee row of each edge.
+        edge_ncalls: Amount of calls along each edge.
+        edge_tottimes: Time spent in callee itself along each edge in seconds.
+        edge_cumtimes: Time spent in callee and its callees along each edge in seconds.
+    """
+
+    filenames: list[str] = field(default_factory=list)
+    linenos: array = field(default_factory=lambda: array('q'))
+    func_names: list[str] = field(default_factory=list)
+    ncalls: array = field(default_factory=lambda: array('q'))
+    primitive_calls: array = field(default_factory=lambda: array('q'))
+    tottimes: array = field(default_factory=lambda: array('d'))
+    cumtimes: array = field(default_factory=lambda: array('d'))
+    edge_callers: array = field(default_factory=lambda: array('q'))
+    edge_callees: array = field(default_factory=lambda: array('q'))
+    edge_ncalls: array = field(default_factory=lambda: array('q'))
+    edge_tottimes: array = field(default_factory=lambda: array('d'))
+    edge_cumtimes: array = field(default_factory=lambda: array('d'))
+    _rows_by_func_name: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _rows_by_filename: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _edges_by_caller: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _edges_by_callee: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        for row, (filename, func_name) in enumerate(zip(self.filenames, self.func_names)):
+            self._rows_by_func_name.setdefault(func_name, []).append(row)
+            self._rows_by_filename.setdefault(filename, []).append(row)
+            self._rows_by_filename.setdefault(os.path.basename(filename), []).append(row)
+        for edge, (caller, callee) in enumerate(zip(self.edge_callers, self.edge_callees)):
+            self._edges_by_caller.setdefault(caller, []).append(edge)
+            self._edges_by_callee.setdefault(callee, []).append(edge)
+
+    @classmethod
+    def from_stats(cls, stats: pstats.Stats) -> 'CallGraphStats':
+        """Converts raw stats of pstats.Stats into a table.
+
+        Args:
+            stats (Stats): Stats of a finished cProfile session.
+
+        Returns:
+            CallGraphStats: Table with one row per called function.
+        """
+        keys = list(stats.stats)
+        rows = {key: row for row, key in enumerate(keys)}
+        table = {'filenames': [], 'linenos': [], 'func_names': [], 'ncalls': [], 'primitive_calls': [], 'tottimes': [], 'cumtimes': []}
+        edges = {'edge_callers': [], 'edge_callees': [], 'edge_ncalls': [], 'edge_tottimes': [], 'edge_cumtimes': []}
+        for key in keys:
+            primitive_calls, ncalls, tottime, cumtime, callers = stats.stats[key]
+            for column, value in zip(table, (*key, ncalls, primitive_calls, tottime, cumtime)):
+                table[column].append(value)
+            # Caller entries are ordered (nc, cc, tt, ct), unlike entries of functions.
+            for caller, (edge_ncalls, _, edge_tottime, edge_cumtime) in callers.items():
+                if caller not in rows:
+                    continue
+                for column, value in zip(edges, (rows[caller], rows[key], edge_ncalls, edge_tottime, edge_cumtime)):
+                    edges[column].append(value)
+        return cls(
+            filenames=table['filenames'],
+            linenos=array('q', table['linenos']),
+            func_names=table['func_names'],
+            ncalls=array('q', table['ncalls']),
+            primitive_calls=array('q', table['primitive_calls']),
+            tottimes=array('d', table['tottimes']),
+            cumtimes=array('d', table['cumtimes']),
+            edge_callers=array('q', edges['edge_callers']),
+            edge_callees=array('q', edges['edge_callees']),
+            edge_ncalls=array('q', edges['edge_ncalls']),
+            edge_tottimes=array('d', edges['edge_tottimes']),
+            edge_cumtimes=array('d', edges['edge_cumtimes'])
+            )
+
+    def __len__(self) -> int:
+        return len(self.func_names)
+
+    @property
+    def total_time(self) -> float:
+        """Time spent in all profiled functions in seconds."""
+        return sum(self.tottimes)
+
+    def row(self, row: int) -> dict:
+        """Returns statistics of a single function as a dictionary."""
+        return {
+            'filename': self.filenames[row],
+            'lineno': self.linenos[row],
+            'func_name': self.func_names[row],
+            'ncalls': self.ncalls[row],
+            'primitive_calls': self.primitive_calls[row],
+            'tottime': self.tottimes[row],
+            'cumtime': self.cumtimes[row]
+            }
+
+    def find(self, func_name: str | None = None, filename: str | None = None) -> list[int]:
+        """Returns rows of functions with given name and/or defined in given file.
+
+        Args:
+            func_name (str | None): Name of the function.
+            filename (str | None): Full path or base name of the file.
+
+        Returns:
+            list[int]: Matching rows in ascending order, all rows if no criteria are provided.
+        """
+        rows = range(len(self))
+        if func_name is not None:
+            rows = self._rows_by_func_name.get(func_name, [])
+        if filename is not None:
+            file_rows = set(self._rows_by_filename.get(filename, []))
+            rows = [row for row in rows if row in file_rows]
+        return list(rows)
+
+    def callers(self, row: int) -> list[tuple[int, int, float, float]]:
+        """Returns caller row, ncalls, tottime and cumtime of each edge leading to the row."""
+        return [
+            (self.edge_callers[edge], self.edge_ncalls[edge], self.edge_tottimes[edge], self.edge_cumtimes[edge])
+            for edge in self._edges_by_callee.get(row, [])
+            ]
+
+    def callees(self, row: int) -> list[tuple[int, int, float, float]]:
+        """Returns callee row, ncalls, tottime and cumtime of each edge leaving the row."""
+        return [
+            (self.edge_callees[edge], self.edge_ncalls[edge], self.edge_tottimes[edge], self.edge_cumtimes[edge])
+            for edge in self._edges_by_caller.get(row, [])
+            ]
+
+    def select(self, rows: list[int]) -> 'CallGraphStats':
+        """Returns table with given rows in given order, edges between kept rows are kept.
+
+        Args:
+            rows (list[int]): Rows of this table.
+
+        Returns:
+            CallGraphStats: Table with selected rows.
+        """
+        new_rows = {row: new_row for new_row, row in enumerate(rows)}
+        kept_edges = [
+            edge for edge in range(len(self.edge_callers))
+            if self.edge_callers[edge] in new_rows and self.edge_callees[edge] in new_rows
+            ]
+        return CallGraphStats(
+            filenames=[self.filenames[row] for row in rows],
+            linenos=array('q', (self.linenos[row] for row in rows)),
+            func_names=[self.func_names[row] for row in rows],
+            ncalls=array('q', (self.ncalls[row] for row in rows)),
+            primitive_calls=array('q', (self.primitive_calls[row] for row in rows)),
+            tottimes=array('d', (self.tottimes[row] for row in rows)),
+            cumtimes=array('d', (self.cumtimes[row] for row in rows)),
+            edge_callers=array('q', (new_rows[self.edge_callers[edge]] for edge in kept_edges)),
+            edge_callees=array('q', (new_rows[self.edge_callees[edge]] for edge in kept_edges)),
+            edge_ncalls=array('q', (self.edge_ncalls[edge] for edge in kept_edges)),
+            edge_tottimes=array('d', (self.edge_tottimes[edge] for edge in kept_edges)),
+            edge_cumtimes=array('d', (self.edge_cumtimes[edge] for edge in kept_edges))
+            )
+
+    def sort(self, key: SortKey = 'cumtime', top_n: int | None = None) -> 'CallGraphStats':
+        """Returns table sorted by a column, numeric columns in descending order.
+
+        Args:
+            key (str): Column to sort by.
+            top_n (int | None): If provided, only first top_n rows are kept.
+
+        Returns:
+            CallGraphStats: Sorted table.
+
+        Raises:
+            ValueError: If key is not a sortable column.
+        """
+        columns = {
+            'ncalls': (self.ncalls, True),
+            'primitive_calls': (self.primitive_calls, True),
+            'tottime': (self.tottimes, True),
+            'cumtime': (self.cumtimes, True),
+            'func_name': (self.func_names, False),
+            'filename': (self.filenames, False)
+            }
+        if key not in columns:
+            raise ValueError(f'Can not sort by {key}, expected one of: {list(columns)}')
+        column, descending = columns[key]
+        rows = sorted(range(len(self)), key=column.__getitem__, reverse=descending)
+        return self.select(rows[:top_n])
+
+    def filter(
+        self,
+        func_name: str | None = None,
+        filename: str | None = None,
+        min_cumtime: float = 0.0,
+        min_ncalls: int = 0
+        ) -> 'CallGraphStats':
+        """Returns table with functions that match all provided criteria.
+
+        Args:
+            func_name (str | None): Name of the function.
+            filename (str | None): Full path or base name of the file.
+            min_cumtime (float): Minimum cumulative time in seconds.
+            min_ncalls (int): Minimum amount of calls.
+
+        Returns:
+            CallGraphStats: Filtered table.
+        """
+        return self.select([
+            row for row in self.find(func_name=func_name, filename=filename)
+            if self.cumtimes[row] >= min_cumtime and self.ncalls[row] >= min_ncalls
+            ])
+
+    def to_dict(self) -> dict:
+        """Returns table with columns as lists of numbers, ready for JSON/YAML serialization."""
+        return {
+            'filenames': list(self.filenames),
+            'linenos': self.linenos.tolist(),
+            'func_names': list(self.func_names),
+            'ncalls': self.ncalls.tolist(),
+            'primitive_calls': self.primitive_calls.tolist(),
+            'tottimes': self.tottimes.tolist(),
+            'cumtimes': self.cumtimes.tolist(),
+            'edge_callers': self.edge_callers.tolist(),
+            'edge_callees': self.edge_callees.tolist(),
+            'edge_ncalls': self.edge_ncalls.tolist(),
+            'edge_tottimes': self.edge_tottimes.tolist(),
+            'edge_cumtimes': self.edge_cumtimes.tolist()
+            }
+
+    def __str__(self) -> str:
+        header = f"{'ncalls':>12} {'tottime':>10} {'cumtime':>10}  filename:lineno(function)"
+        rows = (
+            f"{ncalls if ncalls == primitive_calls else f'{ncalls}/{primitive_calls}':>12} {tottime:>10.6f} {cumtime:>10.6f}  "
+            f"{os.path.basename(filename)}:{lineno}({func_name})"
+            for filename, lineno, func_name, ncalls, primitive_calls, tottime, cumtime in zip(
+                self.filenames, self.linenos, self.func_names, self.ncalls, self.primitive_calls, self.tottimes, self.cumtimes
+                )
+            )
+        return '\n'.join((header, *rows))
+
+    def __repr__(self) -> str:
+        return f'CallGraphStats(functions={len(self)}, edges={len(self.edge_callers)})'
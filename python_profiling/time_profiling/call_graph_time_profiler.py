@@ -2,25 +2,38 @@
 
 import io
 import os
+import tempfile
 from types import BuiltinFunctionType, FunctionType
-from typing import Literal
+from typing import Any, Literal
 
 import pydantic
 import pstats
 
 from python_profiling.time_profiling import time_profiling_results
+from python_profiling.time_profiling import call_graph_stats
+from python_profiling.time_profiling import rolling_call_graph
 from Internals import checks
 from Internals import context_managers
+from Internals import module_locations
+from Internals import monitoring
 from Internals.logger import logger
 
 
 class CallGraphTimeProfiler(pydantic.BaseModel):
-    """Call graph time profiler using cProfile and pstats.
+    """Call graph time profiler using cProfile (or sys.monitoring) and pstats.
 
     Attributes:
         sort_key (str): Metric to sort by (e.g., 'cumulative', 'time', etc.).
         func_filter (str | None): Optional function name to filter profiling output.
         top_n (int): Number of top entries to show in the profiling output.
+        save_stats (bool): If True, raw stats are also dumped into a unique temporary .prof file
+            (e.g. for external visualizers), path of the file is stored in the result.
+        backend (str): 'cprofile' or 'monitoring', the latter collects stats of Python functions
+            through sys.monitoring (Python 3.12+, see monitoring module), results have the same format.
+            Unlike cProfile, which profiles the calling thread, it includes calls of functions in scope
+            made by other threads during the profiled call.
+        modules (list[str] | None): Modules profiled by 'monitoring' backend, functions of other
+            modules are disabled on their first call; all Python code if None.
     """
     
     model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
@@ -28,18 +41,28 @@ class CallGraphTimeProfiler(pydantic.BaseModel):
     sort_key: Literal['time', 'cumulative', 'calls', 'name', 'file', 'line']  = pydantic.Field(default='cumulative')
     func_filter: str | None = pydantic.Field(default=None)
     top_n : int =  pydantic.Field(default=10)
+    save_stats: bool = pydantic.Field(default=False)
+    backend: Literal['cprofile', 'monitoring'] = pydantic.Field(default='cprofile')
+    modules: list[str] | None = pydantic.Field(default=None)
     
-    def _profile_to_string(self, profile_file: str):
-        """Load profiling result and output as a string.
+    @pydantic.field_validator('backend')
+    @classmethod
+    def _check_backend(cls, backend: str) -> str:
+        if backend == 'monitoring' and not monitoring.MONITORING_AVAILABLE:
+            raise ValueError('monitoring backend requires Python 3.12 or newer')
+        return backend
+    
+    def _profile_to_string(self, stats: pstats.Stats):
+        """Output stats of finished profiler as a string.
         
         Args:
-            profile_file: File with profiling result.
+            stats: Stats of finished profiler, stripped of directories in place.
             
         Returns:
             str: Profiling result in string format.
         """
         buf = io.StringIO()
-        stats = pstats.Stats(profile_file, stream=buf)
+        stats.stream = buf
         stats.strip_dirs().sort_stats(self.sort_key)
         stats.print_stats(self.top_n)
         if self.func_filter:
@@ -60,25 +83,150 @@ class CallGraphTimeProfiler(pydantic.BaseModel):
             **kwargs: Keyword arguments to pass to the function.
             
         Returns:
-            CallGraphTimeProfilerResult: Structured profiling result.
+            CallGraphTimeProfilerResult: Structured profiling result, without stats if the call is nested
+                into another profiled call on Python 3.12+ (the function then runs unprofiled).
         
         Raises:
             InvalidInputTypeError: If the function is not of the correct type.
         """
-        with context_managers.CallGraphTimeProfilerManager() as call_graph_profiling_manager:
+        func_result = None
+        with self.profiling_manager(func) as call_graph_profiling_manager:
             func_result = func(**kwargs)
+        return self._get_profiling_result(func, kwargs, func_result, call_graph_profiling_manager)
+    
+    @checks.ValidateType(('func', (BuiltinFunctionType, FunctionType)))
+    async def profile_async(
+        self, 
+        func: BuiltinFunctionType | FunctionType, 
+        **kwargs
+        ) -> time_profiling_results.CallGraphTimeProfilerResult:
+        """Profile call graph of an async def function until its coroutine finishes.
+        
+        The profiler stays enabled while the coroutine is suspended, so other tasks that run on
+        the event loop in the meantime are included into the call graph.
+        
+        Args:
+            func (BuiltinFunctionType | FunctionType): Coroutine function to profile.
+            **kwargs: Keyword arguments to pass to the function.
+            
+        Returns:
+            CallGraphTimeProfilerResult: Structured profiling result, without stats if another cProfile 
+                session is active on Python 3.12+ (the function then runs unprofiled).
+        
+        Raises:
+            InvalidInputTypeError: If the function is not of the correct type.
+        """
+        func_result = None
+        with self.profiling_manager(func, blocking=False) as call_graph_profiling_manager:
+            func_result = await func(**kwargs)
+        return self._get_profiling_result(func, kwargs, func_result, call_graph_profiling_manager)
+            
+    def window_result(
+        self,
+        func: BuiltinFunctionType | FunctionType,
+        window: rolling_call_graph.CallGraphWindow
+        ) -> time_profiling_results.CallGraphWindowResult:
+        """Build structured profiling result from stats merged over a time window.
+        
+        Args:
+            func (BuiltinFunctionType | FunctionType): Profiled function.
+            window (CallGraphWindow): Merged stats of the function calls.
+            
+        Returns:
+            CallGraphWindowResult: Structured profiling result.
+        """
+        stats = window.to_pstats()
+        return time_profiling_results.CallGraphWindowResult(
+            profiler=self,
+            profiled_func=func,
+            window_start=window.window_start,
+            window_end=window.window_end,
+            calls=window.calls,
+            weight=window.weight,
+            func_profiling_stats=call_graph_stats.CallGraphStats.from_stats(stats),
+            func_profiling_result=self._profile_to_string(stats)
+            )
             
-        if not call_graph_profiling_manager.exception:
-            profiling_result = self._profile_to_string(context_managers.CALL_GRAPH_PROFILING_RESULT_FILE)
-            os.remove(context_managers.CALL_GRAPH_PROFILING_RESULT_FILE)
+    def profiling_manager(
+        self, 
+        func: BuiltinFunctionType | FunctionType, 
+        blocking: bool = True, 
+        save_stats: bool = True
+        ) -> context_managers.CallGraphTimeProfilerManager | context_managers.MonitoringProfilerManager:
+        """Returns context manager of a profiling session of the configured backend.
+
+        Args:
+            func (BuiltinFunctionType | FunctionType): Profiled function, always in scope of 'monitoring' backend.
+            blocking (bool): If False, cProfile session does not wait for another session to finish and
+                the function runs unprofiled instead.
+            save_stats (bool): If False, cProfile stats are not dumped even if save_stats is configured.
+        """
+        if self.backend == 'monitoring':
+            codes = [func.__code__] if isinstance(func, FunctionType) else []
+            paths = module_locations.module_paths(self.modules) if self.modules is not None else None
+            return context_managers.MonitoringProfilerManager(session=monitoring.CallGraphMonitor(codes=codes, paths=paths))
+        return context_managers.CallGraphTimeProfilerManager(output_file=self._stats_file() if save_stats else None, blocking=blocking)
+    
+    @staticmethod
+    def raw_stats(
+        call_graph_profiling_manager: context_managers.CallGraphTimeProfilerManager | context_managers.MonitoringProfilerManager
+        ) -> dict:
+        """Returns raw stats in pstats format of a finished profiling session of either backend."""
+        if isinstance(call_graph_profiling_manager, context_managers.MonitoringProfilerManager):
+            return call_graph_profiling_manager.session.stats()
+        call_graph_profiling_manager.profiler.create_stats()
+        return call_graph_profiling_manager.profiler.stats
+    
+    @staticmethod
+    def _pstats(raw_stats: dict) -> pstats.Stats:
+        """Returns pstats.Stats of raw stats, e.g. for printing or sorting."""
+        stats = pstats.Stats()
+        stats.stats = raw_stats
+        stats.get_top_level_stats()
+        return stats
+    
+    def _stats_file(self) -> str | None:
+        """Returns unique path for raw stats if they have to be saved."""
+        if not self.save_stats:
+            return None
+        file_descriptor, stats_file = tempfile.mkstemp(prefix='call_graph_', suffix='.prof')
+        os.close(file_descriptor)
+        return stats_file
+            
+    def _get_profiling_result(
+        self, 
+        func: BuiltinFunctionType | FunctionType, 
+        kwargs: dict,
+        func_result: Any,
+        call_graph_profiling_manager: context_managers.CallGraphTimeProfilerManager | context_managers.MonitoringProfilerManager
+        ) -> time_profiling_results.CallGraphTimeProfilerResult:
+        """Build structured profiling result from finished profiling process, stats are None if it did not run."""
+        exception = call_graph_profiling_manager.exception
+        profiled = call_graph_profiling_manager.profiled
+        monitoring_backend = isinstance(call_graph_profiling_manager, context_managers.MonitoringProfilerManager)
+        stats_file = None if monitoring_backend else call_graph_profiling_manager.output_file
+        if (exception or not profiled) and stats_file is not None:
+            os.remove(stats_file)
+            stats_file = None
+        func_profiling_result, func_profiling_stats = None, None
+        if profiled and not exception:
+            stats = self._pstats(self.raw_stats(call_graph_profiling_manager))
+            if monitoring_backend:
+                stats_file = self._stats_file()
+                if stats_file is not None:
+                    stats.dump_stats(stats_file)
+            func_profiling_stats = call_graph_stats.CallGraphStats.from_stats(stats)
+            func_profiling_result = self._profile_to_string(stats)
             
         return time_profiling_results.CallGraphTimeProfilerResult(
             profiler=self,
             profiled_func=func,
             func_kwargs=kwargs,
-            func_result=func_result if not call_graph_profiling_manager.exception else None,
-            func_profiling_result=profiling_result if not call_graph_profiling_manager.exception else None,
-            func_exception=call_graph_profiling_manager.func_exception
+            func_result=func_result if not exception else None,
+            func_profiling_result=func_profiling_result,
+            func_profiling_stats=func_profiling_stats,
+            func_exception=call_graph_profiling_manager.func_exception,
+            stats_file=stats_file
             )
             
         
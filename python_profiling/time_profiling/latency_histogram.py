@@ -0,0 +1,163 @@
+"""Fixed-memory latency histogram with logarithmically sized buckets (HDR-style)."""
+
+import math
+import threading
+from array import array
+from types import BuiltinFunctionType, FunctionType
+
+from python_profiling.time_profiling import time_profiling_results
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class LatencyHistogram:
+    """Streaming histogram of execution times with constant memory and per-record cost.
+
+    Bucket `i` covers values in [min_value * base ** i, min_value * base ** (i + 1)),
+    where base is 1 + 10 ** -significant_digits, so every recorded value is known up to
+    the configured relative precision no matter how many values were recorded.
+
+    Calls that raised are only counted (see record_failure), their execution times do not
+    enter the histogram.
+
+    Args:
+        min_value (float): Smallest distinguishable value in seconds, smaller values go to the first bucket.
+        max_value (float): Largest distinguishable value in seconds, larger values go to the last bucket.
+        significant_digits (int): Relative precision of recorded values.
+
+    Raises:
+        ValueError: If value range is empty or significant_digits not in [1, 4] range.
+    """
+
+    __slots__ = (
+        'min_value', 'max_value', 'significant_digits', '_log_base', '_counts', '_count',
+        '_failed_count', '_sum', '_min', '_max', '_lock'
+        )
+
+    def __init__(self, min_value: float = 1e-9, max_value: float = 3600.0, significant_digits: int = 2):
+        if not 0 < min_value < max_value:
+            raise ValueError(f'Expected 0 < min_value < max_value, got instead: {min_value, max_value}')
+        if not isinstance(significant_digits, int) or not 1 <= significant_digits <= 4:
+            raise ValueError(f'significant_digits has to be in [1, 4] range, got instead: {significant_digits}')
+        self.min_value = min_value
+        self.max_value = max_value
+        self.significant_digits = significant_digits
+        self._log_base = math.log1p(10 ** -significant_digits)
+        buckets_amount = int(math.log(max_value / min_value) / self._log_base) + 1
+        self._counts = array('d', bytes(8 * buckets_amount))
+        self._count, self._sum, self._min, self._max = 0.0, 0.0, math.inf, 0.0
+        self._failed_count = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> float:
+        """Returns amount of recorded values."""
+        return self._count
+
+    @property
+    def failed_count(self) -> float:
+        """Returns amount of calls that raised."""
+        return self._failed_count
+
+    def _bucket_value(self, index: int) -> float:
+        """Returns geometric middle of the bucket clipped to observed range."""
+        value = self.min_value * math.exp((index + 0.5) * self._log_base)
+        return min(max(value, self._min), self._max)
+
+    def record(self, value: int | float, count: int | float = 1) -> None:
+        """Adds value to the histogram.
+
+        Args:
+            value: Execution time in seconds.
+            count: Amount of calls the value stands for (e.g. sampling weight).
+        """
+        if value <= self.min_value:
+            index = 0
+        else:
+            index = min(int(math.log(value / self.min_value) / self._log_base), len(self._counts) - 1)
+        with self._lock:
+            self._counts[index] += count
+            self._count += count
+            self._sum += value * count
+            if value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
+
+    def record_failure(self, count: int | float = 1) -> None:
+        """Counts a call that raised, its execution time is not recorded.
+
+        Args:
+            count: Amount of calls the failed call stands for (e.g. sampling weight).
+        """
+        with self._lock:
+            self._failed_count += count
+
+    def percentiles(self, percentiles: tuple[float, ...] = PERCENTILES) -> list[float]:
+        """Returns values below which given percentages of recorded values fall.
+
+        Args:
+            percentiles: Percentiles in range [0, 100], sorted ascending.
+
+        Returns:
+            list[float]: Value for each requested percentile, zeros if histogram is empty.
+        """
+        if not self._count:
+            return [0.0 for _ in percentiles]
+        targets = iter([percentile / 100 * self._count for percentile in percentiles])
+        target = next(targets)
+        values, cumulative_count = [], 0.0
+        for index, bucket_count in enumerate(self._counts):
+            cumulative_count += bucket_count
+            while cumulative_count >= target and len(values) < len(percentiles):
+                values.append(self._bucket_value(index))
+                target = next(targets, math.inf)
+            if len(values) == len(percentiles):
+                break
+        return values + [self._max] * (len(percentiles) - len(values))
+
+    def _clear(self) -> None:
+        self._counts = array('d', bytes(8 * len(self._counts)))
+        self._count, self._sum, self._min, self._max = 0.0, 0.0, math.inf, 0.0
+        self._failed_count = 0.0
+
+    def reset(self) -> None:
+        """Removes all recorded values."""
+        with self._lock:
+            self._clear()
+
+    def snapshot(
+        self,
+        profiled_func: BuiltinFunctionType | FunctionType,
+        reset: bool = False
+        ) -> time_profiling_results.LatencyHistogramResult:
+        """Summarize recorded values.
+
+        Args:
+            profiled_func: Function whose execution times were recorded.
+            reset: If True, removes recorded values after summarizing them.
+
+        Returns:
+            LatencyHistogramResult: Structured profiling result.
+        """
+        with self._lock:
+            p50, p90, p99, p999 = self.percentiles()
+            result = time_profiling_results.LatencyHistogramResult(
+                profiler=self,
+                profiled_func=profiled_func,
+                count=self._count,
+                mean_func_execution_time=self._sum / self._count if self._count else 0.0,
+                p50_func_execution_time=p50,
+                p90_func_execution_time=p90,
+                p99_func_execution_time=p99,
+                p999_func_execution_time=p999,
+                max_func_execution_time=self._max,
+                failed_count=self._failed_count
+                )
+            if reset:
+                self._clear()
+        return result
+
+    def __repr__(self) -> str:
+        return (f'LatencyHistogram(min_value={self.min_value}, max_value={self.max_value}, '
+                f'significant_digits={self.significant_digits})')
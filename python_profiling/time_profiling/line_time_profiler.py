@@ -1,13 +1,17 @@
 """Time profiling of Python functions with line_profiler module."""
 
-import io
+import threading
 from types import BuiltinFunctionType, FunctionType
 
 import line_profiler
 
 from python_profiling.time_profiling import time_profiling_results
+from python_profiling.time_profiling import line_timings
+from Internals import callee_discovery
 from Internals import checks
 from Internals import context_managers
+from Internals import module_locations
+from Internals import monitoring
 
 
 class LineTimeProfiler:
@@ -22,18 +26,16 @@ class LineTimeProfiler:
         return line_profiler.LineProfiler()
     
     @staticmethod
-    def _get_profiling_result(line_profiler_: line_profiler.LineProfiler) -> str:
-        """ Returns the line-by-line profiling results as a string.
+    def _get_profiling_result(line_profiler_: line_profiler.LineProfiler) -> list[line_timings.LineTimings]:
+        """ Returns the line-by-line profiling results as columnar timings.
         
         Args:
 			line_profiler_ (LineProfiler): Instance of LineProfiler class.
    
 		Returns:
-			str: A formatted string containing the profiling statistics.
+			list[LineTimings]: Per-line timings of each profiled function.
         """
-        stream = io.StringIO()
-        line_profiler_.print_stats(stream=stream)
-        return stream.getvalue()
+        return line_timings.LineTimings.from_line_stats(line_profiler_.get_stats())
         
     @classmethod
     @checks.ValidateType(('func', (BuiltinFunctionType, FunctionType)))
@@ -53,16 +55,230 @@ class LineTimeProfiler:
         Raises:
             InvalidInputTypeError: If the function is not of the correct type.
         """
+        return cls._profile(profiler=cls, func=func, callees=(), kwargs=kwargs)
+    
+    @classmethod
+    def _profile(
+        cls, 
+        profiler, 
+        func: BuiltinFunctionType | FunctionType, 
+        callees: list[FunctionType], 
+        kwargs: dict
+        ) -> time_profiling_results.LineTimeProfilerResult:
+        """Profile the function together with its callees in a single LineProfiler."""
         line_profiler_ = cls._init_line_profiler()
         
-        with context_managers.LineTimeProfilerManager(profiler=line_profiler_, profiled_func=func) as line_time_profiler_manager:
+        with context_managers.LineTimeProfilerManager(profiler=line_profiler_, profiled_func=func, callees=callees) as line_time_profiler_manager:
             profiling_result = func(**kwargs)
         
         return time_profiling_results.LineTimeProfilerResult(
-            profiler=cls,
+            profiler=profiler,
             profiled_func=func,
             func_kwargs=kwargs,
             func_result=profiling_result if not line_time_profiler_manager.exception else None,
             func_profiling_result=cls._get_profiling_result(line_profiler_),
             func_exception=line_time_profiler_manager.func_exception
-            )
\ No newline at end of file
+            )
+    
+    
+class CalleeLineTimeProfiler(LineTimeProfiler):
+    """Line profiler that also instruments functions called by the profiled function.
+    
+    Callees are discovered by inspection of code objects (see callee_discovery module) once per 
+    profiled function, so a single line-level report covers the whole call path.
+    
+    Args:
+        max_depth (int): Maximum depth of instrumented call chain, 1 instruments direct callees only.
+        package (str | None): If provided, only callees defined in this package (or module) are instrumented.
+        
+    Raises:
+        ValueError: If max_depth is lower than 1.
+    """
+    
+    def __init__(self, max_depth: int = 1, package: str | None = None):
+        if max_depth < 1:
+            raise ValueError(f'max_depth has to be at least 1, got instead: {max_depth}')
+        self.max_depth = max_depth
+        self.package = package
+        self._callees = {}
+        
+    def __repr__(self) -> str:
+        return f'CalleeLineTimeProfiler(max_depth={self.max_depth}, package={self.package})'
+    
+    def callees(self, func: FunctionType) -> list[FunctionType]:
+        """Returns instrumented callees of the function, discovered on the first call."""
+        if func not in self._callees:
+            self._callees[func] = callee_discovery.discover_callees(func, max_depth=self.max_depth, package=self.package)
+        return self._callees[func]
+    
+    @checks.ValidateType(('func', (BuiltinFunctionType, FunctionType)))
+    def profile(
+        self, 
+        func: BuiltinFunctionType | FunctionType,
+        **kwargs
+        ) -> time_profiling_results.LineTimeProfilerResult:
+        """Profile the execution time of each line of a function and of its callees.
+        
+        Args:
+            func (BuiltinFunctionType | FunctionType): Function to profile.
+            **kwargs:  Keyword arguments to pass to the function.
+        Returns:
+            LineTimeProfilerResult:  Structured profiling result with timings of every executed function.
+            
+        Raises:
+            InvalidInputTypeError: If the function is not of the correct type.
+        """
+        callees = self.callees(func) if isinstance(func, FunctionType) else []
+        return self._profile(profiler=self, func=func, callees=callees, kwargs=kwargs)
+    
+    
+class MonitoringLineTimeProfiler(LineTimeProfiler):
+    """Line profiler built on sys.monitoring (Python 3.12+) instead of line_profiler.
+    
+    Line events are enabled only for code of the profiled function, its discovered callees and 
+    functions of given modules; any other code is disabled on its first call (see monitoring 
+    module). Lines of that code executed by other threads during the profiled call are included.
+    Results have the same format as results of LineTimeProfiler.
+    
+    Args:
+        modules (list[str] | None): Modules whose functions are profiled in addition to the profiled function.
+        max_depth (int): Depth of profiled call chain below the profiled function (see callee_discovery module).
+        package (str | None): If provided, only callees defined in this package are profiled.
+        
+    Raises:
+        RuntimeError: If sys.monitoring is not available.
+        ValueError: If max_depth is negative or a module can not be found.
+    """
+    
+    def __init__(self, modules: list[str] | None = None, max_depth: int = 0, package: str | None = None):
+        if not monitoring.MONITORING_AVAILABLE:
+            raise RuntimeError('sys.monitoring backend requires Python 3.12 or newer')
+        if max_depth < 0:
+            raise ValueError(f'max_depth has to be non negative, got instead: {max_depth}')
+        self.modules = modules
+        self.max_depth = max_depth
+        self.package = package
+        self._paths = module_locations.module_paths(modules or [])
+        self._codes = {}
+        
+    def __repr__(self) -> str:
+        return f'MonitoringLineTimeProfiler(modules={self.modules}, max_depth={self.max_depth}, package={self.package})'
+    
+    def codes(self, func: FunctionType) -> list:
+        """Returns code objects of the function and its callees, discovered on the first call."""
+        if func not in self._codes:
+            callees = callee_discovery.discover_callees(func, max_depth=self.max_depth, package=self.package)
+            self._codes[func] = [function.__code__ for function in (func, *callees)]
+        return self._codes[func]
+    
+    @checks.ValidateType(('func', (BuiltinFunctionType, FunctionType)))
+    def profile(
+        self, 
+        func: BuiltinFunctionType | FunctionType,
+        **kwargs
+        ) -> time_profiling_results.LineTimeProfilerResult:
+        """Profile the execution time of each line of a function (and of its callees and given modules).
+        
+        Args:
+            func (BuiltinFunctionType | FunctionType): Function to profile.
+            **kwargs:  Keyword arguments to pass to the function.
+        Returns:
+            LineTimeProfilerResult:  Structured profiling result with timings of every executed function.
+            
+        Raises:
+            InvalidInputTypeError: If the function is not of the correct type.
+        """
+        codes = self.codes(func) if isinstance(func, FunctionType) else []
+        line_monitor = monitoring.LineMonitor(codes=codes, paths=self._paths)
+        
+        with context_managers.MonitoringProfilerManager(session=line_monitor) as line_time_profiler_manager:
+            profiling_result = func(**kwargs)
+            
+        return time_profiling_results.LineTimeProfilerResult(
+            profiler=self,
+            profiled_func=func,
+            func_kwargs=kwargs,
+            func_result=profiling_result if not line_time_profiler_manager.exception else None,
+            func_profiling_result=line_timings.LineTimings.from_line_stats(line_profiler.LineStats(line_monitor.timings(), 1e-9)),
+            func_exception=line_time_profiler_manager.func_exception
+            )
+    
+    
+class AccumulatingLineTimeProfiler:
+    """Line profiler that instruments functions once and accumulates their timings across calls.
+    
+    Timings of all added functions live in a single LineProfiler, which keeps tracing state per 
+    thread, so profiled functions can be called from several threads at once (see 
+    AccumulatingLineTimeProfilerManager). The LineProfiler is never cleared, snapshots are 
+    differences against timings at the previous reset.
+    """
+    
+    def __init__(self):
+        self.line_profiler = line_profiler.LineProfiler()
+        self._baseline = {}
+        self._instrumented_codes = set()
+        self._lock = threading.Lock()
+        
+    def __repr__(self) -> str:
+        return 'AccumulatingLineTimeProfiler()'
+    
+    @staticmethod
+    def timings_key(func: FunctionType) -> tuple[str, int, str]:
+        """Returns key of the function in LineProfiler timings."""
+        return func.__code__.co_filename, func.__code__.co_firstlineno, func.__code__.co_name
+    
+    @checks.ValidateType(('func', FunctionType))
+    def add_function(self, func: FunctionType) -> tuple[str, int, str]:
+        """Instruments the function, functions that are already instrumented are skipped.
+        
+        Args:
+            func (FunctionType): Function to instrument.
+            
+        Returns:
+            tuple[str, int, str]: Key of the function in snapshots.
+            
+        Raises:
+            InvalidInputTypeError: If the function is not of the correct type.
+        """
+        with self._lock:
+            if func.__code__ not in self._instrumented_codes:
+                self.line_profiler.add_function(func)
+                self._instrumented_codes.add(func.__code__)
+        return self.timings_key(func)
+    
+    def snapshot(
+        self, 
+        reset: bool = False, 
+        keys: list[tuple[str, int, str]] | None = None
+        ) -> dict[tuple[str, int, str], line_timings.LineTimings]:
+        """Returns timings accumulated since the previous reset.
+        
+        Args:
+            reset (bool): If True, following snapshots only contain timings recorded after this one.
+            keys (list[tuple[str, int, str]] | None): Keys of functions to snapshot (and reset), all if None.
+            
+        Returns:
+            dict[tuple[str, int, str], LineTimings]: Timings of each function with executed lines, by its key.
+        """
+        with self._lock:
+            line_stats = self.line_profiler.get_stats()
+            accumulated_timings = {
+                key: {lineno: (hits, time) for lineno, hits, time in lines}
+                for key, lines in line_stats.timings.items()
+                if keys is None or key in keys
+                }
+            timings = {}
+            for key, lines in accumulated_timings.items():
+                baseline = self._baseline.get(key, {})
+                timings[key] = [
+                    (lineno, hits - baseline.get(lineno, (0, 0))[0], time - baseline.get(lineno, (0, 0))[1])
+                    for lineno, (hits, time) in lines.items()
+                    if hits > baseline.get(lineno, (0, 0))[0]
+                    ]
+            if reset:
+                self._baseline.update(accumulated_timings)
+        functions_timings = line_timings.LineTimings.from_line_stats(line_profiler.LineStats(timings, line_stats.unit))
+        return {
+            (function_timings.filename, function_timings.first_lineno, function_timings.func_name): function_timings
+            for function_timings in functions_timings
+            }
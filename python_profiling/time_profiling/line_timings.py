@@ -0,0 +1,109 @@
+"""Columnar per-line timings of functions profiled with line_profiler module."""
+
+import heapq
+import linecache
+from array import array
+from dataclasses import dataclass, field
+
+import line_profiler
+
+
+@dataclass
+class LineTimings:
+    """Per-line timings of a single function, one array element per executed line.
+
+    Attributes:
+        filename: File the function is defined in.
+        func_name: Name of the function.
+        first_lineno: Line number of the function definition.
+        linenos: Line numbers of executed lines.
+        hits: Amount of times each line was executed.
+        total_times: Time spent on each line in seconds.
+        per_hit_times: Average time of a single execution of each line in seconds.
+        source_lines: Source text of each line, empty if source is not available.
+    """
+
+    filename: str
+    func_name: str
+    first_lineno: int
+    linenos: array = field(default_factory=lambda: array('q'))
+    hits: array = field(default_factory=lambda: array('q'))
+    total_times: array = field(default_factory=lambda: array('d'))
+    per_hit_times: array = field(default_factory=lambda: array('d'))
+    source_lines: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_line_stats(cls, line_stats: line_profiler.LineStats) -> list['LineTimings']:
+        """Converts stats of LineProfiler.get_stats into timings per profiled function.
+
+        Args:
+            line_stats (LineStats): Timings of LineProfiler in timer units.
+
+        Returns:
+            list[LineTimings]: Timings of each profiled function that executed at least one line.
+        """
+        functions_timings = []
+        for (filename, first_lineno, func_name), lines in line_stats.timings.items():
+            if not lines:
+                continue
+            lines = sorted(lines)
+            source = linecache.getlines(filename)
+            functions_timings.append(cls(
+                filename=filename,
+                func_name=func_name,
+                first_lineno=first_lineno,
+                linenos=array('q', [lineno for lineno, _, _ in lines]),
+                hits=array('q', [hits for _, hits, _ in lines]),
+                total_times=array('d', [time * line_stats.unit for _, _, time in lines]),
+                per_hit_times=array('d', [time * line_stats.unit / hits if hits else 0.0 for _, hits, time in lines]),
+                source_lines=[source[lineno - 1].rstrip() if lineno <= len(source) else '' for lineno, _, _ in lines]
+                ))
+        return functions_timings
+
+    @property
+    def total_time(self) -> float:
+        """Time spent in all executed lines of the function in seconds."""
+        return sum(self.total_times)
+
+    def hot_lines(self, k: int = 5) -> list[tuple[int, int, float, float, str]]:
+        """Returns k lines with the largest total time, slowest first.
+
+        Args:
+            k (int): Amount of returned lines.
+
+        Returns:
+            list[tuple[int, int, float, float, str]]: Line number, hits, total time, per-hit time and source of each line.
+        """
+        indexes = heapq.nlargest(k, range(len(self.linenos)), key=self.total_times.__getitem__)
+        return [
+            (self.linenos[index], self.hits[index], self.total_times[index], self.per_hit_times[index], self.source_lines[index])
+            for index in indexes
+            ]
+
+    def to_dict(self) -> dict:
+        """Returns timings with columns as lists of numbers, ready for JSON/YAML serialization."""
+        return {
+            'filename': self.filename,
+            'func_name': self.func_name,
+            'first_lineno': self.first_lineno,
+            'linenos': self.linenos.tolist(),
+            'hits': self.hits.tolist(),
+            'total_times': self.total_times.tolist(),
+            'per_hit_times': self.per_hit_times.tolist(),
+            'source_lines': list(self.source_lines)
+            }
+
+    def __str__(self) -> str:
+        header = (f"Function: {self.func_name} at line {self.first_lineno} of {self.filename}\n"
+                  f"Total time: {self.total_time:.6f} seconds\n"
+                  f"{'Line #':>6} {'Hits':>9} {'Time (s)':>12} {'Per Hit (s)':>12}  Line Contents")
+        rows = (
+            f"{lineno:>6} {hits:>9} {total_time:>12.6f} {per_hit_time:>12.6f}  {source_line}"
+            for lineno, hits, total_time, per_hit_time, source_line in zip(
+                self.linenos, self.hits, self.total_times, self.per_hit_times, self.source_lines
+                )
+            )
+        return '\n'.join((header, *rows))
+
+    def __repr__(self) -> str:
+        return f'LineTimings(func_name={self.func_name}, first_lineno={self.first_lineno}, lines={len(self.linenos)})'
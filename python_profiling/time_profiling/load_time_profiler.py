@@ -0,0 +1,123 @@
+"""Time profiling of Python functions under concurrent load with a thread pool."""
+
+import collections
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import FunctionType, BuiltinFunctionType
+
+import pydantic
+
+from Internals import checks
+from Internals import context_managers
+from python_profiling.time_profiling import time_profiling_results
+
+
+class LoadTimeProfiler(pydantic.BaseModel):
+    """Time profiler that calls the function many times from a pool of threads.
+
+    Without target_rate all calls are submitted at once (closed loop) and the pool runs
+    `concurrency` of them at a time. With target_rate calls are submitted on a fixed schedule
+    (open loop), so when the function can't keep up calls wait in the pool queue and the wait
+    shows up as queueing delay instead of being hidden by slower submission.
+
+    Useful for functions that release the GIL (I/O, torch ops) where throughput
+    should grow with the amount of threads.
+
+    Attributes:
+        timer (FunctionType | BuiltinFunctionType): Timer function used for profiling.
+        total_calls (int): Amount of calls of the function.
+        concurrency (int): Amount of worker threads.
+        target_rate (float | None): Calls submitted per second, if None all calls are submitted at once.
+    """
+
+    model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
+
+    timer: FunctionType | BuiltinFunctionType = pydantic.Field(default=time.perf_counter)
+    total_calls: int = pydantic.Field(default=100, gt=0)
+    concurrency: int = pydantic.Field(default=4, gt=0)
+    target_rate: float | None = pydantic.Field(default=None, gt=0)
+
+    def _timed_call(self, func: FunctionType | BuiltinFunctionType, kwargs: dict, scheduled_time: float) -> tuple:
+        """Runs single call inside worker thread.
+
+        Returns:
+            tuple: Queueing delay, latency, function result and exception type of the call.
+        """
+        func_result = None
+        with context_managers.TimeProfilerManager(profiling_timer=self.timer) as time_profiler_manager:
+            func_result = func(**kwargs)
+        return (
+            time_profiler_manager.profiling_start - scheduled_time,
+            time_profiler_manager.func_execution_time,
+            func_result,
+            time_profiler_manager.func_exception
+            )
+
+    @staticmethod
+    def _percentile(ordered_values: list[float], percentile: float) -> float:
+        """Nearest-rank percentile of sorted values, 0 if there are no values."""
+        if not ordered_values:
+            return 0.0
+        rank = max(math.ceil(percentile / 100 * len(ordered_values)), 1)
+        return ordered_values[rank - 1]
+
+    @checks.ValidateType(('func', (FunctionType, BuiltinFunctionType)))
+    def profile(self, func: FunctionType | BuiltinFunctionType, **kwargs) -> time_profiling_results.LoadTimeProfilerResult:
+        """Profile the function under concurrent load.
+
+        Args:
+            func (BuiltinFunctionType | FunctionType): Function to profile.
+            **kwargs:  Keyword arguments to pass to the function.
+        Returns:
+            LoadTimeProfilerResult:  Structured profiling result.
+
+        Raises:
+            InvalidInputTypeError: If the function is not of the correct type.
+        """
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            load_start = self.timer()
+            futures = []
+            for call_index in range(self.total_calls):
+                if self.target_rate is None:
+                    scheduled_time = self.timer()
+                else:
+                    scheduled_time = load_start + call_index / self.target_rate
+                    delay = scheduled_time - self.timer()
+                    if delay > 0:
+                        time.sleep(delay)
+                futures.append(executor.submit(self._timed_call, func, kwargs, scheduled_time))
+            calls = [future.result() for future in futures]
+        wall_time = self.timer() - load_start
+
+        queueing_delays = sorted(max(call[0], 0.0) for call in calls)
+        latencies = sorted(call[1] for call in calls if call[3] is None)
+        errors = collections.Counter(call[3].__name__ for call in calls if call[3] is not None)
+        func_result = next((call[2] for call in calls if call[3] is None), None)
+        func_exception = next((call[3] for call in calls if call[3] is not None), None)
+
+        return time_profiling_results.LoadTimeProfilerResult(
+            profiler=self,
+            profiled_func=func,
+            func_kwargs=kwargs,
+            func_result=func_result,
+            total_calls=self.total_calls,
+            concurrency=self.concurrency,
+            target_rate=self.target_rate,
+            wall_time=wall_time,
+            throughput=len(latencies) / wall_time if wall_time else 0.0,
+            mean_func_execution_time=sum(latencies) / len(latencies) if latencies else 0.0,
+            p50_func_execution_time=self._percentile(latencies, 50),
+            p90_func_execution_time=self._percentile(latencies, 90),
+            p99_func_execution_time=self._percentile(latencies, 99),
+            max_func_execution_time=latencies[-1] if latencies else 0.0,
+            mean_queueing_delay=sum(queueing_delays) / len(queueing_delays),
+            p99_queueing_delay=self._percentile(queueing_delays, 99),
+            max_queueing_delay=queueing_delays[-1],
+            errors=dict(errors),
+            func_exception=func_exception
+            )
+
+    def __repr__(self):
+        return (f'LoadTimeProfiler(timer={self.timer}, total_calls={self.total_calls}, '
+                f'concurrency={self.concurrency}, target_rate={self.target_rate})')
@@ -0,0 +1,128 @@
+"""Statistical comparison of benchmark results against a baseline."""
+
+from array import array
+from typing import Sequence
+
+import numpy as np
+import pydantic
+
+from Internals import checks
+from Internals import exceptions
+from Internals import sample_statistics
+from python_profiling import python_profiling_enums
+from python_profiling.time_profiling import time_profiling_results
+
+BenchmarkSamples = (
+    time_profiling_results.TimeItProfilerResult
+    | Sequence[time_profiling_results.TimeItProfilerResult | time_profiling_results.TimeProfilerResult | int | float]
+    | array
+    )
+
+
+class RegressionComparator(pydantic.BaseModel):
+    """Compares candidate execution times against baseline ones with Mann-Whitney U test.
+
+    A change is classified as regression or improvement only if it is both statistically
+    significant (p-value below alpha) and large enough (relative change of the median
+    at least min_relative_change), otherwise it is reported as unchanged.
+
+    Attributes:
+        alpha (float): Significance level of the test.
+        min_relative_change (float): Smallest relative change of the median treated as a real change.
+        confidence_level (float): Confidence level of bootstrap interval of relative change.
+        resamples (int): Amount of bootstrap resamples.
+        seed (int | None): Seed of bootstrap random generator, for reproducible intervals.
+    """
+
+    alpha: float = pydantic.Field(default=0.05, gt=0, lt=1)
+    min_relative_change: float = pydantic.Field(default=0.05, ge=0)
+    confidence_level: float = pydantic.Field(default=0.95, gt=0, lt=1)
+    resamples: int = pydantic.Field(default=sample_statistics.BOOTSTRAP_RESAMPLES, gt=0)
+    seed: int | None = pydantic.Field(default=None)
+
+    @staticmethod
+    def _samples(results: BenchmarkSamples) -> np.ndarray:
+        """Collects per-call execution times from results or raw samples.
+
+        Repeat times of TimeItProfilerResult are divided by its number, so results profiled
+        with different number of executions per repeat are comparable.
+        """
+        if isinstance(results, time_profiling_results.TimeItProfilerResult):
+            results = [results]
+        samples = []
+        for result in results:
+            if isinstance(result, time_profiling_results.TimeItProfilerResult):
+                if result.samples is None:
+                    raise ValueError(f'{result!r} has no samples, profiling of the function failed')
+                samples.extend(np.asarray(result.samples) / (result.number or 1))
+            elif isinstance(result, time_profiling_results.TimeProfilerResult):
+                samples.append(result.func_execution_time)
+            elif isinstance(result, (int, float)):
+                samples.append(result)
+            else:
+                raise exceptions.InvalidInputTypeError(
+                    input_=result,
+                    expected_type=(time_profiling_results.TimeItProfilerResult, time_profiling_results.TimeProfilerResult, float)
+                    )
+        if not samples:
+            raise ValueError('Can not compare empty samples')
+        return np.asarray(samples, dtype=np.float64)
+
+    def _verdict(self, p_value: float, relative_change: float) -> python_profiling_enums.RegressionVerdict:
+        if p_value >= self.alpha or abs(relative_change) < self.min_relative_change:
+            return python_profiling_enums.RegressionVerdict.UNCHANGED
+        if relative_change > 0:
+            return python_profiling_enums.RegressionVerdict.REGRESSED
+        return python_profiling_enums.RegressionVerdict.IMPROVED
+
+    @checks.ValidateType([
+        ('baseline', (time_profiling_results.TimeItProfilerResult, list, tuple, array, np.ndarray)),
+        ('candidate', (time_profiling_results.TimeItProfilerResult, list, tuple, array, np.ndarray))
+        ])
+    def compare(self, baseline: BenchmarkSamples, candidate: BenchmarkSamples) -> time_profiling_results.RegressionComparisonResult:
+        """Compares candidate execution times against baseline ones.
+
+        Args:
+            baseline: TimeItProfilerResult, sequence of TimeItProfilerResult / TimeProfilerResult or execution times.
+            candidate: Same as baseline, for the changed code.
+
+        Returns:
+            RegressionComparisonResult: Structured comparison result with verdict and exit code.
+
+        Raises:
+            InvalidInputTypeError: If baseline or candidate are of incorrect types.
+            MissingArgumentError: If any required argument is missing.
+            ValueError: If baseline or candidate have no samples.
+        """
+        baseline_samples, candidate_samples = self._samples(baseline), self._samples(candidate)
+        baseline_median, candidate_median = float(np.median(baseline_samples)), float(np.median(candidate_samples))
+        relative_change = candidate_median / baseline_median - 1 if baseline_median else 0.0
+        u_statistic, p_value = sample_statistics.mann_whitney_u(candidate_samples, baseline_samples)
+        ci_low, ci_high = sample_statistics.bootstrap_median_ratio_ci(
+            baseline_samples,
+            candidate_samples,
+            confidence_level=self.confidence_level,
+            resamples=self.resamples,
+            seed=self.seed
+            )
+        verdict = self._verdict(p_value, relative_change)
+
+        return time_profiling_results.RegressionComparisonResult(
+            profiler=self,
+            baseline_size=baseline_samples.size,
+            candidate_size=candidate_samples.size,
+            baseline_median=baseline_median,
+            candidate_median=candidate_median,
+            relative_change=relative_change,
+            ci_low=ci_low,
+            ci_high=ci_high,
+            u_statistic=u_statistic,
+            p_value=p_value,
+            probability_of_regression=u_statistic / (baseline_samples.size * candidate_samples.size),
+            verdict=verdict,
+            exit_code=int(verdict is python_profiling_enums.RegressionVerdict.REGRESSED)
+            )
+
+    def __repr__(self):
+        return (f'RegressionComparator(alpha={self.alpha}, min_relative_change={self.min_relative_change}, '
+                f'confidence_level={self.confidence_level})')
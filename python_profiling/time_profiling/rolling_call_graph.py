@@ -0,0 +1,136 @@
+"""In-memory merging of cProfile stats of many calls into consecutive time windows."""
+
+import cProfile
+import threading
+import time
+from dataclasses import dataclass, field
+
+import pstats
+
+
+@dataclass(frozen=True)
+class CallGraphWindow:
+    """Merged cProfile stats of calls that started within one time window.
+
+    Attributes:
+        window_start: Timestamp of the window start.
+        window_end: Timestamp of the window end (snapshot time for windows that are still open).
+        calls: Amount of merged calls.
+        weight: Sum of sampling weights of merged calls, estimated amount of calls the merged calls
+            stand for, so counts and times scaled by weight / calls estimate those of all calls.
+        stats: Raw stats in pstats format, {(filename, lineno, func_name): (cc, nc, tt, ct, callers)}.
+    """
+
+    window_start: float
+    window_end: float
+    calls: int
+    weight: float
+    stats: dict = field(repr=False)
+
+    def to_pstats(self) -> pstats.Stats:
+        """Returns merged stats as pstats.Stats, e.g. for printing or sorting."""
+        merged_stats = pstats.Stats()
+        merged_stats.stats = dict(self.stats)
+        merged_stats.get_top_level_stats()
+        return merged_stats
+
+
+class RollingCallGraphAggregator:
+    """Merges stats of finished cProfile sessions into tumbling windows of fixed duration.
+
+    Merging follows pstats.Stats.add, but works on raw stats of each session instead of files,
+    so memory is bounded by the amount of distinct functions within a single window. The window
+    is closed by the first session added after the window duration elapsed.
+
+    Args:
+        window (int | float): Window duration in seconds.
+        clock (Callable): Clock that timestamps windows.
+
+    Raises:
+        ValueError: If window is not positive.
+    """
+
+    __slots__ = ('window', 'clock', '_stats', '_calls', '_weight', '_window_start', '_lock')
+
+    def __init__(self, window: int | float = 300.0, clock=time.time):
+        if window <= 0:
+            raise ValueError(f'window has to be positive, got instead: {window}')
+        self.window = window
+        self.clock = clock
+        self._stats = {}
+        self._calls = 0
+        self._weight = 0
+        self._window_start = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def calls(self) -> int:
+        """Returns amount of calls merged into the current window."""
+        return self._calls
+
+    def _close(self, now: float) -> CallGraphWindow:
+        window = CallGraphWindow(
+            window_start=self._window_start, window_end=now, calls=self._calls, weight=self._weight, stats=self._stats
+            )
+        self._stats, self._calls, self._weight, self._window_start = {}, 0, 0, now
+        return window
+
+    def add(self, profile: cProfile.Profile, weight: int | float = 1) -> CallGraphWindow | None:
+        """Merges stats of a finished cProfile session into the current window.
+
+        Args:
+            profile (Profile): Disabled profiler.
+            weight (int | float): Sampling weight of the call, amount of calls it stands for.
+
+        Returns:
+            CallGraphWindow | None: Previous window if this session closed it and it has merged calls.
+        """
+        profile.create_stats()
+        return self.add_stats(profile.stats, weight)
+
+    def add_stats(self, stats: dict, weight: int | float = 1) -> CallGraphWindow | None:
+        """Merges raw stats of a finished session (e.g. of sys.monitoring backend) into the current window.
+
+        Args:
+            stats (dict): Raw stats in pstats format.
+            weight (int | float): Sampling weight of the call, amount of calls it stands for.
+
+        Returns:
+            CallGraphWindow | None: Previous window if this session closed it and it has merged calls.
+        """
+        with self._lock:
+            now = self.clock()
+            closed_window = None
+            if now - self._window_start >= self.window:
+                closed_window = self._close(now) if self._calls else None
+                self._window_start = now
+            for func, func_stats in stats.items():
+                self._stats[func] = pstats.add_func_stats(self._stats[func], func_stats) if func in self._stats else func_stats
+            self._calls += 1
+            self._weight += weight
+        return closed_window
+
+    def snapshot(self, reset: bool = False) -> CallGraphWindow | None:
+        """Returns stats merged in the current window.
+
+        Args:
+            reset (bool): If True, closes the current window and starts a new one.
+
+        Returns:
+            CallGraphWindow | None: Current window, None if no calls were merged.
+        """
+        with self._lock:
+            if not self._calls:
+                return None
+            if reset:
+                return self._close(self.clock())
+            return CallGraphWindow(
+                window_start=self._window_start,
+                window_end=self.clock(),
+                calls=self._calls,
+                weight=self._weight,
+                stats=dict(self._stats)
+                )
+
+    def __repr__(self) -> str:
+        return f'RollingCallGraphAggregator(window={self.window})'
@@ -0,0 +1,85 @@
+"""Statistical time profiling of Python functions by periodic sampling of thread stacks."""
+
+import threading
+import time
+from types import BuiltinFunctionType, FunctionType
+from typing import Literal
+
+import pydantic
+
+from Internals import checks
+from Internals import context_managers
+from Internals import stack_sampling
+from python_profiling.time_profiling import time_profiling_results
+
+
+class SamplingTimeProfiler(pydantic.BaseModel):
+    """Time profiler that samples stacks while the function runs instead of tracing every call.
+
+    Cost of profiling depends on the sampling frequency only (one stack walk per sample), not on
+    the amount of calls made by the function, so it is suitable for production code. Shares of 
+    samples estimate shares of time, their precision grows with the amount of samples. In 'thread' 
+    mode the sampling thread needs the GIL, so intervals shorter than sys.getswitchinterval() 
+    do not increase the sampling frequency of CPU bound code.
+
+    Attributes:
+        interval (float): Seconds between samples.
+        mode (str): 'thread' samples from a background thread through sys._current_frames,
+            'signal' samples the main thread on SIGPROF (Unix main thread only, CPU time based).
+        all_threads (bool): If True, stacks of all threads are sampled in 'thread' mode, otherwise
+            only the thread that runs the function.
+        max_depth (int): Maximum amount of frames of a sampled stack.
+    """
+
+    interval: float = pydantic.Field(default=0.005, gt=0)
+    mode: Literal['thread', 'signal'] = pydantic.Field(default='thread')
+    all_threads: bool = pydantic.Field(default=False)
+    max_depth: int = pydantic.Field(default=256, gt=0)
+
+    @checks.ValidateType(('func', (BuiltinFunctionType, FunctionType)))
+    def profile(
+        self,
+        func: BuiltinFunctionType | FunctionType,
+        **kwargs
+        ) -> time_profiling_results.SamplingTimeProfilerResult:
+        """Profile the function by sampling stacks during its execution.
+
+        Args:
+            func (BuiltinFunctionType | FunctionType): Function to profile.
+            **kwargs:  Keyword arguments to pass to the function.
+        Returns:
+            SamplingTimeProfilerResult:  Structured profiling result.
+
+        Raises:
+            InvalidInputTypeError: If the function is not of the correct type.
+            ValueError: If signal mode is used outside of Unix main thread.
+        """
+        sampler = stack_sampling.StackSampler(
+            interval=self.interval,
+            mode=self.mode,
+            thread_ids=None if self.all_threads else {threading.get_ident()},
+            max_depth=self.max_depth
+            )
+        func_result = None
+        with sampler, context_managers.TimeProfilerManager(profiling_timer=time.perf_counter) as time_profiler_manager:
+            func_result = func(**kwargs)
+        trie = sampler.trie
+        execution_time = time_profiler_manager.func_execution_time
+
+        return time_profiling_results.SamplingTimeProfilerResult(
+            profiler=self,
+            profiled_func=func,
+            func_kwargs=kwargs,
+            func_result=func_result if not time_profiler_manager.exception else None,
+            func_execution_time=execution_time,
+            samples=trie.samples,
+            sampling_overhead=sampler.sampling_time / execution_time if execution_time else 0.0,
+            function_shares=trie.function_shares(),
+            line_shares=trie.line_shares(),
+            func_profiling_result=trie,
+            func_exception=time_profiler_manager.func_exception
+            )
+
+    def __repr__(self):
+        return (f'SamplingTimeProfiler(interval={self.interval}, mode={self.mode}, '
+                f'all_threads={self.all_threads})')
@@ -0,0 +1,133 @@
+"""Time profiling of multi-core scaling of Python functions with a process pool."""
+
+import multiprocessing
+import os
+import time
+from typing import Literal
+from concurrent.futures import ProcessPoolExecutor
+from types import FunctionType, BuiltinFunctionType
+
+import pydantic
+
+from Internals import checks
+from Internals import context_managers
+from python_profiling.time_profiling import time_profiling_results
+
+
+def _timed_task(func: FunctionType | BuiltinFunctionType, kwargs: dict, timer: BuiltinFunctionType) -> tuple:
+    """Runs single task inside worker process.
+
+    Returns:
+        tuple: Latency, function result and exception type of the task.
+    """
+    func_result = None
+    with context_managers.TimeProfilerManager(profiling_timer=timer) as time_profiler_manager:
+        func_result = func(**kwargs)
+    return time_profiler_manager.func_execution_time, func_result, time_profiler_manager.func_exception
+
+
+class ScalingTimeProfiler(pydantic.BaseModel):
+    """Time profiler that runs the same workload on process pools of growing size.
+
+    For every worker count a fresh pool is started and warmed up (each worker runs the function
+    once, which is not measured), then `tasks` calls are spread across the workers. Speedup is
+    throughput relative to the measured throughput of a single worker, efficiency is speedup per
+    worker. A single worker is always profiled as the baseline, even if 1 is not in worker_counts.
+
+    Function and its keyword arguments are sent to worker processes, so both have to be picklable
+    (e.g. the function has to be defined at module level).
+
+    Attributes:
+        timer (BuiltinFunctionType): Timer function used for profiling.
+        tasks (int): Amount of calls of the function for every worker count.
+        worker_counts (list[int] | None): Pool sizes to profile, if None from 1 to cpu count,
+            1 is added if missing.
+        start_method (str): Multiprocessing start method, 'spawn' by default since forking a process
+            that already runs threads (e.g. asynchronous observers) may deadlock workers.
+    """
+
+    model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
+
+    timer: BuiltinFunctionType = pydantic.Field(default=time.perf_counter)
+    tasks: int = pydantic.Field(default=32, gt=0)
+    worker_counts: list[pydantic.PositiveInt] | None = pydantic.Field(default=None)
+    start_method: Literal['spawn', 'fork', 'forkserver'] = pydantic.Field(default='spawn')
+
+    def model_post_init(self, __context):
+        """Sets default worker counts from 1 to amount of available cores, adds the single worker baseline."""
+        if not self.worker_counts:
+            self.worker_counts = list(range(1, (os.cpu_count() or 1) + 1))
+        self.worker_counts = sorted(set(self.worker_counts) | {1})
+
+    def _profile_workers(self, func: FunctionType | BuiltinFunctionType, kwargs: dict, workers: int) -> tuple:
+        """Runs the workload on a pool of given size.
+
+        Returns:
+            tuple: Wall time of the workload and (latency, result, exception type) of every task.
+        """
+        mp_context = multiprocessing.get_context(self.start_method)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+            warm_up = [executor.submit(_timed_task, func, kwargs, self.timer) for _ in range(workers)]
+            for future in warm_up:
+                future.result()
+            workload_start = self.timer()
+            futures = [executor.submit(_timed_task, func, kwargs, self.timer) for _ in range(self.tasks)]
+            task_results = [future.result() for future in futures]
+            wall_time = self.timer() - workload_start
+        return wall_time, task_results
+
+    @checks.ValidateType(('func', (FunctionType, BuiltinFunctionType)))
+    def profile(self, func: FunctionType | BuiltinFunctionType, **kwargs) -> time_profiling_results.ScalingTimeProfilerResult:
+        """Profile the function on every configured amount of worker processes.
+
+        Args:
+            func (BuiltinFunctionType | FunctionType): Picklable function to profile.
+            **kwargs:  Picklable keyword arguments to pass to the function.
+        Returns:
+            ScalingTimeProfilerResult:  Structured profiling result, lists are aligned with worker_counts.
+
+        Raises:
+            InvalidInputTypeError: If the function is not of the correct type.
+        """
+        func_result, func_exception = None, None
+        wall_times, throughputs, mean_latencies, max_latencies = [], [], [], []
+        with context_managers.TimeItProfilerManager() as time_profiler_manager:
+            for workers in self.worker_counts:
+                wall_time, task_results = self._profile_workers(func, kwargs, workers)
+                latencies = [latency for latency, _, exception in task_results if exception is None]
+                failed_task = next((task for task in task_results if task[2] is not None), None)
+                if failed_task is not None and func_exception is None:
+                    func_exception = failed_task[2]
+                if latencies and func_result is None:
+                    func_result = next(result for _, result, exception in task_results if exception is None)
+                wall_times.append(wall_time)
+                throughputs.append(len(latencies) / wall_time if wall_time else 0.0)
+                mean_latencies.append(sum(latencies) / len(latencies) if latencies else 0.0)
+                max_latencies.append(max(latencies, default=0.0))
+
+        if time_profiler_manager.exception:
+            func_exception = time_profiler_manager.func_exception
+
+        profiled_worker_counts = self.worker_counts[:len(throughputs)]
+        single_worker_throughput = throughputs[0] if throughputs else 0.0
+        speedups = [throughput / single_worker_throughput if single_worker_throughput else 0.0 for throughput in throughputs]
+
+        return time_profiling_results.ScalingTimeProfilerResult(
+            profiler=self,
+            profiled_func=func,
+            func_kwargs=kwargs,
+            func_result=func_result,
+            tasks=self.tasks,
+            worker_counts=profiled_worker_counts,
+            wall_times=wall_times,
+            throughputs=throughputs,
+            mean_func_execution_times=mean_latencies,
+            max_func_execution_times=max_latencies,
+            speedups=speedups,
+            efficiencies=[speedup / workers for speedup, workers in zip(speedups, profiled_worker_counts)],
+            func_exception=func_exception
+            )
+
+    def __repr__(self):
+        return (f'ScalingTimeProfiler(timer={self.timer}, tasks={self.tasks}, '
+                f'worker_counts={self.worker_counts}, start_method={self.start_method})')
@@ -12,6 +12,7 @@ from python_profiling.time_profiling import time_profiling_results
 
 from Internals.context_managers import TimeProfilerManager
 from Internals.checks import ValidateType
+from Internals.coroutines import TimedAwaitable
 
 
 class TimeProfilerI(ABC):
@@ -57,6 +58,35 @@ class TimeProfiler(TimeProfilerI):
             func_exception=time_profiler_manager.func_exception
             )
         
+    @ValidateType(('func', (BuiltinFunctionType, FunctionType)))
+    async def profile_async(self, func: BuiltinFunctionType | FunctionType, **kwargs) -> time_profiling_results.TimeProfilerResult:
+        """Profile the execution time of an async def function.
+        
+        Args:
+            func (BuiltinFunctionType | FunctionType): Coroutine function to profile.
+            **kwargs:  Keyword arguments to pass to the function.
+        Returns:
+            TimeProfilerResult:  Structured profiling result, where func_execution_time is wall time 
+                until the coroutine finished and func_running_time is time it actually ran on the event loop.
+            
+        Raises:
+            InvalidInputTypeError: If the function is not of the correct type.
+        """
+        with TimeProfilerManager(profiling_timer=self.profilig_timer) as time_profiler_manager:
+            timed_coroutine = TimedAwaitable(func(**kwargs), timer=self.profilig_timer)
+            profiling_result = await timed_coroutine
+            
+        return time_profiling_results.TimeProfilerResult(
+            profiler=self,
+            profiled_func=func,
+            func_args=None,
+            func_kwargs=kwargs,
+            func_result=profiling_result if not time_profiler_manager.exception else None,
+            func_execution_time=time_profiler_manager.func_execution_time,
+            func_exception=time_profiler_manager.func_exception,
+            func_running_time=timed_coroutine.running_time if not time_profiler_manager.exception else None
+            )
+        
     def __repr__(self) -> str:
         return f'TimeProfiler(profiling_timer={self.profilig_timer})'
         
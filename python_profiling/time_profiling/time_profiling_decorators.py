@@ -2,8 +2,10 @@
 
 from abc import ABC, abstractmethod
 import functools
+import inspect
 import enum
 from typing import Type, ClassVar, Callable
+import threading
 import time
 from types import BuiltinFunctionType, FunctionType
 
@@ -15,10 +17,17 @@ from python_profiling.time_profiling import time_profiler as time_profiler_
 from python_profiling.time_profiling import timeit_profiler
 from python_profiling.time_profiling import time_profiling_results
 from python_profiling.time_profiling import line_time_profiler
+from python_profiling.time_profiling import line_timings
 from python_profiling.time_profiling import call_graph_time_profiler
+from python_profiling.time_profiling import rolling_call_graph
+from python_profiling.time_profiling import load_time_profiler
+from python_profiling.time_profiling import sampling_time_profiler
+from python_profiling.time_profiling import latency_histogram
 from python_profiling import _base_profiling_decorators
 from Internals import checks
+from Internals import context_managers
 from Internals import observers
+from Internals import samplers
 from Internals.logger import logger
 
 
@@ -59,7 +68,13 @@ class TimeProfilerDecorator(pydantic.BaseModel, TimeProfilingDecoratorI, _base_p
         storages (StorageConfig): Data Transfer Object that contains all configured output destinations.
         time_profiler (TimeProfilerI): Time profiler based on time module.
         obaserver (ProfilingObserver): A class that responsible for storing profiling result to 
-        multiple sources.
+        multiple sources, ProfilingObserver over storages is used if not provided.
+        sampler (SamplerI | None): Sampling policy that decides which calls are profiled.
+        aggregate (bool): If True, execution times are folded into a fixed-memory latency histogram
+            per decorated function instead of producing a profiling result per call.
+        snapshot_interval (int | float | None): Seconds between histogram snapshots emitted to the observer
+            in aggregation mode, None to emit snapshots only on demand.
+        histogram_significant_digits (int): Relative precision of aggregated execution times.
     """
     
     model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
@@ -76,11 +91,17 @@ class TimeProfilerDecorator(pydantic.BaseModel, TimeProfilingDecoratorI, _base_p
     storages: python_profiling_configs.StorageConfig = pydantic.Field(default_factory=python_profiling_configs.StorageConfig)
     time_profiler: time_profiler_.TimeProfilerI = pydantic.Field(init=False, default=None)
     observer: observers.ProfilingObserverI = pydantic.Field(init=False, default=None)
+    sampler: samplers.SamplerI | None = pydantic.Field(default=None)
+    aggregate: bool = pydantic.Field(default=False)
+    snapshot_interval: int | float | None = pydantic.Field(default=None, gt=0)
+    histogram_significant_digits: int = pydantic.Field(default=2, ge=1, le=4)
+    _histograms: dict = pydantic.PrivateAttr(default_factory=dict)
     
     def model_post_init(self, __context):
-        """Setup time profiler and observer based on provided profiling stragedy and storages."""
+        """Setup time profiler and observer (unless one is provided) based on provided profiling stragedy and storages."""
         self.time_profiler = self._avaliable_time_profilers[self.time_profiler_strategy]
-        self.observer = observers.ProfilingObserver(storages=self.storages)
+        if self.observer is None:
+            self.observer = observers.ProfilingObserver(storages=self.storages)
         
     @classmethod
     @checks.ValidateType(
@@ -112,11 +133,87 @@ class TimeProfilerDecorator(pydantic.BaseModel, TimeProfilingDecoratorI, _base_p
         """Change time profiling strategy."""
         self.time_profiler = self._avaliable_time_profilers[profiler_name]
         
+    @property
+    def _aggregation_timer(self) -> Callable:
+        """Timer of current time profiler, thread based profiler measures time with time.time."""
+        return getattr(self.time_profiler, 'profilig_timer', time.time)
+        
+    def snapshot(self, reset: bool = True) -> list[time_profiling_results.LatencyHistogramResult]:
+        """Summarize latency histograms of all decorated functions and store the summaries.
+        
+        Args:
+            reset (bool): If True, histograms start empty after the snapshot.
+            
+        Returns:
+            list[LatencyHistogramResult]: Summary per decorated function with recorded calls.
+        """
+        results = []
+        for func, histogram in self._histograms.items():
+            if not histogram.count and not histogram.failed_count:
+                continue
+            result = histogram.snapshot(profiled_func=func, reset=reset)
+            self.observer.dump(result)
+            results.append(result)
+        return results
+        
+    def _aggregate__call__(self, func: Callable) -> Callable:
+        """Decorator that folds execution times of each call into latency histogram of the function.
+        
+        Args:
+            func (Callable): The original function to decorate.
+            
+        Returns:
+            Callable: A wrapped function that returns result of the original function, None if it raised.
+        """
+        histogram = latency_histogram.LatencyHistogram(significant_digits=self.histogram_significant_digits)
+        self._histograms[func] = histogram
+        snapshot_schedule = _base_profiling_decorators.SnapshotSchedule(self.snapshot_interval)
+        profiling_timer = self._aggregation_timer
+        sampler = self.sampler
+        
+        def record(time_profiler_manager, sampling_weight):
+            if time_profiler_manager.exception:
+                histogram.record_failure(sampling_weight)
+            else:
+                histogram.record(time_profiler_manager.func_execution_time, sampling_weight)
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(**kwargs):
+                sampling_weight = 1 if sampler is None else sampler.sample()
+                if sampling_weight is None:
+                    return await func(**kwargs)
+                func_result = None
+                with context_managers.TimeProfilerManager(profiling_timer=profiling_timer) as time_profiler_manager:
+                    func_result = await func(**kwargs)
+                record(time_profiler_manager, sampling_weight)
+                if snapshot_schedule.due():
+                    self.observer.dump(histogram.snapshot(profiled_func=func, reset=True))
+                return func_result
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(**kwargs):
+            sampling_weight = 1 if sampler is None else sampler.sample()
+            if sampling_weight is None:
+                return func(**kwargs)
+            with context_managers.TimeProfilerManager(profiling_timer=profiling_timer) as time_profiler_manager:
+                func_result = func(**kwargs)
+            record(time_profiler_manager, sampling_weight)
+            if snapshot_schedule.due():
+                self.observer.dump(histogram.snapshot(profiled_func=func, reset=True))
+            return func_result if not time_profiler_manager.exception else None
+        return wrapper
+        
     def __call__(self, func: Callable) -> Callable:
+        if self.aggregate:
+            return self._aggregate__call__(func)
         return self.base_profiling__call__(
             func=func,
             profiling_func=self.time_profiler.profile,
-            observing_func=self.observer.dump
+            observing_func=self.observer.dump,
+            sampler=self.sampler,
+            async_profiling_func=getattr(self.time_profiler, 'profile_async', None)
             )
         
 class TimeItProfilerDecorator(_base_profiling_decorators.BaseProfilingDecorator):
@@ -126,10 +223,14 @@ class TimeItProfilerDecorator(_base_profiling_decorators.BaseProfilingDecorator)
         timer (FunctionType | BuiltinFunctionType): Timer function used for profiling.
         number (int): Number of times to execute the function per repeat.
         repeat (int): Number of repetitions to run.
+        adaptive (bool): If True, calibrate number and repeat until mean time converges.
+        target_relative_error (float): Relative half width of confidence interval to stop at in adaptive mode.
+        time_budget (float): Maximum time in seconds spent on adaptive profiling of a call.
         storages (StorageConfig): Data Transfer Object that contains all configured output destinations.
         time_profiler (TimeProfilerI): Time profiler based on time module.
         obaserver (ProfilingObserver): A class that responsible for storing profiling result to.
         multiple sources.
+        sampler (SamplerI | None): Sampling policy that decides which calls are profiled.
     """
     
     def __init__(
@@ -137,19 +238,106 @@ class TimeItProfilerDecorator(_base_profiling_decorators.BaseProfilingDecorator)
         timer: FunctionType | BuiltinFunctionType = time.perf_counter,
         number: int = 10000,
         repeat: int = 1,
+        adaptive: bool = False,
+        target_relative_error: float = 0.01,
+        time_budget: float = 10.0,
         storages: python_profiling_configs.StorageConfig = python_profiling_configs.StorageConfig(),
-        observer: observers.ProfilingObserverI = observers.ProfilingObserver
+        observer: observers.ProfilingObserverI = observers.ProfilingObserver,
+        sampler: samplers.SamplerI | None = None
         ):
         self.time_profiler = timeit_profiler.TimeItProfiler(timer=timer,
                                                             number=number,
-                                                            repeat=repeat)
+                                                            repeat=repeat,
+                                                            adaptive=adaptive,
+                                                            target_relative_error=target_relative_error,
+                                                            time_budget=time_budget)
+        self.sampler = sampler
+        self._init_observer(storages=storages, observer=observer)
+        
+    def __call__(self, func: Callable) -> Callable:
+        return self.base_profiling__call__(
+            func=func,
+            profiling_func=self.time_profiler.profile,
+            observing_func=self.observer.dump,
+            sampler=self.sampler,
+            async_profiling_func=self.time_profiler.profile_async
+            )
+        
+class LoadTimeProfilerDecorator(_base_profiling_decorators.BaseProfilingDecorator):
+    """Decorator for time profiling under concurrent load with a thread pool.
+    
+    Attributes:            
+        timer (FunctionType | BuiltinFunctionType): Timer function used for profiling.
+        total_calls (int): Amount of calls of the function per profiling.
+        concurrency (int): Amount of worker threads.
+        target_rate (float | None): Calls submitted per second, if None all calls are submitted at once.
+        storages (StorageConfig): Data Transfer Object that contains all configured output destinations.
+        time_profiler (LoadTimeProfiler): Load time profiler.
+        obaserver (ProfilingObserver): A class that responsible for storing profiling result to.
+        multiple sources.
+        sampler (SamplerI | None): Sampling policy that decides which calls are profiled.
+    """
+    
+    def __init__(
+        self, 
+        timer: FunctionType | BuiltinFunctionType = time.perf_counter,
+        total_calls: int = 100,
+        concurrency: int = 4,
+        target_rate: float | None = None,
+        storages: python_profiling_configs.StorageConfig = python_profiling_configs.StorageConfig(),
+        observer: observers.ProfilingObserverI = observers.ProfilingObserver,
+        sampler: samplers.SamplerI | None = None
+        ):
+        self.time_profiler = load_time_profiler.LoadTimeProfiler(timer=timer,
+                                                                 total_calls=total_calls,
+                                                                 concurrency=concurrency,
+                                                                 target_rate=target_rate)
+        self.sampler = sampler
+        self._init_observer(storages=storages, observer=observer)
+        
+    def __call__(self, func: Callable) -> Callable:
+        return self.base_profiling__call__(
+            func=func,
+            profiling_func=self.time_profiler.profile,
+            observing_func=self.observer.dump,
+            sampler=self.sampler
+            )
+        
+class SamplingTimeProfilerDecorator(_base_profiling_decorators.BaseProfilingDecorator):
+    """Decorator for statistical time profiling with stack sampling.
+    
+    Attributes:            
+        interval (float): Seconds between samples.
+        mode (str): 'thread' or 'signal' sampling (see SamplingTimeProfiler).
+        all_threads (bool): If True, stacks of all threads are sampled, otherwise only the calling thread.
+        storages (StorageConfig): Data Transfer Object that contains all configured output destinations.
+        time_profiler (SamplingTimeProfiler): Sampling time profiler.
+        obaserver (ProfilingObserver): A class that responsible for storing profiling result to.
+        multiple sources.
+        sampler (SamplerI | None): Sampling policy that decides which calls are profiled.
+    """
+    
+    def __init__(
+        self, 
+        interval: float = 0.005,
+        mode: str = 'thread',
+        all_threads: bool = False,
+        storages: python_profiling_configs.StorageConfig = python_profiling_configs.StorageConfig(),
+        observer: observers.ProfilingObserverI = observers.ProfilingObserver,
+        sampler: samplers.SamplerI | None = None
+        ):
+        self.time_profiler = sampling_time_profiler.SamplingTimeProfiler(interval=interval,
+                                                                         mode=mode,
+                                                                         all_threads=all_threads)
+        self.sampler = sampler
         self._init_observer(storages=storages, observer=observer)
         
     def __call__(self, func: Callable) -> Callable:
         return self.base_profiling__call__(
             func=func,
             profiling_func=self.time_profiler.profile,
-            observing_func=self.observer.dump
+            observing_func=self.observer.dump,
+            sampler=self.sampler
             )
         
 class LineTimeProfilerDecorator(_base_profiling_decorators.BaseProfilingDecorator):
@@ -158,20 +346,160 @@ class LineTimeProfilerDecorator(_base_profiling_decorators.BaseProfilingDecorato
     Attributes:
         storages (StorageConfig): Data Transfer Object that contains all configured output destinations.
         obaserver (ProfilingObserver): A class that responsible for storing profiling result to.
-
+        sampler (SamplerI | None): Sampling policy that decides which calls are profiled. Accumulated
+            results get `sampled_calls` and mean `sampling_weight` of sampled calls as context.
+        accumulate (bool): If True, decorated functions are instrumented once and line timings of all
+            calls are accumulated instead of producing a profiling result per call.
+        snapshot_interval (int | float | None): Seconds between snapshots of accumulated line timings
+            emitted to the observer, None to emit snapshots only on demand.
+        callee_depth (int): Depth of call chain below decorated function whose functions are
+            profiled as well (see callee_discovery module), 0 profiles decorated function only.
+        callee_package (str | None): If provided, only callees defined in this package are profiled.
+        backend (str): 'line_profiler' or 'monitoring' (sys.monitoring, Python 3.12+, see MonitoringLineTimeProfiler).
+        modules (list[str] | None): Modules whose functions are profiled as well by 'monitoring' backend.
+        
+    Raises:
+        ValueError: If snapshot_interval or callee_depth is out of range, backend is unknown
+            or accumulation is requested with 'monitoring' backend.
+        RuntimeError: If 'monitoring' backend is requested before Python 3.12.
     """
     def __init__(
         self, 
         storages: python_profiling_configs.StorageConfig = python_profiling_configs.StorageConfig(), 
-        observer: observers.ProfilingObserverI = observers.ProfilingObserver
+        observer: observers.ProfilingObserverI = observers.ProfilingObserver,
+        sampler: samplers.SamplerI | None = None,
+        accumulate: bool = False,
+        snapshot_interval: int | float | None = None,
+        callee_depth: int = 0,
+        callee_package: str | None = None,
+        backend: str = 'line_profiler',
+        modules: list[str] | None = None
         ):
+        if snapshot_interval is not None and snapshot_interval <= 0:
+            raise ValueError(f'snapshot_interval has to be positive, got instead: {snapshot_interval}')
+        if callee_depth < 0:
+            raise ValueError(f'callee_depth has to be non negative, got instead: {callee_depth}')
+        if backend not in ('line_profiler', 'monitoring'):
+            raise ValueError(f"backend has to be 'line_profiler' or 'monitoring', got instead: {backend}")
+        if backend == 'monitoring' and accumulate:
+            raise ValueError('Line timings can be accumulated with line_profiler backend only')
+        self.sampler = sampler
+        self.accumulate = accumulate
+        self.snapshot_interval = snapshot_interval
+        self.callee_depth = callee_depth
+        self.callee_package = callee_package
+        self.line_time_profiler = line_time_profiler.AccumulatingLineTimeProfiler() if accumulate else None
+        self.callee_line_time_profiler = (
+            line_time_profiler.CalleeLineTimeProfiler(max_depth=callee_depth, package=callee_package) 
+            if callee_depth else None
+            )
+        self.monitoring_line_time_profiler = (
+            line_time_profiler.MonitoringLineTimeProfiler(modules=modules, max_depth=callee_depth, package=callee_package)
+            if backend == 'monitoring' else None
+            )
+        self._decorated_funcs = {}
+        # Amount of sampled calls and sum of their sampling weights per decorated function.
+        self._sampling_weights = {}
+        self._sampling_lock = threading.Lock()
         self._init_observer(storages=storages,observer=observer)
         
+    def _accumulated_result(
+        self, 
+        func: FunctionType, 
+        functions_timings: list[line_timings.LineTimings], 
+        reset: bool
+        ) -> time_profiling_results.LineTimeProfilerResult:
+        result = time_profiling_results.LineTimeProfilerResult(
+            profiler=self.line_time_profiler,
+            profiled_func=func,
+            func_kwargs={},
+            func_result=None,
+            func_profiling_result=functions_timings
+            )
+        if self.sampler is not None:
+            with self._sampling_lock:
+                sampled_calls, weights_sum = self._sampling_weights[func]
+                if reset:
+                    self._sampling_weights[func] = [0, 0.0]
+            result.add_context(context={
+                'sampled_calls': sampled_calls,
+                'sampling_weight': weights_sum / sampled_calls if sampled_calls else None
+                })
+        return result
+        
+    def snapshot(self, reset: bool = True) -> list[time_profiling_results.LineTimeProfilerResult]:
+        """Summarize accumulated line timings of all decorated functions and store the summaries.
+        
+        Args:
+            reset (bool): If True, accumulation starts from zero after the snapshot.
+            
+        Returns:
+            list[LineTimeProfilerResult]: Result per decorated function with recorded calls.
+        """
+        results = []
+        if self.line_time_profiler is None:
+            return results
+        keys = [key for func_keys in self._decorated_funcs.values() for key in func_keys]
+        functions_timings = self.line_time_profiler.snapshot(reset=reset, keys=keys)
+        for func, func_keys in self._decorated_funcs.items():
+            if func_keys[0] not in functions_timings:
+                continue
+            result = self._accumulated_result(func, [functions_timings[key] for key in func_keys if key in functions_timings], reset)
+            self.observer.dump(result)
+            results.append(result)
+        return results
+        
+    def _accumulate__call__(self, func: Callable) -> Callable:
+        """Decorator that accumulates line timings of each call of the function.
+        
+        Args:
+            func (Callable): The original function to decorate.
+            
+        Returns:
+            Callable: A wrapped function that returns result of the original function, None if it raised.
+        """
+        if inspect.iscoroutinefunction(func):
+            raise TypeError(f'Line timings of coroutine function {func.__qualname__} can not be accumulated')
+        callees = self.callee_line_time_profiler.callees(func) if self.callee_line_time_profiler else []
+        keys = [self.line_time_profiler.add_function(func=function) for function in (func, *callees)]
+        self._decorated_funcs[func] = keys
+        self._sampling_weights[func] = [0, 0.0]
+        snapshot_schedule = _base_profiling_decorators.SnapshotSchedule(self.snapshot_interval)
+        line_profiler_ = self.line_time_profiler.line_profiler
+        sampler = self.sampler
+        
+        @functools.wraps(func)
+        def wrapper(**kwargs):
+            if sampler is not None:
+                sampling_weight = sampler.sample()
+                if sampling_weight is None:
+                    return func(**kwargs)
+                with self._sampling_lock:
+                    sampling_weights = self._sampling_weights[func]
+                    sampling_weights[0] += 1
+                    sampling_weights[1] += sampling_weight
+            func_result = None
+            with context_managers.AccumulatingLineTimeProfilerManager(profiler=line_profiler_) as line_time_profiler_manager:
+                func_result = func(**kwargs)
+            if snapshot_schedule.due():
+                functions_timings = self.line_time_profiler.snapshot(reset=True, keys=keys)
+                if keys[0] in functions_timings:
+                    self.observer.dump(self._accumulated_result(func, [functions_timings[key] for key in keys if key in functions_timings], True))
+            return func_result if not line_time_profiler_manager.exception else None
+        return wrapper
+        
     def __call__(self, func: Callable) -> Callable:
+        if self.accumulate:
+            return self._accumulate__call__(func)
         return self.base_profiling__call__(
             func=func,
-            profiling_func=line_time_profiler.LineTimeProfiler.profile,
-            observing_func=self.observer.dump
+            profiling_func=(
+                self.monitoring_line_time_profiler.profile if self.monitoring_line_time_profiler
+                else self.callee_line_time_profiler.profile if self.callee_line_time_profiler 
+                else line_time_profiler.LineTimeProfiler.profile
+                ),
+            observing_func=self.observer.dump,
+            sampler=self.sampler
         )
         
 class CallGraphTimeProfilerDecorator(_base_profiling_decorators.BaseProfilingDecorator):
@@ -183,10 +511,17 @@ class CallGraphTimeProfilerDecorator(_base_profiling_decorators.BaseProfilingDec
         top_n (int): Number of top entries to show in the profiling output.
         storages (StorageConfig): Data Transfer Object that contains all configured output destinations.
         obaserver (ProfilingObserver): A class that responsible for storing profiling result to.
+        sampler (SamplerI | None): Sampling policy that decides which calls are profiled.
+        aggregate (bool): If True, call graphs of all calls within a time window are merged in memory 
+            and a single merged result per window is emitted to the observer instead of a result per call.
+        window (int | float): Duration of aggregation window in seconds.
+        backend (str): 'cprofile' or 'monitoring' (sys.monitoring, Python 3.12+).
+        modules (list[str] | None): Modules profiled by 'monitoring' backend, all Python code if None.
         
     Raises:
-        ValidationError: If sort_key, func_filter, top_n has incorrect type.
+        ValidationError: If sort_key, func_filter, top_n, backend or modules has incorrect value.
         InvalidInputError: If storages or observer has incorrect type.
+        ValueError: If window is not positive.
     """
     def __init__(
         self, 
@@ -194,21 +529,106 @@ class CallGraphTimeProfilerDecorator(_base_profiling_decorators.BaseProfilingDec
         func_filter: str = '', 
         top_n: int = 10,
         storages: python_profiling_configs.StorageConfig = python_profiling_configs.StorageConfig(),
-        observer:  observers.ProfilingObserverI =  observers.ProfilingObserver
+        observer:  observers.ProfilingObserverI =  observers.ProfilingObserver,
+        sampler: samplers.SamplerI | None = None,
+        aggregate: bool = False,
+        window: int | float = 300.0,
+        backend: str = 'cprofile',
+        modules: list[str] | None = None
         ):
+        if window <= 0:
+            raise ValueError(f'window has to be positive, got instead: {window}')
+        self.sampler = sampler
         self.sort_key = sort_key
         self.func_filter = func_filter
         self.top_n = top_n
+        self.aggregate = aggregate
+        self.window = window
+        self._aggregators = {}
         self._init_observer(storages=storages, observer=observer)
         self.profiler = call_graph_time_profiler.CallGraphTimeProfiler(sort_key=self.sort_key,
                                                                        func_filter=self.func_filter,
-                                                                       top_n=self.top_n)
+                                                                       top_n=self.top_n,
+                                                                       backend=backend,
+                                                                       modules=modules)
+        
+    def snapshot(self, reset: bool = True) -> list[time_profiling_results.CallGraphWindowResult]:
+        """Summarize call graphs merged in current windows of all decorated functions and store the summaries.
+        
+        Args:
+            reset (bool): If True, current windows are closed and new ones start.
+            
+        Returns:
+            list[CallGraphWindowResult]: Result per decorated function with merged calls.
+        """
+        results = []
+        for func, aggregator in self._aggregators.items():
+            window = aggregator.snapshot(reset=reset)
+            if window is None:
+                continue
+            result = self.profiler.window_result(func, window)
+            self.observer.dump(result)
+            results.append(result)
+        return results
+        
+    def _aggregate__call__(self, func: Callable) -> Callable:
+        """Decorator that merges call graph of each call into the current window of the function.
+        
+        Calls that can not start a cProfile session on Python 3.12+ (concurrent coroutines, nested
+        calls) run unprofiled and are not merged, see CallGraphTimeProfilerManager. Sampling weights
+        of merged calls are summed into the `weight` of the window.
+        
+        Args:
+            func (Callable): The original function to decorate.
+            
+        Returns:
+            Callable: A wrapped function that returns result of the original function, None if it raised.
+        """
+        aggregator = rolling_call_graph.RollingCallGraphAggregator(window=self.window)
+        self._aggregators[func] = aggregator
+        sampler = self.sampler
+        
+        def add(call_graph_profiling_manager, sampling_weight):
+            if not call_graph_profiling_manager.profiled:
+                return
+            closed_window = aggregator.add_stats(self.profiler.raw_stats(call_graph_profiling_manager), sampling_weight)
+            if closed_window is not None:
+                self.observer.dump(self.profiler.window_result(func, closed_window))
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(**kwargs):
+                sampling_weight = 1 if sampler is None else sampler.sample()
+                if sampling_weight is None:
+                    return await func(**kwargs)
+                func_result = None
+                with self.profiler.profiling_manager(func, blocking=False, save_stats=False) as call_graph_profiling_manager:
+                    func_result = await func(**kwargs)
+                add(call_graph_profiling_manager, sampling_weight)
+                return func_result if not call_graph_profiling_manager.exception else None
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(**kwargs):
+            sampling_weight = 1 if sampler is None else sampler.sample()
+            if sampling_weight is None:
+                return func(**kwargs)
+            func_result = None
+            with self.profiler.profiling_manager(func, save_stats=False) as call_graph_profiling_manager:
+                func_result = func(**kwargs)
+            add(call_graph_profiling_manager, sampling_weight)
+            return func_result if not call_graph_profiling_manager.exception else None
+        return wrapper
         
     def __call__(self, func: Callable) -> Callable:
+        if self.aggregate:
+            return self._aggregate__call__(func)
         return self.base_profiling__call__(
             func=func,
             profiling_func=self.profiler.profile,
-            observing_func=self.observer.dump
+            observing_func=self.observer.dump,
+            sampler=self.sampler,
+            async_profiling_func=self.profiler.profile_async
         )
         
     
@@ -1,5 +1,7 @@
 """Structured time profiling results."""
 
+import heapq
+from array import array
 from dataclasses import dataclass
 from typing import Any, Type
 from types import BuiltinFunctionType, FunctionType
@@ -7,8 +9,12 @@ from types import BuiltinFunctionType, FunctionType
 
 from python_profiling import _base_profiling_result
 from python_profiling import python_profiling_enums
+from python_profiling.time_profiling import line_timings
+from python_profiling.time_profiling import call_graph_stats
+from python_profiling.time_profiling import call_graph_diff
 from Internals import checks
 from Internals import serialization
+from Internals import stack_sampling
 from Internals.logger import logger
 
    
@@ -24,6 +30,8 @@ class TimeProfilerResult(_base_profiling_result.BaseProfilingResult):
         func_result: Profiled function result.
         func_execution_time: Profiled function execution time.
         func_exception: Exception raised during execution, if any.
+        func_running_time: Time coroutine of profiled async function actually ran on the event loop, 
+            None for regular functions.
     """
     
     profiler: Type
@@ -33,6 +41,7 @@ class TimeProfilerResult(_base_profiling_result.BaseProfilingResult):
     func_result: Any
     func_execution_time: int | float
     func_exception: str | None = None
+    func_running_time: int | float | None = None
     
     
     def __str__(self) -> str:
@@ -42,6 +51,8 @@ class TimeProfilerResult(_base_profiling_result.BaseProfilingResult):
                 f"Function Kwargs: {self.func_kwargs}\n"
                 f"Function Result: {self.func_result}\n"
                 f"Function Executions Time: {self.func_execution_time:.6f} seconds\n"
+                + (f"Function Running Time: {self.func_running_time:.6f} seconds\n" 
+                   if self.func_running_time is not None else "") +
                 f"Function Exception: {self.func_exception or 'None'}")
         
     def __repr__(self) -> str:
@@ -62,6 +73,20 @@ class TimeItProfilerResult(_base_profiling_result.BaseProfilingResult):
         avg_func_execution_time: Average execution time.
         max_func_execution_time:  Maximum execution time.
         func_exception: Exception raised during execution, if any.
+        avg_func_running_time: Average time coroutines of profiled async function actually ran on 
+            the event loop during a repeat, None for regular functions.
+        number: Number of executions per repeat.
+        relative_error: Half width of 95% confidence interval of the mean relative to the mean, 
+            None unless profiled in adaptive mode.
+        samples: Execution time of every repeat.
+        median_func_execution_time: Median execution time.
+        std_func_execution_time: Standard deviation of execution time.
+        mad_func_execution_time: Median absolute deviation of execution time.
+        outliers: Amount of repeats outside of 1.5 IQR fences.
+        ci_low_func_execution_time: Lower bound of bootstrap confidence interval of the mean,
+            None unless requested with confidence_interval.
+        ci_high_func_execution_time: Upper bound of bootstrap confidence interval of the mean,
+            None unless requested with confidence_interval.
     """
     
     profiler: Type
@@ -73,6 +98,16 @@ class TimeItProfilerResult(_base_profiling_result.BaseProfilingResult):
     avg_func_execution_time: int | float
     max_func_execution_time: int | float
     func_exception: str | None = None
+    avg_func_running_time: int | float | None = None
+    number: int | None = None
+    relative_error: float | None = None
+    samples: array | None = None
+    median_func_execution_time: float | None = None
+    std_func_execution_time: float | None = None
+    mad_func_execution_time: float | None = None
+    outliers: int | None = None
+    ci_low_func_execution_time: float | None = None
+    ci_high_func_execution_time: float | None = None
     
     
     def __str__(self) -> str:
@@ -82,7 +117,20 @@ class TimeItProfilerResult(_base_profiling_result.BaseProfilingResult):
                 f"Function Result: {self.func_result}\n"
                 f"Function Min Executions Time: {self.min_func_execution_time:.6f} seconds\n"
                 f"Function Avg of {self.repeats} Executions Time: {self.avg_func_execution_time:.6f} seconds\n"
+                + (f"Function Executions per Repeat: {self.number}\n" if self.number is not None else "")
+                + (f"Relative Error of Avg Time (95% CI): {self.relative_error:.2%}\n" 
+                   if self.relative_error is not None else "") +
                 f"Function Max Executions Time: {self.max_func_execution_time:.6f} seconds\n"
+                + (f"Function Median Executions Time: {self.median_func_execution_time:.6f} seconds\n"
+                   f"Function Executions Time Std: {self.std_func_execution_time:.6f} seconds\n"
+                   f"Function Executions Time MAD: {self.mad_func_execution_time:.6f} seconds\n"
+                   f"Outlier Repeats: {self.outliers}\n"
+                   if self.samples is not None else "")
+                + (f"Function Avg Executions Time CI: [{self.ci_low_func_execution_time:.6f}, "
+                   f"{self.ci_high_func_execution_time:.6f}] seconds\n"
+                   if self.ci_low_func_execution_time is not None else "")
+                + (f"Function Avg Running Time: {self.avg_func_running_time:.6f} seconds\n" 
+                   if self.avg_func_running_time is not None else "") +
                 f"Function Exception: {self.func_exception or 'None'}")
         
     def __repr__(self) -> str:
@@ -97,7 +145,7 @@ class LineTimeProfilerResult(_base_profiling_result.BaseProfilingResult):
         profiled_func: Profiled function.
         func_kwargs: Keyword arguments of profiled function.
         func_result: Profiled function result.
-        func_profiling_result: Structured profiling result.
+        func_profiling_result: Per-line timings of each profiled function.
         func_exception: Exception raised during execution, if any.
     """
     
@@ -105,15 +153,33 @@ class LineTimeProfilerResult(_base_profiling_result.BaseProfilingResult):
     profiled_func: BuiltinFunctionType | FunctionType
     func_kwargs: dict
     func_result: Any
-    func_profiling_result: str | None
+    func_profiling_result: list[line_timings.LineTimings] | None
     func_exception: str | None = None
     
+    def hot_lines(self, k: int = 5) -> list[tuple[str, int, int, float, float, str]]:
+        """Returns k lines with the largest total time across all profiled functions, slowest first.
+        
+        Args:
+            k (int): Amount of returned lines.
+            
+        Returns:
+            list[tuple[str, int, int, float, float, str]]: Function name, line number, hits, total time, 
+                per-hit time and source of each line.
+        """
+        lines = (
+            (function_timings.func_name, *line) 
+            for function_timings in self.func_profiling_result or []
+            for line in function_timings.hot_lines(k)
+            )
+        return heapq.nlargest(k, lines, key=lambda line: line[3])
+    
     def __str__(self) -> str:
+        func_profiling_result = '\n\n'.join(str(function_timings) for function_timings in self.func_profiling_result or [])
         return (f"Profiler: {self.profiler}\n"
                 f"Profiled Function: {self.profiled_func.__name__}\n"
                 f"Function Kwargs: {self.func_kwargs}\n"
                 f"Function Result: {self.func_result}\n"
-                f"Function Profiling Result: {self.func_profiling_result}\n"
+                f"Function Profiling Result:\n{func_profiling_result}\n"
                 f"Function Exceptions: {self.func_exception}")
         
     def __repr__(self) -> str:
@@ -129,8 +195,10 @@ class CallGraphTimeProfilerResult(_base_profiling_result.BaseProfilingResult):
         profiled_func: Profiled function.
         func_kwargs: Keyword arguments of profiled function.
         func_result: Profiled function result.
-        func_profiling_result: Structured profiling result.
+        func_profiling_result: Text report of top functions (and callers/callees of filtered function).
         func_exception: Exception raised during execution, if any.
+        stats_file: Temporary .prof file with raw stats, if saving of stats was requested.
+        func_profiling_stats: Statistics of every called function with caller/callee edges.
     """
     
     
@@ -140,6 +208,8 @@ class CallGraphTimeProfilerResult(_base_profiling_result.BaseProfilingResult):
     func_result: Any
     func_profiling_result: str | None
     func_exception: str |  None  = None
+    stats_file: str | None = None
+    func_profiling_stats: call_graph_stats.CallGraphStats | None = None
     
     def __str__(self) -> str:
         return (f"Profiler: {self.profiler}\n"
@@ -151,4 +221,360 @@ class CallGraphTimeProfilerResult(_base_profiling_result.BaseProfilingResult):
         
     def __repr__(self) -> str:
         return f"CallGrapthTimeProfilerResult(profiler={self.profiler.__class__.__name__}, profiled_func={self.profiled_func})"
-    
\ No newline at end of file
+        
+    
+@dataclass
+class CallGraphWindowResult(_base_profiling_result.BaseProfilingResult):
+    """Structured profiling result of call graphs merged over a time window.
+    
+    Attributes:
+        profiler: An instance of CallGraphTimeProfiler.
+        profiled_func: Profiled function.
+        window_start: Timestamp of the window start.
+        window_end: Timestamp of the window end.
+        calls: Amount of merged calls.
+        func_profiling_result: Text report of top functions of merged calls.
+        weight: Sum of sampling weights of merged calls, estimated amount of calls they stand for.
+        func_profiling_stats: Statistics of every function called by merged calls.
+    """
+    
+    profiler: Type
+    profiled_func: BuiltinFunctionType | FunctionType
+    window_start: float
+    window_end: float
+    calls: int
+    func_profiling_result: str
+    func_profiling_stats: call_graph_stats.CallGraphStats
+    weight: float = 0
+    
+    def __str__(self) -> str:
+        return (f"Profiler: {self.profiler}\n"
+                f"Profiled Function: {self.profiled_func.__name__}\n"
+                f"Window: {self.window_start:.3f} - {self.window_end:.3f}\n"
+                f"Function Calls: {self.calls} (weight {self.weight:g})\n"
+                f"Function Profiling Result: {self.func_profiling_result}")
+        
+    def __repr__(self) -> str:
+        return f'CallGraphWindowResult(profiler={self.profiler.__class__.__name__}, profiled_func={self.profiled_func.__name__})'
+    
+    
+@dataclass
+class SamplingTimeProfilerResult(_base_profiling_result.BaseProfilingResult):
+    """Structured profiling result for statistical time profiling with stack sampling.
+    
+    Attributes:
+        profiler: An instance of SamplingTimeProfiler.
+        profiled_func: Profiled function.
+        func_kwargs: Keyword arguments of profiled function.
+        func_result: Profiled function result.
+        func_execution_time: Execution time of the function.
+        samples: Amount of sampled stacks.
+        sampling_overhead: Time spent on sampling relative to execution time.
+        function_shares: (filename, first line, function name), inclusive and exclusive share 
+            of samples per function, largest inclusive share first.
+        line_shares: (filename, first line, function name, line), inclusive and exclusive share 
+            of samples per line, largest inclusive share first.
+        func_profiling_result: Trie of sampled stacks.
+        func_exception: Exception raised during execution, if any.
+    """
+    
+    profiler: Type
+    profiled_func: BuiltinFunctionType | FunctionType
+    func_kwargs: dict
+    func_result: Any
+    func_execution_time: int | float
+    samples: int
+    sampling_overhead: float
+    function_shares: list
+    line_shares: list
+    func_profiling_result: stack_sampling.StackTrie
+    func_exception: str | None = None
+    
+    def __str__(self) -> str:
+        function_shares = '\n'.join(
+            f"{inclusive:>9.2%} {exclusive:>9.2%}  {func_name} ({filename}:{first_lineno})"
+            for (filename, first_lineno, func_name), inclusive, exclusive in self.function_shares[:10]
+            )
+        return (f"Profiler: {self.profiler}\n"
+                f"Profiled Function: {self.profiled_func.__name__}\n"
+                f"Function Kwargs: {self.func_kwargs}\n"
+                f"Function Result: {self.func_result}\n"
+                f"Function Execution Time: {self.func_execution_time:.6f} seconds\n"
+                f"Samples: {self.samples} (sampling overhead {self.sampling_overhead:.2%})\n"
+                f"{'Inclusive':>9} {'Exclusive':>9}  Function\n"
+                f"{function_shares}\n"
+                f"Function Exceptions: {self.func_exception}")
+        
+    def __repr__(self) -> str:
+        return f'SamplingTimeProfilerResult(profiler={self.profiler.__class__.__name__}, profiled_func={self.profiled_func})'
+    
+    
+@dataclass
+class LatencyHistogramResult(_base_profiling_result.BaseProfilingResult):
+    """Structured summary of execution times aggregated into a latency histogram.
+    
+    Attributes:
+        profiler: An instance of LatencyHistogram.
+        profiled_func: Profiled function.
+        count: Amount of recorded calls, calls that raised excluded.
+        mean_func_execution_time: Mean execution time.
+        p50_func_execution_time: Median execution time.
+        p90_func_execution_time: 90th percentile of execution time.
+        p99_func_execution_time: 99th percentile of execution time.
+        p999_func_execution_time: 99.9th percentile of execution time.
+        max_func_execution_time: Maximum execution time.
+        failed_count: Amount of calls that raised, their execution times are not recorded.
+    """
+    
+    profiler: Type
+    profiled_func: BuiltinFunctionType | FunctionType
+    count: int | float
+    mean_func_execution_time: int | float
+    p50_func_execution_time: int | float
+    p90_func_execution_time: int | float
+    p99_func_execution_time: int | float
+    p999_func_execution_time: int | float
+    max_func_execution_time: int | float
+    failed_count: int | float = 0
+    
+    def __str__(self) -> str:
+        return (f"Profiler: {self.profiler}\n"
+                f"Profiled Function: {self.profiled_func.__name__}\n"
+                f"Function Calls: {self.count:g}\n"
+                f"Failed Function Calls: {self.failed_count:g}\n"
+                f"Function Mean Execution Time: {self.mean_func_execution_time:.6f} seconds\n"
+                f"Function p50 Execution Time: {self.p50_func_execution_time:.6f} seconds\n"
+                f"Function p90 Execution Time: {self.p90_func_execution_time:.6f} seconds\n"
+                f"Function p99 Execution Time: {self.p99_func_execution_time:.6f} seconds\n"
+                f"Function p99.9 Execution Time: {self.p999_func_execution_time:.6f} seconds\n"
+                f"Function Max Execution Time: {self.max_func_execution_time:.6f} seconds")
+        
+    def __repr__(self) -> str:
+        return f'LatencyHistogramResult(profiler={self.profiler.__class__.__name__}, profiled_func={self.profiled_func.__name__})'
+    
+    
+@dataclass
+class LoadTimeProfilerResult(_base_profiling_result.BaseProfilingResult):
+    """Structured profiling result for time profiling under concurrent load.
+    
+    Attributes:
+        profiler: An instance of LoadTimeProfiler.
+        profiled_func: Profiled function.
+        func_kwargs: Keyword arguments of profiled function.
+        func_result: Result of the first successful call.
+        total_calls: Amount of calls of the function.
+        concurrency: Amount of worker threads.
+        target_rate: Calls submitted per second, None if all calls were submitted at once.
+        wall_time: Time from the first submission until the last call finished.
+        throughput: Successful calls per second of wall time.
+        mean_func_execution_time: Mean latency of successful calls.
+        p50_func_execution_time: Median latency of successful calls.
+        p90_func_execution_time: 90th percentile of latency of successful calls.
+        p99_func_execution_time: 99th percentile of latency of successful calls.
+        max_func_execution_time: Maximum latency of successful calls.
+        mean_queueing_delay: Mean time calls waited for a free worker after being scheduled.
+        p99_queueing_delay: 99th percentile of queueing delay.
+        max_queueing_delay: Maximum queueing delay.
+        errors: Amount of failed calls per exception name.
+        func_exception: Exception raised by the first failed call, if any.
+    """
+    
+    profiler: Type
+    profiled_func: BuiltinFunctionType | FunctionType
+    func_kwargs: dict
+    func_result: Any
+    total_calls: int
+    concurrency: int
+    target_rate: float | None
+    wall_time: int | float
+    throughput: int | float
+    mean_func_execution_time: int | float
+    p50_func_execution_time: int | float
+    p90_func_execution_time: int | float
+    p99_func_execution_time: int | float
+    max_func_execution_time: int | float
+    mean_queueing_delay: int | float
+    p99_queueing_delay: int | float
+    max_queueing_delay: int | float
+    errors: dict
+    func_exception: str | None = None
+    
+    def __str__(self) -> str:
+        return (f"Profiler: {self.profiler}\n"
+                f"Profiled Function: {self.profiled_func.__name__}\n"
+                f"Function Kwargs: {self.func_kwargs}\n"
+                f"Function Result: {self.func_result}\n"
+                f"Function Calls: {self.total_calls} on {self.concurrency} threads"
+                f"{f' at {self.target_rate:g} calls/s' if self.target_rate is not None else ''}\n"
+                f"Wall Time: {self.wall_time:.6f} seconds\n"
+                f"Throughput: {self.throughput:.2f} calls/s\n"
+                f"Function Mean Execution Time: {self.mean_func_execution_time:.6f} seconds\n"
+                f"Function p50 Execution Time: {self.p50_func_execution_time:.6f} seconds\n"
+                f"Function p90 Execution Time: {self.p90_func_execution_time:.6f} seconds\n"
+                f"Function p99 Execution Time: {self.p99_func_execution_time:.6f} seconds\n"
+                f"Function Max Execution Time: {self.max_func_execution_time:.6f} seconds\n"
+                f"Mean Queueing Delay: {self.mean_queueing_delay:.6f} seconds\n"
+                f"p99 Queueing Delay: {self.p99_queueing_delay:.6f} seconds\n"
+                f"Max Queueing Delay: {self.max_queueing_delay:.6f} seconds\n"
+                f"Errors: {self.errors}\n"
+                f"Function Exception: {self.func_exception or 'None'}")
+        
+    def __repr__(self) -> str:
+        return f'LoadTimeProfilerResult(profiler={self.profiler.__class__.__name__}, profiled_func={self.profiled_func})'
+    
+    
+@dataclass
+class ScalingTimeProfilerResult(_base_profiling_result.BaseProfilingResult):
+    """Structured profiling result for multi-core scaling sweep with a process pool.
+    
+    All lists are aligned with worker_counts.
+    
+    Attributes:
+        profiler: An instance of ScalingTimeProfiler.
+        profiled_func: Profiled function.
+        func_kwargs: Keyword arguments of profiled function.
+        func_result: Result of the first successful task.
+        tasks: Amount of calls of the function for every worker count.
+        worker_counts: Profiled pool sizes.
+        wall_times: Time to run all tasks.
+        throughputs: Successful tasks per second.
+        mean_func_execution_times: Mean latency of a task.
+        max_func_execution_times: Maximum latency of a task.
+        speedups: Throughput relative to measured throughput of a single worker.
+        efficiencies: Speedup per worker.
+        func_exception: Exception raised during execution, if any.
+    """
+    
+    profiler: Type
+    profiled_func: BuiltinFunctionType | FunctionType
+    func_kwargs: dict
+    func_result: Any
+    tasks: int
+    worker_counts: list[int]
+    wall_times: list[int | float]
+    throughputs: list[int | float]
+    mean_func_execution_times: list[int | float]
+    max_func_execution_times: list[int | float]
+    speedups: list[int | float]
+    efficiencies: list[int | float]
+    func_exception: str | None = None
+    
+    def __str__(self) -> str:
+        rows = '\n'.join(
+            f"{workers:>7} {throughput:>12.2f} {mean_time:>14.6f} {max_time:>14.6f} {speedup:>8.2f} {efficiency:>10.2f}"
+            for workers, throughput, mean_time, max_time, speedup, efficiency in zip(
+                self.worker_counts, self.throughputs, self.mean_func_execution_times,
+                self.max_func_execution_times, self.speedups, self.efficiencies
+                )
+            )
+        return (f"Profiler: {self.profiler}\n"
+                f"Profiled Function: {self.profiled_func.__name__}\n"
+                f"Function Kwargs: {self.func_kwargs}\n"
+                f"Function Result: {self.func_result}\n"
+                f"Tasks per Worker Count: {self.tasks}\n"
+                f"{'Workers':>7} {'Tasks/s':>12} {'Mean Time (s)':>14} {'Max Time (s)':>14} {'Speedup':>8} {'Efficiency':>10}\n"
+                f"{rows}\n"
+                f"Function Exception: {self.func_exception or 'None'}")
+        
+    def __repr__(self) -> str:
+        return f'ScalingTimeProfilerResult(profiler={self.profiler.__class__.__name__}, profiled_func={self.profiled_func})'
+    
+    
+@dataclass
+class RegressionComparisonResult(_base_profiling_result.BaseProfilingResult):
+    """Structured result of statistical comparison of candidate execution times against baseline ones.
+    
+    Attributes:
+        profiler: An instance of RegressionComparator.
+        baseline_size: Amount of baseline samples.
+        candidate_size: Amount of candidate samples.
+        baseline_median: Median of baseline samples.
+        candidate_median: Median of candidate samples.
+        relative_change: Relative change of the median, positive when the candidate is slower.
+        ci_low: Lower bound of bootstrap confidence interval of relative_change.
+        ci_high: Upper bound of bootstrap confidence interval of relative_change.
+        u_statistic: Mann-Whitney U statistic of candidate samples.
+        p_value: Two-sided p-value of Mann-Whitney U test.
+        probability_of_regression: Probability that a candidate sample is slower than a baseline one.
+        verdict: Classification of the change.
+        exit_code: 1 if the candidate regressed, 0 otherwise, for gating CI jobs.
+    """
+    
+    profiler: Type
+    baseline_size: int
+    candidate_size: int
+    baseline_median: float
+    candidate_median: float
+    relative_change: float
+    ci_low: float
+    ci_high: float
+    u_statistic: float
+    p_value: float
+    probability_of_regression: float
+    verdict: python_profiling_enums.RegressionVerdict
+    exit_code: int
+    
+    def __str__(self) -> str:
+        return (f"Profiler: {self.profiler}\n"
+                f"Baseline Samples: {self.baseline_size}, Median: {self.baseline_median:.6f} seconds\n"
+                f"Candidate Samples: {self.candidate_size}, Median: {self.candidate_median:.6f} seconds\n"
+                f"Relative Change of Median: {self.relative_change:+.2%} "
+                f"[{self.ci_low:+.2%}, {self.ci_high:+.2%}]\n"
+                f"Mann-Whitney U: {self.u_statistic:g}, p-value: {self.p_value:.4g}\n"
+                f"Probability of Regression: {self.probability_of_regression:.2f}\n"
+                f"Verdict: {self.verdict.value}")
+        
+    def __repr__(self) -> str:
+        return f'RegressionComparisonResult(profiler={self.profiler.__class__.__name__}, verdict={self.verdict.value})'
+    
+    
+@dataclass
+class CallGraphDiffResult(_base_profiling_result.BaseProfilingResult):
+    """Structured result of per-function comparison of a candidate call graph against a baseline one.
+    
+    Attributes:
+        profiler: An instance of CallGraphDiffer.
+        baseline_total_time: Time spent in all functions of the baseline profile.
+        candidate_total_time: Time spent in all functions of the candidate profile.
+        regressions: Functions that got slower with their delta, largest delta first.
+        improvements: Functions that got faster with their delta, largest decrease first.
+        added_funcs: Functions called only in the candidate profile.
+        removed_funcs: Functions called only in the baseline profile.
+        func_profiling_diff: Matched functions of both profiles.
+    """
+    
+    profiler: Type
+    baseline_total_time: float
+    candidate_total_time: float
+    regressions: list[dict]
+    improvements: list[dict]
+    added_funcs: list[dict]
+    removed_funcs: list[dict]
+    func_profiling_diff: call_graph_diff.CallGraphDiff
+    
+    def render_flame_graph(self, title: str = 'Differential Flame Graph', width: int = 1200, min_fraction: float = 0.001) -> str:
+        """Renders differential flame graph of the candidate profile against the baseline one as SVG."""
+        return self.func_profiling_diff.render_flame_graph(title=title, width=width, min_fraction=min_fraction)
+    
+    @staticmethod
+    def _format_funcs(funcs: list[dict], delta_format: str) -> str:
+        return ''.join(
+            f"\n  {func['func_name']} ({func['filename']}:{func['lineno']}): "
+            f"{func['baseline_tottime']:.6f}s -> {func['candidate_tottime']:.6f}s tottime, "
+            f"{func['baseline_ncalls']} -> {func['candidate_ncalls']} calls"
+            + (f", delta {func['delta']:{delta_format}}" if 'delta' in func else '')
+            for func in funcs
+            )
+    
+    def __str__(self) -> str:
+        delta_format = '.6g' if self.profiler.metric == 'ncalls' or not self.profiler.normalized else '+.2%'
+        return (f"Profiler: {self.profiler!r}\n"
+                f"Total Time: {self.baseline_total_time:.6f}s -> {self.candidate_total_time:.6f}s\n"
+                f"Regressions:{self._format_funcs(self.regressions, delta_format)}\n"
+                f"Improvements:{self._format_funcs(self.improvements, delta_format)}\n"
+                f"Added Functions:{self._format_funcs(self.added_funcs, delta_format)}\n"
+                f"Removed Functions:{self._format_funcs(self.removed_funcs, delta_format)}")
+        
+    def __repr__(self) -> str:
+        return (f'CallGraphDiffResult(profiler={self.profiler.__class__.__name__}, regressions={len(self.regressions)}, '
+                f'improvements={len(self.improvements)})')
@@ -1,7 +1,9 @@
 """Time Profiling of Python functions with timeit module."""
 
+import math
 import timeit
 import time
+from array import array
 from types import FunctionType, BuiltinFunctionType
 
 import pydantic
@@ -9,15 +11,37 @@ import pydantic
 from Internals import checks
 from python_profiling.time_profiling import time_profiling_results
 from Internals import context_managers
+from Internals import coroutines
+from Internals import sample_statistics
+
+
+Z_95 = 1.959964
+# Two-sided 95% quantiles of Student's t distribution for 1 to 29 degrees of freedom.
+T_95 = (
+    12.706205, 4.302653, 3.182446, 2.776445, 2.570582, 2.446912, 2.364624, 2.306004, 2.262157, 2.228139,
+    2.200985, 2.178813, 2.160369, 2.144787, 2.131450, 2.119905, 2.109816, 2.100922, 2.093024, 2.085963,
+    2.079614, 2.073873, 2.068658, 2.063899, 2.059539, 2.055529, 2.051831, 2.048407, 2.045230
+    )
 
 
 class TimeItProfiler(pydantic.BaseModel):
     """Time profiler that uses a specified timer from the time module and timeit module.
     
+    In adaptive mode `number` and `repeat` are not used: `number` is calibrated with 
+    timeit.Timer.autorange, then repeats run until the 95% confidence interval of the mean 
+    repeat time is within target_relative_error of the mean, or time_budget is spent.
+    
     Attributes:
         timer (FunctionType | BuiltinFunctionType): Timer function used for profiling.
         number (int): Number of times to execute the function per repeat.
         repeat (int): Number of repetitions to run.
+        adaptive (bool): If True, calibrate number and stop repeating on convergence.
+        target_relative_error (float): Half width of confidence interval relative to the mean to stop at.
+        time_budget (float): Maximum time in seconds spent on adaptive profiling.
+        min_repeat (int): Minimum amount of repeats in adaptive mode, they run even if time budget is spent.
+        confidence_interval (bool): If True, bootstrap confidence interval of the mean repeat time is
+            computed, it resamples repeat times thousands of times, so it is off by default.
+        confidence_level (float): Confidence level of bootstrap confidence interval of the mean repeat time.
     """
     
     model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
@@ -25,13 +49,85 @@ class TimeItProfiler(pydantic.BaseModel):
     timer: FunctionType | BuiltinFunctionType = pydantic.Field(default=time.perf_counter)
     number: int = pydantic.Field(default=10000)
     repeat: int = pydantic.Field(default=1)
+    adaptive: bool = pydantic.Field(default=False)
+    target_relative_error: float = pydantic.Field(default=0.01, gt=0)
+    time_budget: float = pydantic.Field(default=10.0, gt=0)
+    min_repeat: int = pydantic.Field(default=5, ge=2)
+    confidence_interval: bool = pydantic.Field(default=False)
+    confidence_level: float = pydantic.Field(default=0.95, gt=0, lt=1)
     
-    def _get_time_profiler(self, func: FunctionType | BuiltinFunctionType, kwargs: dict) -> timeit.Timer:
-        return timeit.Timer(stmt=lambda : func(**kwargs), timer=self.timer)
+    @staticmethod
+    def _get_time_profiler(
+        func: FunctionType | BuiltinFunctionType, 
+        kwargs: dict, 
+        timer: FunctionType | BuiltinFunctionType
+        ) -> timeit.Timer:
+        """Creates timeit.Timer which times the call alone, its result is captured by a separate call."""
+        return timeit.Timer(stmt=lambda : func(**kwargs), timer=timer)
     
     @staticmethod
     def _profiling_stats(profiling_result: list[int | float]):
         return min(profiling_result), sum(profiling_result) / len(profiling_result), max(profiling_result)
+    
+    def _robust_stats(self, profiling_result: array) -> dict:
+        """Keeps raw repeat times and summarizes them with robust statistics.
+        
+        Returns:
+            dict: Sample related fields of TimeItProfilerResult.
+        """
+        statistics = sample_statistics.describe(
+            profiling_result, 
+            confidence_level=self.confidence_level,
+            resamples=sample_statistics.BOOTSTRAP_RESAMPLES if self.confidence_interval else 0
+            )
+        return {
+            'samples': profiling_result,
+            'median_func_execution_time': statistics.median,
+            'std_func_execution_time': statistics.std,
+            'mad_func_execution_time': statistics.mad,
+            'outliers': statistics.outliers,
+            'ci_low_func_execution_time': statistics.ci_low,
+            'ci_high_func_execution_time': statistics.ci_high
+            }
+    
+    @staticmethod
+    def _relative_error(profiling_result: list[int | float]) -> float:
+        """Half width of 95% confidence interval of the mean relative to the mean.
+        
+        Student's t quantile is taken from a table below 30 degrees of freedom and approximated
+        with two Cornish-Fisher terms from 30 on, where the approximation is within 0.01%.
+        """
+        repeats = len(profiling_result)
+        mean = sum(profiling_result) / repeats
+        if mean <= 0:
+            return 0.0
+        variance = sum((value - mean) ** 2 for value in profiling_result) / (repeats - 1)
+        degrees_of_freedom = repeats - 1
+        if degrees_of_freedom < len(T_95) + 1:
+            t_quantile = T_95[degrees_of_freedom - 1]
+        else:
+            t_quantile = (Z_95 
+                          + (Z_95 ** 3 + Z_95) / (4 * degrees_of_freedom)
+                          + (5 * Z_95 ** 5 + 16 * Z_95 ** 3 + 3 * Z_95) / (96 * degrees_of_freedom ** 2))
+        return t_quantile * math.sqrt(variance / repeats) / mean
+    
+    def _adaptive_repeat(self, time_profiler: timeit.Timer) -> tuple[int, list[int | float], float]:
+        """Calibrates number and repeats until convergence or until time budget is spent.
+        
+        Returns:
+            tuple: Calibrated number, repeat times and reached relative error.
+        """
+        budget_start = time.monotonic()
+        number, _ = time_profiler.autorange()
+        profiling_result = array('d')
+        relative_error = math.inf
+        while (len(profiling_result) < self.min_repeat 
+               or (relative_error > self.target_relative_error 
+                   and time.monotonic() - budget_start < self.time_budget)):
+            profiling_result.append(time_profiler.timeit(number=number))
+            if len(profiling_result) >= self.min_repeat:
+                relative_error = self._relative_error(profiling_result)
+        return number, profiling_result, relative_error
 
     
     @checks.ValidateType(('func', (FunctionType, BuiltinFunctionType)))
@@ -48,15 +144,72 @@ class TimeItProfiler(pydantic.BaseModel):
             InvalidInputTypeError: If the function is not of the correct type.
         """
         
+        number, relative_error, profiling_result = self.number, None, []
         with context_managers.TimeItProfilerManager() as time_profiler_manager:
-            time_profiler = self._get_time_profiler(func, kwargs)
+            time_profiler = self._get_time_profiler(func, kwargs, self.timer)
             func_result = func(**kwargs)
-            profiling_result = time_profiler.repeat(repeat=self.repeat, number=self.number)
+            if self.adaptive:
+                number, profiling_result, relative_error = self._adaptive_repeat(time_profiler)
+            else:
+                profiling_result = array('d', time_profiler.repeat(repeat=self.repeat, number=self.number))
             func_profiling_stats= self._profiling_stats(profiling_result)
+            robust_stats = self._robust_stats(profiling_result)
+            
+        if time_profiler_manager.exception:
+            func_result = None
+            func_profiling_stats = (-1,-1,-1)
+            robust_stats = {}
+            
+        return time_profiling_results.TimeItProfilerResult(
+            profiler=self,
+            profiled_func=func,
+            func_kwargs=kwargs,
+            func_result=func_result,
+            repeats=len(profiling_result) if self.adaptive else self.repeat,
+            min_func_execution_time=func_profiling_stats[0],
+            avg_func_execution_time=func_profiling_stats[1],
+            max_func_execution_time=func_profiling_stats[2],
+            func_exception=time_profiler_manager.func_exception,
+            number=number,
+            relative_error=relative_error,
+            **robust_stats
+            )
+    
+    @checks.ValidateType(('func', (FunctionType, BuiltinFunctionType)))
+    async def profile_async(self, func: FunctionType | BuiltinFunctionType, **kwargs) -> time_profiling_results.TimeItProfilerResult:
+        """Profile the execution time of an async def function by awaiting it `number` times per repeat.
+        
+        Adaptive mode is not applied, event loop scheduling noise makes convergence unreliable.
+        
+        Args:
+            func (BuiltinFunctionType | FunctionType): Coroutine function to profile.
+            **kwargs:  Keyword arguments to pass to the function.
+        Returns:
+            TimeItProfilerResult:  Structured profiling result, where execution times are wall times of repeats 
+                and avg_func_running_time is average time coroutines of a repeat actually ran on the event loop.
+            
+        Raises:
+            InvalidInputTypeError: If the function is not of the correct type.
+        """
+        
+        with context_managers.TimeItProfilerManager() as time_profiler_manager:
+            profiling_result, running_times = array('d'), []
+            for _ in range(self.repeat):
+                running_time = 0
+                repeat_start = self.timer()
+                for _ in range(self.number):
+                    timed_coroutine = coroutines.TimedAwaitable(func(**kwargs), timer=self.timer)
+                    func_result = await timed_coroutine
+                    running_time += timed_coroutine.running_time
+                profiling_result.append(self.timer() - repeat_start)
+                running_times.append(running_time)
+            func_profiling_stats = self._profiling_stats(profiling_result)
+            robust_stats = self._robust_stats(profiling_result)
             
         if time_profiler_manager.exception:
             func_result = None
             func_profiling_stats = (-1,-1,-1)
+            robust_stats = {}
             
         return time_profiling_results.TimeItProfilerResult(
             profiler=self,
@@ -67,8 +220,14 @@ class TimeItProfiler(pydantic.BaseModel):
             min_func_execution_time=func_profiling_stats[0],
             avg_func_execution_time=func_profiling_stats[1],
             max_func_execution_time=func_profiling_stats[2],
-            func_exception=time_profiler_manager.func_exception
+            func_exception=time_profiler_manager.func_exception,
+            avg_func_running_time=sum(running_times) / len(running_times) if not time_profiler_manager.exception else None,
+            number=self.number,
+            **robust_stats
             )
     
     def __repr__(self):
+        if self.adaptive:
+            return (f'TimeItProfiler(timer={self.timer}, adaptive=True, target_relative_error={self.target_relative_error}, '
+                    f'time_budget={self.time_budget}, min_repeat={self.min_repeat})')
         return f'TimeItProfiler(timer={self.timer}, number={self.number}, repeat={self.repeat})'
@@ -0,0 +1,73 @@
+"""Tests for benchmark_history module."""
+
+import os
+
+import pytest
+
+from Internals import benchmark_history
+from Internals import observers
+from python_profiling import python_profiling_enums
+from python_profiling.python_profiling_configs import StorageConfig
+from python_profiling.time_profiling import time_profiler
+from python_profiling.time_profiling import time_profiling_decorators
+
+
+def profiled_add(x):
+    return x + 1
+
+
+def test_profiling_record():
+    result = time_profiler.TimeProfiler().profile(func=profiled_add, x=1)
+    other_kwargs_result = time_profiler.TimeProfiler().profile(func=profiled_add, x=2)
+    record = result.profiling_record
+    assert record['func_qualname'] == f'{__name__}.profiled_add'
+    assert record['source_hash'] == other_kwargs_result.profiling_record['source_hash']
+    assert record['kwargs_fingerprint'] != other_kwargs_result.profiling_record['kwargs_fingerprint']
+    assert record['result_type'] == 'TimeProfilerResult'
+    assert record['metrics']['func_execution_time'] == result.func_execution_time
+    assert record['data'] == result.profiling_data_str
+    # Timestamp is the time the result was created at, not the time of reading the record.
+    assert record['timestamp'] == result.profiling_record['timestamp'] <= other_kwargs_result.profiling_record['timestamp']
+
+
+def test_BenchmarkHistoryStore(tmp_path):
+    file_path = os.path.join(tmp_path, 'history.db')
+    store = benchmark_history.BenchmarkHistoryStore(file_path)
+    records = []
+    for run in range(100):
+        record = time_profiler.TimeProfiler().profile(func=profiled_add, x=run).profiling_record
+        record['timestamp'] = run
+        record['metrics']['func_execution_time'] = float(run)
+        records.append(record)
+    store.add(records)
+    trend = store.trend(f'{__name__}.profiled_add', 'func_execution_time', last_runs=50)
+    assert [value for _, value in trend] == [float(run) for run in range(50, 100)]
+    assert store.percentile(f'{__name__}.profiled_add', 'func_execution_time', 50, last_runs=50) == pytest.approx(74.5)
+    assert store.percentile(f'{__name__}.profiled_add', 'missing_metric', 99) is None
+    runs = store.runs(f'{__name__}.profiled_add', last_runs=2)
+    assert [run['timestamp'] for run in runs] == [99, 98]
+    assert runs[0]['data']['func_kwargs'] == "{'x': 99}"
+    
+    
+@pytest.mark.parametrize('observer', [observers.ProfilingObserver, observers.AsyncProfilingObserver])
+def test_sqlite_storage(tmp_path, observer):
+    file_path = os.path.join(tmp_path, 'history.db')
+    storages = StorageConfig(serializers_strategies=[python_profiling_enums.SerializerStrategy.SQLITE], file_paths=[file_path])
+    profiling_observer = observer(storages=storages)
+    decorated_func = time_profiling_decorators.TimeProfilerDecorator(observer=profiling_observer)(profiled_add)
+    for run in range(5):
+        decorated_func(x=run)
+    if isinstance(profiling_observer, observers.AsyncProfilingObserver):
+        profiling_observer.close()
+    assert len(benchmark_history.BenchmarkHistoryStore(file_path).runs(f'{__name__}.profiled_add')) == 5
+
+
+def test_cached_store(tmp_path):
+    file_path = os.path.join(tmp_path, 'history.db')
+    store = benchmark_history.cached_store(file_path)
+    assert benchmark_history.cached_store(file_path) is store
+    store.add([time_profiler.TimeProfiler().profile(func=profiled_add, x=1).profiling_record])
+    os.remove(file_path)
+    reopened_store = benchmark_history.cached_store(file_path)
+    assert reopened_store is not store
+    assert reopened_store.runs(f'{__name__}.profiled_add') == []
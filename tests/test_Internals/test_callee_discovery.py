@@ -0,0 +1,60 @@
+import contextlib
+import functools
+import json
+
+import pytest
+
+from Internals import callee_discovery
+
+
+def leaf(x):
+    return x + 1
+
+
+def decorator(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+    return wrapper
+
+
+@decorator
+def decorated_leaf(x):
+    return x - 1
+
+
+def middle(x):
+    return [leaf(x=value) for value in range(x)]
+
+
+def root(x):
+    return middle(x=x) + [decorated_leaf(x=x), json.dumps(x)]
+
+
+class Model:
+    def forward(self, x):
+        return self.transform(x=x)
+    
+    def transform(self, x):
+        return leaf(x=x)
+    
+    
+@pytest.mark.parametrize(
+    'func, max_depth, package, callees, expectation',
+    [
+        (root, 0, None, [], contextlib.nullcontext()),
+        (root, 1, __name__, [decorated_leaf.__wrapped__, middle], contextlib.nullcontext()),
+        (root, 2, __name__, [decorated_leaf.__wrapped__, middle, leaf], contextlib.nullcontext()),
+        (Model.forward, 2, None, [Model.transform, leaf], contextlib.nullcontext()),
+        (root, -1, None, None, pytest.raises(ValueError))
+    ]
+)
+def test_discover_callees(func, max_depth, package, callees, expectation):
+    with expectation:
+        assert callee_discovery.discover_callees(func, max_depth=max_depth, package=package) == callees
+
+
+def test_discover_callees_package():
+    callees = callee_discovery.discover_callees(root, max_depth=1)
+    assert json.dumps in callees
+    assert all(callee.__module__ == __name__ for callee in callee_discovery.discover_callees(root, max_depth=3, package=__name__))
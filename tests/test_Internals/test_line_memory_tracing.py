@@ -0,0 +1,109 @@
+import contextlib
+import sys
+
+import pytest
+
+from Internals import line_memory_tracing
+
+MIB = 1024 ** 2
+
+
+def _child(size):
+    temporary = bytearray(4 * size)
+    del temporary
+    return bytearray(size)
+
+
+def _work(size):
+    kept = bytearray(size)
+    result = _child(size=size)
+    del kept
+    return len(result)
+
+
+def _chunks(size):
+    for _ in range(2):
+        yield bytearray(size)
+
+
+def _fail():
+    data = bytearray(MIB)
+    raise ValueError(len(data))
+
+
+def _count_odd(n):
+    odd = 0
+    for number in range(n):
+        odd += number % 2
+    return odd
+
+
+def _relative_lines(tracer, func):
+    first_lineno = func.__code__.co_firstlineno
+    for (_, _, func_name), lines in tracer.lines().items():
+        if func_name == func.__name__:
+            return {lineno - first_lineno: (hits, increment / MIB, peak / MIB) for lineno, hits, increment, peak in lines}
+    return {}
+
+
+# Buffers of RSS cases are larger than the maximal mmap threshold of glibc (32 MiB), so they are
+# always mapped and unmapped instead of reusing resident heap memory.
+@pytest.mark.parametrize(
+    'metric, sample_every, size, raised_exception_ctx',
+    [
+        ('rss', 1, 40, contextlib.nullcontext()),
+        ('tracemalloc', 1, 10, contextlib.nullcontext()),
+        ('invalid', 1, 10, pytest.raises(ValueError)),
+        ('rss', 0, 10, pytest.raises(ValueError))
+    ]
+)
+def test_LineMemoryTracer(metric, sample_every, size, raised_exception_ctx):
+    with raised_exception_ctx:
+        with line_memory_tracing.LineMemoryTracer(codes=[_work.__code__, _child.__code__], metric=metric, sample_every=sample_every) as tracer:
+            _work(size=size * MIB)
+        work_lines = _relative_lines(tracer, _work)
+        child_lines = _relative_lines(tracer, _child)
+        assert set(work_lines) == {1, 2, 3, 4}
+        assert all(hits == 1 for hits, _, _ in work_lines.values())
+        assert work_lines[1][1] == pytest.approx(size, abs=1)
+        # Increment of a calling line includes its callee, peak includes the freed temporary buffer.
+        assert work_lines[2][1] == pytest.approx(size, abs=1)
+        assert work_lines[2][2] == pytest.approx(4 * size, abs=1)
+        assert work_lines[3][1] == pytest.approx(-size, abs=1)
+        assert child_lines[1][1] == pytest.approx(4 * size, abs=1)
+        assert child_lines[2][1] == pytest.approx(-4 * size, abs=1)
+
+
+def test_LineMemoryTracer_sample_every():
+    with line_memory_tracing.LineMemoryTracer(codes=[_work.__code__, _child.__code__], metric='tracemalloc', sample_every=3) as tracer:
+        _work(size=10 * MIB)
+    work_lines = _relative_lines(tracer, _work)
+    # Lines are counted on every event, memory changes of skipped readings go to the line running at the reading.
+    assert [hits for hits, _, _ in work_lines.values()] == [1, 1, 1, 1]
+    assert work_lines[1][1] == pytest.approx(10, abs=1)
+    # Peaks of callees are kept even if their frames end between readings.
+    assert work_lines[2][2] == pytest.approx(40, abs=1)
+
+
+def test_LineMemoryTracer_generator_and_exception():
+    previous_trace = sys.gettrace()
+    with line_memory_tracing.LineMemoryTracer(codes=[_chunks.__code__, _fail.__code__], metric='tracemalloc') as tracer:
+        chunks = list(_chunks(size=MIB))
+        with pytest.raises(ValueError):
+            _fail()
+    assert sys.gettrace() is previous_trace
+    chunk_lines = _relative_lines(tracer, _chunks)
+    assert chunk_lines[2][0] == 2 and chunk_lines[2][1] == pytest.approx(len(chunks), abs=0.1)
+    fail_lines = _relative_lines(tracer, _fail)
+    assert fail_lines[1][1] == pytest.approx(1, abs=0.1)
+
+
+def test_LineMemoryTracer_tracer_memory_excluded():
+    with line_memory_tracing.LineMemoryTracer(codes=[_count_odd.__code__], metric='tracemalloc') as tracer:
+        for _ in range(3):
+            _count_odd(n=100)
+    lines = _relative_lines(tracer, _count_odd)
+    # Entries, line stats and readings of the tracer are not counted into lines of code that does not allocate.
+    assert set(lines) == {1, 2, 3, 4}
+    assert all(increment * MIB == pytest.approx(0, abs=64) for _, increment, _ in lines.values())
+    assert all(peak * MIB < 256 for _, _, peak in lines.values())
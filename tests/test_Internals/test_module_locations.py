@@ -0,0 +1,21 @@
+import contextlib
+import json
+import os
+
+import pytest
+
+from Internals import module_locations
+
+
+@pytest.mark.parametrize(
+    'modules, paths, raised_exception_ctx',
+    [
+        (['json'], (os.path.join(os.path.dirname(json.__file__), ''),), contextlib.nullcontext()),
+        (['contextlib'], (contextlib.__file__,), contextlib.nullcontext()),
+        ([], (), contextlib.nullcontext()),
+        (['not_existing_module'], None, pytest.raises(ValueError))
+    ]
+)
+def test_module_paths(modules, paths, raised_exception_ctx):
+    with raised_exception_ctx:
+        assert module_locations.module_paths(modules) == paths
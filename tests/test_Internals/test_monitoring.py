@@ -0,0 +1,130 @@
+import cProfile
+import json
+import threading
+
+import pytest
+
+from Internals import module_locations
+from Internals import monitoring
+
+requires_monitoring = pytest.mark.skipif(not monitoring.MONITORING_AVAILABLE, reason='sys.monitoring requires Python 3.12+')
+
+
+def _fib(n):
+    return n if n < 2 else _fib(n=n - 1) + _fib(n=n - 2)
+
+
+def _count(n):
+    for i in range(n):
+        yield i
+
+
+def _fail():
+    raise ValueError('failed')
+
+
+def _work():
+    total = _fib(n=10) + sum(_count(n=3))
+    try:
+        _fail()
+    except ValueError:
+        pass
+    json.dumps([total])
+    return total
+
+
+@pytest.mark.skipif(monitoring.MONITORING_AVAILABLE, reason='sys.monitoring is available')
+def test_MonitoringSession_unavailable():
+    with pytest.raises(RuntimeError):
+        monitoring.CallGraphMonitor()
+
+
+@requires_monitoring
+def test_CallGraphMonitor():
+    with monitoring.CallGraphMonitor(codes=[_work.__code__]) as call_graph_monitor:
+        _work()
+    stats = {func_name: func_stats for (_, _, func_name), func_stats in call_graph_monitor.stats().items()}
+    primitive_calls, ncalls, tottime, cumtime, callers = stats['_fib']
+    assert (primitive_calls, ncalls) == (1, 177)
+    assert cumtime >= tottime > 0
+    assert {caller[2]: edge_stats[0] for caller, edge_stats in callers.items()} == {'_work': 1, '_fib': 176}
+    # Each resume of the generator is counted as a call, as in cProfile.
+    assert stats['_count'][1] == 4
+    assert stats['_fail'][1] == 1
+    assert 'dumps' in stats
+    assert stats['_work'][4] == {}
+
+
+@requires_monitoring
+def test_CallGraphMonitor_paths():
+    with monitoring.CallGraphMonitor(codes=[_work.__code__], paths=module_locations.module_paths(['json'])) as call_graph_monitor:
+        _work()
+    func_names = {func_name for _, _, func_name in call_graph_monitor.stats()}
+    assert '_work' in func_names and 'dumps' in func_names
+    assert '_fib' not in func_names
+    # Code disabled by the previous session is reported again by a new one.
+    with monitoring.CallGraphMonitor(codes=[_fib.__code__], paths=()) as call_graph_monitor:
+        _fib(n=3)
+    assert {func_name for _, _, func_name in call_graph_monitor.stats()} == {'_fib'}
+
+
+@requires_monitoring
+def test_MonitoringSession_restart_events(monkeypatch):
+    restarts = []
+    restart_events = monitoring.sys.monitoring.restart_events
+    monkeypatch.setattr(monitoring.sys.monitoring, 'restart_events', lambda: restarts.append(1) or restart_events())
+    monkeypatch.setattr(monitoring, '_tool_ids_with_disabled_events', set())
+    # Events disabled by other tools are restarted only if a previous session disabled code itself.
+    for _ in range(2):
+        with monitoring.CallGraphMonitor(codes=[_fib.__code__]):
+            _fib(n=3)
+    assert restarts == []
+    with monitoring.CallGraphMonitor(codes=[_work.__code__], paths=()):
+        _work()
+    with monitoring.CallGraphMonitor(codes=[_fib.__code__], paths=()) as call_graph_monitor:
+        _fib(n=3)
+    assert restarts == [1]
+    assert {func_name for _, _, func_name in call_graph_monitor.stats()} == {'_fib'}
+
+
+@requires_monitoring
+def test_CallGraphMonitor_threads():
+    with monitoring.CallGraphMonitor(codes=[_fib.__code__], paths=()) as call_graph_monitor:
+        threads = [threading.Thread(target=_fib, kwargs={'n': 8}) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    (primitive_calls, ncalls, _, _, _), = call_graph_monitor.stats().values()
+    assert (primitive_calls, ncalls) == (3, 3 * 67)
+
+
+@requires_monitoring
+def test_LineMonitor():
+    with monitoring.LineMonitor(codes=[_work.__code__, _count.__code__]) as line_monitor:
+        _work()
+        _work()
+    timings = {func_name: lines for (_, _, func_name), lines in line_monitor.timings().items()}
+    assert set(timings) == {'_work', '_count'}
+    work_lines = {lineno - _work.__code__.co_firstlineno: (hits, line_time) for lineno, hits, line_time in timings['_work']}
+    assert work_lines[1][0] == 2 and work_lines[1][1] > 0
+    assert work_lines[6][0] == 2
+    # The loop line is hit once per resume and once when the loop ends.
+    count_hits = {lineno - _count.__code__.co_firstlineno: hits for lineno, hits, _ in timings['_count']}
+    assert count_hits == {1: 8, 2: 6}
+
+
+@requires_monitoring
+def test_MonitoringSession_cProfile():
+    with monitoring.CallGraphMonitor(codes=[_fib.__code__], paths=()) as call_graph_monitor:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        _fib(n=3)
+        profiler.disable()
+    assert call_graph_monitor.tool_id is None
+    assert {func_name for _, _, func_name in call_graph_monitor.stats()} == {'_fib'}
+
+
+def test_MonitoringSession_abstract():
+    with pytest.raises(TypeError):
+        monitoring.MonitoringSession()
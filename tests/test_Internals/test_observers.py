@@ -1,9 +1,15 @@
 """Tests for observers module."""
 
 import os
+import threading
+import time
+
 import pytest
 
 from Internals import observers
+from python_profiling import python_profiling_enums
+from python_profiling.memory_profiling import memory_profiling_decorators
+from python_profiling.python_profiling_configs import StorageConfig
 
 
 def test_ProfilingObserver(
@@ -23,4 +29,96 @@ def test_ProfilingObserver(
         
     assert valid
     
-    
\ No newline at end of file
+    
+
+@pytest.mark.parametrize(
+    'full_queue_policy',
+    [
+        python_profiling_enums.QueueFullPolicy.DROP_OLDEST,
+        python_profiling_enums.QueueFullPolicy.DROP_NEWEST,
+        python_profiling_enums.QueueFullPolicy.BLOCK
+        ]
+    )
+def test_AsyncProfilingObserver(
+    full_queue_policy,
+    remove_dummy_file, 
+    dummy_TimeProfilerResult, 
+    common_storage
+    ):
+    observer = observers.AsyncProfilingObserver(storages=common_storage, 
+                                                full_queue_policy=full_queue_policy,
+                                                flush_interval=0.01)
+    for _ in range(10):
+        observer.dump(dummy_TimeProfilerResult)
+    observer.flush()
+    
+    valid = all(os.path.exists(file_path) for file_path in common_storage.file_paths)
+    for file_path in common_storage.file_paths:
+        remove_dummy_file(file_path)
+    observer.close()
+    
+    assert valid
+    assert observer.dropped_results == 0
+    
+    
+@pytest.mark.parametrize(
+    'full_queue_policy, dropped_results',
+    [
+        (python_profiling_enums.QueueFullPolicy.DROP_OLDEST, 3),
+        (python_profiling_enums.QueueFullPolicy.DROP_NEWEST, 3)
+        ]
+    )
+def test_AsyncProfilingObserver_full_queue(
+    full_queue_policy,
+    dropped_results,
+    dummy_TimeProfilerResult
+    ):
+    writing_allowed = threading.Event()
+    
+    class BlockedObserver(observers.AsyncProfilingObserver):
+        def _write_batch(self, batch):
+            writing_allowed.wait()
+    
+    observer = BlockedObserver(storages=StorageConfig(), 
+                               full_queue_policy=full_queue_policy,
+                               max_queue_size=2,
+                               batch_size=1)
+    observer.dump(dummy_TimeProfilerResult)
+    while not observer._queue.empty():
+        time.sleep(0.001)
+    for _ in range(5):
+        observer.dump(dummy_TimeProfilerResult)
+    writing_allowed.set()
+    observer.close()
+    assert observer.dropped_results == dropped_results
+
+
+def test_AsyncProfilingObserver_dump_while_closing(dummy_TimeProfilerResult):
+    written_results = []
+    
+    class CountingObserver(observers.AsyncProfilingObserver):
+        def _write_batch(self, batch):
+            written_results.extend(batch)
+    
+    observer = CountingObserver(storages=StorageConfig(), 
+                                full_queue_policy=python_profiling_enums.QueueFullPolicy.BLOCK,
+                                flush_interval=0.001)
+    
+    def dump_results():
+        for _ in range(200):
+            observer.dump(dummy_TimeProfilerResult)
+    
+    threads = [threading.Thread(target=dump_results) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    observer.close()
+    for thread in threads:
+        thread.join()
+    assert len(written_results) == 800
+    assert observer._queue.empty()
+
+
+def test_decorator_observer_instance():
+    observer = observers.ProfilingObserver(storages=StorageConfig())
+    decorator = memory_profiling_decorators.PeakMemoryProfilerDecorator(observer=observer)
+    assert decorator.observer is observer
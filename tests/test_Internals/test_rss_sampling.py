@@ -0,0 +1,55 @@
+import contextlib
+import time
+
+import pytest
+
+from Internals import rss_sampling
+
+
+def _allocate_phases():
+    rss_sampling.mark('allocate')
+    data = bytearray(50 * 1024 ** 2)
+    time.sleep(0.05)
+    rss_sampling.mark('release')
+    del data
+    time.sleep(0.05)
+
+
+@pytest.mark.parametrize(
+    'interval, capacity, raised_exception_ctx',
+    [
+        (0.001, 65536, contextlib.nullcontext()),
+        (0.0001, 65536, pytest.raises(ValueError)),
+        (0.001, 0, pytest.raises(ValueError))
+    ]
+)
+def test_RssSampler(interval, capacity, raised_exception_ctx):
+    with raised_exception_ctx:
+        with rss_sampling.RssSampler(interval=interval, capacity=capacity) as sampler:
+            _allocate_phases()
+        timeline = sampler.timeline()
+        assert len(timeline) > 20 and timeline.dropped == 0
+        assert list(timeline.times) == sorted(timeline.times)
+        assert timeline.marker_labels == ['allocate', 'release']
+        assert sampler.peak_rss - sampler.start_rss >= 40
+        assert timeline.phase_peaks()['allocate'] - sampler.start_rss >= 40
+        assert timeline.to_dict()['rss'] == list(timeline.rss)
+        assert 'markers=' in str(timeline)
+
+
+def test_RssSampler_ring_buffer():
+    sampler = rss_sampling.RssSampler(interval=0.001, capacity=8)
+    with sampler:
+        data = bytearray(50 * 1024 ** 2)
+        time.sleep(0.05)
+        del data
+        time.sleep(0.05)
+    timeline = sampler.timeline()
+    assert len(timeline) == 8 and timeline.dropped > 0
+    assert list(timeline.times) == sorted(timeline.times)
+    # Peak of overwritten samples is kept.
+    assert sampler.peak_rss - max(timeline.rss) >= 40
+
+
+def test_mark_without_sampler():
+    rss_sampling.mark('ignored')
@@ -0,0 +1,38 @@
+"""Tests for sample_statistics module."""
+
+import contextlib
+from array import array
+
+import numpy as np
+import pytest
+
+from Internals import sample_statistics
+
+
+@pytest.mark.parametrize(
+    'samples, expected_median, expected_mad, expected_outliers, raised_exception_ctx',
+    [
+        (array('d', [1.0, 2.0, 3.0, 4.0, 5.0]), 3.0, 1.0, 0, contextlib.nullcontext()),
+        ([1.0, 1.1, 0.9, 1.0, 1.05, 0.95, 10.0], 1.0, 0.05, 1, contextlib.nullcontext()),
+        ([2.0], 2.0, 0.0, 0, contextlib.nullcontext()),
+        ([], None, None, None, pytest.raises(ValueError))
+        ]
+    )
+def test_describe(samples, expected_median, expected_mad, expected_outliers, raised_exception_ctx):
+    with raised_exception_ctx:
+        statistics = sample_statistics.describe(samples, seed=0)
+        assert statistics.median == pytest.approx(expected_median)
+        assert statistics.mad == pytest.approx(expected_mad)
+        assert statistics.outliers == expected_outliers
+        assert statistics.std == pytest.approx(np.std(samples, ddof=1) if len(samples) > 1 else 0.0)
+        assert statistics.ci_low <= np.mean(samples) <= statistics.ci_high
+        assert sample_statistics.describe(samples, resamples=0).ci_low is None
+        
+        
+def test_bootstrap_mean_ci():
+    samples = np.random.default_rng(0).normal(loc=1.0, scale=0.1, size=200)
+    narrow_ci = sample_statistics.bootstrap_mean_ci(samples, confidence_level=0.5, seed=0)
+    wide_ci = sample_statistics.bootstrap_mean_ci(samples, confidence_level=0.99, seed=0)
+    assert wide_ci[0] < narrow_ci[0] < narrow_ci[1] < wide_ci[1]
+    assert wide_ci[1] - wide_ci[0] < 0.1
+    assert sample_statistics.bootstrap_mean_ci(samples, seed=1) == sample_statistics.bootstrap_mean_ci(samples, seed=1)
@@ -0,0 +1,108 @@
+"""Tests for samplers module."""
+
+import asyncio
+import contextlib
+
+import pytest
+
+from Internals import observers
+from Internals import samplers
+from python_profiling.python_profiling_configs import StorageConfig
+from python_profiling.time_profiling import time_profiling_decorators
+from python_profiling.time_profiling import time_profiling_results
+
+CALLS = 1000
+
+
+@pytest.mark.parametrize(
+    'n, expected_samples, expected_weight, raised_exception_ctx',
+    [
+        (1, CALLS, 1.0, contextlib.nullcontext()),
+        (10, CALLS // 10, 10.0, contextlib.nullcontext()),
+        (0, None, None, pytest.raises(ValueError))
+        ]
+    )
+def test_EveryNthSampler(n, expected_samples, expected_weight, raised_exception_ctx):
+    with raised_exception_ctx:
+        sampler = samplers.EveryNthSampler(n=n)
+        weights = [weight for weight in (sampler.sample() for _ in range(CALLS)) if weight is not None]
+        assert len(weights) == expected_samples
+        assert set(weights) == {expected_weight}
+
+
+@pytest.mark.parametrize(
+    'rate, raised_exception_ctx',
+    [
+        (1, contextlib.nullcontext()),
+        (0.5, contextlib.nullcontext()),
+        (0, pytest.raises(ValueError)),
+        (2, pytest.raises(ValueError))
+        ]
+    )
+def test_ProbabilisticSampler(rate, raised_exception_ctx):
+    with raised_exception_ctx:
+        sampler = samplers.ProbabilisticSampler(rate=rate)
+        weights = [weight for weight in (sampler.sample() for _ in range(CALLS)) if weight is not None]
+        assert 0 < len(weights) <= CALLS
+        assert set(weights) == {1 / rate}
+
+
+def test_TokenBucketSampler():
+    sampler = samplers.TokenBucketSampler(rate=1e-3, burst=2)
+    weights = [sampler.sample() for _ in range(CALLS)]
+    sampled_weights = [weight for weight in weights if weight is not None]
+    assert sampled_weights[:2] == [1.0, 1.0]
+    assert len(sampled_weights) <= 3
+
+
+class RecordingObserver(observers.ProfilingObserver):
+    """Keeps dumped results in memory instead of storing them."""
+    
+    def __init__(self, storages: StorageConfig = StorageConfig()):
+        super().__init__(storages=storages)
+        self.results = []
+        
+    def dump(self, result):
+        self.results.append(result)
+
+
+async def _async_add_one(x):
+    await asyncio.sleep(0)
+    return x + 1
+
+
+@pytest.mark.parametrize('aggregate', [False, True])
+def test_sampled_decorator(aggregate):
+    observer = RecordingObserver()
+    decorated_func = time_profiling_decorators.TimeProfilerDecorator(
+        sampler=samplers.EveryNthSampler(n=2),
+        observer=observer,
+        aggregate=aggregate
+        )(lambda x: x + 1)
+    sampled_result, skipped_result = decorated_func(x=1), decorated_func(x=1)
+    assert sampled_result == skipped_result == 2
+    if not aggregate:
+        assert len(observer.results) == 1
+        assert isinstance(observer.results[0], time_profiling_results.TimeProfilerResult)
+        assert observer.results[0].sampling_weight == 2.0
+
+
+def test_sampled_async_decorator():
+    observer = RecordingObserver()
+    decorated_func = time_profiling_decorators.TimeProfilerDecorator(
+        sampler=samplers.EveryNthSampler(n=2),
+        observer=observer
+        )(_async_add_one)
+    assert [asyncio.run(decorated_func(x=1)) for _ in range(2)] == [2, 2]
+    assert len(observer.results) == 1
+    assert observer.results[0].sampling_weight == 2.0
+
+
+def test_sampled_decorator_raised():
+    def raise_error():
+        raise ValueError('sampled')
+    
+    decorated_func = time_profiling_decorators.TimeProfilerDecorator(
+        sampler=samplers.EveryNthSampler(n=1), observer=RecordingObserver()
+        )(raise_error)
+    assert decorated_func() is None
@@ -0,0 +1,61 @@
+import contextlib
+import time
+
+import pytest
+
+from Internals import stack_sampling
+
+
+def _busy_leaf(duration):
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        pass
+    
+    
+def _busy_root(duration):
+    _busy_leaf(duration=duration)
+    
+    
+def test_StackTrie():
+    main, load, compute, kernel = (('main.py', 1, 'main', 3), ('main.py', 10, 'load', 11), 
+                                   ('main.py', 20, 'compute', 22), ('main.py', 30, 'kernel', 31))
+    trie = stack_sampling.StackTrie()
+    trie.add([main, load], count=2)
+    trie.add([main, compute, kernel], count=5)
+    trie.add([main, compute, kernel])
+    trie.add([main, compute])
+    trie.add([main, compute, ('main.py', 20, 'compute', 25)], count=2)
+    
+    assert trie.samples == 11
+    assert len(trie) == 5
+    assert trie.stacks()[(main, compute, kernel)] == 6
+    function_shares = {frame_key[2]: (inclusive, exclusive) for frame_key, inclusive, exclusive in trie.function_shares()}
+    assert function_shares['main'] == (1.0, 0.0)
+    assert function_shares['compute'] == pytest.approx((9 / 11, 3 / 11))
+    assert function_shares['kernel'] == pytest.approx((6 / 11, 6 / 11))
+    line_shares = {frame_key: (inclusive, exclusive) for frame_key, inclusive, exclusive in trie.line_shares()}
+    assert line_shares[('main.py', 20, 'compute', 25)] == pytest.approx((2 / 11, 2 / 11))
+    trie_arrays = trie.to_dict()
+    assert len(trie_arrays['frames']) == 5
+    assert sum(trie_arrays['counts']) == 11
+    assert len(trie_arrays['parents']) == len(trie_arrays['frame_indexes']) == len(trie_arrays['counts']) == 6
+    assert stack_sampling.StackTrie().function_shares() == []
+    
+    
+@pytest.mark.parametrize(
+    'interval, mode, expectation',
+    [
+        (0.002, 'thread', contextlib.nullcontext()),
+        (0.002, 'signal', contextlib.nullcontext()),
+        (0, 'thread', pytest.raises(ValueError)),
+        (0.002, 'invalid', pytest.raises(ValueError))
+    ]
+)
+def test_StackSampler(interval, mode, expectation):
+    with expectation:
+        with stack_sampling.StackSampler(interval=interval, mode=mode) as sampler:
+            _busy_root(duration=0.2)
+        assert sampler.trie.samples >= 10
+        leaf_frames = [stack[-1][2] for stack in sampler.trie.stacks()]
+        assert '_busy_leaf' in leaf_frames
+        assert all(frame[2] != '_sample_threads' for stack in sampler.trie.stacks() for frame in stack)
@@ -0,0 +1,79 @@
+import contextlib
+import threading
+import tracemalloc
+
+import pytest
+
+from Internals import tracemalloc_sessions
+
+
+@pytest.fixture
+def sessions():
+    if tracemalloc.is_tracing():
+        pytest.skip('tracemalloc is traced outside of the test')
+    yield tracemalloc_sessions.TracemallocSessions()
+    tracemalloc.stop()
+
+
+@pytest.mark.parametrize(
+    'nframes, raised_exception_ctx',
+    [
+        (1, contextlib.nullcontext()),
+        (5, contextlib.nullcontext()),
+        (0, pytest.raises(ValueError))
+    ]
+)
+def test_TracemallocSession(sessions, nframes, raised_exception_ctx):
+    with raised_exception_ctx:
+        with tracemalloc_sessions.TracemallocSession(nframes, sessions=sessions) as session:
+            assert tracemalloc.is_tracing()
+            assert session.nframes == nframes
+            data = bytearray(10 ** 6)
+        assert not tracemalloc.is_tracing()
+        assert session.peak_increase >= len(data)
+        assert sessions.active == []
+
+
+def test_TracemallocSession_nested(sessions, caplog):
+    with tracemalloc_sessions.TracemallocSession(3, sessions=sessions) as outer:
+        large = bytearray(2 * 10 ** 6)
+        del large
+        with tracemalloc_sessions.TracemallocSession(10, sessions=sessions) as inner:
+            small = bytearray(10 ** 6)
+        # Tracing is not restarted for a larger traceback limit, it would drop traces of the outer session.
+        assert inner.nframes == outer.nframes == 3
+        assert 'requested 10 frames' in caplog.text
+        assert tracemalloc.is_tracing()
+    assert not tracemalloc.is_tracing()
+    assert len(small) <= inner.peak_increase < 2 * 10 ** 6
+    assert outer.peak_increase >= 2 * 10 ** 6
+
+
+def test_TracemallocSession_keeps_outer_tracing(sessions):
+    tracemalloc.start(2)
+    with tracemalloc_sessions.TracemallocSession(1, sessions=sessions) as session:
+        pass
+    assert session.nframes == 2
+    assert tracemalloc.is_tracing()
+
+
+def test_TracemallocSession_threads(sessions):
+    peaks = {}
+    barrier = threading.Barrier(2)
+
+    def allocate(size):
+        with tracemalloc_sessions.TracemallocSession(sessions=sessions) as session:
+            barrier.wait()
+            data = bytearray(size)
+            barrier.wait()
+            del data
+        peaks[size] = session.peak_increase
+
+    threads = [threading.Thread(target=allocate, kwargs={'size': size}) for size in (10 ** 6, 2 * 10 ** 6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Sessions overlap, each one sees allocations of the whole process during its lifetime.
+    assert peaks[10 ** 6] >= 3 * 10 ** 6 and peaks[2 * 10 ** 6] >= 3 * 10 ** 6
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,154 @@
+import os
+import contextlib
+import time
+import xml.dom.minidom
+from array import array
+
+import pytest
+
+from python_profiling import python_profiling_enums
+from python_profiling.call_graph_profiling import call_graph_profiler
+from python_profiling.call_graph_profiling import flame_graph
+from python_profiling.time_profiling import call_graph_stats
+from python_profiling.time_profiling import call_graph_time_profiler
+from python_profiling.time_profiling import sampling_time_profiler
+
+
+def _fibonacci(n):
+    return n if n < 2 else _fibonacci(n=n - 1) + _fibonacci(n=n - 2)
+
+
+def _workload(n):
+    return _fibonacci(n=n) + sum(i * i for i in range(1000))
+
+
+def _term(tokens):
+    return tokens.pop()
+
+
+def _expr(tokens, depth):
+    return _term(tokens=tokens) + (_parse(tokens=tokens, depth=depth - 1) if depth else 0)
+
+
+def _parse(tokens, depth):
+    return _expr(tokens=tokens, depth=depth) + sum(i * i for i in range(1000))
+
+
+def _cyclic_stats(functions, fan_out, calls):
+    """Synthetic profile where function i calls the next fan_out functions (modulo functions), 
+    so every function but the entry one is called only from within the profile."""
+    stats = {'ncalls': [], 'edge_callers': [], 'edge_callees': [], 'edge_ncalls': [], 'edge_cumtimes': []}
+    for row in range(functions):
+        stats['ncalls'].append(calls * fan_out + (1 if row == 0 else 0))
+        for offset in range(1, fan_out + 1):
+            stats['edge_callers'].append(row)
+            stats['edge_callees'].append((row + offset) % functions)
+            stats['edge_ncalls'].append(calls)
+            stats['edge_cumtimes'].append(1.0 / fan_out)
+    return call_graph_stats.CallGraphStats(
+        filenames=['cyclic.py'] * functions,
+        linenos=array('q', range(functions)),
+        func_names=[f'f{row}' for row in range(functions)],
+        ncalls=array('q', stats['ncalls']),
+        primitive_calls=array('q', [1] + [calls * fan_out] * (functions - 1)),
+        tottimes=array('d', [0.01] * functions),
+        cumtimes=array('d', [1.0] * functions),
+        edge_callers=array('q', stats['edge_callers']),
+        edge_callees=array('q', stats['edge_callees']),
+        edge_ncalls=array('q', stats['edge_ncalls']),
+        edge_tottimes=array('d', [0.01 / fan_out] * len(stats['edge_callers'])),
+        edge_cumtimes=array('d', stats['edge_cumtimes'])
+        )
+
+
+def test_collapsed_stacks_from_stats():
+    stats = call_graph_time_profiler.CallGraphTimeProfiler().profile(func=_workload, n=15).func_profiling_stats
+    stacks = flame_graph.collapsed_stacks_from_stats(stats, min_fraction=0)
+    workload_stacks = {stack: weight for stack, weight in stacks.items() if stack.startswith('_workload')}
+    workload_row, = stats.find(func_name='_workload')
+    assert any(stack.split(';')[-1].startswith('_fibonacci') for stack in workload_stacks)
+    assert all(';_fibonacci' not in stack.split(';_fibonacci', 1)[1] for stack in workload_stacks if ';_fibonacci' in stack)
+    assert sum(workload_stacks.values()) == pytest.approx(stats.cumtimes[workload_row])
+    assert len(flame_graph.collapsed_stacks_from_stats(stats, min_fraction=0.5)) < len(stacks)
+    
+    
+def test_collapsed_stacks_from_stats_recursion():
+    # Profiled function is called again through recursion, so all of its calls but the first have callers.
+    stats = call_graph_time_profiler.CallGraphTimeProfiler().profile(func=_parse, tokens=list(range(10)), depth=3).func_profiling_stats
+    stacks = flame_graph.collapsed_stacks_from_stats(stats, min_fraction=0)
+    parse_row, = stats.find(func_name='_parse')
+    parse_stacks = {stack: weight for stack, weight in stacks.items() if stack.startswith('_parse')}
+    assert any(stack.split(';')[-1].startswith('_term') for stack in parse_stacks)
+    assert sum(parse_stacks.values()) == pytest.approx(stats.cumtimes[parse_row])
+    
+    
+def test_collapsed_stacks_from_stats_large_profile():
+    # Millions of calls of a thousand mutually recursive functions render in seconds thanks to pruning.
+    stats = _cyclic_stats(functions=1000, fan_out=8, calls=1000)
+    start = time.perf_counter()
+    stacks = flame_graph.collapsed_stacks_from_stats(stats)
+    svg = flame_graph.render_svg(stacks)
+    assert time.perf_counter() - start < 5
+    # Pruned callees are folded into their callers, so no time is lost.
+    assert 100 < len(stacks) < 1 / 0.001
+    assert sum(stacks.values()) == pytest.approx(1.0)
+    xml.dom.minidom.parseString(svg)
+    
+    
+@pytest.mark.parametrize(
+    'text, stacks, expectation',
+    [
+        ('a;b 10\na 5\n\na;b 1\n', {'a;b': 11.0, 'a': 5.0}, contextlib.nullcontext()),
+        ('a;b', None, pytest.raises(ValueError))
+    ]
+)
+def test_parse_collapsed(text, stacks, expectation):
+    with expectation:
+        assert flame_graph.parse_collapsed(text) == stacks
+        assert flame_graph.parse_collapsed(flame_graph.format_collapsed(stacks, scale=1)) == stacks
+        
+        
+def test_render_svg():
+    stacks = flame_graph.collapsed_stacks_from_samples({
+        ('main', 'load'): 2, 
+        ('main', 'compute', 'kernel'): 6, 
+        ('main',): 1,
+        ('main', 'compute', 'tiny'): 0.001
+        })
+    svg = flame_graph.render_svg(stacks, title='<test>', width=900)
+    document = xml.dom.minidom.parseString(svg)
+    frames = {frame.getAttribute('data-label'): float(frame.getAttribute('data-w')) for frame in document.getElementsByTagName('g')}
+    assert frames['all'] == pytest.approx(900)
+    assert frames['main'] == pytest.approx(900)
+    assert frames['kernel'] == pytest.approx(900 * 6 / 9.001, rel=1e-6)
+    assert frames['load'] + frames['compute'] < frames['main']
+    assert 'tiny' not in frames
+    
+    
+def _busy(duration):
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        pass
+    
+    
+def test_render_svg_sampled_stacks():
+    result = sampling_time_profiler.SamplingTimeProfiler(interval=0.002).profile(func=_busy, duration=0.1)
+    stacks = flame_graph.collapsed_stacks_from_samples(result.func_profiling_result.stacks())
+    assert sum(stacks.values()) == result.samples
+    assert any(stack.split(';')[-1] == flame_graph.frame_label(__file__, _busy.__code__.co_firstlineno, '_busy') for stack in stacks)
+    document = xml.dom.minidom.parseString(flame_graph.render_svg(stacks, unit='samples'))
+    assert any(frame.getAttribute('data-label').startswith('_busy') for frame in document.getElementsByTagName('g'))
+    
+    
+def test_FlameGraphVisualizer(tmp_path):
+    output_file = os.path.join(tmp_path, 'call_graph.prof')
+    profiler = call_graph_profiler.CallGraphProfiler(
+        output_file=output_file, 
+        visualizer_strategy=python_profiling_enums.CallGraphVisualizers.FLAME_GRAPH
+        )
+    result = profiler.profile(func=_workload, n=12)
+    assert result.func_result == _workload(n=12)
+    with open(os.path.join(tmp_path, 'call_graph.folded')) as f:
+        assert '_fibonacci' in f.read()
+    with open(os.path.join(tmp_path, 'call_graph.svg')) as f:
+        xml.dom.minidom.parseString(f.read())
@@ -1,3 +1,5 @@
+import time
+
 import pytest
 import contextlib
 import pydantic
@@ -21,6 +23,9 @@ from python_profiling.memory_profiling import line_memory_profiler
      (0.2, 1, 'psutil', True, lambda x: x + 1, {'x': 1}, 2, True,  None, contextlib.nullcontext()),
      (0.2, 1, 'invalid', True, lambda x: x + 1, {'x': 1}, 2, True,  None, pytest.raises(pydantic.ValidationError)),
      (0.2, 1, 'psutil', True, lambda x: 1 / x, {'x': 0}, None, False,  ZeroDivisionError, contextlib.nullcontext()),
+     (0.001, 1, 'native', True, lambda x: bytearray(x), {'x': 10 ** 7}, bytearray(10 ** 7), True,  None, contextlib.nullcontext()),
+     (0.0001, 1, 'native', True, lambda x: x + 1, {'x': 1}, 2, True,  None, pytest.raises(pydantic.ValidationError)),
+     (0.001, 1, 'native', True, lambda x: 1 / x, {'x': 0}, None, False,  ZeroDivisionError, contextlib.nullcontext()),
   ]
 )
 def test_LineMemoryProfiler(
@@ -52,4 +57,63 @@ def test_LineMemoryProfiler(
         assert bool(result.memory_timeline) == has_memory_stats
         assert func_exception == func_exception
         
-        
\ No newline at end of file
+        
+
+def _allocate_phases(size):
+    line_memory_profiler.mark_phase('allocate')
+    data = bytearray(size)
+    time.sleep(0.05)
+    line_memory_profiler.mark_phase('release')
+    del data
+    time.sleep(0.05)
+    return size
+
+
+def test_LineMemoryProfiler_native():
+    profiler = line_memory_profiler.LineMemoryProfiler(interval=0.001, backed='native')
+    result = profiler.profile(func=_allocate_phases, size=50 * 1024 ** 2)
+    assert result.func_result == 50 * 1024 ** 2
+    assert result.max_memory_increase >= 40
+    assert result.memory_timeline.marker_labels == ['allocate', 'release']
+    assert len(result.memory_timeline) > 20
+    assert result.profiling_data_structured['memory_timeline']['marker_labels'] == ['allocate', 'release']
+
+
+def _allocate_buffer(size):
+    return bytearray(size)
+
+
+def _allocate_buffers(size):
+    first = _allocate_buffer(size=size)
+    second = _allocate_buffer(size=size)
+    return len(first) + len(second)
+
+
+@pytest.mark.parametrize(
+    'backed, line_memory, max_depth, sample_every, traced_funcs, raised_exception_ctx',
+    [
+        ('native', 'rss', 0, 1, {'_allocate_buffers'}, contextlib.nullcontext()),
+        ('native', 'tracemalloc', 1, 1, {'_allocate_buffers', '_allocate_buffer'}, contextlib.nullcontext()),
+        ('psutil', 'tracemalloc', 1, 2, {'_allocate_buffers', '_allocate_buffer'}, contextlib.nullcontext()),
+        ('native', 'invalid', 0, 1, set(), pytest.raises(pydantic.ValidationError)),
+        ('native', 'rss', 0, 0, set(), pytest.raises(pydantic.ValidationError))
+    ]
+)
+def test_LineMemoryProfiler_line_memory(backed, line_memory, max_depth, sample_every, traced_funcs, raised_exception_ctx):
+    with raised_exception_ctx:
+        profiler = line_memory_profiler.LineMemoryProfiler(
+            interval=0.01,
+            backed=backed,
+            line_memory=line_memory,
+            max_depth=max_depth,
+            sample_every=sample_every
+            )
+        result = profiler.profile(func=_allocate_buffers, size=40 * 1024 ** 2)
+        assert result.func_result == 80 * 1024 ** 2
+        assert {function_memory.func_name for function_memory in result.line_memory} == traced_funcs
+        (buffers_memory,) = [function_memory for function_memory in result.line_memory if function_memory.func_name == '_allocate_buffers']
+        assert list(buffers_memory.hits) == [1, 1, 1]
+        assert buffers_memory.hot_lines(k=1)[0][3] == pytest.approx(40, abs=1)
+        assert buffers_memory.source_lines[0].strip() == 'first = _allocate_buffer(size=size)'
+        assert result.profiling_data_structured['line_memory'][0]['linenos'] == list(result.line_memory[0].linenos)
+        assert 'Increment' in str(result)
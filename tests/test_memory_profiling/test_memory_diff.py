@@ -0,0 +1,64 @@
+import contextlib
+import tracemalloc
+
+import pytest
+
+from python_profiling.memory_profiling import memory_diff
+
+
+def _inner():
+    return [bytearray(10 ** 4) for _ in range(10)]
+
+
+def _outer():
+    return _inner()
+
+
+@pytest.fixture
+def snapshots():
+    if tracemalloc.is_tracing():
+        pytest.skip('tracemalloc is traced outside of the test')
+    tracemalloc.start(5)
+    try:
+        snapshot_before = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(True, __file__)])
+        blocks = _outer()
+        snapshot_after = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(True, __file__)])
+    finally:
+        tracemalloc.stop()
+    yield snapshot_before, snapshot_after
+    del blocks
+
+
+@pytest.mark.parametrize(
+    'key_type, top_n, raised_exception_ctx',
+    [
+        ('lineno', 3, contextlib.nullcontext()),
+        ('traceback', None, contextlib.nullcontext()),
+        ('filename', 1, contextlib.nullcontext()),
+        ('invalid', 1, pytest.raises(ValueError))
+    ]
+)
+def test_MemoryDiff(snapshots, key_type, top_n, raised_exception_ctx):
+    snapshot_before, snapshot_after = snapshots
+    with raised_exception_ctx:
+        diff = memory_diff.MemoryDiff.from_snapshots(snapshot_before, snapshot_after, key_type=key_type, top_n=top_n)
+        stats = snapshot_after.compare_to(snapshot_before, key_type)[:top_n]
+        assert len(diff) == len(stats)
+        assert list(diff.size_diffs) == [stat.size_diff for stat in stats]
+        assert list(diff.count_diffs) == [stat.count_diff for stat in stats]
+        # Allocation site is the most recent frame, in _inner.
+        assert diff.row(0)['lineno'] == (0 if key_type == 'filename' else _inner.__code__.co_firstlineno + 1)
+        assert diff.size_diffs[0] >= 10 ** 5
+        assert diff.to_dict()['size_diffs'] == list(diff.size_diffs)
+        assert str(diff).splitlines()[0].endswith(str(stats[0]).split(': ', 1)[1].rsplit(', average', 1)[0])
+
+
+def test_TracebackStats(snapshots):
+    _, snapshot_after = snapshots
+    stats = memory_diff.TracebackStats.from_snapshot(snapshot_after, top_n=1)
+    assert len(stats) == 1 and stats.sizes[0] >= 10 ** 5
+    linenos = [lineno for _, lineno in stats.frames(0)]
+    assert _outer.__code__.co_firstlineno + 1 in linenos
+    assert linenos[-1] == _inner.__code__.co_firstlineno + 1
+    assert stats.to_dict()['frame_offsets'] == [0, len(linenos)]
+    assert str(stats).startswith('Memory block: ')
@@ -1,8 +1,13 @@
+import asyncio
+
 import  pytest
 import contextlib
+import json
+import os
 import tracemalloc
 import pydantic
 
+from python_profiling.memory_profiling import memory_diff
 from python_profiling.memory_profiling  import  peak_memory_profiler
 
 @pytest.mark.parametrize(
@@ -44,9 +49,88 @@ def test_PeakMemoryProfiler(
         assert result.func_result == func_result
         assert isinstance(result.current_memory, (float, int))
         assert isinstance(result.peak_memory, (float, int))
-        assert type(result.allocation_before) == tracemalloc.Snapshot
-        assert type(result.allocation_after) == tracemalloc.Snapshot
+        assert type(result.memory_diff) == memory_diff.MemoryDiff
+        assert type(result.traceback_stats) == memory_diff.TracebackStats
+        assert len(result.memory_diff) <= top_n and len(result.traceback_stats) <= top_n
+        assert result.snapshot_before_file is None and result.snapshot_after_file is None
+        assert result.nframes == nframes or tracemalloc.is_tracing()
         assert result.func_exception == func_exception
-        
-        
-    
\ No newline at end of file
+
+
+
+async def _async_allocate(size):
+    await asyncio.sleep(0)
+    return len(bytearray(size))
+
+
+def test_PeakMemoryProfiler_profile_async():
+    profiler = peak_memory_profiler.PeakMemoryProfiler(nframes=1, key_type='lineno', top_n=3)
+    result = asyncio.run(profiler.profile_async(func=_async_allocate, size=10 ** 6))
+    assert result.func_result == 10 ** 6
+    assert result.peak_memory >= 10 ** 6
+    assert result.func_exception is None
+
+
+def _allocate(size):
+    return len(bytearray(size))
+
+
+def test_PeakMemoryProfiler_peak_only():
+    profiler = peak_memory_profiler.PeakMemoryProfiler(peak_only=True)
+    result = profiler.profile(func=_allocate, size=10 ** 6)
+    assert result.func_result == 10 ** 6
+    assert result.memory_diff is None and result.traceback_stats is None
+    assert 10 ** 6 <= result.peak_increase < 2 * 10 ** 6
+    assert 'Peak increase' in str(result)
+
+
+def _allocate_lists(n):
+    return json.dumps([list(range(n)) for _ in range(10)])
+
+
+@pytest.mark.parametrize(
+    'trace_filters, raised_exception_ctx',
+    [
+        ([__file__], contextlib.nullcontext()),
+        (['*/test_peak_memory_profiler.py'], contextlib.nullcontext()),
+        (['tests.test_memory_profiling'], contextlib.nullcontext()),
+        (['not_existing_module'], pytest.raises(ValueError))
+    ]
+)
+def test_PeakMemoryProfiler_trace_filters(trace_filters, raised_exception_ctx):
+    with raised_exception_ctx:
+        profiler = peak_memory_profiler.PeakMemoryProfiler(trace_filters=trace_filters)
+        result = profiler.profile(func=_allocate_lists, n=1000)
+        assert set(result.memory_diff.filenames) == {__file__}
+        assert set(result.traceback_stats.frame_filenames) == {__file__}
+
+
+def test_PeakMemoryProfiler_peak_only_trace_filters():
+    with pytest.raises(pydantic.ValidationError):
+        peak_memory_profiler.PeakMemoryProfiler(peak_only=True, trace_filters=[__file__])
+
+
+def _profile_allocate(size):
+    inner = peak_memory_profiler.PeakMemoryProfiler(peak_only=True).profile(func=_allocate, size=size)
+    return inner.peak_increase
+
+
+def test_PeakMemoryProfiler_nested():
+    was_tracing = tracemalloc.is_tracing()
+    result = peak_memory_profiler.PeakMemoryProfiler(peak_only=True).profile(func=_profile_allocate, size=10 ** 6)
+    assert 10 ** 6 <= result.func_result <= result.peak_increase
+    assert tracemalloc.is_tracing() == was_tracing
+
+
+def test_PeakMemoryProfiler_dump_snapshots(capsys):
+    profiler = peak_memory_profiler.PeakMemoryProfiler(dump_snapshots=True, trace_filters=[__file__])
+    result = profiler.profile(func=_allocate_lists, n=1000)
+    try:
+        snapshot_before = tracemalloc.Snapshot.load(result.snapshot_before_file)
+        snapshot_after = tracemalloc.Snapshot.load(result.snapshot_after_file)
+        assert snapshot_after.compare_to(snapshot_before, 'lineno')[0].size_diff == result.memory_diff.size_diffs[0]
+        assert 'Top 5 memory differences' in str(result)
+        assert capsys.readouterr().out == ''
+    finally:
+        os.remove(result.snapshot_before_file)
+        os.remove(result.snapshot_after_file)
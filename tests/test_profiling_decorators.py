@@ -1,3 +1,4 @@
+import asyncio
 import os
 import time
 import pytest
@@ -190,4 +191,57 @@ def test_time_profiler_decorator(
         
         
         
-    
\ No newline at end of file
+    
+
+async def _async_add(x):
+    await asyncio.sleep(0)
+    return x + 1
+
+
+@pytest.mark.parametrize(
+    'decorator, decorator_kwargs, raised_exception_ctx, expected_result_class',
+    [
+        (
+            time_profiling_decorators.TimeProfilerDecorator,
+            {'time_profiler_strategy': python_profiling_enums.TimeProfilerStrategy.PRECISE},
+            contextlib.nullcontext(),
+            time_profiling_results.TimeProfilerResult
+        ),
+        (
+            time_profiling_decorators.TimeItProfilerDecorator,
+            {'number': 10, 'repeat': 2},
+            contextlib.nullcontext(),
+            time_profiling_results.TimeItProfilerResult
+        ),
+        (
+            time_profiling_decorators.CallGraphTimeProfilerDecorator,
+            {},
+            contextlib.nullcontext(),
+            time_profiling_results.CallGraphTimeProfilerResult
+        ),
+        (
+            memory_profiling_decorators.PeakMemoryProfilerDecorator,
+            {},
+            contextlib.nullcontext(),
+            memory_profiling_results.PeakMemoryProfilerResult
+        ),
+        (
+            time_profiling_decorators.TimeProfilerDecorator,
+            {'time_profiler_strategy': python_profiling_enums.TimeProfilerStrategy.THREAD_BASED},
+            pytest.raises(TypeError),
+            None
+        ),
+        (
+            time_profiling_decorators.LineTimeProfilerDecorator,
+            {},
+            pytest.raises(TypeError),
+            None
+        )
+    ]
+)
+def test_async_profiling_decorators(decorator, decorator_kwargs, raised_exception_ctx, expected_result_class):
+    with raised_exception_ctx:
+        decorated_func = decorator(**decorator_kwargs)(_async_add)
+        result = asyncio.run(decorated_func(x=1))
+        assert isinstance(result, expected_result_class)
+        assert result.func_result == 2
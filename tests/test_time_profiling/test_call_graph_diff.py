@@ -0,0 +1,128 @@
+import contextlib
+import os
+import pstats
+import xml.dom.minidom
+from array import array
+
+import pytest
+
+from Internals import exceptions
+from python_profiling.time_profiling import call_graph_diff
+from python_profiling.time_profiling import call_graph_differ
+from python_profiling.time_profiling import call_graph_stats
+from python_profiling.time_profiling import call_graph_time_profiler
+
+
+def _table(functions: dict[str, tuple[int, float, float]], edges: list[tuple[str, str]]) -> call_graph_stats.CallGraphStats:
+    """Builds table of functions defined in app.py, {name: (ncalls, tottime, cumtime)}."""
+    names = list(functions)
+    return call_graph_stats.CallGraphStats(
+        filenames=['app.py'] * len(names),
+        linenos=array('q', (10 * (row + 1) for row in range(len(names)))),
+        func_names=names,
+        ncalls=array('q', (ncalls for ncalls, _, _ in functions.values())),
+        primitive_calls=array('q', (ncalls for ncalls, _, _ in functions.values())),
+        tottimes=array('d', (tottime for _, tottime, _ in functions.values())),
+        cumtimes=array('d', (cumtime for _, _, cumtime in functions.values())),
+        edge_callers=array('q', (names.index(caller) for caller, _ in edges)),
+        edge_callees=array('q', (names.index(callee) for _, callee in edges)),
+        edge_ncalls=array('q', (functions[callee][0] for _, callee in edges)),
+        edge_tottimes=array('d', (functions[callee][1] for _, callee in edges)),
+        edge_cumtimes=array('d', (functions[callee][2] for _, callee in edges))
+        )
+
+
+BASELINE = _table({'main': (1, 1.0, 4.0), 'load': (2, 1.0, 1.0), 'parse': (4, 2.0, 2.0)}, [('main', 'load'), ('main', 'parse')])
+CANDIDATE = _table({'main': (1, 1.0, 8.0), 'load': (2, 6.0, 6.0), 'parse': (4, 1.0, 1.0), 'cache': (1, 0.0, 0.0)}, [('main', 'load'), ('main', 'parse')])
+
+
+def test_CallGraphDiff():
+    diff = call_graph_diff.CallGraphDiff.from_stats(BASELINE, CANDIDATE)
+    assert len(diff) == 4
+    assert diff.func_names == ['main', 'load', 'parse', 'cache']
+    assert list(diff.baseline_rows) == [0, 1, 2, -1]
+    assert diff.added() == [3]
+    assert diff.removed() == []
+    assert diff.deltas(metric='tottime', normalized=False) == [0.0, 5.0, -1.0, 0.0]
+    assert diff.deltas(metric='tottime') == pytest.approx([1 / 8 - 1 / 4, 6 / 8 - 1 / 4, 1 / 8 - 2 / 4, 0.0])
+    assert diff.deltas(metric='ncalls') == [0, 0, 0, 1]
+    assert diff.regressions() == [(1, pytest.approx(0.5))]
+    assert [row for row, _ in diff.improvements()] == [2, 0]
+    assert [row for row, _ in diff.improvements(top_n=1)] == [2]
+    assert diff.row(3)['status'] == 'added' and diff.row(3)['baseline_tottime'] == 0
+    assert diff.row(1)['candidate_tottime'] == 6.0
+    assert diff.to_dict()['candidate_rows'] == [0, 1, 2, 3]
+    with pytest.raises(ValueError):
+        diff.deltas(metric='func_name')
+
+
+def test_CallGraphDiff_render_flame_graph():
+    diff = call_graph_diff.CallGraphDiff.from_stats(BASELINE, CANDIDATE)
+    svg = diff.render_flame_graph(title='main: baseline vs candidate')
+    document = xml.dom.minidom.parseString(svg)
+    titles = {
+        title.firstChild.data.split(' (')[0]: title.firstChild.data
+        for title in document.getElementsByTagName('title')
+        }
+    assert '+50.00%' in titles['load'] and '-37.50%' in titles['parse']
+    fills = {
+        group.getAttribute('data-label').split(' (')[0]: group.getElementsByTagName('rect')[0].getAttribute('fill')
+        for group in document.getElementsByTagName('g')
+        }
+    assert fills['load'] == 'rgb(255,45,45)'
+    assert fills['parse'].endswith(',255)')
+
+
+def _nested_sum(n):
+    return sum(_square(x=i) for i in range(n))
+
+
+def _square(x):
+    return x * x
+
+
+def _nested_sum_cubes(n):
+    return sum(_cube(x=i) for i in range(n))
+
+
+def _cube(x):
+    return x * x * x
+
+
+@pytest.mark.parametrize(
+    'baseline_kind, raised_exception_ctx',
+    [
+        ('result', contextlib.nullcontext()),
+        ('prof_file', contextlib.nullcontext()),
+        ('pstats', contextlib.nullcontext()),
+        ('failed_result', pytest.raises(ValueError)),
+        ('invalid', pytest.raises(exceptions.InvalidInputTypeError))
+    ]
+)
+def test_CallGraphDiffer(baseline_kind, raised_exception_ctx):
+    profiler = call_graph_time_profiler.CallGraphTimeProfiler(save_stats=True)
+    baseline_result = profiler.profile(func=_nested_sum, n=100)
+    candidate = profiler.profile(func=_nested_sum_cubes, n=100)
+    baselines = {
+        'result': baseline_result,
+        'prof_file': baseline_result.stats_file,
+        'pstats': pstats.Stats(baseline_result.stats_file),
+        'failed_result': profiler.profile(func=lambda x: 1 / x, x=0),
+        'invalid': 1
+        }
+    try:
+        with raised_exception_ctx:
+            result = call_graph_differ.CallGraphDiffer(top_n=3).compare(baseline=baselines[baseline_kind], candidate=candidate)
+            added_funcs = {func['func_name'] for func in result.added_funcs}
+            removed_funcs = {func['func_name'] for func in result.removed_funcs}
+            assert {'_nested_sum_cubes', '_cube'} <= added_funcs
+            assert {'_nested_sum', '_square'} <= removed_funcs
+            assert len(result.regressions) <= 3 and len(result.improvements) <= 3
+            assert all(func['delta'] > 0 for func in result.regressions)
+            assert result.candidate_total_time == pytest.approx(candidate.func_profiling_stats.total_time)
+            assert '_cube' in str(result)
+            assert 'Profiler: CallGraphDiffer(metric=tottime, normalized=True, top_n=3)' in str(result)
+            assert result.render_flame_graph().startswith('<?xml')
+    finally:
+        for profiling_result in (baseline_result, candidate):
+            os.remove(profiling_result.stats_file)
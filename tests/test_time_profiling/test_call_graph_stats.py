@@ -0,0 +1,78 @@
+import os
+import json
+import contextlib
+
+import pytest
+
+from python_profiling import python_profiling_enums
+from python_profiling.time_profiling import call_graph_time_profiler
+from python_profiling.time_profiling import call_graph_stats
+
+
+def _fibonacci(n):
+    return n if n < 2 else _fibonacci(n=n - 1) + _fibonacci(n=n - 2)
+
+
+def _square(x):
+    return x * x
+
+
+def _workload(n):
+    return _fibonacci(n=n) + sum(_square(x=i) for i in range(n))
+
+
+@pytest.fixture
+def stats():
+    profiler = call_graph_time_profiler.CallGraphTimeProfiler(top_n=1)
+    return profiler.profile(func=_workload, n=10).func_profiling_stats
+
+
+def test_CallGraphStats(stats):
+    workload_row, = stats.find(func_name='_workload', filename=os.path.basename(__file__))
+    fibonacci_row, = stats.find(func_name='_fibonacci', filename=__file__)
+    square_row, = stats.find(func_name='_square')
+    assert stats.find(func_name='_workload', filename='missing.py') == []
+    
+    assert stats.row(fibonacci_row)['ncalls'] == 177
+    assert stats.row(fibonacci_row)['primitive_calls'] == 1
+    assert stats.row(square_row)['ncalls'] == 10
+    assert stats.cumtimes[workload_row] >= stats.cumtimes[fibonacci_row]
+    assert sorted(edge[:2] for edge in stats.callers(fibonacci_row)) == sorted([(workload_row, 1), (fibonacci_row, 176)])
+    assert fibonacci_row in [edge[0] for edge in stats.callees(workload_row)]
+    
+    
+@pytest.mark.parametrize(
+    'key, top_n, expectation',
+    [
+        ('cumtime', 3, contextlib.nullcontext()),
+        ('ncalls', None, contextlib.nullcontext()),
+        ('func_name', 2, contextlib.nullcontext()),
+        ('invalid', None, pytest.raises(ValueError))
+    ]
+)
+def test_CallGraphStats_sort(stats, key, top_n, expectation):
+    with expectation:
+        sorted_stats = stats.sort(key=key, top_n=top_n)
+        assert len(sorted_stats) == (top_n or len(stats))
+        column = [sorted_stats.row(row)[key] for row in range(len(sorted_stats))]
+        assert column == sorted(column, reverse=key != 'func_name')
+        
+        
+def test_CallGraphStats_filter(stats):
+    filtered_stats = stats.filter(filename=__file__, min_ncalls=2)
+    assert sorted(filtered_stats.func_names) == ['<genexpr>', '_fibonacci', '_square']
+    fibonacci_row, = filtered_stats.find(func_name='_fibonacci')
+    assert [edge[0] for edge in filtered_stats.callers(fibonacci_row)] == [fibonacci_row]
+    square_row, = filtered_stats.find(func_name='_square')
+    assert [filtered_stats.func_names[edge[0]] for edge in filtered_stats.callers(square_row)] == ['<genexpr>']
+    
+    
+def test_CallGraphStats_serialization(tmp_path):
+    profiler = call_graph_time_profiler.CallGraphTimeProfiler()
+    result = profiler.profile(func=_workload, n=5)
+    file_path = os.path.join(tmp_path, 'call_graph_stats.json')
+    result.dump(file_path=file_path, serializer_strategy=python_profiling_enums.SerializerStrategy.JSON)
+    with open(file_path) as f:
+        dumped_stats = json.load(f)['func_profiling_stats']
+    assert dumped_stats == result.func_profiling_stats.to_dict()
+    assert isinstance(call_graph_stats.CallGraphStats(**dumped_stats), call_graph_stats.CallGraphStats)
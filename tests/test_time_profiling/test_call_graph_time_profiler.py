@@ -1,8 +1,16 @@
+import asyncio
+import os
+import pstats
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import pydantic
 import contextlib
 
 from python_profiling.time_profiling import call_graph_time_profiler
+from Internals import context_managers
+from Internals import monitoring
 
 @pytest.mark.parametrize(
     '''
@@ -44,4 +52,125 @@ def test_CallGraphTimeProfiler(
         assert result.func_result == func_result
         assert type(result.func_profiling_result) == func_profiling_result_type or result.func_profiling_result == func_profiling_result_type
         assert result.func_exception == func_exception
-    
\ No newline at end of file
+
+    
+    
+async def _async_add(x):
+    await asyncio.sleep(0)
+    return x + 1
+
+
+def test_CallGraphTimeProfiler_profile_async():
+    profiler = call_graph_time_profiler.CallGraphTimeProfiler(sort_key='cumulative', func_filter='', top_n=10)
+    result = asyncio.run(profiler.profile_async(func=_async_add, x=1))
+    assert result.profiled_func == _async_add
+    assert result.func_result == 2
+    assert '_async_add' in result.func_profiling_result
+    assert result.func_exception is None
+
+
+def _nested_sum(n):
+    return sum(_square(x=i) for i in range(n))
+
+
+def _square(x):
+    return x * x
+
+
+def test_CallGraphTimeProfiler_parallel(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    profiler = call_graph_time_profiler.CallGraphTimeProfiler(top_n=5)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda n: profiler.profile(func=_nested_sum, n=n), range(100, 108)))
+    assert [result.func_result for result in results] == [_nested_sum(n=n) for n in range(100, 108)]
+    assert all('_square' in result.func_profiling_stats.func_names for result in results)
+    assert all(result.stats_file is None for result in results)
+    assert os.listdir(tmp_path) == []
+    
+    
+def test_CallGraphTimeProfiler_single_session(monkeypatch):
+    monkeypatch.setattr(context_managers, 'CPROFILE_SINGLE_SESSION', True)
+    profiler = call_graph_time_profiler.CallGraphTimeProfiler(save_stats=True)
+    nested_results = []
+    
+    def outer(n):
+        nested_results.append(profiler.profile(func=_nested_sum, n=n))
+        return n
+    
+    result = profiler.profile(func=outer, n=10)
+    nested_result, = nested_results
+    assert result.func_result == 10
+    assert 'outer' in result.func_profiling_stats.func_names
+    assert nested_result.func_result == _nested_sum(n=10)
+    assert nested_result.func_profiling_stats is None and nested_result.stats_file is None
+    os.remove(result.stats_file)
+    
+    async def gather_profiled():
+        return await asyncio.gather(*(profiler.profile_async(func=_async_add, x=x) for x in range(2)))
+    
+    results = asyncio.run(gather_profiled())
+    assert [result.func_result for result in results] == [1, 2]
+    assert sum(result.func_profiling_stats is not None for result in results) == 1
+    for result in results:
+        if result.stats_file is not None:
+            os.remove(result.stats_file)
+    
+    
+@pytest.mark.parametrize(
+    'func, func_kwargs, stats_saved',
+    [
+        (_nested_sum, {'n': 10}, True),
+        (lambda x: 1 / x, {'x': 0}, False)
+    ]
+)
+def test_CallGraphTimeProfiler_save_stats(func, func_kwargs, stats_saved):
+    profiler = call_graph_time_profiler.CallGraphTimeProfiler(save_stats=True)
+    result = profiler.profile(func=func, **func_kwargs)
+    assert (result.stats_file is not None) == stats_saved
+    if stats_saved:
+        try:
+            assert pstats.Stats(result.stats_file).total_calls > 0
+        finally:
+            os.remove(result.stats_file)
+            
+            
+@pytest.mark.parametrize(
+    'backend, modules, profiled_funcs',
+    [
+        ('cprofile', None, {'_nested_sum', '_square'}),
+        ('monitoring', None, {'_nested_sum', '_square'}),
+        ('monitoring', ['json'], {'_nested_sum'})
+    ]
+)
+def test_CallGraphTimeProfiler_backend(backend, modules, profiled_funcs):
+    expectation = (
+        pytest.raises(pydantic.ValidationError) if backend == 'monitoring' and not monitoring.MONITORING_AVAILABLE
+        else contextlib.nullcontext()
+        )
+    with expectation:
+        profiler = call_graph_time_profiler.CallGraphTimeProfiler(backend=backend, modules=modules, save_stats=True)
+        result = profiler.profile(func=_nested_sum, n=10)
+        assert result.func_result == 285
+        func_names = set(result.func_profiling_stats.func_names)
+        assert profiled_funcs <= func_names
+        assert ('_square' in func_names) == ('_square' in profiled_funcs)
+        assert '_nested_sum' in result.func_profiling_result
+        try:
+            assert pstats.Stats(result.stats_file).total_calls > 0
+        finally:
+            os.remove(result.stats_file)
+            
+            
+@pytest.mark.skipif(not monitoring.MONITORING_AVAILABLE, reason='sys.monitoring requires Python 3.12+')
+def test_CallGraphTimeProfiler_monitoring_tool_ids_in_use():
+    occupied_tool_ids = [tool_id for tool_id in (3, 4) if sys.monitoring.get_tool(tool_id) is None]
+    for tool_id in occupied_tool_ids:
+        sys.monitoring.use_tool_id(tool_id, 'test')
+    try:
+        result = call_graph_time_profiler.CallGraphTimeProfiler(backend='monitoring').profile(func=_nested_sum, n=10)
+    finally:
+        for tool_id in occupied_tool_ids:
+            sys.monitoring.free_tool_id(tool_id)
+    assert result.func_result == 285
+    assert result.func_profiling_stats is None
+    assert result.func_exception is None
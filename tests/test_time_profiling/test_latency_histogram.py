@@ -0,0 +1,74 @@
+import asyncio
+import contextlib
+
+import pytest
+
+from python_profiling.time_profiling import latency_histogram
+from python_profiling.time_profiling import time_profiling_decorators
+from python_profiling.time_profiling import time_profiling_results
+
+
+@pytest.mark.parametrize(
+    'significant_digits, values, raised_exception_ctx',
+    [
+        (2, [i / 1000 for i in range(1, 1001)], contextlib.nullcontext()),
+        (3, [1e-6] * 99 + [1.0], contextlib.nullcontext()),
+        (0, [], pytest.raises(ValueError))
+        ]
+    )
+def test_LatencyHistogram(significant_digits, values, raised_exception_ctx):
+    with raised_exception_ctx:
+        histogram = latency_histogram.LatencyHistogram(significant_digits=significant_digits)
+        for value in values:
+            histogram.record(value)
+        result = histogram.snapshot(profiled_func=test_LatencyHistogram, reset=True)
+        ordered_values = sorted(values)
+        relative_error = 10 ** -significant_digits
+        assert isinstance(result, time_profiling_results.LatencyHistogramResult)
+        assert result.count == len(values)
+        assert result.max_func_execution_time == max(values)
+        assert result.mean_func_execution_time == pytest.approx(sum(values) / len(values))
+        assert result.p50_func_execution_time == pytest.approx(ordered_values[len(values) // 2 - 1], rel=relative_error)
+        assert result.p99_func_execution_time == pytest.approx(ordered_values[int(len(values) * 0.99) - 1], rel=relative_error)
+        assert histogram.count == 0
+
+
+def test_aggregating_TimeProfilerDecorator():
+    decorator = time_profiling_decorators.TimeProfilerDecorator(aggregate=True)
+    decorated_func = decorator(lambda x: x + 1)
+    func_results = [decorated_func(x=1) for _ in range(100)]
+    results = decorator.snapshot()
+    assert func_results == [2] * 100
+    assert len(results) == 1
+    assert results[0].count == 100
+    assert decorator.snapshot() == []
+
+
+def test_aggregating_TimeProfilerDecorator_async():
+    async def async_add(x):
+        await asyncio.sleep(0)
+        return x + 1
+
+    async def run_calls(decorated_func):
+        return [await decorated_func(x=1) for _ in range(10)]
+
+    decorator = time_profiling_decorators.TimeProfilerDecorator(aggregate=True)
+    func_results = asyncio.run(run_calls(decorator(async_add)))
+    results = decorator.snapshot()
+    assert func_results == [2] * 10
+    assert results[0].count == 10
+
+
+def test_aggregating_TimeProfilerDecorator_failed_calls():
+    def fail_on_negative(x):
+        if x < 0:
+            raise ValueError('negative')
+        return x
+
+    decorator = time_profiling_decorators.TimeProfilerDecorator(aggregate=True)
+    decorated_func = decorator(fail_on_negative)
+    func_results = [decorated_func(x=x) for x in (1, -1, 2, -2, -3)]
+    results = decorator.snapshot()
+    assert func_results == [1, None, 2, None, None]
+    assert results[0].count == 2
+    assert results[0].failed_count == 3
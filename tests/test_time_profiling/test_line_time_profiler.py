@@ -1,6 +1,17 @@
+import contextlib
+import os
+import json
+import threading
+
 import pytest
 
+from python_profiling import python_profiling_enums
 from python_profiling.time_profiling import line_time_profiler
+from python_profiling.time_profiling import line_timings
+from python_profiling.time_profiling import time_profiling_decorators
+from Internals import context_managers
+from Internals import monitoring
+from Internals import samplers
 
 
 @pytest.mark.parametrize(
@@ -21,7 +32,172 @@ def test_LineTimeProfiler(
     assert result.profiled_func == profiled_func
     assert result.func_kwargs  ==  func_kwargs
     assert result.func_result == func_result
-    assert isinstance(result.func_profiling_result, str)
+    assert all(isinstance(function_timings, line_timings.LineTimings) for function_timings in result.func_profiling_result)
     assert  func_exception  ==  func_exception
 
-    
\ No newline at end of file
+
+def summing_loop(n):
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+def test_LineTimeProfiler_line_timings(tmp_path):
+    result = line_time_profiler.LineTimeProfiler.profile(func=summing_loop, n=100)
+    function_timings, = result.func_profiling_result
+    first_lineno = summing_loop.__code__.co_firstlineno
+    assert function_timings.func_name == 'summing_loop'
+    assert list(function_timings.linenos) == [first_lineno + offset for offset in range(1, 5)]
+    assert list(function_timings.hits) == [1, 101, 100, 1]
+    assert function_timings.source_lines[2].strip() == 'total += i * i'
+    assert function_timings.per_hit_times[2] == pytest.approx(function_timings.total_times[2] / 100)
+    hot_lines = result.hot_lines(k=2)
+    assert len(hot_lines) == 2
+    assert {line[1] for line in hot_lines} <= {first_lineno + 2, first_lineno + 3}
+    assert hot_lines[0][3] >= hot_lines[1][3]
+    
+    file_path = os.path.join(tmp_path, 'line_timings.json')
+    result.dump(file_path=file_path, serializer_strategy=python_profiling_enums.SerializerStrategy.JSON)
+    with open(file_path) as f:
+        dumped_timings, = json.load(f)['func_profiling_result']
+    assert dumped_timings['hits'] == [1, 101, 100, 1]
+    assert dumped_timings['total_times'] == list(function_timings.total_times)
+
+
+def squaring_loop(n):
+    for i in range(n):
+        i * i
+
+
+def test_AccumulatingLineTimeProfiler():
+    profiler = line_time_profiler.AccumulatingLineTimeProfiler()
+    summing_key = profiler.add_function(func=summing_loop)
+    squaring_key = profiler.add_function(func=squaring_loop)
+    summing_loop(n=10)
+    assert profiler.snapshot() == {}
+    
+    for _ in range(2):
+        with context_managers.AccumulatingLineTimeProfilerManager(profiler=profiler.line_profiler):
+            summing_loop(n=10)
+            squaring_loop(n=10)
+    with context_managers.AccumulatingLineTimeProfilerManager(profiler=profiler.line_profiler) as manager:
+        summing_loop(n=None)
+    assert manager.func_exception == TypeError
+    
+    assert list(profiler.snapshot(reset=True, keys=[summing_key])[summing_key].hits) == [3, 23, 20, 2]
+    functions_timings = profiler.snapshot()
+    assert set(functions_timings) == {squaring_key}
+    assert list(functions_timings[squaring_key].hits) == [22, 20]
+        
+        
+@pytest.mark.parametrize(
+    'threads, calls',
+    [
+        (1, 50),
+        (4, 50)
+    ]
+)
+def test_accumulating_LineTimeProfilerDecorator(threads, calls):
+    decorator = time_profiling_decorators.LineTimeProfilerDecorator(accumulate=True)
+    decorated_func = decorator(summing_loop)
+    func_results = []
+    workers = [
+        threading.Thread(target=lambda: func_results.extend(decorated_func(n=10) for _ in range(calls)))
+        for _ in range(threads)
+        ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert func_results == [285] * threads * calls
+    
+    result, = decorator.snapshot(reset=True)
+    function_timings, = result.func_profiling_result
+    assert result.profiled_func == summing_loop
+    assert list(function_timings.hits) == [threads * calls, threads * calls * 11, threads * calls * 10, threads * calls]
+    assert decorator.snapshot() == []
+    
+    decorated_func(n=10)
+    result, = decorator.snapshot(reset=False)
+    assert list(result.func_profiling_result[0].hits) == [1, 11, 10, 1]
+    assert list(decorator.snapshot()[0].func_profiling_result[0].hits) == [1, 11, 10, 1]
+
+
+def test_accumulating_LineTimeProfilerDecorator_sampled():
+    decorator = time_profiling_decorators.LineTimeProfilerDecorator(accumulate=True, sampler=samplers.EveryNthSampler(n=4))
+    decorated_func = decorator(summing_loop)
+    assert [decorated_func(n=10) for _ in range(8)] == [285] * 8
+    result, = decorator.snapshot(reset=True)
+    assert list(result.func_profiling_result[0].hits) == [2, 22, 20, 2]
+    assert result.sampled_calls == 2
+    assert result.sampling_weight == 4.0
+    assert time_profiling_decorators.LineTimeProfilerDecorator().line_time_profiler is None
+
+
+def summing_loops(n):
+    return summing_loop(n=n) + summing_loop(n=n)
+
+
+@pytest.mark.parametrize(
+    'max_depth, expectation',
+    [
+        (1, contextlib.nullcontext()),
+        (0, pytest.raises(ValueError))
+    ]
+)
+def test_CalleeLineTimeProfiler(max_depth, expectation):
+    with expectation:
+        profiler = line_time_profiler.CalleeLineTimeProfiler(max_depth=max_depth, package=__name__)
+        result = profiler.profile(func=summing_loops, n=10)
+        assert result.profiler == profiler
+        assert result.func_result == 570
+        functions_timings = {function_timings.func_name: function_timings for function_timings in result.func_profiling_result}
+        assert set(functions_timings) == {'summing_loops', 'summing_loop'}
+        assert list(functions_timings['summing_loop'].hits) == [2, 22, 20, 2]
+        
+        
+def test_accumulating_LineTimeProfilerDecorator_callees():
+    decorator = time_profiling_decorators.LineTimeProfilerDecorator(accumulate=True, callee_depth=1, callee_package=__name__)
+    decorated_func = decorator(summing_loops)
+    for _ in range(3):
+        decorated_func(n=10)
+    result, = decorator.snapshot()
+    assert [function_timings.func_name for function_timings in result.func_profiling_result] == ['summing_loops', 'summing_loop']
+    assert list(result.func_profiling_result[1].hits) == [6, 66, 60, 6]
+    
+    
+@pytest.mark.parametrize(
+    'max_depth, modules, functions_hits',
+    [
+        (0, None, {'summing_loops': [1]}),
+        (1, None, {'summing_loops': [1], 'summing_loop': [2, 22, 20, 2]}),
+        (0, [__name__], {'summing_loops': [1], 'summing_loop': [2, 22, 20, 2]})
+    ]
+)
+def test_MonitoringLineTimeProfiler(max_depth, modules, functions_hits):
+    expectation = contextlib.nullcontext() if monitoring.MONITORING_AVAILABLE else pytest.raises(RuntimeError)
+    with expectation:
+        profiler = line_time_profiler.MonitoringLineTimeProfiler(modules=modules, max_depth=max_depth, package=__name__)
+        result = profiler.profile(func=summing_loops, n=10)
+        assert result.profiler == profiler
+        assert result.func_result == 570
+        functions_timings = {function_timings.func_name: function_timings for function_timings in result.func_profiling_result}
+        assert {func_name: list(function_timings.hits) for func_name, function_timings in functions_timings.items()} == functions_hits
+        assert all(time > 0 for time in functions_timings['summing_loops'].total_times)
+        
+        
+@pytest.mark.parametrize(
+    'backend, accumulate, expectation',
+    [
+        ('line_profiler', True, contextlib.nullcontext()),
+        ('monitoring', True, pytest.raises(ValueError)),
+        ('invalid', False, pytest.raises(ValueError)),
+        ('monitoring', False, contextlib.nullcontext() if monitoring.MONITORING_AVAILABLE else pytest.raises(RuntimeError))
+    ]
+)
+def test_LineTimeProfilerDecorator_backend(backend, accumulate, expectation):
+    with expectation:
+        decorator = time_profiling_decorators.LineTimeProfilerDecorator(backend=backend, accumulate=accumulate)
+        result = decorator(summing_loop)(n=10)
+        assert (result if accumulate else result.func_result) == 285
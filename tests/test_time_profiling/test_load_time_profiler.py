@@ -0,0 +1,64 @@
+import time
+import contextlib
+
+import pydantic
+import pytest
+
+from python_profiling.time_profiling import load_time_profiler
+from python_profiling.time_profiling import time_profiling_decorators
+from python_profiling.time_profiling import time_profiling_results
+
+
+def sleeping_add(x):
+    time.sleep(0.01)
+    return x + 1
+
+
+def failing_div(x):
+    if x % 2:
+        return x
+    return 1 / 0
+
+
+@pytest.mark.parametrize(
+    'total_calls, concurrency, target_rate, func, func_kwargs, func_result, errors, raised_exception_ctx',
+    [
+        (20, 4, None, sleeping_add, {'x': 1}, 2, {}, contextlib.nullcontext()),
+        (10, 2, 200.0, sleeping_add, {'x': 1}, 2, {}, contextlib.nullcontext()),
+        (10, 2, None, failing_div, {'x': 0}, None, {'ZeroDivisionError': 10}, contextlib.nullcontext()),
+        (10, 0, None, sleeping_add, {'x': 1}, 2, {}, pytest.raises(pydantic.ValidationError)),
+        (10, 2, -1.0, sleeping_add, {'x': 1}, 2, {}, pytest.raises(pydantic.ValidationError))
+        ]
+    )
+def test_LoadTimeProfiler(total_calls, concurrency, target_rate, func, func_kwargs, func_result, errors, raised_exception_ctx):
+    with raised_exception_ctx:
+        profiler = load_time_profiler.LoadTimeProfiler(total_calls=total_calls,
+                                                       concurrency=concurrency,
+                                                       target_rate=target_rate)
+        result = profiler.profile(func=func, **func_kwargs)
+        assert isinstance(result, time_profiling_results.LoadTimeProfilerResult)
+        assert result.profiled_func == func
+        assert result.func_result == func_result
+        assert result.errors == errors
+        assert result.p50_func_execution_time <= result.p99_func_execution_time <= result.max_func_execution_time
+        assert 0 <= result.mean_queueing_delay <= result.max_queueing_delay
+        if not errors:
+            assert result.throughput > 0
+            assert result.func_exception is None
+        else:
+            assert result.throughput == 0
+            assert result.func_exception == ZeroDivisionError
+            
+            
+def test_LoadTimeProfiler_scales_with_threads():
+    single_thread_result = load_time_profiler.LoadTimeProfiler(total_calls=8, concurrency=1).profile(func=sleeping_add, x=1)
+    multi_thread_result = load_time_profiler.LoadTimeProfiler(total_calls=8, concurrency=8).profile(func=sleeping_add, x=1)
+    assert multi_thread_result.throughput > 2 * single_thread_result.throughput
+    assert single_thread_result.max_queueing_delay > multi_thread_result.max_queueing_delay
+    
+
+def test_LoadTimeProfilerDecorator():
+    decorated_func = time_profiling_decorators.LoadTimeProfilerDecorator(total_calls=5, concurrency=5)(sleeping_add)
+    result = decorated_func(x=1)
+    assert isinstance(result, time_profiling_results.LoadTimeProfilerResult)
+    assert result.total_calls == 5
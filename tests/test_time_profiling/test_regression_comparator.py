@@ -0,0 +1,60 @@
+import contextlib
+from array import array
+
+import numpy as np
+import pydantic
+import pytest
+
+from Internals import exceptions
+from python_profiling import python_profiling_enums
+from python_profiling.time_profiling import regression_comparator
+from python_profiling.time_profiling import time_profiler
+from python_profiling.time_profiling import timeit_profiler
+from python_profiling.time_profiling import time_profiling_results
+
+RNG = np.random.default_rng(0)
+BASELINE = list(RNG.normal(loc=1.0, scale=0.02, size=50))
+
+
+@pytest.mark.parametrize(
+    'candidate, expected_verdict, expected_exit_code, raised_exception_ctx',
+    [
+        (list(RNG.normal(loc=1.2, scale=0.02, size=50)), python_profiling_enums.RegressionVerdict.REGRESSED, 1, contextlib.nullcontext()),
+        (array('d', RNG.normal(loc=0.8, scale=0.02, size=50)), python_profiling_enums.RegressionVerdict.IMPROVED, 0, contextlib.nullcontext()),
+        (list(RNG.normal(loc=1.0, scale=0.02, size=50)), python_profiling_enums.RegressionVerdict.UNCHANGED, 0, contextlib.nullcontext()),
+        (list(RNG.normal(loc=1.01, scale=0.001, size=50)), python_profiling_enums.RegressionVerdict.UNCHANGED, 0, contextlib.nullcontext()),
+        ([], None, None, pytest.raises(ValueError)),
+        (['slow'], None, None, pytest.raises(exceptions.InvalidInputTypeError)),
+        (1.0, None, None, pytest.raises(exceptions.InvalidInputTypeError))
+        ]
+    )
+def test_RegressionComparator(candidate, expected_verdict, expected_exit_code, raised_exception_ctx):
+    with raised_exception_ctx:
+        comparator = regression_comparator.RegressionComparator(seed=0)
+        result = comparator.compare(baseline=BASELINE, candidate=candidate)
+        assert isinstance(result, time_profiling_results.RegressionComparisonResult)
+        assert result.verdict == expected_verdict
+        assert result.exit_code == expected_exit_code
+        assert result.ci_low <= result.relative_change <= result.ci_high
+        assert 0 <= result.p_value <= 1
+        
+        
+def test_RegressionComparator_invalid_thresholds():
+    with pytest.raises(pydantic.ValidationError):
+        regression_comparator.RegressionComparator(alpha=1.5)
+        
+        
+def test_RegressionComparator_profiling_results():
+    profiler = time_profiler.TimeProfiler()
+    baseline = [profiler.profile(func=lambda n: sum(range(n)), n=10) for _ in range(20)]
+    candidate = [profiler.profile(func=lambda n: sum(range(n)), n=10) for _ in range(20)]
+    result = regression_comparator.RegressionComparator().compare(baseline=baseline, candidate=candidate)
+    assert result.baseline_size == result.candidate_size == 20
+    
+    
+def test_RegressionComparator_timeit_results():
+    baseline = timeit_profiler.TimeItProfiler(number=1000, repeat=15).profile(func=lambda n: sum(range(n)), n=10)
+    candidate = timeit_profiler.TimeItProfiler(number=10, repeat=15).profile(func=lambda n: sum(range(n)), n=1000)
+    result = regression_comparator.RegressionComparator().compare(baseline=baseline, candidate=candidate)
+    assert result.verdict == python_profiling_enums.RegressionVerdict.REGRESSED
+    assert result.relative_change > 10
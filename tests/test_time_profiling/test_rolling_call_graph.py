@@ -0,0 +1,133 @@
+import asyncio
+import time
+import contextlib
+
+import pytest
+
+from Internals import context_managers
+from Internals import monitoring
+from Internals import samplers
+from python_profiling.time_profiling import rolling_call_graph
+from python_profiling.time_profiling import time_profiling_decorators
+
+
+def _square(x):
+    return x * x
+
+
+def _workload(n):
+    return sum(_square(x=i) for i in range(n))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        
+    def __call__(self):
+        return self.now
+    
+    
+def _profile(n):
+    with context_managers.CallGraphTimeProfilerManager() as call_graph_profiling_manager:
+        _workload(n=n)
+    return call_graph_profiling_manager.profiler
+
+
+@pytest.mark.parametrize(
+    'window, expectation',
+    [
+        (10, contextlib.nullcontext()),
+        (0, pytest.raises(ValueError))
+    ]
+)
+def test_RollingCallGraphAggregator(window, expectation):
+    with expectation:
+        clock = FakeClock()
+        aggregator = rolling_call_graph.RollingCallGraphAggregator(window=window, clock=clock)
+        assert aggregator.snapshot() is None
+        assert [aggregator.add(_profile(n=10)) for _ in range(3)] == [None] * 3
+        
+        clock.now = 5
+        current_window = aggregator.snapshot()
+        assert (current_window.calls, current_window.weight, current_window.window_end) == (3, 3, 5)
+        square_calls = next(stats[1] for func, stats in current_window.stats.items() if func[2] == '_square')
+        assert square_calls == 30
+        
+        clock.now = 12
+        closed_window = aggregator.add(_profile(n=1), weight=4)
+        assert (closed_window.window_start, closed_window.window_end, closed_window.calls) == (0, 12, 3)
+        assert closed_window.to_pstats().total_calls == current_window.to_pstats().total_calls
+        assert aggregator.calls == 1
+        assert aggregator.snapshot().weight == 4
+        assert aggregator.snapshot(reset=True).calls == 1
+        assert aggregator.snapshot() is None
+        
+        
+@pytest.mark.parametrize(
+    'backend',
+    [
+        'cprofile',
+        pytest.param('monitoring', marks=pytest.mark.skipif(not monitoring.MONITORING_AVAILABLE, reason='requires Python 3.12+'))
+    ]
+)
+def test_aggregating_CallGraphTimeProfilerDecorator(backend):
+    decorator = time_profiling_decorators.CallGraphTimeProfilerDecorator(aggregate=True, window=0.05, backend=backend)
+    decorated_func = decorator(_workload)
+    assert [decorated_func(n=10) for _ in range(5)] == [285] * 5
+    result, = decorator.snapshot(reset=False)
+    square_row, = result.func_profiling_stats.find(func_name='_square')
+    assert result.calls == 5
+    assert result.func_profiling_stats.ncalls[square_row] == 50
+    assert '_workload' in result.func_profiling_result
+    
+    time.sleep(0.06)
+    decorated_func(n=10)
+    result, = decorator.snapshot()
+    assert result.calls == 1
+    assert decorator.snapshot() == []
+    
+    
+def test_aggregating_CallGraphTimeProfilerDecorator_sampled():
+    decorator = time_profiling_decorators.CallGraphTimeProfilerDecorator(aggregate=True, sampler=samplers.EveryNthSampler(n=2))
+    decorated_func = decorator(_workload)
+    assert [decorated_func(n=10) for _ in range(6)] == [285] * 6
+    result, = decorator.snapshot()
+    # Merged calls stand for all calls, counts scaled by weight / calls estimate counts of all calls.
+    assert (result.calls, result.weight) == (3, 6)
+    square_row, = result.func_profiling_stats.find(func_name='_square')
+    assert result.func_profiling_stats.ncalls[square_row] * result.weight / result.calls == 60
+    
+    
+def test_aggregating_CallGraphTimeProfilerDecorator_async():
+    async def async_workload(n):
+        await asyncio.sleep(0)
+        return _workload(n=n)
+    
+    async def run_calls(decorated_func):
+        return [await decorated_func(n=10) for _ in range(3)]
+    
+    decorator = time_profiling_decorators.CallGraphTimeProfilerDecorator(aggregate=True)
+    assert asyncio.run(run_calls(decorator(async_workload))) == [285] * 3
+    result, = decorator.snapshot()
+    assert result.calls == 3
+
+
+def test_aggregating_CallGraphTimeProfilerDecorator_concurrent(monkeypatch):
+    monkeypatch.setattr(context_managers, 'CPROFILE_SINGLE_SESSION', True)
+    
+    async def async_workload(n):
+        await asyncio.sleep(0)
+        return _workload(n=n)
+    
+    async def gather_calls(decorated_func):
+        return await asyncio.gather(*(decorated_func(n=10) for _ in range(3)))
+    
+    decorator = time_profiling_decorators.CallGraphTimeProfilerDecorator(aggregate=True)
+    assert asyncio.run(gather_calls(decorator(async_workload))) == [285] * 3
+    result, = decorator.snapshot()
+    assert result.calls == 1
+    
+    decorated_func = decorator(_workload)
+    nested_func = decorator(lambda n: decorated_func(n=n))
+    assert nested_func(n=10) == 285
+    assert sum(result.calls for result in decorator.snapshot()) == 1
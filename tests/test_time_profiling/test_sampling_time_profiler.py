@@ -0,0 +1,70 @@
+import time
+import threading
+import contextlib
+
+import pytest
+import pydantic
+
+from python_profiling import python_profiling_enums
+from python_profiling import python_profiling_configs
+from python_profiling.time_profiling import sampling_time_profiler
+
+
+def _busy_leaf(duration):
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        pass
+    
+    
+def _busy_root(duration):
+    _busy_leaf(duration=duration / 2)
+    deadline = time.perf_counter() + duration / 2
+    while time.perf_counter() < deadline:
+        pass
+    return duration
+    
+
+@pytest.mark.parametrize(
+    'mode, func, func_kwargs, func_result, func_exception, expectation',
+    [
+        ('thread', _busy_root, {'duration': 0.3}, 0.3, None, contextlib.nullcontext()),
+        ('signal', _busy_root, {'duration': 0.3}, 0.3, None, contextlib.nullcontext()),
+        ('thread', lambda x: 1 / x, {'x': 0}, None, ZeroDivisionError, contextlib.nullcontext()),
+        ('invalid', _busy_root, {'duration': 0.3}, None, None, pytest.raises(pydantic.ValidationError))
+    ]
+)
+def test_SamplingTimeProfiler(mode, func, func_kwargs, func_result, func_exception, expectation):
+    with expectation:
+        profiler = sampling_time_profiler.SamplingTimeProfiler(interval=0.002, mode=mode)
+        result = profiler.profile(func=func, **func_kwargs)
+        assert result.profiler == profiler
+        assert result.func_result == func_result
+        assert result.func_exception == func_exception
+        if func_exception is None:
+            function_shares = {frame_key[2]: (inclusive, exclusive) for frame_key, inclusive, exclusive in result.function_shares}
+            assert result.samples >= 20
+            assert function_shares['_busy_root'][0] == pytest.approx(1.0, abs=0.1)
+            assert function_shares['_busy_leaf'][0] == pytest.approx(0.5, abs=0.25)
+            assert function_shares['_busy_root'][1] == pytest.approx(0.5, abs=0.25)
+            assert result.line_shares[0][1] == pytest.approx(1.0, abs=0.1)
+            assert result.sampling_overhead < 0.1
+            
+            
+def test_SamplingTimeProfiler_threads():
+    def background():
+        _busy_leaf(duration=0.2)
+        
+    worker = threading.Thread(target=background)
+    worker.start()
+    result = sampling_time_profiler.SamplingTimeProfiler(interval=0.002, all_threads=True).profile(func=_busy_root, duration=0.2)
+    worker.join()
+    assert any(frame_key[2] == 'background' for frame_key, _, _ in result.function_shares)
+    
+    
+def test_SamplingTimeProfiler_strategy():
+    config = python_profiling_configs.ComposedProfilingConfig(
+        time_profiling_strategy=python_profiling_enums.TimeProfilingStrategy.SAMPLING_TIME_PROFILER,
+        memory_profiling_strategy=python_profiling_enums.MemoryProfilingStrategy.PEAK_MEMORY_PROFILER,
+        call_graph_profiling_strategy=python_profiling_enums.CallGraphProfilingStrategy.CALL_GRAPH_PROFILER
+        )
+    assert isinstance(config.time_profiler, sampling_time_profiler.SamplingTimeProfiler)
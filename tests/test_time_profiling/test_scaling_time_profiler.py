@@ -0,0 +1,55 @@
+import os
+import contextlib
+
+import pydantic
+import pytest
+
+from python_profiling.time_profiling import scaling_time_profiler
+from python_profiling.time_profiling import time_profiling_results
+from python_profiling import python_profiling_enums
+
+
+def cpu_bound_sum(n):
+    return sum(i * i for i in range(n))
+
+
+def failing_div(x):
+    return 1 / x
+
+
+@pytest.mark.parametrize(
+    'tasks, worker_counts, func, func_kwargs, func_result, func_exception, raised_exception_ctx',
+    [
+        (4, [1, 2], cpu_bound_sum, {'n': 1000}, cpu_bound_sum(1000), None, contextlib.nullcontext()),
+        (2, [2, 1, 2], cpu_bound_sum, {'n': 10}, cpu_bound_sum(10), None, contextlib.nullcontext()),
+        (2, [2], cpu_bound_sum, {'n': 10}, cpu_bound_sum(10), None, contextlib.nullcontext()),
+        (2, [1], failing_div, {'x': 0}, None, ZeroDivisionError, contextlib.nullcontext()),
+        (2, [0], cpu_bound_sum, {'n': 10}, None, None, pytest.raises(pydantic.ValidationError)),
+        (0, [1], cpu_bound_sum, {'n': 10}, None, None, pytest.raises(pydantic.ValidationError))
+        ]
+    )
+def test_ScalingTimeProfiler(tasks, worker_counts, func, func_kwargs, func_result, func_exception, raised_exception_ctx):
+    with raised_exception_ctx:
+        profiler = scaling_time_profiler.ScalingTimeProfiler(tasks=tasks, worker_counts=worker_counts)
+        result = profiler.profile(func=func, **func_kwargs)
+        assert isinstance(result, time_profiling_results.ScalingTimeProfilerResult)
+        assert result.worker_counts == sorted(set(worker_counts) | {1})
+        assert result.func_result == func_result
+        assert result.func_exception == func_exception
+        assert len(result.throughputs) == len(result.speedups) == len(result.efficiencies) == len(result.worker_counts)
+        if func_exception is None:
+            assert result.speedups[0] == pytest.approx(1.0)
+            assert result.efficiencies[-1] == pytest.approx(result.speedups[-1] / result.worker_counts[-1])
+
+
+def test_ScalingTimeProfiler_unpicklable_func():
+    result = scaling_time_profiler.ScalingTimeProfiler(tasks=1, worker_counts=[1]).profile(func=lambda x: x, x=1)
+    assert result.func_exception is not None
+    assert result.throughputs == []
+    
+    
+def test_ScalingTimeProfiler_dump(tmp_path):
+    file_path = os.path.join(tmp_path, 'scaling.json')
+    result = scaling_time_profiler.ScalingTimeProfiler(tasks=2, worker_counts=[1]).profile(func=cpu_bound_sum, n=10)
+    result.dump(file_path=file_path, serializer_strategy=python_profiling_enums.SerializerStrategy.JSON)
+    assert os.path.getsize(file_path) > 0
@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 import pytest
@@ -52,3 +53,31 @@ def test_ThreadBasedTimeProfiler(
     assert result.func_result == func_result
     assert type(result.func_execution_time) == float
     assert result.func_exception == func_exception
+
+    
+async def _sleeping_add(x):
+    await asyncio.sleep(0.05)
+    return x + 2
+
+
+async def _sleeping_div(x):
+    await asyncio.sleep(0)
+    return 1 / x
+
+
+@pytest.mark.parametrize(
+    'func, kwargs, func_result, func_exception',
+    [
+        (_sleeping_add, {'x': 1}, 3, None),
+        (_sleeping_div, {'x': 0}, None, ZeroDivisionError)
+        ]
+    )
+def test_TimeProfiler_profile_async(func, kwargs, func_result, func_exception):
+    profiler = time_profiler.TimeProfiler(profiling_timer=time.perf_counter)
+    result = asyncio.run(profiler.profile_async(func=func, **kwargs))
+    assert result.profiled_func == func
+    assert result.func_result == func_result
+    assert result.func_exception == func_exception
+    if func_exception is None:
+        assert result.func_execution_time >= 0.05
+        assert result.func_running_time < result.func_execution_time / 2
@@ -1,5 +1,7 @@
+import asyncio
 import time
 import contextlib
+from array import array
 
 import pydantic
 import pytest
@@ -40,4 +42,90 @@ def test_TimeItProfiler(
         assert isinstance(result.avg_func_execution_time, (int, float))
         assert isinstance(result.max_func_execution_time, (int, float)) 
         assert result.func_exception == func_exception
-        
\ No newline at end of file
+
+        
+        
+async def _async_add(x):
+    await asyncio.sleep(0)
+    return x + 1
+
+
+@pytest.mark.parametrize(
+    'func, func_result, kwargs, func_exception',
+    [
+        (_async_add, 2, {'x': 1}, None),
+        (lambda x: 1/x, None, {'x': 0}, ZeroDivisionError)
+        ]
+    )
+def test_TimeItProfiler_profile_async(func, func_result, kwargs, func_exception):
+    profiler = timeit_profiler.TimeItProfiler(timer=time.perf_counter, number=10, repeat=3)
+    result = asyncio.run(profiler.profile_async(func=func, **kwargs))
+    assert result.func_result == func_result
+    assert result.func_exception == func_exception
+    if func_exception is None:
+        assert 0 < result.avg_func_running_time <= result.avg_func_execution_time
+
+
+@pytest.mark.parametrize(
+    'func, kwargs, target_relative_error, time_budget, min_repeat, raised_exception',
+    [
+        (lambda x: x + 1, {'x': 1}, 0.05, 1.0, 3, contextlib.nullcontext()),
+        (lambda x: time.sleep(x), {'x': 0.01}, 0.05, 0.5, 3, contextlib.nullcontext()),
+        (lambda x: x + 1, {'x': 1}, 0, 1.0, 3, pytest.raises(pydantic.ValidationError)),
+        (lambda x: x + 1, {'x': 1}, 0.05, 1.0, 1, pytest.raises(pydantic.ValidationError))
+        ]
+    )
+def test_adaptive_TimeItProfiler(func, kwargs, target_relative_error, time_budget, min_repeat, raised_exception):
+    with raised_exception:
+        profiler = timeit_profiler.TimeItProfiler(adaptive=True,
+                                                  target_relative_error=target_relative_error,
+                                                  time_budget=time_budget,
+                                                  min_repeat=min_repeat)
+        profiling_start = time.monotonic()
+        result = profiler.profile(func=func, **kwargs)
+        profiling_time = time.monotonic() - profiling_start
+        assert profiling_time < time_budget + 1
+        assert result.func_result == func(**kwargs)
+        assert result.repeats >= min_repeat
+        assert result.number >= 1
+        assert result.relative_error <= target_relative_error or profiling_time >= time_budget
+        
+        
+def test_TimeItProfiler_calls_count():
+    calls = []
+    result = timeit_profiler.TimeItProfiler(number=3, repeat=2).profile(func=lambda: calls.append(1) or len(calls))
+    # Result is captured by a call before timed repeats, so timed calls do not store it.
+    assert len(calls) == 7
+    assert result.func_result == 1
+    
+    
+def test_TimeItProfiler_samples():
+    result = timeit_profiler.TimeItProfiler(number=100, repeat=10).profile(func=lambda x: x + 1, x=1)
+    assert isinstance(result.samples, array)
+    assert len(result.samples) == 10
+    assert result.min_func_execution_time <= result.median_func_execution_time <= result.max_func_execution_time
+    assert result.ci_low_func_execution_time is None
+    assert 0 <= result.outliers <= 10
+    ci_result = timeit_profiler.TimeItProfiler(number=100, repeat=10, confidence_interval=True).profile(func=lambda x: x + 1, x=1)
+    assert ci_result.ci_low_func_execution_time <= ci_result.ci_high_func_execution_time
+    assert 'CI' in str(ci_result) and 'CI' not in str(result)
+    failed_result = timeit_profiler.TimeItProfiler(number=1, repeat=2).profile(func=lambda x: 1 / x, x=0)
+    assert failed_result.samples is None
+    assert failed_result.median_func_execution_time is None
+
+
+@pytest.mark.parametrize(
+    'profiling_result, t_quantile',
+    [
+        ([1.0, 2.0, 3.0], 4.302653),
+        ([1.0, 3.0] * 5, 2.262157),
+        ([1.0, 3.0] * 16, 2.039513),
+        ([1.0, 3.0] * 50, 1.984217)
+        ]
+    )
+def test_TimeItProfiler_relative_error(profiling_result, t_quantile):
+    repeats = len(profiling_result)
+    mean = sum(profiling_result) / repeats
+    std = (sum((value - mean) ** 2 for value in profiling_result) / (repeats - 1)) ** 0.5
+    expected_relative_error = t_quantile * std / repeats ** 0.5 / mean
+    assert timeit_profiler.TimeItProfiler._relative_error(profiling_result) == pytest.approx(expected_relative_error, rel=1e-4)